@@ -7,6 +7,8 @@ import httpx
 
 from app.application.ports.ml_client_port import (
     MLClientPort,
+    MLDerivedAudioClientPort,
+    MLDerivedAudioResponse,
     MLProcessResponse,
 )
 
@@ -106,4 +108,58 @@ class HttpMLClient(MLClientPort):
             status=response_status,
             path=response_path,
             error=response_error,
-        )
\ No newline at end of file
+        )
+
+
+@dataclass(frozen=True)
+class HttpMLDerivedAudioClient(MLDerivedAudioClientPort):
+    base_url: str
+    # 곡 길이만큼 wav 를 읽고 쓰므로 process 보다 여유 있게
+    timeout_seconds: float = 300.0
+
+    async def materialize(
+        self,
+        *,
+        asset_id: str,
+        kind: str,
+        original_wav_path: str,
+        bass_only_wav_path: str,
+        boosted_volume_db: Optional[float] = None,
+    ) -> MLDerivedAudioResponse:
+        payload: dict[str, object] = {
+            "asset_id": asset_id,
+            "kind": kind,
+            "original_wav_path": original_wav_path,
+            "bass_only_wav_path": bass_only_wav_path,
+            "boosted_volume_db": boosted_volume_db,
+        }
+
+        url: str = f"{self.base_url}/v1/derived-audio"
+
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+                r: httpx.Response = await client.post(url, json=payload)
+                r.raise_for_status()
+                data: dict[str, object] = r.json()
+
+        except httpx.TimeoutException as e:
+            return MLDerivedAudioResponse(ok=False, asset_id=asset_id, kind=kind, error=f"ML timeout: {e}")
+        except httpx.HTTPError as e:
+            return MLDerivedAudioResponse(ok=False, asset_id=asset_id, kind=kind, error=f"ML http error: {e}")
+        except Exception as e:
+            return MLDerivedAudioResponse(ok=False, asset_id=asset_id, kind=kind, error=f"ML unknown error: {e}")
+
+        raw_path: object = data.get("path")
+        response_path: Optional[str] = None if raw_path in (None, "") else str(raw_path)
+
+        raw_db: object = data.get("boosted_volume_db")
+        response_db: Optional[float] = None if raw_db is None else float(raw_db)  # type: ignore[arg-type]
+
+        return MLDerivedAudioResponse(
+            ok=response_path is not None,
+            asset_id=asset_id,
+            kind=str(data.get("kind") or kind),
+            path=response_path,
+            boosted_volume_db=response_db,
+            error=None if response_path is not None else "ML returned no path",
+        )
@@ -7,6 +7,12 @@ from dataclasses import dataclass
 from app.application.ports.asset_repository_port import AssetRepositoryPort
 from app.domain.asset_domain import Asset
 
+# kind -> 컬럼 (컬럼명을 쿼리에 넣으므로 이 목록 밖의 값은 받지 않음)
+DERIVED_AUDIO_COLUMNS: dict[str, str] = {
+    "bass_removed": "bass_removed_path",
+    "bass_boosted": "bass_boosted_path",
+}
+
 
 @dataclass(frozen=True)
 class AssetRepositorySqliteAdapter(AssetRepositoryPort):
@@ -170,4 +176,29 @@ class AssetRepositorySqliteAdapter(AssetRepositoryPort):
             finally:
                 conn.close()
 
-        await asyncio.to_thread(_execute)
\ No newline at end of file
+        await asyncio.to_thread(_execute)
+
+    async def update_derived_audio_path(self, *, asset_id: str, kind: str, path: str) -> None:
+        asset_id_: str = asset_id.strip()
+        path_: str = path.strip()
+
+        column: str | None = DERIVED_AUDIO_COLUMNS.get(kind)
+        if column is None:
+            raise ValueError(f"unknown derived audio kind: {kind}")
+        if len(asset_id_) == 0:
+            raise ValueError("asset_id must not be empty")
+        if len(path_) == 0:
+            raise ValueError("path must not be empty")
+
+        def _execute() -> None:
+            conn: sqlite3.Connection = self._connect()
+            try:
+                conn.execute(
+                    f"UPDATE assets SET {column} = ? WHERE asset_id = ?",
+                    (path_, asset_id_),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        await asyncio.to_thread(_execute)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import struct
+import uuid
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from app.application.ports.tab_reader_port import TabReaderPort
+
+"""
+    ML 서버가 쓰는 tab binary (.btab, little-endian) reader
+
+    [header 16B] [bar 표 28B * bar_count] [note 기록 18B * note_count]
+
+    header : magic "BTAB" / version (u16) / header_size (u16) / bar_count (u32) / note_count (u32)
+    bar    : bar_index (i32) / start_time (f64) / end_time (f64) / note_start (u32) / note_count (u32)
+    note   : time (f64) / offset (f64) / line (u8) / fret (u8)
+
+    bar 범위 요청 -> bar 표만 읽어서 범위를 찾고 note 기록은 그 구간만 seek 해서 읽음 (전체 파싱 X)
+    포맷은 ml_server app/adapters/tab/tab/tab_binary_format.py 와 같아야 함
+
+    JSON view : original_tab.json (+ 압축본 original_tab.json.gz / .json.br)
+        ML 서버가 tab 만들때 압축본을 써둠 -> 없거나 binary 보다 오래된 것만 여기서 만듦
+        brotli 모듈이 없으면 .br 은 못 만듦 (None)
+"""
+
+TAB_BINARY_MAGIC: bytes = b"BTAB"
+TAB_BINARY_VERSION: int = 1
+
+TAB_HEADER: struct.Struct = struct.Struct("<4sHHII")
+TAB_BAR: struct.Struct = struct.Struct("<iddII")
+TAB_NOTE: struct.Struct = struct.Struct("<ddBB")
+
+# Content-Encoding -> JSON view 뒤에 붙는 확장자
+TAB_JSON_ENCODING_SUFFIXES: dict[str, str] = {"gzip": ".gz", "br": ".br"}
+
+
+@dataclass(frozen=True)
+class TabBinaryReaderAdapter(TabReaderPort):
+
+    def read_bars(self, *, binary_path: str, bar_from: int | None, bar_to: int | None) -> list[dict]:
+        with open(binary_path, "rb") as f:
+            header_size, bar_count = self._read_header(f=f, path=binary_path)
+
+            f.seek(header_size)
+            bars: list[tuple[int, float, float, int, int]] = list(TAB_BAR.iter_unpack(f.read(bar_count * TAB_BAR.size)))
+            bar_indices: list[int] = [bar[0] for bar in bars]
+
+            lo: int = 0 if bar_from is None else bisect_left(bar_indices, int(bar_from))
+            hi: int = len(bars) if bar_to is None else bisect_left(bar_indices, int(bar_to))
+            if lo >= hi:
+                return []
+
+            first_note: int = bars[lo][3]
+            last_note: int = bars[hi - 1][3] + bars[hi - 1][4]
+
+            f.seek(header_size + bar_count * TAB_BAR.size + first_note * TAB_NOTE.size)
+            notes: list[tuple[float, float, int, int]] = list(
+                TAB_NOTE.iter_unpack(f.read((last_note - first_note) * TAB_NOTE.size))
+            )
+
+        out: list[dict] = []
+        for bar_index, start_time, end_time, note_start, note_count in bars[lo:hi]:
+            k: int = note_start - first_note
+            out.append(
+                {
+                    "bar_index": int(bar_index),
+                    "start_time": float(start_time),
+                    "end_time": float(end_time),
+                    "notes": [
+                        {
+                            "time": float(time),
+                            "offset": float(offset),
+                            "line": int(line),
+                            "fret": int(fret),
+                        }
+                        for time, offset, line, fret in notes[k : k + note_count]
+                    ],
+                }
+            )
+        return out
+
+    def json_view(self, *, binary_path: str, encoding: str | None) -> str | None:
+        binary: Path = Path(binary_path)
+        json_path: Path = binary.with_suffix(".json")
+        if encoding is not None:
+            json_path = json_path.with_name(json_path.name + TAB_JSON_ENCODING_SUFFIXES[encoding])
+
+        if json_path.exists() and json_path.stat().st_mtime_ns >= binary.stat().st_mtime_ns:
+            return str(json_path)
+
+        payload: list[dict] = self.read_bars(binary_path=binary_path, bar_from=None, bar_to=None)
+        data: bytes | None = self._encode(
+            data=json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8"),
+            encoding=encoding,
+        )
+        if data is None:
+            return None
+
+        # 동시 요청이 서로 덮어쓰지 않게 임시 파일에 쓰고 rename
+        tmp_path: Path = json_path.with_name(f".{json_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, json_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return str(json_path)
+
+    def _encode(self, *, data: bytes, encoding: str | None) -> bytes | None:
+        if encoding is None:
+            return data
+        if encoding == "gzip":
+            return gzip.compress(data, compresslevel=9, mtime=0)
+        if encoding == "br":
+            try:
+                import brotli  # type: ignore
+            except ImportError:
+                return None
+            return brotli.compress(data, quality=11)
+        raise ValueError(f"unknown tab json encoding: {encoding}")
+
+    def _read_header(self, *, f: BinaryIO, path: str) -> tuple[int, int]:
+        raw: bytes = f.read(TAB_HEADER.size)
+        if len(raw) < TAB_HEADER.size:
+            raise ValueError(f"tab binary too short: {path}")
+
+        magic, version, header_size, bar_count, _note_count = TAB_HEADER.unpack(raw)
+        if magic != TAB_BINARY_MAGIC:
+            raise ValueError(f"not a tab binary file: {path}")
+        if int(version) != TAB_BINARY_VERSION:
+            raise ValueError(f"unsupported tab binary version: {version}")
+        return int(header_size), int(bar_count)
@@ -1,6 +1,7 @@
 # main_server/app/api/v1/deps.py
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from pathlib import Path
 
@@ -14,16 +15,22 @@ from app.application.ports.job_store_port import JobStore
 from app.application.ports.song_repository_port import SongRepositoryPort
 from app.application.ports.result_repostiroty_port import ResultRepositoryPort
 from app.application.ports.asset_repository_port import AssetRepositoryPort
+from app.application.ports.ml_client_port import MLDerivedAudioClientPort
+from app.application.ports.tab_reader_port import TabReaderPort
 
 from app.adapters.songs.song_repository_adapter import SongRepositorySqliteAdapter
 from app.adapters.songs.result_repository_adapter import ResultRepositorySqliteAdapter
 from app.adapters.songs.asset_repository_adapter import AssetRepositorySqliteAdapter
+from app.adapters.ml.http_client import HttpMLDerivedAudioClient
+from app.adapters.tabs.tab_binary_reader import TabBinaryReaderAdapter
 
 from app.application.usecases.job.create_job_usecase import CreateJobUseCase
 from app.application.usecases.RequestCreateJobUseCase import RequestCreateJobUseCase
 from app.application.usecases.songs.song_create_usecase import CreateSongUseCase
 from app.application.usecases.songs.result_create_usecase import CreateResultUseCase
 from app.application.usecases.songs.song_search_usecase import SearchSongsUseCase
+from app.application.usecases.songs.asset_audio_usecase import GetAssetAudioUseCase
+from app.application.usecases.songs.asset_tab_usecase import GetAssetTabUseCase
 
 
 # ------------------------------------------------------------
@@ -95,6 +102,18 @@ def get_asset_repo() -> AssetRepositoryPort:
     )
 
 
+@lru_cache
+def get_ml_derived_audio_client() -> MLDerivedAudioClientPort:
+    return HttpMLDerivedAudioClient(
+        base_url=os.getenv("ML_SERVER_BASE_URL", "http://localhost:8001"),
+    )
+
+
+@lru_cache
+def get_tab_reader() -> TabReaderPort:
+    return TabBinaryReaderAdapter()
+
+
 # ------------------------------------------------------------
 # song_usecase
 # ------------------------------------------------------------
@@ -122,6 +141,25 @@ def get_create_result_uc() -> CreateResultUseCase:
     )
 
 
+# ------------------------------------------------------------
+# Asset UseCases
+# ------------------------------------------------------------
+@lru_cache
+def get_asset_audio_uc() -> GetAssetAudioUseCase:
+    return GetAssetAudioUseCase(
+        asset_repository=get_asset_repo(),
+        ml_client=get_ml_derived_audio_client(),
+    )
+
+
+@lru_cache
+def get_asset_tab_uc() -> GetAssetTabUseCase:
+    return GetAssetTabUseCase(
+        asset_repository=get_asset_repo(),
+        tab_reader=get_tab_reader(),
+    )
+
+
 # ------------------------------------------------------------
 # Job UseCases
 # ------------------------------------------------------------
@@ -1,9 +1,13 @@
 from fastapi import APIRouter
 from app.api.v1.routers import jobs
+from app.api.v1.routers import asset_audio_router
+from app.api.v1.routers import asset_tab_router
 from bass_back.main_server.app.api.v1.routers import song_search_router
 
 
 api_router = APIRouter()
 
 api_router.include_router(jobs.router)
-api_router.include_router(song_search_router.router)
\ No newline at end of file
+api_router.include_router(song_search_router.router)
+api_router.include_router(asset_audio_router.router)
+api_router.include_router(asset_tab_router.router)
\ No newline at end of file
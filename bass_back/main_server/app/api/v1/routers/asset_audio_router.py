@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path as FilePath
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import FileResponse
+
+from app.api.v1.deps import get_asset_audio_uc
+from app.application.usecases.songs.asset_audio_usecase import AUDIO_KINDS, GetAssetAudioUseCase
+from app.domain.errors_domain import AssetNotFoundError, DerivedAudioUnavailableError
+
+
+router = APIRouter(prefix="/assets", tags=["assets"])
+
+
+@router.get("/{asset_id}/audio/{kind}")
+async def get_asset_audio(
+    asset_id: str = Path(..., min_length=1),
+    kind: str = Path(..., pattern="^(" + "|".join(AUDIO_KINDS) + ")$"),
+    boost_db: float | None = Query(None, ge=-24.0, le=24.0),
+    usecase: GetAssetAudioUseCase = Depends(get_asset_audio_uc),
+) -> FileResponse:
+    try:
+        path: str = await usecase.execute(
+            asset_id=asset_id,
+            kind=kind,
+            boosted_volume_db=boost_db,
+        )
+    except AssetNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="asset not found")
+    except DerivedAudioUnavailableError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=e.reason)
+
+    file_path: FilePath = FilePath(path)
+    if not file_path.exists():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="audio file not found")
+
+    return FileResponse(str(file_path), media_type="audio/wav", filename=file_path.name)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+from app.api.v1.deps import get_asset_tab_uc
+from app.application.services.http_cache import etag_matches
+from app.application.usecases.songs.asset_tab_usecase import (
+    TAB_KINDS,
+    GetAssetTabUseCase,
+    TabBarRange,
+    TabJsonFile,
+)
+from app.domain.errors_domain import AssetNotFoundError, TabNotFoundError
+
+
+router = APIRouter(prefix="/assets", tags=["assets"])
+
+
+# bar_from / bar_to 가 없으면 전체 JSON 파일, 있으면 bar_from <= bar_index < bar_to 인 bar 만
+# If-None-Match 가 ETag 와 같으면 304
+@router.get("/{asset_id}/tab/{kind}", response_model=None)
+async def get_asset_tab(
+    request: Request,
+    asset_id: str = Path(..., min_length=1),
+    kind: str = Path(..., pattern="^(" + "|".join(TAB_KINDS) + ")$"),
+    bar_from: int | None = Query(None, ge=0),
+    bar_to: int | None = Query(None, ge=0),
+    usecase: GetAssetTabUseCase = Depends(get_asset_tab_uc),
+) -> Response:
+    # 매번 ETag 로 확인하고 다시 씀
+    headers: dict[str, str] = {"Cache-Control": "no-cache"}
+    if_none_match: str | None = request.headers.get("if-none-match")
+
+    try:
+        if bar_from is None and bar_to is None:
+            tab_file: TabJsonFile = await usecase.json_file(
+                asset_id=asset_id,
+                kind=kind,
+                accept_encoding=request.headers.get("accept-encoding"),
+            )
+            headers["ETag"] = tab_file.etag
+            headers["Vary"] = "Accept-Encoding"
+            if etag_matches(if_none_match, tab_file.etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            if tab_file.encoding is not None:
+                headers["Content-Encoding"] = tab_file.encoding
+            return FileResponse(tab_file.path, media_type="application/json", headers=headers)
+
+        tab_range: TabBarRange = await usecase.bar_range(
+            asset_id=asset_id,
+            kind=kind,
+            bar_from=bar_from,
+            bar_to=bar_to,
+        )
+    except AssetNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="asset not found")
+    except TabNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="tab file not found")
+
+    headers["ETag"] = tab_range.etag
+    if etag_matches(if_none_match, tab_range.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(tab_range.bars, headers=headers)
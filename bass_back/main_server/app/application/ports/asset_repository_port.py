@@ -13,4 +13,8 @@ class AssetRepositoryPort(Protocol):
         ...
 
     async def save(self, *, asset: Asset) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    # 지연 생성된 파생 음원 경로 기록 (kind : bass_removed / bass_boosted)
+    async def update_derived_audio_path(self, *, asset_id: str, kind: str, path: str) -> None:
+        ...
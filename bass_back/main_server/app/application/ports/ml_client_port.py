@@ -35,3 +35,28 @@ class MLClientPort(Protocol):
         meta: Optional[Dict[str, Any]] = None,
     ) -> MLProcessResponse:
         ...
+
+
+# 파생 음원 지연 생성 응답
+@dataclass(frozen=True)
+class MLDerivedAudioResponse:
+    ok: bool
+    asset_id: str
+    kind: str
+    path: Optional[str] = None
+    boosted_volume_db: Optional[float] = None
+    error: Optional[str] = None
+
+
+# ml_server에 파생 음원(bass_removed / bass_boosted) 생성을 요청하는 포트
+class MLDerivedAudioClientPort(Protocol):
+    async def materialize(
+        self,
+        *,
+        asset_id: str,
+        kind: str,
+        original_wav_path: str,
+        bass_only_wav_path: str,
+        boosted_volume_db: Optional[float] = None,
+    ) -> MLDerivedAudioResponse:
+        ...
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class TabReaderPort(Protocol):
+    # bar_from <= bar_index < bar_to 인 bar 만 (None 이면 그쪽 끝까지), JSON 과 같은 dict 모양
+    def read_bars(self, *, binary_path: str, bar_from: int | None, bar_to: int | None) -> list[dict]:
+        ...
+
+    # binary 에서 만든 전체 JSON 파일 경로 (encoding = gzip / br 이면 그 압축본)
+    # 없거나 오래됐으면 새로 만듦, 못 만드는 encoding 이면 None
+    def json_view(self, *, binary_path: str, encoding: str | None) -> str | None:
+        ...
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from functools import lru_cache
+
+"""
+    미리 압축해둔 파일 고르기 (Accept-Encoding) / strong ETag
+
+    preferred_encodings : 클라이언트가 받는 압축 중 서버가 가진 것 (q 높은 순, 같으면 br > gzip), 마지막은 None (압축 X)
+    strong_etag         : 파일 내용 sha256 (경로 + mtime + 크기 로 cache -> 파일이 바뀔때만 다시 읽음)
+                          압축본마다 bytes 가 달라서 ETag 도 다름
+"""
+
+SERVER_ENCODINGS: tuple[str, ...] = ("br", "gzip")
+_ENCODING_ALIASES: dict[str, str] = {"x-gzip": "gzip"}
+_HASH_CHUNK_BYTES: int = 1 << 20
+
+
+def preferred_encodings(accept_encoding: str | None) -> list[str | None]:
+    if not accept_encoding:
+        return [None]
+
+    q_values: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        name: str = _ENCODING_ALIASES.get(token.strip().lower(), token.strip().lower())
+        if not name:
+            continue
+
+        q: float = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        q_values[name] = q
+
+    wildcard: float = q_values.get("*", 0.0)
+    accepted: list[tuple[float, int, str]] = []
+    for rank, encoding in enumerate(SERVER_ENCODINGS):
+        q = q_values.get(encoding, wildcard)
+        if q > 0.0:
+            accepted.append((-q, rank, encoding))
+
+    return [encoding for _, _, encoding in sorted(accepted)] + [None]
+
+
+def strong_etag(path: str) -> str:
+    st: os.stat_result = os.stat(path)
+    return f'"{_file_sha256(path, st.st_mtime_ns, st.st_size)[:32]}"'
+
+
+@lru_cache(maxsize=512)
+def _file_sha256(path: str, mtime_ns: int, size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk: bytes = f.read(_HASH_CHUNK_BYTES)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# If-None-Match 비교 (weak 비교, "*" 는 전부 일치)
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    target: str = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        value: str = candidate.strip()
+        if value == "*" or value.removeprefix("W/") == target:
+            return True
+    return False
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.application.ports.asset_repository_port import AssetRepositoryPort
+from app.application.ports.ml_client_port import MLDerivedAudioClientPort, MLDerivedAudioResponse
+from app.domain.asset_domain import Asset
+from app.domain.errors_domain import AssetNotFoundError, DerivedAudioUnavailableError
+
+"""
+    asset 음원 경로 조회
+
+    original / bass_only  -> ML 처리때 만들어진 파일 그대로
+    bass_removed / bass_boosted
+        -> assets 에 기록된 파일이 있으면 그대로
+        -> 없으면 ML 서버에 생성 요청 (/v1/derived-audio) 후 assets 에 기록
+    boost 를 따로 지정하면 (기본 10dB 가 아니면) ML 서버 디스크에만 cache 되고 assets 에는 기록 X
+"""
+
+AUDIO_KINDS: tuple[str, ...] = ("original", "bass_only", "bass_removed", "bass_boosted")
+DERIVED_KINDS: tuple[str, ...] = ("bass_removed", "bass_boosted")
+DEFAULT_BOOSTED_VOLUME_DB: float = 10.0
+
+
+@dataclass(frozen=True)
+class GetAssetAudioUseCase:
+    asset_repository: AssetRepositoryPort
+    ml_client: MLDerivedAudioClientPort
+
+    async def execute(
+        self,
+        *,
+        asset_id: str,
+        kind: str,
+        boosted_volume_db: Optional[float] = None,
+    ) -> str:
+        if kind not in AUDIO_KINDS:
+            raise ValueError(f"unknown audio kind: {kind}")
+
+        asset: Asset | None = await self.asset_repository.get_by_asset_id(asset_id=asset_id)
+        if asset is None:
+            raise AssetNotFoundError(asset_id)
+
+        if kind == "original":
+            return asset.original_audio_path
+        if kind == "bass_only":
+            if asset.bass_only_path is None:
+                raise DerivedAudioUnavailableError(asset_id, kind, "bass_only not recorded")
+            return asset.bass_only_path
+
+        is_default: bool = kind == "bass_removed" or boosted_volume_db is None or (
+            float(boosted_volume_db) == DEFAULT_BOOSTED_VOLUME_DB
+        )
+
+        if is_default:
+            recorded: str | None = self._recorded_path(asset=asset, kind=kind)
+            if recorded is not None and Path(recorded).exists():
+                return recorded
+
+        if asset.bass_only_path is None:
+            raise DerivedAudioUnavailableError(asset_id, kind, "bass_only not recorded")
+
+        response: MLDerivedAudioResponse = await self.ml_client.materialize(
+            asset_id=asset.asset_id,
+            kind=kind,
+            original_wav_path=asset.original_audio_path,
+            bass_only_wav_path=asset.bass_only_path,
+            boosted_volume_db=None if kind == "bass_removed" else boosted_volume_db,
+        )
+        if not response.ok or response.path is None:
+            raise DerivedAudioUnavailableError(asset_id, kind, response.error or "unknown error")
+
+        if is_default:
+            await self.asset_repository.update_derived_audio_path(
+                asset_id=asset.asset_id,
+                kind=kind,
+                path=response.path,
+            )
+
+        return response.path
+
+    def _recorded_path(self, *, asset: Asset, kind: str) -> str | None:
+        if kind == "bass_removed":
+            return asset.bass_removed_path
+        return asset.bass_boosted_path
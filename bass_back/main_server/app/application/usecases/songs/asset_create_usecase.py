@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from app.application.ports.asset_repository_port import AssetRepositoryPort
-from app.domain.results_domain import Result
+from app.domain.asset_domain import Asset
 from app.application.services.path_maker import audio_path, tab_path
 
 
@@ -18,18 +18,19 @@ class CreateResultUseCase:
         result_id: str,
         asset_id: str,
         path: str,
-    ) -> Result:
+    ) -> Asset:
         base_path: Path = Path(path)
 
-        asset: Result = Result.create(
-            asset_id_=asset_id,
-            result_id_=result_id,
-            original_audio_path_=audio_path(base_path, "original.wav"),
-            bass_only_path_=audio_path(base_path, "bass_only.wav"),
-            bass_removed_path_=audio_path(base_path, "bass_removed.wav"),
-            bass_boosted_path_=audio_path(base_path, "bass_boosted.wav"),
-            original_tab_path_=tab_path(base_path, "original_tab.json"),
-            root_tab_path_=tab_path(base_path, "root_tab.json"),
+        # bass_removed / bass_boosted 는 처음 요청될 때 만들어서 기록 (GetAssetAudioUseCase)
+        asset: Asset = Asset(
+            asset_id=asset_id,
+            result_id=result_id,
+            original_audio_path=audio_path(base_path, "original.wav"),
+            bass_only_path=audio_path(base_path, "bass_only.wav"),
+            bass_removed_path=None,
+            bass_boosted_path=None,
+            original_tab_path=tab_path(base_path, "original_tab.json"),
+            root_tab_path=tab_path(base_path, "root_tab.json"),
         )
 
         await self.asset_repository.save(asset=asset)
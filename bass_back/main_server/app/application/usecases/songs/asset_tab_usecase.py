@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.application.ports.asset_repository_port import AssetRepositoryPort
+from app.application.ports.tab_reader_port import TabReaderPort
+from app.application.services.http_cache import preferred_encodings, strong_etag
+from app.domain.asset_domain import Asset
+from app.domain.errors_domain import AssetNotFoundError, TabNotFoundError
+
+"""
+    asset tab 조회
+
+    ML 서버는 tab 을 binary (original_tab.btab / root_tab.btab) 로 씀
+    assets 에 기록된 경로는 JSON view 경로 (original_tab.json) -> 같은 이름 .btab 이 binary
+
+    전체      -> JSON view 파일 (처음 요청때 binary 에서 만들고 재사용)
+                 Accept-Encoding 에 맞는 압축본 (.json.br / .json.gz) 이 있으면 그걸 그대로 보냄
+    bar 범위  -> binary 에서 그 bar 들만 seek 해서 읽음
+    binary 가 없는 예전 asset 은 JSON 파일을 그대로 씀
+    ETag 는 보내는 파일 내용 hash (bar 범위는 binary hash + 범위)
+"""
+
+TAB_KINDS: tuple[str, ...] = ("original", "root")
+
+
+@dataclass(frozen=True)
+class TabJsonFile:
+    path: str
+    # Content-Encoding (None 이면 압축 안된 JSON)
+    encoding: str | None
+    etag: str
+
+
+@dataclass(frozen=True)
+class TabBarRange:
+    bars: list[dict]
+    etag: str
+
+
+@dataclass(frozen=True)
+class GetAssetTabUseCase:
+    asset_repository: AssetRepositoryPort
+    tab_reader: TabReaderPort
+
+    # 전체 tab JSON 파일 (accept_encoding = 요청의 Accept-Encoding 헤더)
+    async def json_file(self, *, asset_id: str, kind: str, accept_encoding: str | None) -> TabJsonFile:
+        view_path: Path = await self._view_path(asset_id=asset_id, kind=kind)
+        binary_path: Path = view_path.with_suffix(".btab")
+
+        if binary_path.exists():
+            for encoding in preferred_encodings(accept_encoding):
+                path: str | None = await asyncio.to_thread(
+                    self.tab_reader.json_view,
+                    binary_path=str(binary_path),
+                    encoding=encoding,
+                )
+                if path is not None:
+                    return TabJsonFile(path=path, encoding=encoding, etag=await asyncio.to_thread(strong_etag, path))
+
+        if view_path.exists():
+            return TabJsonFile(
+                path=str(view_path),
+                encoding=None,
+                etag=await asyncio.to_thread(strong_etag, str(view_path)),
+            )
+        raise TabNotFoundError(asset_id, kind)
+
+    # bar_from <= bar_index < bar_to 인 bar 들
+    async def bar_range(
+        self,
+        *,
+        asset_id: str,
+        kind: str,
+        bar_from: int | None,
+        bar_to: int | None,
+    ) -> TabBarRange:
+        view_path: Path = await self._view_path(asset_id=asset_id, kind=kind)
+        binary_path: Path = view_path.with_suffix(".btab")
+        range_tag: str = f"{'' if bar_from is None else bar_from}-{'' if bar_to is None else bar_to}"
+
+        if binary_path.exists():
+            etag: str = await asyncio.to_thread(strong_etag, str(binary_path))
+            bars: list[dict] = await asyncio.to_thread(
+                self.tab_reader.read_bars,
+                binary_path=str(binary_path),
+                bar_from=bar_from,
+                bar_to=bar_to,
+            )
+            return TabBarRange(bars=bars, etag=f'{etag[:-1]}-{range_tag}"')
+
+        if view_path.exists():
+            etag = await asyncio.to_thread(strong_etag, str(view_path))
+            all_bars: list[dict] = json.loads(view_path.read_text(encoding="utf-8"))
+            return TabBarRange(
+                bars=[
+                    bar
+                    for bar in all_bars
+                    if (bar_from is None or int(bar["bar_index"]) >= bar_from)
+                    and (bar_to is None or int(bar["bar_index"]) < bar_to)
+                ],
+                etag=f'{etag[:-1]}-{range_tag}"',
+            )
+        raise TabNotFoundError(asset_id, kind)
+
+    async def _view_path(self, *, asset_id: str, kind: str) -> Path:
+        if kind not in TAB_KINDS:
+            raise ValueError(f"unknown tab kind: {kind}")
+
+        asset: Asset | None = await self.asset_repository.get_by_asset_id(asset_id=asset_id)
+        if asset is None:
+            raise AssetNotFoundError(asset_id)
+
+        if kind == "original":
+            return Path(asset.original_tab_path)
+        return Path(asset.root_tab_path)
@@ -19,3 +19,36 @@ class JobNotFoundError(Exception):
     def __init__(self, job_id: str):
         self.job_id = job_id
         super().__init__(f"Job not found: {job_id}")
+
+
+class AssetNotFoundError(Exception):
+    """
+    asset_id 로 찾은 asset 이 없을때
+    """
+
+    def __init__(self, asset_id: str):
+        self.asset_id = asset_id
+        super().__init__(f"Asset not found: {asset_id}")
+
+
+class DerivedAudioUnavailableError(Exception):
+    """
+    파생 음원(bass_removed / bass_boosted)을 ML 서버에서 만들지 못했을때
+    """
+
+    def __init__(self, asset_id: str, kind: str, reason: str):
+        self.asset_id = asset_id
+        self.kind = kind
+        self.reason = reason
+        super().__init__(f"Derived audio unavailable: {asset_id}/{kind} ({reason})")
+
+
+class TabNotFoundError(Exception):
+    """
+    asset 의 tab 파일(binary / JSON 둘다)이 없을때
+    """
+
+    def __init__(self, asset_id: str, kind: str):
+        self.asset_id = asset_id
+        self.kind = kind
+        super().__init__(f"Tab not found: {asset_id}/{kind}")
@@ -19,4 +19,20 @@ class MLProcessResponseDTO(BaseModel):
     asset_id: str
     status: str 
     path : str
-    error: str | None = None
\ No newline at end of file
+    error: str | None = None
+
+
+# 파생 음원(bass_removed / bass_boosted) 지연 생성 요청
+class MLDerivedAudioRequestDTO(BaseModel):
+    asset_id: str
+    kind: str
+    original_wav_path: str
+    bass_only_wav_path: str
+    boosted_volume_db: Optional[float] = None
+
+class MLDerivedAudioResponseDTO(BaseModel):
+    asset_id: str
+    kind: str
+    path: str
+    boosted_volume_db: float | None = None
+    created: bool = False
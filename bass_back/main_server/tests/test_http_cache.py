@@ -0,0 +1,32 @@
+from app.application.services.http_cache import etag_matches, preferred_encodings, strong_etag
+
+
+def test_preferred_encodings_order():
+    assert preferred_encodings(None) == [None]
+    assert preferred_encodings("") == [None]
+    assert preferred_encodings("gzip, deflate, br") == ["br", "gzip", None]
+    assert preferred_encodings("gzip;q=1.0, br;q=0.5") == ["gzip", "br", None]
+    assert preferred_encodings("br;q=0, gzip") == ["gzip", None]
+    assert preferred_encodings("deflate") == [None]
+    assert preferred_encodings("*") == ["br", "gzip", None]
+    assert preferred_encodings("x-gzip") == ["gzip", None]
+
+
+def test_strong_etag_follows_content(tmp_path):
+    path = tmp_path / "tab.json"
+    path.write_text("[1]", encoding="utf-8")
+    first = strong_etag(str(path))
+
+    assert first.startswith('"') and first.endswith('"')
+    assert strong_etag(str(path)) == first
+
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert strong_etag(str(path)) != first
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
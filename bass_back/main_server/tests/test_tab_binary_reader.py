@@ -0,0 +1,111 @@
+import gzip
+import json
+import os
+
+from app.adapters.tabs.tab_binary_reader import (
+    TAB_BAR,
+    TAB_BINARY_MAGIC,
+    TAB_BINARY_VERSION,
+    TAB_HEADER,
+    TAB_NOTE,
+    TabBinaryReaderAdapter,
+)
+
+
+# ML 서버 _write_json 이 쓰던 모양의 tab
+BARS = [
+    {
+        "bar_index": 0,
+        "start_time": 0.0,
+        "end_time": 2.0,
+        "notes": [
+            {"time": 0.0, "offset": 0.0, "line": 4, "fret": 3},
+            {"time": 0.5, "offset": 1.0, "line": 4, "fret": 5},
+        ],
+    },
+    {"bar_index": 1, "start_time": 2.0, "end_time": 4.0, "notes": []},
+    {
+        "bar_index": 3,
+        "start_time": 6.0,
+        "end_time": 8.0,
+        "notes": [{"time": 6.125, "offset": 0.25, "line": 1, "fret": 12}],
+    },
+    {
+        "bar_index": 4,
+        "start_time": 8.0,
+        "end_time": 10.0,
+        "notes": [
+            {"time": 8.0, "offset": 0.0, "line": 2, "fret": 0},
+            {"time": 9.5, "offset": 3.0, "line": 3, "fret": 7},
+        ],
+    },
+]
+
+
+def _write_binary(path):
+    bar_rows = b""
+    note_rows = b""
+    note_start = 0
+    for bar in BARS:
+        bar_rows += TAB_BAR.pack(bar["bar_index"], bar["start_time"], bar["end_time"], note_start, len(bar["notes"]))
+        for note in bar["notes"]:
+            note_rows += TAB_NOTE.pack(note["time"], note["offset"], note["line"], note["fret"])
+        note_start += len(bar["notes"])
+
+    header = TAB_HEADER.pack(TAB_BINARY_MAGIC, TAB_BINARY_VERSION, TAB_HEADER.size, len(BARS), note_start)
+    path.write_bytes(header + bar_rows + note_rows)
+
+
+def test_read_all_bars(tmp_path):
+    path = tmp_path / "original_tab.btab"
+    _write_binary(path)
+
+    assert TabBinaryReaderAdapter().read_bars(binary_path=str(path), bar_from=None, bar_to=None) == BARS
+
+
+def test_read_bar_range(tmp_path):
+    path = tmp_path / "original_tab.btab"
+    _write_binary(path)
+    reader = TabBinaryReaderAdapter()
+
+    assert reader.read_bars(binary_path=str(path), bar_from=1, bar_to=4) == BARS[1:3]
+    assert reader.read_bars(binary_path=str(path), bar_from=2, bar_to=None) == BARS[2:]
+    assert reader.read_bars(binary_path=str(path), bar_from=None, bar_to=1) == BARS[:1]
+    assert reader.read_bars(binary_path=str(path), bar_from=5, bar_to=9) == []
+    assert reader.read_bars(binary_path=str(path), bar_from=3, bar_to=3) == []
+
+
+def test_json_view_matches_old_json(tmp_path):
+    path = tmp_path / "root_tab.btab"
+    _write_binary(path)
+
+    json_path = TabBinaryReaderAdapter().json_view(binary_path=str(path), encoding=None)
+
+    assert json_path == str(tmp_path / "root_tab.json")
+    with open(json_path, encoding="utf-8") as f:
+        assert f.read() == json.dumps(BARS, ensure_ascii=False, indent=2)
+
+
+def test_gzip_json_view(tmp_path):
+    path = tmp_path / "root_tab.btab"
+    _write_binary(path)
+
+    gz_path = TabBinaryReaderAdapter().json_view(binary_path=str(path), encoding="gzip")
+
+    assert gz_path == str(tmp_path / "root_tab.json.gz")
+    with open(gz_path, "rb") as f:
+        assert gzip.decompress(f.read()).decode("utf-8") == json.dumps(BARS, ensure_ascii=False, indent=2)
+    assert not (tmp_path / "root_tab.json").exists()
+
+
+def test_stale_json_view_is_rebuilt(tmp_path):
+    path = tmp_path / "root_tab.btab"
+    _write_binary(path)
+    stale = tmp_path / "root_tab.json.gz"
+    stale.write_bytes(b"old")
+    st = os.stat(path)
+    os.utime(stale, ns=(st.st_atime_ns, st.st_mtime_ns - 1_000_000_000))
+
+    TabBinaryReaderAdapter().json_view(binary_path=str(path), encoding="gzip")
+
+    assert gzip.decompress(stale.read_bytes()).decode("utf-8") == json.dumps(BARS, ensure_ascii=False, indent=2)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.audio.raw_pcm_format import (
+    RawPcmHeader,
+    attach_shared_raw_pcm,
+    create_shared_raw_pcm,
+    open_raw_pcm,
+    raw_pcm_key,
+    raw_pcm_path,
+    raw_pcm_shm_name,
+    write_raw_pcm,
+)
+from app.application.ports.audio.audio_buffer_port import AudioBuffer, AudioBufferPort
+
+"""
+    job 단위 decode 된 음원 보관소 ((path, sr, channels) -> float32 [channels, samples])
+
+    original.wav / bass_only.wav 를 stage 마다 다시 decode 하지 않음
+        demucs      : 파일 그대로 (sr / channels 변환은 demucs convert_audio)
+        basic_pitch : bass_only 22050 mono
+        bpm         : original 22050 mono
+    파일은 soundfile 로 한번만 읽고 나머지 변형은 그 결과에서 만듦
+        mono     : channel 평균 (librosa.to_mono 와 같음)
+        channels : 부족하면 복제, 많으면 앞에서부터 (demucs convert_audio_channels 와 같음)
+        resample : librosa.resample soxr_hq (librosa.load 기본값과 같음)
+
+    파일이 바뀌면 (mtime / 크기) 그 파일의 buffer 는 버리고 다시 읽음
+    job 끝나면 clear() -> 곡 하나 분량만 메모리에 있음
+
+    stage 가 다른 process 에서 돌때만 (raw_pcm_format 참고)
+        raw_pcm_dir   : 변형마다 float32 raw PCM sidecar 를 한번 씀 -> 다른 process 는 np.memmap 으로 열기만 함
+        shared_memory : 같은 node 면 sidecar 대신 shared memory 에 올림 -> 이름으로 attach (복사 X)
+        찾는 순서 = 이 process 보관 -> shared memory -> sidecar -> decode / 변환 (하면 다시 올림)
+        clear() 때 이 registry 가 만든 sidecar / shared memory 만 지움 (attach 한 것은 닫기만)
+        ml_worker 는 모든 stage 를 한 process 에서 돌려서 둘다 끔 (올려도 읽는 process 가 없음)
+        읽을 process 가 없으면 켜지 말 것 -> 쓰기 / 복사만 늘고 clear() 때 그대로 지워짐
+"""
+
+
+@dataclass(frozen=True)
+class _DecodedFile:
+    signature: tuple[int, int]  # (mtime_ns, size)
+    buffers: dict[tuple[int | None, int | None], AudioBuffer]
+
+
+class AudioBufferRegistry(AudioBufferPort):
+    def __init__(self, *, raw_pcm_dir: Path | None = None, shared_memory: bool = False) -> None:
+        self._raw_pcm_dir: Path | None = None if raw_pcm_dir is None else Path(raw_pcm_dir)
+        self._shared_memory: bool = bool(shared_memory)
+        self._files: dict[str, _DecodedFile] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._decode_count: int = 0
+
+        # 이 registry 가 만든 것 (clear 때 지움) / attach 한 것 (clear 때 닫기만)
+        self._written_paths: list[Path] = []
+        self._created_shm: list[SharedMemory] = []
+        self._attached_shm: list[SharedMemory] = []
+
+    def get(
+        self,
+        *,
+        path: Path,
+        sr: int | None = None,
+        channels: int | None = None,
+        offset_seconds: float = 0.0,
+        duration_seconds: float | None = None,
+    ) -> AudioBuffer:
+        if sr is not None and sr <= 0:
+            raise ValueError("sr must be > 0 or None")
+        if channels is not None and channels <= 0:
+            raise ValueError("channels must be > 0 or None")
+        if offset_seconds < 0.0:
+            raise ValueError("offset_seconds must be >= 0.0")
+        if duration_seconds is not None and duration_seconds <= 0.0:
+            raise ValueError("duration_seconds must be > 0.0 or None")
+
+        # 구간 요청 : 원래 sr 에서 자르고 변환 (보관 X)
+        if offset_seconds > 0.0 or duration_seconds is not None:
+            source: AudioBuffer = self.get(path=path, sr=None, channels=channels)
+            start: int = int(np.round(source.samplerate * offset_seconds))
+            stop: int | None = None
+            if duration_seconds is not None:
+                stop = start + int(np.round(source.samplerate * duration_seconds))
+            return self._convert(
+                source=AudioBuffer(audio=source.audio[:, start:stop], samplerate=source.samplerate),
+                sr=sr,
+                channels=None,
+            )
+
+        key: str = str(Path(path).resolve())
+
+        # decode / 변환은 lock 안에서 -> 같은 파일을 동시에 두번 읽지 않음
+        with self._lock:
+            decoded: _DecodedFile = self._entry_locked(key=key)
+            return self._variant_locked(key=key, decoded=decoded, variant=(sr, channels))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+
+            for shm in self._created_shm:
+                self._close_shm(shm=shm)
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+            for shm in self._attached_shm:
+                self._close_shm(shm=shm)
+            for written in self._written_paths:
+                written.unlink(missing_ok=True)
+
+            self._created_shm.clear()
+            self._attached_shm.clear()
+            self._written_paths.clear()
+
+    def decode_count(self) -> int:
+        with self._lock:
+            return self._decode_count
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(
+                int(buffer.audio.nbytes)
+                for decoded in self._files.values()
+                for buffer in decoded.buffers.values()
+            )
+
+    def _entry_locked(self, *, key: str) -> _DecodedFile:
+        st: os.stat_result = os.stat(key)
+        signature: tuple[int, int] = (int(st.st_mtime_ns), int(st.st_size))
+
+        decoded: _DecodedFile | None = self._files.get(key)
+        if decoded is None or decoded.signature != signature:
+            decoded = _DecodedFile(signature=signature, buffers={})
+            self._files[key] = decoded
+        return decoded
+
+    def _variant_locked(
+        self,
+        *,
+        key: str,
+        decoded: _DecodedFile,
+        variant: tuple[int | None, int | None],
+    ) -> AudioBuffer:
+        hit: AudioBuffer | None = decoded.buffers.get(variant)
+        if hit is not None:
+            return hit
+
+        shared_key: str = raw_pcm_key(
+            source_path=key,
+            source_signature=decoded.signature,
+            sr=variant[0],
+            channels=variant[1],
+        )
+        buffer: AudioBuffer | None = self._open_shared_locked(shared_key=shared_key, signature=decoded.signature)
+        if buffer is None:
+            sr, channels = variant
+            if variant == (None, None):
+                # librosa.load 와 같은 decode (float32, [samples, channels] -> [channels, samples])
+                data, samplerate = sf.read(key, dtype="float32", always_2d=True)
+                self._decode_count += 1
+                buffer = AudioBuffer(audio=self._freeze(data.T), samplerate=int(samplerate))
+            elif sr is None:
+                native: AudioBuffer = self._variant_locked(key=key, decoded=decoded, variant=(None, None))
+                buffer = self._convert(source=native, sr=None, channels=channels)
+            else:
+                # channel 변환을 먼저 (mono 는 resample 할 양이 줄어듦), 중간 결과도 보관
+                shaped: AudioBuffer = self._variant_locked(key=key, decoded=decoded, variant=(None, channels))
+                buffer = self._convert(source=shaped, sr=sr, channels=None)
+            # 변환이 없던 변형 (원본과 같은 배열) 은 다시 올리지 않음
+            if not any(buffer is other for other in decoded.buffers.values()):
+                buffer = self._publish_locked(shared_key=shared_key, signature=decoded.signature, buffer=buffer)
+
+        decoded.buffers[variant] = buffer
+        return buffer
+
+    def _open_shared_locked(self, *, shared_key: str, signature: tuple[int, int]) -> AudioBuffer | None:
+        if self._shared_memory:
+            attached: tuple[SharedMemory, RawPcmHeader, AudioBuffer] | None = attach_shared_raw_pcm(
+                name=raw_pcm_shm_name(key=shared_key)
+            )
+            if attached is not None:
+                shm, header, buffer = attached
+                if header.source_signature == signature:
+                    self._attached_shm.append(shm)
+                    return buffer
+                # 원본이 바뀐 뒤의 남은 segment -> 배열을 놓고 닫음
+                del attached, buffer
+                self._close_shm(shm=shm)
+
+        if self._raw_pcm_dir is not None:
+            sidecar: Path = raw_pcm_path(raw_pcm_dir=self._raw_pcm_dir, key=shared_key)
+            if sidecar.exists():
+                try:
+                    header, buffer = open_raw_pcm(path=sidecar)
+                except ValueError:
+                    return None
+                if header.source_signature == signature:
+                    return buffer
+        return None
+
+    def _publish_locked(self, *, shared_key: str, signature: tuple[int, int], buffer: AudioBuffer) -> AudioBuffer:
+        if self._shared_memory:
+            try:
+                shm, shared = create_shared_raw_pcm(
+                    name=raw_pcm_shm_name(key=shared_key),
+                    buffer=buffer,
+                    source_signature=signature,
+                )
+            except FileExistsError:
+                # 다른 process 가 먼저 올리는 중 -> 이 process 는 자기 배열 사용
+                return buffer
+            self._created_shm.append(shm)
+            return shared
+
+        if self._raw_pcm_dir is not None:
+            sidecar: Path = write_raw_pcm(
+                path=raw_pcm_path(raw_pcm_dir=self._raw_pcm_dir, key=shared_key),
+                buffer=buffer,
+                source_signature=signature,
+            )
+            self._written_paths.append(sidecar)
+        return buffer
+
+    def _close_shm(self, *, shm: SharedMemory) -> None:
+        try:
+            shm.close()
+        except BufferError:
+            # 아직 배열을 쥐고 있는 곳이 있음 -> 그 배열이 사라질때 같이 풀림
+            pass
+
+    def _convert(self, *, source: AudioBuffer, sr: int | None, channels: int | None) -> AudioBuffer:
+        audio: np.ndarray = source.audio
+
+        if channels is not None and channels != audio.shape[0]:
+            if channels == 1:
+                audio = np.mean(audio, axis=0, keepdims=True)
+            elif audio.shape[0] == 1:
+                audio = np.repeat(audio, channels, axis=0)
+            elif audio.shape[0] > channels:
+                audio = audio[:channels]
+            else:
+                raise ValueError(f"cannot convert {audio.shape[0]} channels to {channels}")
+
+        samplerate: int = source.samplerate
+        if sr is not None and sr != samplerate:
+            import librosa  # type: ignore
+
+            # mono 는 1-D 로 넘김 (librosa.load 와 같은 입력)
+            resampled: np.ndarray = librosa.resample(
+                audio[0] if audio.shape[0] == 1 else audio,
+                orig_sr=samplerate,
+                target_sr=int(sr),
+                res_type="soxr_hq",
+            )
+            audio = resampled.reshape(audio.shape[0], -1)
+            samplerate = int(sr)
+
+        if audio is source.audio:
+            return source
+        return AudioBuffer(audio=self._freeze(audio), samplerate=samplerate)
+
+    def _freeze(self, audio: np.ndarray) -> np.ndarray:
+        # 여러 stage 가 같은 배열을 봄 -> 쓰기 막음 (수정이 필요하면 복사해서)
+        out: np.ndarray = np.ascontiguousarray(audio, dtype=np.float32)
+        out.flags.writeable = False
+        return out
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.audio.audio_buffer_registry import AudioBufferRegistry
+from app.application.ports.audio.audio_buffer_port import AudioBuffer
+
+"""
+    job 단위 decode 보관소 확인
+        변형 (원본 / mono / channel 복제 / 구간) 이 파일을 직접 읽은 결과와 같은지
+        변형을 여러번 받아도 decode 는 파일당 한번인지, 파일이 바뀌면 다시 읽는지
+        librosa 가 있으면 22050 mono (구간 포함) 가 librosa.load 와 같은지
+    STAGE_READS 번 파일 decode vs 보관소 재사용 시간도 출력
+"""
+
+SAMPLERATE: int = 44100
+SECONDS: float = 30.0
+TARGET_SR: int = 22050
+STAGE_READS: int = 3
+SEED: int = 0
+
+
+def _write_wav(*, path: Path, rng: np.random.Generator, channels: int) -> np.ndarray:
+    audio: np.ndarray = (rng.standard_normal((int(SAMPLERATE * SECONDS), channels)) * 0.1).astype(np.float32)
+    sf.write(str(path), audio, SAMPLERATE, subtype="PCM_24")
+    return sf.read(str(path), dtype="float32", always_2d=True)[0].T
+
+
+def _check_variants(*, tmp_dir: Path, rng: np.random.Generator) -> bool:
+    path: Path = tmp_dir / "original.wav"
+    expected: np.ndarray = _write_wav(path=path, rng=rng, channels=2)
+    registry: AudioBufferRegistry = AudioBufferRegistry()
+
+    ok: bool = True
+    native: AudioBuffer = registry.get(path=path)
+    ok = ok and native.samplerate == SAMPLERATE and np.array_equal(native.audio, expected)
+    ok = ok and np.array_equal(registry.get(path=path, channels=1).mono, np.mean(expected, axis=0))
+    ok = ok and registry.get(path=path, sr=SAMPLERATE, channels=2) is registry.get(path=path, sr=SAMPLERATE, channels=2)
+
+    segment: AudioBuffer = registry.get(path=path, channels=1, offset_seconds=1.5, duration_seconds=2.0)
+    start: int = int(np.round(SAMPLERATE * 1.5))
+    ok = ok and np.array_equal(segment.mono, np.mean(expected, axis=0)[start : start + 2 * SAMPLERATE])
+
+    mono_path: Path = tmp_dir / "bass_only.wav"
+    mono_expected: np.ndarray = _write_wav(path=mono_path, rng=rng, channels=1)
+    ok = ok and np.array_equal(registry.get(path=mono_path, channels=2).audio, np.repeat(mono_expected, 2, axis=0))
+    ok = ok and registry.decode_count() == 2
+
+    # 같은 경로에 다시 쓰면 다시 decode
+    time.sleep(0.01)
+    rewritten: np.ndarray = _write_wav(path=path, rng=rng, channels=2)
+    ok = ok and np.array_equal(registry.get(path=path).audio, rewritten) and registry.decode_count() == 3
+
+    try:
+        registry.get(path=path).audio[0, 0] = 1.0
+        ok = False
+    except ValueError:
+        pass
+
+    registry.clear()
+    ok = ok and registry.total_bytes() == 0
+    return ok
+
+
+def _check_librosa(*, tmp_dir: Path, rng: np.random.Generator) -> str:
+    try:
+        import librosa  # type: ignore
+    except ImportError:
+        return "skip (librosa not installed)"
+
+    path: Path = tmp_dir / "librosa.wav"
+    _write_wav(path=path, rng=rng, channels=2)
+    registry: AudioBufferRegistry = AudioBufferRegistry()
+
+    whole, _ = librosa.load(str(path), sr=TARGET_SR, mono=True)
+    part, _ = librosa.load(str(path), sr=TARGET_SR, mono=True, offset=2.25, duration=5.0)
+    same: bool = np.array_equal(registry.get(path=path, sr=TARGET_SR, channels=1).mono, whole) and np.array_equal(
+        registry.get(path=path, sr=TARGET_SR, channels=1, offset_seconds=2.25, duration_seconds=5.0).mono, part
+    )
+    return f"identical={same}"
+
+
+def main() -> None:
+    rng: np.random.Generator = np.random.default_rng(SEED)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir: Path = Path(tmp)
+        print(f"variants / decode count: ok={_check_variants(tmp_dir=tmp_dir, rng=rng)}")
+        print(f"librosa.load {TARGET_SR} mono: {_check_librosa(tmp_dir=tmp_dir, rng=rng)}")
+
+        path: Path = tmp_dir / "bench.wav"
+        _write_wav(path=path, rng=rng, channels=2)
+
+        t0: float = time.perf_counter()
+        for _ in range(STAGE_READS):
+            sf.read(str(path), dtype="float32", always_2d=True)
+        file_seconds: float = time.perf_counter() - t0
+
+        registry: AudioBufferRegistry = AudioBufferRegistry()
+        t0 = time.perf_counter()
+        for _ in range(STAGE_READS):
+            registry.get(path=path)
+        registry_seconds: float = time.perf_counter() - t0
+
+        print(
+            f"{SECONDS:.0f}s stereo x{STAGE_READS} reads: file={file_seconds * 1000.0:.1f}ms "
+            f"registry={registry_seconds * 1000.0:.1f}ms decodes={registry.decode_count()} "
+            f"bytes={registry.total_bytes()}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import uuid
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+
+from app.application.ports.audio.audio_buffer_port import AudioBuffer
+
+"""
+    decode 된 음원 raw PCM sidecar (.f32pcm, little-endian)
+
+    [header 64B] [float32 * channels * frames]  (channel 별로 이어서 저장 = AudioBuffer.audio [channels, samples])
+
+    header : magic "RPCM" / version (u16) / header_size (u16) / samplerate (u32) / channels (u32) / frames (u64)
+             / 원본 mtime_ns (i64) / 원본 크기 (u64)   나머지는 0 (data 64B 정렬)
+
+    파일 : 한번 쓰고 다음 stage 는 np.memmap 으로 열기만 함 (decode / resample / 복사 X)
+    shared memory : 같은 바이트를 multiprocessing.shared_memory 에 올림 -> 같은 node 의 다른 process 가 이름으로 attach
+    원본 파일이 바뀌면 (mtime / 크기) header 가 안 맞음 -> 안 씀
+"""
+
+RAW_PCM_MAGIC: bytes = b"RPCM"
+RAW_PCM_VERSION: int = 1
+RAW_PCM_SUFFIX: str = ".f32pcm"
+
+RAW_PCM_HEADER: struct.Struct = struct.Struct("<4sHHIIQqQ")
+RAW_PCM_HEADER_SIZE: int = 64
+RAW_PCM_DTYPE: np.dtype = np.dtype("<f4")
+
+# POSIX shm 이름 길이 제한 (macOS 31자) 안으로
+_SHM_PREFIX: str = "bassaudio_"
+_SHM_HASH_CHARS: int = 20
+
+
+@dataclass(frozen=True)
+class RawPcmHeader:
+    samplerate: int
+    channels: int
+    frames: int
+    source_signature: tuple[int, int]  # 원본 (mtime_ns, size)
+
+
+def raw_pcm_key(*, source_path: str, source_signature: tuple[int, int], sr: int | None, channels: int | None) -> str:
+    # 원본 경로 + 원본 상태 + 변형 -> 파일 / shm 이름 (다른 process 도 같은 이름을 계산)
+    text: str = f"{source_path}|{source_signature[0]}|{source_signature[1]}|{sr}|{channels}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def raw_pcm_path(*, raw_pcm_dir: Path, key: str) -> Path:
+    return raw_pcm_dir / key[:2] / f"{key}{RAW_PCM_SUFFIX}"
+
+
+def raw_pcm_shm_name(*, key: str) -> str:
+    return f"{_SHM_PREFIX}{key[:_SHM_HASH_CHARS]}"
+
+
+def pack_raw_pcm_header(header: RawPcmHeader) -> bytes:
+    raw: bytes = RAW_PCM_HEADER.pack(
+        RAW_PCM_MAGIC,
+        RAW_PCM_VERSION,
+        RAW_PCM_HEADER_SIZE,
+        int(header.samplerate),
+        int(header.channels),
+        int(header.frames),
+        int(header.source_signature[0]),
+        int(header.source_signature[1]),
+    )
+    return raw.ljust(RAW_PCM_HEADER_SIZE, b"\0")
+
+
+def unpack_raw_pcm_header(raw: bytes | memoryview, *, where: str) -> tuple[RawPcmHeader, int]:
+    if len(raw) < RAW_PCM_HEADER.size:
+        raise ValueError(f"raw pcm too short: {where}")
+
+    magic, version, header_size, samplerate, channels, frames, mtime_ns, size = RAW_PCM_HEADER.unpack(
+        bytes(raw[: RAW_PCM_HEADER.size])
+    )
+    if magic != RAW_PCM_MAGIC:
+        raise ValueError(f"not a raw pcm file: {where}")
+    if int(version) != RAW_PCM_VERSION:
+        raise ValueError(f"unsupported raw pcm version: {version}")
+
+    header: RawPcmHeader = RawPcmHeader(
+        samplerate=int(samplerate),
+        channels=int(channels),
+        frames=int(frames),
+        source_signature=(int(mtime_ns), int(size)),
+    )
+    return header, int(header_size)
+
+
+def _header_for(*, buffer: AudioBuffer, source_signature: tuple[int, int]) -> RawPcmHeader:
+    return RawPcmHeader(
+        samplerate=int(buffer.samplerate),
+        channels=int(buffer.audio.shape[0]),
+        frames=int(buffer.audio.shape[1]),
+        source_signature=source_signature,
+    )
+
+
+def write_raw_pcm(*, path: Path, buffer: AudioBuffer, source_signature: tuple[int, int]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data: np.ndarray = np.ascontiguousarray(buffer.audio, dtype=RAW_PCM_DTYPE)
+
+    # 다른 process 가 쓰다 만 파일을 열지 않게 임시 파일에 쓰고 rename
+    tmp_path: Path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(pack_raw_pcm_header(_header_for(buffer=buffer, source_signature=source_signature)))
+            data.tofile(f)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return path
+
+
+def open_raw_pcm(*, path: Path) -> tuple[RawPcmHeader, AudioBuffer]:
+    with path.open("rb") as f:
+        header, header_size = unpack_raw_pcm_header(f.read(RAW_PCM_HEADER.size), where=str(path))
+
+    expected_bytes: int = header_size + header.channels * header.frames * RAW_PCM_DTYPE.itemsize
+    if path.stat().st_size != expected_bytes:
+        raise ValueError(f"raw pcm size mismatch: {path}")
+
+    audio: np.ndarray = np.memmap(
+        str(path),
+        dtype=RAW_PCM_DTYPE,
+        mode="r",
+        offset=header_size,
+        shape=(header.channels, header.frames),
+    )
+    return header, AudioBuffer(audio=audio, samplerate=header.samplerate)
+
+
+def create_shared_raw_pcm(
+    *,
+    name: str,
+    buffer: AudioBuffer,
+    source_signature: tuple[int, int],
+) -> tuple[SharedMemory, AudioBuffer]:
+    header: RawPcmHeader = _header_for(buffer=buffer, source_signature=source_signature)
+    data_bytes: int = header.channels * header.frames * RAW_PCM_DTYPE.itemsize
+
+    shm: SharedMemory = SharedMemory(name=name, create=True, size=RAW_PCM_HEADER_SIZE + max(data_bytes, 1))
+    audio: np.ndarray = np.ndarray(
+        (header.channels, header.frames),
+        dtype=RAW_PCM_DTYPE,
+        buffer=shm.buf,
+        offset=RAW_PCM_HEADER_SIZE,
+    )
+    audio[...] = buffer.audio
+    audio.flags.writeable = False
+    # header 는 data 다음에 씀 -> attach 쪽은 header 가 있으면 data 도 다 있음
+    shm.buf[:RAW_PCM_HEADER_SIZE] = pack_raw_pcm_header(header)
+    return shm, AudioBuffer(audio=audio, samplerate=header.samplerate)
+
+
+def attach_shared_raw_pcm(*, name: str) -> tuple[SharedMemory, RawPcmHeader, AudioBuffer] | None:
+    # attach 한 쪽이 끝날때 resource_tracker 가 segment 를 지우지 않게 (지우는건 만든 process 만)
+    shm: SharedMemory
+    try:
+        shm = SharedMemory(name=name, create=False, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # python < 3.13 : track 인자가 없음 -> 등록된 것을 바로 해제
+        try:
+            shm = SharedMemory(name=name, create=False)
+        except FileNotFoundError:
+            return None
+        resource_tracker.unregister(getattr(shm, "_name", name), "shared_memory")
+    except FileNotFoundError:
+        return None
+
+    try:
+        header, header_size = unpack_raw_pcm_header(bytes(shm.buf[:RAW_PCM_HEADER_SIZE]), where=name)
+    except ValueError:
+        shm.close()
+        return None
+
+    audio: np.ndarray = np.ndarray(
+        (header.channels, header.frames),
+        dtype=RAW_PCM_DTYPE,
+        buffer=shm.buf,
+        offset=header_size,
+    )
+    audio.flags.writeable = False
+    return shm, header, AudioBuffer(audio=audio, samplerate=header.samplerate)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.audio.audio_buffer_registry import AudioBufferRegistry
+from app.adapters.audio.raw_pcm_format import open_raw_pcm, write_raw_pcm
+from app.application.ports.audio.audio_buffer_port import AudioBuffer
+
+"""
+    raw PCM sidecar / shared memory 확인
+        write -> np.memmap 으로 연 배열이 원래 배열 / header 와 같은지
+        raw_pcm_dir 를 같이 쓰는 두번째 registry (다른 stage 역할) 는 decode 없이 sidecar 를 여는지
+        shared_memory registry 가 올린 배열을 다른 process 가 decode 없이 attach 하는지
+        원본 wav 가 바뀌면 sidecar 를 쓰지 않는지, clear() 뒤에 sidecar 가 지워지는지
+    SECONDS 길이 stereo wav decode vs sidecar memmap 시간도 출력
+"""
+
+SAMPLERATE: int = 44100
+SECONDS: float = 60.0
+SEED: int = 0
+
+
+def _write_wav(*, path: Path, rng: np.random.Generator) -> np.ndarray:
+    audio: np.ndarray = (rng.standard_normal((int(SAMPLERATE * SECONDS), 2)) * 0.1).astype(np.float32)
+    sf.write(str(path), audio, SAMPLERATE, subtype="PCM_24")
+    return sf.read(str(path), dtype="float32", always_2d=True)[0].T
+
+
+# 다른 stage process : 같은 설정의 registry 로 받기만 함 (별도 interpreter -> resource_tracker 도 따로)
+_CHILD_CODE: str = """
+import sys
+import numpy as np
+from pathlib import Path
+from app.adapters.audio.audio_buffer_registry import AudioBufferRegistry
+
+registry = AudioBufferRegistry(shared_memory=True)
+buffer = registry.get(path=Path(sys.argv[1]), channels=1)
+print(registry.decode_count(), repr(float(np.sum(buffer.audio, dtype=np.float64))), buffer.samplerate)
+del buffer
+registry.clear()
+"""
+
+
+def _check_file_round_trip(*, tmp_dir: Path, rng: np.random.Generator) -> bool:
+    audio: np.ndarray = rng.standard_normal((2, 1234)).astype(np.float32)
+    path: Path = write_raw_pcm(
+        path=tmp_dir / "round_trip.f32pcm",
+        buffer=AudioBuffer(audio=audio, samplerate=22050),
+        source_signature=(123, 456),
+    )
+    header, buffer = open_raw_pcm(path=path)
+    return (
+        isinstance(buffer.audio, np.memmap)
+        and np.array_equal(buffer.audio, audio)
+        and buffer.samplerate == 22050
+        and header.source_signature == (123, 456)
+    )
+
+
+def _check_sidecar_handoff(*, tmp_dir: Path, wav: Path, expected: np.ndarray) -> bool:
+    raw_dir: Path = tmp_dir / "raw_pcm"
+    producer: AudioBufferRegistry = AudioBufferRegistry(raw_pcm_dir=raw_dir)
+    producer.get(path=wav)
+    producer.get(path=wav, channels=1)
+
+    consumer: AudioBufferRegistry = AudioBufferRegistry(raw_pcm_dir=raw_dir)
+    mono: AudioBuffer = consumer.get(path=wav, channels=1)
+    ok: bool = consumer.decode_count() == 0 and np.array_equal(mono.mono, np.mean(expected, axis=0))
+    ok = ok and isinstance(mono.audio, np.memmap)
+    del mono
+
+    # 원본이 바뀌면 sidecar 무시하고 decode
+    time.sleep(0.01)
+    os.utime(wav)
+    stale: AudioBufferRegistry = AudioBufferRegistry(raw_pcm_dir=raw_dir)
+    stale.get(path=wav, channels=1)
+    ok = ok and stale.decode_count() == 1
+
+    consumer.clear()
+    stale.clear()
+    producer.clear()
+    return ok and not any(raw_dir.rglob("*.f32pcm"))
+
+
+def _check_shared_memory(*, wav: Path, expected: np.ndarray) -> bool:
+    producer: AudioBufferRegistry = AudioBufferRegistry(shared_memory=True)
+    producer.get(path=wav, channels=1)
+
+    out: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-c", _CHILD_CODE, str(wav)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    decodes, total, samplerate = out.stdout.split()
+
+    producer.clear()
+    expected_total: float = float(np.sum(np.mean(expected, axis=0), dtype=np.float64))
+    return int(decodes) == 0 and int(samplerate) == SAMPLERATE and float(total) == expected_total and not out.stderr
+
+
+def main() -> None:
+    rng: np.random.Generator = np.random.default_rng(SEED)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir: Path = Path(tmp)
+        wav: Path = tmp_dir / "original.wav"
+        expected: np.ndarray = _write_wav(path=wav, rng=rng)
+
+        print(f"file round trip: ok={_check_file_round_trip(tmp_dir=tmp_dir, rng=rng)}")
+        print(f"sidecar handoff: ok={_check_sidecar_handoff(tmp_dir=tmp_dir, wav=wav, expected=expected)}")
+        print(f"shared memory handoff: ok={_check_shared_memory(wav=wav, expected=expected)}")
+
+        sidecar: Path = write_raw_pcm(
+            path=tmp_dir / "bench.f32pcm",
+            buffer=AudioBuffer(audio=expected, samplerate=SAMPLERATE),
+            source_signature=(0, 0),
+        )
+
+        t0: float = time.perf_counter()
+        sf.read(str(wav), dtype="float32", always_2d=True)
+        decode_seconds: float = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        _header, buffer = open_raw_pcm(path=sidecar)
+        open_seconds: float = time.perf_counter() - t0
+        float(np.sum(buffer.audio[:, :: SAMPLERATE]))
+
+        print(
+            f"{SECONDS:.0f}s stereo: wav decode={decode_seconds * 1000.0:.1f}ms "
+            f"memmap open={open_seconds * 1000.0:.2f}ms sidecar={sidecar.stat().st_size}B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,24 +2,51 @@ from __future__ import annotations
 
 import asyncio
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
 import basic_pitch.constants as c
 import numpy as np
 
+from app.adapters.basic_pitch.basic_pitch_model_registry import (
+    BasicPitchLoadedModel,
+    BasicPitchModelRegistry,
+    get_basic_pitch_model_registry,
+)
+from app.application.ports.audio.audio_buffer_port import AudioBuffer, AudioBufferPort
 from app.application.ports.basic_pitch.basic_pitch_port import (
     BasicPitchFramePitchDTO,
+    BasicPitchFrameTrack,
     BasicPitchNoteEventDTO,
+    BasicPitchOnsetFrameResult,
     BasicPitchParams,
     BasicPitchPort,
     BasicPitchResult,
 )
 
+# _predict_audio 가 따라 만든 basic_pitch 버전 (run_inference / predict 내부 순서)
+# 다른 버전이 설치돼 있으면 audio_buffers 가 있어도 predict(path) 사용
+# 같은지 확인 : basic_pitch_buffer_test.py
+BASIC_PITCH_VERSION: str = "0.4.0"
+
+# audio_buffers 로 추론할 때 basic_pitch.inference.predict 기본값
+PREDICT_N_OVERLAPPING_FRAMES: int = 30
+PREDICT_ONSET_THRESHOLD: float = 0.5
+PREDICT_FRAME_THRESHOLD: float = 0.3
+PREDICT_MINIMUM_NOTE_LENGTH_MS: float = 127.70
+
 
 @dataclass(frozen=True)
 class BasicPitchAdapter(BasicPitchPort):
+    # auto / tf / tflite / onnx / coreml (basic_pitch_model_registry 참고)
+    backend: str = "auto"
+    model_registry: BasicPitchModelRegistry = field(default_factory=get_basic_pitch_model_registry)
+    # job 단위 decode 보관소 (있으면 파일 대신 보관소의 22050 mono 배열로 추론)
+    audio_buffers: AudioBufferPort | None = None
+
     async def export_onset(
         self,
         *,
@@ -52,40 +79,37 @@ class BasicPitchAdapter(BasicPitchPort):
         )
         _ = note_events_obj
 
-        frame_source: str = getattr(params, "frame_source", "notes")
-
-        picked: tuple[str, np.ndarray] | None = _pick_frame_array(
+        frame_track: BasicPitchFrameTrack = _frame_track_from_output(
             model_output=model_output,
-            frame_source=frame_source,
+            params=params,
         )
-        if picked is None:
-            return []
-
-        _picked_key: str
-        arr: np.ndarray
-        _picked_key, arr = picked
+        print("basic_pitch로  리스트 추출완료")
+        return frame_track.to_dtos()
 
-        time_pitch: np.ndarray | None = _normalize_time_pitch_matrix(arr=arr)
-        if time_pitch is None:
-            return []
+    # 추론 한번 -> model_output 은 frame, note_events 는 onset 으로 같이 사용
+    async def export_onset_and_frame(
+        self,
+        *,
+        params: BasicPitchParams,
+    ) -> BasicPitchOnsetFrameResult:
+        input_wav_path: Path = params.input_wav_path
 
-        consts: dict[str, float] = _get_basic_pitch_constants()
-        frame_times: np.ndarray = _build_frame_times(
-            num_frames=int(time_pitch.shape[0]),
-            fps=float(consts["fps"]),
+        model_output: Mapping[str, Any]
+        note_events_obj: object
+        model_output, note_events_obj = await self._predict_basic_pitch(
+            input_wav_path=input_wav_path,
         )
 
-        conf_threshold: float = float(params.frame_conf_threshold)
-
-        frame_pitches: list[BasicPitchFramePitchDTO] = _extract_frame_pitches(
-            time_pitch=time_pitch,
-            frame_times=frame_times,
-            conf_threshold=conf_threshold,
-            midi_offset=float(consts["midi_offset"]),
-            bins_per_semitone=float(consts["bins_per_semitone"]),
+        note_events: list[BasicPitchNoteEventDTO] = _extract_note_events(note_events_obj)
+        frame_track: BasicPitchFrameTrack = _frame_track_from_output(
+            model_output=model_output,
+            params=params,
+        )
+        print("basic_pitch로 온셋 + 프레임 리스트 추출완료 (추론 1회)")
+        return BasicPitchOnsetFrameResult(
+            note_events=note_events,
+            frame_track=frame_track,
         )
-        print("basic_pitch로  리스트 추출완료")
-        return frame_pitches
 
     async def export_file(
         self,
@@ -108,12 +132,11 @@ class BasicPitchAdapter(BasicPitchPort):
                     frame_pitches_json_path=frame_pitches_path,
                 )
 
-        note_events: list[BasicPitchNoteEventDTO] = await self.export_onset(
-            params=params,
-        )
-        frame_pitches: list[BasicPitchFramePitchDTO] = await self.export_frame(
+        onset_frame: BasicPitchOnsetFrameResult = await self.export_onset_and_frame(
             params=params,
         )
+        note_events: list[BasicPitchNoteEventDTO] = onset_frame.note_events
+        frame_track: BasicPitchFrameTrack = onset_frame.frame_track
 
         note_payload: list[dict[str, Any]] = [
             {
@@ -127,11 +150,15 @@ class BasicPitchAdapter(BasicPitchPort):
 
         frame_payload: list[dict[str, Any]] = [
             {
-                "t": float(fp.t),
-                "pitch_midi": int(fp.pitch_midi),
-                "confidence": None if fp.confidence is None else float(fp.confidence),
+                "t": t,
+                "pitch_midi": p,
+                "confidence": c,
             }
-            for fp in frame_pitches
+            for t, p, c in zip(
+                frame_track.t.tolist(),
+                frame_track.pitch_midi.tolist(),
+                frame_track.confidence_list(),
+            )
         ]
 
         _json_dump(path=note_events_path, payload=note_payload)
@@ -152,17 +179,129 @@ class BasicPitchAdapter(BasicPitchPort):
 
         from basic_pitch.inference import predict
 
+        # 상주 모델 재사용 (처음 한번만 로드)
+        loaded: BasicPitchLoadedModel = await asyncio.to_thread(
+            self.model_registry.get,
+            backend=self.backend,
+        )
+
         def _run_predict() -> tuple[Mapping[str, Any], Any, Any]:
-            return predict(str(input_wav_path))
+            with loaded.lock:
+                return predict(str(input_wav_path), loaded.model)
+
+        def _run_predict_buffer() -> tuple[Mapping[str, Any], object]:
+            assert self.audio_buffers is not None
+            buffer: AudioBuffer = self.audio_buffers.get(
+                path=input_wav_path,
+                sr=int(c.AUDIO_SAMPLE_RATE),
+                channels=1,
+            )
+            with loaded.lock:
+                return _predict_audio(audio=buffer.mono, model=loaded.model)
 
         model_output: Mapping[str, Any]
-        _midi_data: Any
         note_events_obj: object
+        if self.audio_buffers is not None and _buffer_predict_supported():
+            model_output, note_events_obj = await asyncio.to_thread(_run_predict_buffer)
+            return model_output, note_events_obj
+
+        _midi_data: Any
         model_output, _midi_data, note_events_obj = await asyncio.to_thread(_run_predict)
 
         return model_output, note_events_obj
 
 
+@lru_cache(maxsize=1)
+def _buffer_predict_supported() -> bool:
+    try:
+        installed: str = metadata.version("basic-pitch")
+    except metadata.PackageNotFoundError:
+        installed = "unknown"
+    if installed != BASIC_PITCH_VERSION:
+        print(f"[basic_pitch] installed={installed} != {BASIC_PITCH_VERSION} -> buffer 추론 대신 predict(path) 사용")
+        return False
+    return True
+
+
+# basic_pitch.inference.predict(path) 를 배열 입력으로 (BASIC_PITCH_VERSION 기준) (파일 decode 만 빠짐, 기본 threshold 그대로)
+#   run_inference : 앞에 overlap/2 만큼 0 -> AUDIO_N_SAMPLES 창으로 잘라 model.predict -> unwrap_output
+#   predict       : model_output_to_notes (onset 0.5 / frame 0.3 / 최소 길이 127.70ms / melodia_trick)
+# midi 는 쓰지 않아서 만들지 않음
+def _predict_audio(*, audio: np.ndarray, model: object) -> tuple[Mapping[str, Any], object]:
+    from basic_pitch import note_creation
+    from basic_pitch.inference import unwrap_output, window_audio_file
+
+    overlap_len: int = PREDICT_N_OVERLAPPING_FRAMES * int(c.FFT_HOP)
+    hop_size: int = int(c.AUDIO_N_SAMPLES) - overlap_len
+
+    original_length: int = int(audio.shape[0])
+    padded: np.ndarray = np.concatenate([np.zeros((overlap_len // 2,), dtype=np.float32), audio])
+
+    output: dict[str, list[np.ndarray]] = {"note": [], "onset": [], "contour": []}
+    for window, _window_time in window_audio_file(padded, hop_size):
+        for k, v in model.predict(np.expand_dims(window, axis=0)).items():  # type: ignore[attr-defined]
+            output[k].append(v)
+
+    model_output: dict[str, np.ndarray] = {
+        k: unwrap_output(np.concatenate(v), original_length, PREDICT_N_OVERLAPPING_FRAMES) for k, v in output.items()
+    }
+
+    min_note_len: int = int(np.round(PREDICT_MINIMUM_NOTE_LENGTH_MS / 1000 * (c.AUDIO_SAMPLE_RATE / c.FFT_HOP)))
+    notes: object = note_creation.model_output_to_notes(
+        model_output,
+        onset_thresh=PREDICT_ONSET_THRESHOLD,
+        frame_thresh=PREDICT_FRAME_THRESHOLD,
+        min_note_len=min_note_len,
+        min_freq=None,
+        max_freq=None,
+        multiple_pitch_bends=False,
+        melodia_trick=True,
+    )
+    # 0.3 이하 : (midi, note_events) / 0.4 이상 : note_events
+    if isinstance(notes, tuple):
+        notes = notes[1]
+    return model_output, notes
+
+
+def _frame_track_from_output(
+    *,
+    model_output: Mapping[str, Any],
+    params: BasicPitchParams,
+) -> BasicPitchFrameTrack:
+    frame_source: str = getattr(params, "frame_source", "notes")
+
+    picked: tuple[str, np.ndarray] | None = _pick_frame_array(
+        model_output=model_output,
+        frame_source=frame_source,
+    )
+    if picked is None:
+        return BasicPitchFrameTrack.empty()
+
+    _picked_key: str
+    arr: np.ndarray
+    _picked_key, arr = picked
+
+    time_pitch: np.ndarray | None = _normalize_time_pitch_matrix(arr=arr)
+    if time_pitch is None:
+        return BasicPitchFrameTrack.empty()
+
+    consts: dict[str, float] = _get_basic_pitch_constants()
+    frame_times: np.ndarray = _build_frame_times(
+        num_frames=int(time_pitch.shape[0]),
+        fps=float(consts["fps"]),
+    )
+
+    conf_threshold: float = float(params.frame_conf_threshold)
+
+    return _extract_frame_track(
+        time_pitch=time_pitch,
+        frame_times=frame_times,
+        conf_threshold=conf_threshold,
+        midi_offset=float(consts["midi_offset"]),
+        bins_per_semitone=float(consts["bins_per_semitone"]),
+    )
+
+
 def _get_basic_pitch_constants() -> dict[str, float]:
     return {
         "fps": float(c.ANNOTATIONS_FPS),
@@ -376,36 +515,29 @@ def _build_frame_times(*, num_frames: int, fps: float) -> np.ndarray:
     return np.arange(num_frames, dtype=np.float64) / float(fps)
 
 
-def _extract_frame_pitches(
+# frame 마다 최대 bin -> threshold 이상만 남김 -> bin 을 midi 로 (전부 배열 연산)
+def _extract_frame_track(
     *,
     time_pitch: np.ndarray,
     frame_times: np.ndarray,
     conf_threshold: float,
     midi_offset: float,
     bins_per_semitone: float,
-) -> list[BasicPitchFramePitchDTO]:
+) -> BasicPitchFrameTrack:
     T: int = int(min(time_pitch.shape[0], frame_times.shape[0]))
+    if T <= 0:
+        return BasicPitchFrameTrack.empty()
 
     top_idx: np.ndarray = np.argmax(time_pitch[:T], axis=1)
-    top_val: np.ndarray = np.max(time_pitch[:T], axis=1)
+    top_val: np.ndarray = np.take_along_axis(time_pitch[:T], top_idx[:, None], axis=1)[:, 0]
 
-    out: list[BasicPitchFramePitchDTO] = []
-    for i in range(T):
-        conf: float = float(top_val[i])
-        if conf < conf_threshold:
-            continue
+    keep: np.ndarray = ~(top_val.astype(np.float64) < float(conf_threshold))
 
-        pitch_midi: int = _bin_to_midi(
-            bin_index=int(top_idx[i]),
-            midi_offset=midi_offset,
-            bins_per_semitone=bins_per_semitone,
-        )
+    # _bin_to_midi 와 같은 식 (np.round 도 round() 처럼 .5 는 짝수로)
+    midi_float: np.ndarray = float(midi_offset) + (top_idx[keep].astype(np.float64) / float(bins_per_semitone))
 
-        out.append(
-            BasicPitchFramePitchDTO(
-                t=float(frame_times[i]),
-                pitch_midi=pitch_midi,
-                confidence=conf,
-            )
-        )
-    return out
\ No newline at end of file
+    return BasicPitchFrameTrack(
+        t=frame_times[:T][keep],
+        pitch_midi=np.round(midi_float).astype(np.int16),
+        confidence=top_val[keep].astype(np.float64),
+    )
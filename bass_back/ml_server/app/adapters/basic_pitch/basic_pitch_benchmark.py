@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.basic_pitch.basic_pitch_adapter import _extract_note_events
+from app.adapters.basic_pitch.basic_pitch_model_registry import (
+    BasicPitchLoadedModel,
+    BasicPitchModelRegistry,
+)
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+
+"""
+    basic_pitch backend 별 CPU 추론 속도 / 결과 비교
+
+    backend 마다
+        로드 시간, 오디오 1초당 추론 시간 (REPEATS 회 중 최소값)
+        기준 backend 대비 model_output 최대 오차, note event 일치율
+    설치 안된 runtime 은 skip
+"""
+
+INPUT_WAV_PATH: Path = Path(r"C:\bass_project\storage\demucs\asset\test_asset_001\audio\bass_only.wav")
+BACKENDS: tuple[str, ...] = ("tf", "tflite", "onnx")
+REPEATS: int = 3
+
+# 같은 note 로 보는 시작 시간 차이 (초)
+ONSET_TOLERANCE_SECONDS: float = 0.05
+
+
+def _run(*, loaded: BasicPitchLoadedModel, path: Path) -> tuple[Mapping[str, Any], list[BasicPitchNoteEventDTO]]:
+    from basic_pitch.inference import predict
+
+    model_output, _midi_data, note_events_obj = predict(str(path), loaded.model)
+    return model_output, _extract_note_events(note_events_obj)
+
+
+def _output_max_diff(*, a: Mapping[str, Any], b: Mapping[str, Any]) -> float:
+    worst: float = 0.0
+    for key in ("note", "onset", "contour"):
+        if key not in a or key not in b:
+            continue
+        x: np.ndarray = np.asarray(a[key], dtype=np.float32)
+        y: np.ndarray = np.asarray(b[key], dtype=np.float32)
+        n: int = min(x.shape[0], y.shape[0])
+        worst = max(worst, float(np.max(np.abs(x[:n] - y[:n]))) if n > 0 else 0.0)
+    return worst
+
+
+def _note_match_ratio(*, ref: list[BasicPitchNoteEventDTO], got: list[BasicPitchNoteEventDTO]) -> float:
+    if not ref and not got:
+        return 1.0
+
+    ref_starts: dict[int, np.ndarray] = {}
+    for pitch in {e.pitch_midi for e in ref}:
+        ref_starts[pitch] = np.sort([e.start_time for e in ref if e.pitch_midi == pitch])
+
+    matched: int = 0
+    for e in got:
+        starts: np.ndarray | None = ref_starts.get(e.pitch_midi)
+        if starts is None or starts.size == 0:
+            continue
+        i: int = int(np.searchsorted(starts, e.start_time))
+        near: list[float] = [abs(float(starts[j]) - e.start_time) for j in (i - 1, i) if 0 <= j < starts.size]
+        if near and min(near) <= ONSET_TOLERANCE_SECONDS:
+            matched += 1
+    return matched / float(max(len(ref), len(got)))
+
+
+def main() -> None:
+    if not INPUT_WAV_PATH.exists():
+        print(f"input wav not found: {INPUT_WAV_PATH}")
+        return
+
+    duration: float = float(sf.info(str(INPUT_WAV_PATH)).duration)
+    print(f"input={INPUT_WAV_PATH} duration={duration:.1f}s")
+
+    registry: BasicPitchModelRegistry = BasicPitchModelRegistry()
+    reference: tuple[str, Mapping[str, Any], list[BasicPitchNoteEventDTO]] | None = None
+
+    for backend in BACKENDS:
+        try:
+            t0: float = time.perf_counter()
+            loaded: BasicPitchLoadedModel = registry.get(backend=backend)
+            load_seconds: float = time.perf_counter() - t0
+        except Exception as e:
+            print(f"[{backend}] skip ({e})")
+            continue
+
+        best: float = float("inf")
+        model_output: Mapping[str, Any] = {}
+        notes: list[BasicPitchNoteEventDTO] = []
+        for _ in range(REPEATS):
+            t0 = time.perf_counter()
+            model_output, notes = _run(loaded=loaded, path=INPUT_WAV_PATH)
+            best = min(best, time.perf_counter() - t0)
+
+        line: str = (
+            f"[{backend}] load={load_seconds:.2f}s "
+            f"infer={best:.2f}s ({best / max(duration, 1e-9) * 1000.0:.1f} ms per audio second) "
+            f"notes={len(notes)}"
+        )
+
+        if reference is None:
+            reference = (backend, model_output, notes)
+            line += " (reference)"
+        else:
+            ref_name, ref_output, ref_notes = reference
+            line += (
+                f" vs {ref_name}: output_max_diff={_output_max_diff(a=ref_output, b=model_output):.2e}"
+                f" note_match={_note_match_ratio(ref=ref_notes, got=notes) * 100.0:.1f}%"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
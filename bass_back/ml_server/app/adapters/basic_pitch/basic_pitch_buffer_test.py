@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Mapping
+
+import basic_pitch.constants as c
+import numpy as np
+import soundfile as sf
+
+from app.adapters.audio.audio_buffer_registry import AudioBufferRegistry
+from app.adapters.basic_pitch.basic_pitch_adapter import BASIC_PITCH_VERSION, _extract_note_events, _predict_audio
+from app.adapters.basic_pitch.basic_pitch_model_registry import BasicPitchLoadedModel, BasicPitchModelRegistry
+from app.application.ports.audio.audio_buffer_port import AudioBuffer
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+
+"""
+    보관소 배열 추론 (_predict_audio) vs basic_pitch.inference.predict(path) 같은 파일로 비교
+
+    보관소 22050 mono 가 librosa.load 와 같으므로 (audio_buffer_registry_test) model_output / note event 가 같아야 함
+    설치된 basic_pitch 버전이 BASIC_PITCH_VERSION 과 다르면 먼저 알림 (adapter 는 그때 predict(path) 사용)
+    INPUT_WAV_PATH 가 없으면 합성 bass 음원으로
+"""
+
+INPUT_WAV_PATH: Path = Path(r"C:\bass_project\storage\demucs\asset\test_asset_001\audio\bass_only.wav")
+BACKEND: str = "auto"
+SAMPLERATE: int = 44100
+SECONDS: float = 20.0
+SEED: int = 0
+
+
+def _fake_bass(*, path: Path) -> None:
+    rng: np.random.Generator = np.random.default_rng(SEED)
+    t: np.ndarray = np.arange(int(SAMPLERATE * 0.5), dtype=np.float64) / float(SAMPLERATE)
+    audio: np.ndarray = np.zeros(int(SAMPLERATE * SECONDS), dtype=np.float64)
+    for start in range(0, audio.size - t.size, t.size):
+        freq: float = 440.0 * 2.0 ** ((int(rng.integers(28, 52)) - 69) / 12.0)
+        audio[start : start + t.size] += 0.4 * np.exp(-3.0 * t) * np.sin(2.0 * np.pi * freq * t)
+    sf.write(str(path), np.stack([audio, audio], axis=1), SAMPLERATE, subtype="PCM_24")
+
+
+def _output_max_diff(*, a: Mapping[str, Any], b: Mapping[str, Any]) -> float:
+    worst: float = 0.0
+    for key in ("note", "onset", "contour"):
+        x: np.ndarray = np.asarray(a[key], dtype=np.float64)
+        y: np.ndarray = np.asarray(b[key], dtype=np.float64)
+        if x.shape != y.shape:
+            return float("inf")
+        worst = max(worst, float(np.max(np.abs(x - y))) if x.size else 0.0)
+    return worst
+
+
+def _compare(*, path: Path, loaded: BasicPitchLoadedModel) -> bool:
+    from basic_pitch.inference import predict
+
+    ref_output, _midi_data, ref_events_obj = predict(str(path), loaded.model)
+    ref_events: list[BasicPitchNoteEventDTO] = _extract_note_events(ref_events_obj)
+
+    registry: AudioBufferRegistry = AudioBufferRegistry()
+    buffer: AudioBuffer = registry.get(path=path, sr=int(c.AUDIO_SAMPLE_RATE), channels=1)
+    got_output, got_events_obj = _predict_audio(audio=buffer.mono, model=loaded.model)
+    got_events: list[BasicPitchNoteEventDTO] = _extract_note_events(got_events_obj)
+    registry.clear()
+
+    max_diff: float = _output_max_diff(a=ref_output, b=got_output)
+    same_events: bool = ref_events == got_events
+    print(
+        f"input={path} output_max_diff={max_diff:.3e} "
+        f"notes predict={len(ref_events)} buffer={len(got_events)} identical={same_events}"
+    )
+    return max_diff == 0.0 and same_events
+
+
+def main() -> None:
+    try:
+        installed: str = metadata.version("basic-pitch")
+    except metadata.PackageNotFoundError:
+        installed = "unknown"
+    print(f"basic_pitch installed={installed} mirrored={BASIC_PITCH_VERSION}")
+
+    loaded: BasicPitchLoadedModel = BasicPitchModelRegistry().get(backend=BACKEND)
+
+    ok: bool
+    if INPUT_WAV_PATH.exists():
+        ok = _compare(path=INPUT_WAV_PATH, loaded=loaded)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path: Path = Path(tmp) / "bass_only.wav"
+            _fake_bass(path=path)
+            ok = _compare(path=path, loaded=loaded)
+
+    print("buffer 추론 = predict(path)" if ok else "buffer 추론 결과가 predict(path) 와 다름")
+
+
+if __name__ == "__main__":
+    main()
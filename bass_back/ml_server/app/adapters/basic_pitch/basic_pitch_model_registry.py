@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from basic_pitch import ICASSP_2022_MODEL_PATH, FilenameSuffix, build_icassp_2022_model_path
+from basic_pitch.inference import Model
+
+"""
+    프로세스 단위 basic_pitch 모델 보관소 (backend -> 로드된 Model)
+
+    predict(path) 는 호출마다 모델 파일을 다시 읽음
+    -> worker 시작 시 한번 로드해서 predict(path, model) 로 재사용
+
+    backend
+        auto   : basic_pitch 기본값 (설치된 runtime 중 tf > coreml > tflite > onnx 순)
+        tf     : TensorFlow SavedModel
+        tflite : TFLite (tflite-runtime 또는 tensorflow 필요)
+        onnx   : ONNX Runtime
+        coreml : CoreML (macOS)
+"""
+
+BASIC_PITCH_BACKENDS: tuple[str, ...] = ("auto", "tf", "tflite", "onnx", "coreml")
+
+
+def basic_pitch_model_path(*, backend: str) -> Path:
+    if backend == "auto":
+        return Path(ICASSP_2022_MODEL_PATH)
+    if backend not in BASIC_PITCH_BACKENDS:
+        raise ValueError(f"unknown basic_pitch backend: {backend} (choose from {BASIC_PITCH_BACKENDS})")
+    return Path(build_icassp_2022_model_path(FilenameSuffix[backend]))
+
+
+@dataclass(frozen=True)
+class BasicPitchLoadedModel:
+    backend: str
+    model_path: Path
+    model: Model
+    # tflite interpreter 는 thread-safe 가 아니라서 추론은 모델마다 한번에 하나씩
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+class BasicPitchModelRegistry:
+    def __init__(self) -> None:
+        self._models: dict[str, BasicPitchLoadedModel] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, *, backend: str) -> BasicPitchLoadedModel:
+        name: str = str(backend)
+
+        with self._lock:
+            hit: BasicPitchLoadedModel | None = self._models.get(name)
+            if hit is not None:
+                return hit
+
+            model_path: Path = basic_pitch_model_path(backend=name)
+            loaded: BasicPitchLoadedModel = BasicPitchLoadedModel(
+                backend=name,
+                model_path=model_path,
+                model=Model(model_path),
+            )
+            self._models[name] = loaded
+            print(f"[basic-pitch-registry] load backend={name} path={model_path}")
+            return loaded
+
+    def preload(self, *, backends: list[str]) -> list[str]:
+        loaded_names: list[str] = []
+        for name in backends:
+            if not name:
+                continue
+            self.get(backend=name)
+            loaded_names.append(str(name))
+        return loaded_names
+
+    def loaded_backends(self) -> list[str]:
+        with self._lock:
+            return list(self._models.keys())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+_DEFAULT_REGISTRY: BasicPitchModelRegistry = BasicPitchModelRegistry()
+
+
+def get_basic_pitch_model_registry() -> BasicPitchModelRegistry:
+    return _DEFAULT_REGISTRY
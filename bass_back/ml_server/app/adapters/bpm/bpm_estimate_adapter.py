@@ -8,8 +8,9 @@ from typing import Any
 
 import numpy as np
 
+from app.application.ports.audio.audio_buffer_port import AudioBuffer, AudioBufferPort
 from app.application.ports.bpm.bpm_port import BpmEstimatePort, BpmEstimateAdapterConfig
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack, as_note_track
 from app.domain.bpm_domain import BpmEstimationError
 
 
@@ -23,14 +24,21 @@ class LibrosaBpmEstimator(BpmEstimatePort):
 
     """
 
-    def __init__(self, *, cfg: BpmEstimateAdapterConfig | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        cfg: BpmEstimateAdapterConfig | None = None,
+        audio_buffers: AudioBufferPort | None = None,
+    ) -> None:
         self._cfg: BpmEstimateAdapterConfig = cfg or BpmEstimateAdapterConfig()
+        # job 단위 decode 보관소 (있으면 librosa.load 대신 보관소 배열 사용)
+        self._audio_buffers: AudioBufferPort | None = audio_buffers
 
     async def estimate_bpm(
         self,
         *,
         input_wav_path: Path,
-        note: list[BasicPitchNoteEventDTO],
+        note: list[BasicPitchNoteEventDTO] | NoteTrack,
         start_seconds: float = 0.0,
         duration_seconds: float | None = None,
         sr: int = 22050,
@@ -129,20 +137,30 @@ class LibrosaBpmEstimator(BpmEstimatePort):
         start_seconds: float,
         duration_seconds: float | None,
         sr: int,
-        note: list[BasicPitchNoteEventDTO],
+        note: list[BasicPitchNoteEventDTO] | NoteTrack,
     ) -> int:
         import librosa  # type: ignore
 
         y: np.ndarray
         sr_loaded: int
 
-        y, sr_loaded = librosa.load(
-            path=str(input_audio_path),
-            sr=sr,
-            mono=True,
-            offset=start_seconds,
-            duration=duration_seconds,
-        )
+        if self._audio_buffers is not None:
+            buffer: AudioBuffer = self._audio_buffers.get(
+                path=input_audio_path,
+                sr=sr,
+                channels=1,
+                offset_seconds=start_seconds,
+                duration_seconds=duration_seconds,
+            )
+            y, sr_loaded = buffer.mono, buffer.samplerate
+        else:
+            y, sr_loaded = librosa.load(
+                path=str(input_audio_path),
+                sr=sr,
+                mono=True,
+                offset=start_seconds,
+                duration=duration_seconds,
+            )
 
         if y.size < sr_loaded:
             raise BpmEstimationError("audio too short to estimate bpm")
@@ -406,12 +424,11 @@ class LibrosaBpmEstimator(BpmEstimatePort):
         self,
         *,
         beat_time: list[float],
-        note: list[BasicPitchNoteEventDTO],
+        note: list[BasicPitchNoteEventDTO] | NoteTrack,
         configs: BpmEstimateAdapterConfig,
     ) -> float:
 
-        start_time_list: list[float] = [float(st.start_time) for st in note]
-        start_time_list.sort()
+        start_time_list: list[float] = np.sort(as_note_track(note).start_time).tolist()
 
         if not start_time_list or not beat_time:
             return -1.0
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import shutil
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
@@ -11,9 +12,16 @@ import numpy as np
 import soundfile as sf
 import torch
 from demucs.apply import apply_model
-from demucs.audio import AudioFile
-from demucs.pretrained import get_model
-
+from demucs.audio import AudioFile, convert_audio
+
+from app.adapters.demucs.demucs_dsp import apply_dsp_chain
+from app.adapters.demucs.demucs_mix import DSP_META_FILENAME, NO_BASS_FILENAME, mix_boost, mix_sum, to_pcm24, write_pcm24
+from app.adapters.demucs.demucs_model_registry import (
+    DemucsLoadedModel,
+    DemucsModelRegistry,
+    get_demucs_model_registry,
+)
+from app.application.ports.audio.audio_buffer_port import AudioBuffer, AudioBufferPort
 from app.application.ports.demucs.demucs_port import (
     DemucsPort,
     DemucsSplitSetting,
@@ -28,6 +36,9 @@ from app.application.ports.demucs.demucs_port import (
 """
 @dataclass(frozen=True)
 class DemucsAdapter(DemucsPort):
+    model_registry: DemucsModelRegistry = field(default_factory=get_demucs_model_registry)
+    # job 단위 decode 보관소 (있으면 original 을 여기서 decode -> 다음 stage 가 재사용)
+    audio_buffers: AudioBufferPort | None = None
 
     async def split(
         self,
@@ -83,6 +94,10 @@ class DemucsAdapter(DemucsPort):
             demucs_model=str(setting.demucs_model),
             overwrite_outputs=bool(setting.overwrite_outputs),
             cleanup_stems=bool(setting.cleanup_stems),
+            make_bass_removed=bool(setting.make_bass_removed),
+            make_bass_boosted=bool(setting.make_bass_boosted),
+            stream_segment_seconds=float(setting.stream_segment_seconds),
+            stream_overlap_seconds=float(setting.stream_overlap_seconds),
             enable_dsp=bool(dsp.enable_dsp),
 
             dsp_highpass_hz=float(dsp.dsp_highpass_hz),
@@ -110,6 +125,10 @@ class DemucsAdapter(DemucsPort):
             demucs_model=str(setting.demucs_model),
             overwrite_outputs=bool(setting.overwrite_outputs),
             cleanup_stems=bool(setting.cleanup_stems),
+            make_bass_removed=bool(setting.make_bass_removed),
+            make_bass_boosted=bool(setting.make_bass_boosted),
+            stream_segment_seconds=float(setting.stream_segment_seconds),
+            stream_overlap_seconds=float(setting.stream_overlap_seconds),
             enable_dsp=bool(dsp.enable_dsp),
             dsp_highpass_hz=float(dsp.dsp_highpass_hz),
             dsp_lowpass_hz=float(dsp.dsp_lowpass_hz),
@@ -128,6 +147,10 @@ class DemucsAdapter(DemucsPort):
         demucs_model: str,
         overwrite_outputs: bool,
         cleanup_stems: bool,
+        make_bass_removed: bool,
+        make_bass_boosted: bool,
+        stream_segment_seconds: float,
+        stream_overlap_seconds: float,
         enable_dsp: bool,
         dsp_highpass_hz: float,
         dsp_lowpass_hz: float,
@@ -140,111 +163,139 @@ class DemucsAdapter(DemucsPort):
         if boosted_volume_db < -24.0 or boosted_volume_db > 24.0:
             raise ValueError("too much boosted volume")
 
+        streaming: bool = stream_segment_seconds > 0.0
+        if streaming:
+            if stream_overlap_seconds < 0.0 or stream_overlap_seconds * 2.0 >= stream_segment_seconds:
+                raise ValueError("stream_overlap_seconds must be >= 0 and < stream_segment_seconds / 2")
+            # dsp(compressor/limiter)는 곡 전체 상태가 필요해서 streaming 과 같이 못씀
+            if enable_dsp:
+                raise ValueError("enable_dsp is not supported with stream_segment_seconds > 0")
+
         asset_dir: Path = output_dir / "asset" / asset_id
         audio_dir: Path = asset_dir / "audio"
         stem_dir_root: Path = asset_dir / "stem"
         audio_dir.mkdir(parents=True, exist_ok=True)
-        stem_dir_root.mkdir(parents=True, exist_ok=True)
 
         run_id: str = uuid.uuid4().hex
         demucs_tmp_dir: Path = stem_dir_root / f"_demucs_tmp_{run_id}"
-        demucs_tmp_dir.mkdir(parents=True, exist_ok=True)
 
         original_copy: Path = audio_dir / "original.wav"
         bass_only: Path = audio_dir / "bass_only.wav"
         bass_removed: Path = audio_dir / "bass_removed.wav"
         bass_boosted: Path = audio_dir / "bass_boosted.wav"
-
-        required_outputs: list[Path] = (
-            [bass_only]
-            if mode == "bass_only"
-            else [original_copy, bass_only, bass_removed, bass_boosted]
-        )
+        no_bass: Path = audio_dir / NO_BASS_FILENAME
+
+        # bass_only 모드 / 요청 안 된 파생 음원은 아예 만들지 않음
+        # full 모드에서 bass_removed 를 안 만들면 stem 합을 no_bass 로 남김 (나중에 DerivedAudioAdapter 가 씀)
+        # dsp 켠 job 은 DerivedAudioAdapter 가 거절 -> no_bass 도 안 남김
+        output_paths: dict[str, Path] = {"bass_only": bass_only}
+        if mode == "full":
+            if make_bass_removed:
+                output_paths["bass_removed"] = bass_removed
+            elif not enable_dsp:
+                output_paths["no_bass"] = no_bass
+            if make_bass_boosted:
+                output_paths["bass_boosted"] = bass_boosted
+
+        required_outputs: list[Path] = list(output_paths.values())
+        if mode == "full":
+            required_outputs.insert(0, original_copy)
 
         if not overwrite_outputs:
             for p in required_outputs:
                 if p.exists():
                     raise FileExistsError(f"Output already exists: {p}")
 
-        try:
-            # full 모드: original.wav 보관
-            if mode == "full":
-                self._copy_file(
-                    input_path=input_wav_path,
-                    output_path=original_copy,
-                    overwrite=overwrite_outputs,
-                )
-
-            # demucs 추론 → stem 임시 저장
-            model, samplerate, audio_channels = self._load_model(demucs_model=demucs_model)
+        # full 모드: original.wav 보관
+        if mode == "full":
+            self._copy_file(
+                input_path=input_wav_path,
+                output_path=original_copy,
+                overwrite=overwrite_outputs,
+            )
 
-            wav: torch.Tensor = self._read_audio(
-                input_path=(original_copy if mode == "full" else input_wav_path),
+        model, samplerate, audio_channels = self._load_model(demucs_model=demucs_model)
+        # buffer 보관소를 쓰면 복사본 대신 원본 경로로 decode (내용 같음, bpm 이 같은 key 로 재사용)
+        separate_input: Path = original_copy if mode == "full" and self.audio_buffers is None else input_wav_path
+        needed_stems: list[str] = self._needed_stems(names=list(output_paths.keys()))
+        dsp_meta: dict[str, object] = {
+            "enable_dsp": enable_dsp,
+            "dsp_highpass_hz": dsp_highpass_hz,
+            "dsp_lowpass_hz": dsp_lowpass_hz,
+            "dsp_force_mono": dsp_force_mono,
+            "dsp_compress": dsp_compress,
+        }
+
+        if streaming:
+            self._separate_streaming(
+                model=model,
                 samplerate=samplerate,
                 audio_channels=audio_channels,
+                input_path=separate_input,
+                output_paths=output_paths,
+                needed_stems=needed_stems,
+                stems_dir=(None if cleanup_stems else demucs_tmp_dir),
+                boosted_volume_db=boosted_volume_db,
+                segment_seconds=stream_segment_seconds,
+                overlap_seconds=stream_overlap_seconds,
+                overwrite=overwrite_outputs,
             )
+            self._write_dsp_meta(path=audio_dir / DSP_META_FILENAME, dsp_meta=dsp_meta)
+            print("demucs분리작업 완료 (streaming)")
+            return bass_only
+
+        # demucs 추론 → stem 배열 (파일로 쓰지 않음)
+        wav: torch.Tensor = self._read_audio(
+            input_path=separate_input,
+            samplerate=samplerate,
+            audio_channels=audio_channels,
+        )
 
-            sources: torch.Tensor = self._infer_sources(model=model, wav=wav)
+        sources: torch.Tensor = self._infer_sources(model=model, wav=wav)
+        del wav
 
-            stem_paths: dict[str, Path] = self._save_stems(
-                sources=sources,
-                model=model,
+        stems: dict[str, np.ndarray] = self._map_stems(
+            sources=sources,
+            model=model,
+            names=needed_stems,
+        )
+
+        # cleanup_stems=False 일때만 디버깅용으로 (필요한) stem 보관
+        if not cleanup_stems:
+            self._save_stems(
+                stems=stems,
                 samplerate=samplerate,
                 demucs_tmp_dir=demucs_tmp_dir,
             )
 
-            # bass_only 생성 (항상)
-            bass_src: Path = self._require_stem(stem_paths=stem_paths, name="bass")
-            self._copy_file(
-                input_path=bass_src,
-                output_path=bass_only,
-                overwrite=overwrite_outputs,
-            )
-
-            # full 모드에서만 파생 생성
-            if mode == "full":
-                vocals_src: Path = self._require_stem(stem_paths=stem_paths, name="vocals")
-                drums_src: Path = self._require_stem(stem_paths=stem_paths, name="drums")
-                other_src: Path = self._require_stem(stem_paths=stem_paths, name="other")
-
-                await self._make_bass_removed(
-                    vocals_src=vocals_src,
-                    drums_src=drums_src,
-                    other_src=other_src,
-                    out_path=bass_removed,
-                    overwrite=overwrite_outputs,
-                )
-
-                await self._make_bass_boosted(
-                    bass_removed_path=bass_removed,
-                    bass_only_path=bass_only,
-                    out_path=bass_boosted,
-                    gain_db=boosted_volume_db,
-                    overwrite=overwrite_outputs,
-                )
+        outputs: dict[str, np.ndarray] = self._build_outputs(
+            stems=stems,
+            names=list(output_paths.keys()),
+            boosted_volume_db=boosted_volume_db,
+        )
 
-            if enable_dsp:
-                if mode == "bass_only":
-                    await self._dsp_inplace(
-                        path=bass_only,
-                        dsp_highpass_hz=dsp_highpass_hz,
-                        dsp_lowpass_hz=dsp_lowpass_hz,
-                        dsp_force_mono=dsp_force_mono,
-                        dsp_compress=dsp_compress,
-                    )
-                else:
-                    for p in [bass_only, bass_removed, bass_boosted]:
-                        await self._dsp_inplace(
-                            path=p,
-                            dsp_highpass_hz=dsp_highpass_hz,
-                            dsp_lowpass_hz=dsp_lowpass_hz,
-                            dsp_force_mono=dsp_force_mono,
-                            dsp_compress=dsp_compress,
-                        )
+        # dsp는 저장 전에 메모리에서 처리 (numpy / scipy 계산 -> event loop 막지 않게 thread 에서)
+        if enable_dsp:
+            processed: list[np.ndarray] = await asyncio.to_thread(
+                apply_dsp_chain,
+                audios=list(outputs.values()),
+                samplerate=samplerate,
+                dsp_highpass_hz=dsp_highpass_hz,
+                dsp_lowpass_hz=dsp_lowpass_hz,
+                dsp_force_mono=dsp_force_mono,
+                dsp_compress=dsp_compress,
+            )
+            outputs = dict(zip(outputs.keys(), processed))
 
-        finally:
-            if cleanup_stems:
-                shutil.rmtree(demucs_tmp_dir, ignore_errors=True)
+        for name, audio in outputs.items():
+            self._write_output(
+                path=output_paths[name],
+                audio=audio,
+                samplerate=samplerate,
+                overwrite=overwrite_outputs,
+            )
+        del outputs
+        self._write_dsp_meta(path=audio_dir / DSP_META_FILENAME, dsp_meta=dsp_meta)
 
         print("demucs분리작업 완료")
         return bass_only
@@ -266,22 +317,29 @@ class DemucsAdapter(DemucsPort):
         4) stem 분리
     """
 
-    # 모델 로드하는 코드
+    # 모델 로드하는 코드 (registry에 상주한 모델 재사용)
     def _load_model(self, *, demucs_model: str) -> tuple[object, int, int]:
-        model: object = get_model(name=str(demucs_model))
-        # type: ignore[attr-defined]
-        model.cpu()  # type: ignore[union-attr]
-        model.eval()  # type: ignore[union-attr]
-        samplerate: int = int(getattr(model, "samplerate", 44100))
-        audio_channels: int = int(getattr(model, "audio_channels", 2))
-        return model, samplerate, audio_channels
+        loaded: DemucsLoadedModel = self.model_registry.get(demucs_model=str(demucs_model))
+        return loaded.model, loaded.samplerate, loaded.audio_channels
 
     # wav파일을 demucs가 추론가능한 형태로 읽어옴
+    # audio_buffers 가 있으면 보관소 decode 결과 + convert_audio (streaming 분리와 같은 변환)
     def _read_audio(self, *, input_path: Path, samplerate: int, audio_channels: int) -> torch.Tensor:
-        wav: torch.Tensor = AudioFile(str(input_path)).read(
-            samplerate=int(samplerate),
-            channels=int(audio_channels),
-        )
+        wav: torch.Tensor
+        if self.audio_buffers is not None:
+            buffer: AudioBuffer = self.audio_buffers.get(path=input_path)
+            # 보관소 배열은 읽기 전용 -> 복사해서 tensor 로
+            wav = convert_audio(
+                torch.tensor(buffer.audio),
+                int(buffer.samplerate),
+                int(samplerate),
+                int(audio_channels),
+            )
+        else:
+            wav = AudioFile(str(input_path)).read(
+                samplerate=int(samplerate),
+                channels=int(audio_channels),
+            )
         return self._ensure_batched_wav(wav=wav)
 
     #
@@ -298,14 +356,21 @@ class DemucsAdapter(DemucsPort):
             )
         return self._ensure_sources_3d(sources=sources)
 
-    def _save_stems(
+    # 출력 이름 -> 만들때 필요한 stem 이름
+    def _needed_stems(self, *, names: list[str]) -> list[str]:
+        needed: list[str] = ["bass"]
+        if any(name in names for name in ("bass_removed", "bass_boosted", "no_bass")):
+            needed += ["vocals", "drums", "other"]
+        return needed
+
+    # sources [stem, channels, time] -> {stem 이름: [channels, time] 배열} (names 에 있는 것만)
+    def _map_stems(
         self,
         *,
         sources: torch.Tensor,
         model: object,
-        samplerate: int,
-        demucs_tmp_dir: Path,
-    ) -> dict[str, Path]:
+        names: list[str],
+    ) -> dict[str, np.ndarray]:
         stem_names: list[str] = list(getattr(model, "sources", []))
         if not stem_names:
             raise RuntimeError("Demucs model.sources is empty; cannot map stems.")
@@ -314,53 +379,253 @@ class DemucsAdapter(DemucsPort):
                 f"Unexpected sources shape. got={tuple(sources.shape)} sources={stem_names}"
             )
 
+        arr: np.ndarray = sources.detach().cpu().numpy().astype(np.float32, copy=False)
+        return {name: arr[i] for i, name in enumerate(stem_names) if name in names}
+
+    def _save_stems(
+        self,
+        *,
+        stems: dict[str, np.ndarray],
+        samplerate: int,
+        demucs_tmp_dir: Path,
+    ) -> dict[str, Path]:
         stem_paths: dict[str, Path] = {}
-        for i, name in enumerate(stem_names):
+        for name, audio in stems.items():
             stem_path: Path = demucs_tmp_dir / f"{name}.wav"
-            self._write_wav(path=stem_path, audio=sources[i], samplerate=int(samplerate))
+            write_pcm24(path=stem_path, audio=audio, samplerate=int(samplerate))
             stem_paths[name] = stem_path
 
         return stem_paths
 
-    def _require_stem(self, *, stem_paths: dict[str, Path], name: str) -> Path:
-        p: Path | None = stem_paths.get(name)
-        if p is None:
-            raise RuntimeError(f"Demucs stem missing: {name}. got={list(stem_paths.keys())}")
-        return p
+    def _require_stem(self, *, stems: dict[str, np.ndarray], name: str) -> np.ndarray:
+        x: np.ndarray | None = stems.get(name)
+        if x is None:
+            raise RuntimeError(f"Demucs stem missing: {name}. got={list(stems.keys())}")
+        return x
+
+    # ffmpeg amix=inputs=3:normalize=0 과 동일
+    def _make_bass_removed(
+        self,
+        *,
+        vocals_src: np.ndarray,
+        drums_src: np.ndarray,
+        other_src: np.ndarray,
+    ) -> np.ndarray:
+        return mix_sum(stems=[vocals_src, drums_src, other_src])
+
+    # ffmpeg volume=XdB + amix=inputs=2:normalize=0 과 동일
+    def _make_bass_boosted(
+        self,
+        *,
+        bass_removed: np.ndarray,
+        bass_only: np.ndarray,
+        gain_db: float,
+    ) -> np.ndarray:
+        return mix_boost(base=bass_removed, boost=bass_only, gain_db=float(gain_db))
 
-    async def _make_bass_removed(
+    # stem 배열 -> 출력 이름별 배열 (bass_only / bass_removed / bass_boosted / no_bass)
+    def _build_outputs(
         self,
         *,
-        vocals_src: Path,
-        drums_src: Path,
-        other_src: Path,
-        out_path: Path,
+        stems: dict[str, np.ndarray],
+        names: list[str],
+        boosted_volume_db: float,
+    ) -> dict[str, np.ndarray]:
+        bass_src: np.ndarray = self._require_stem(stems=stems, name="bass")
+        outputs: dict[str, np.ndarray] = {"bass_only": bass_src}
+
+        if any(name in names for name in ("bass_removed", "bass_boosted", "no_bass")):
+            vocals_src: np.ndarray = self._require_stem(stems=stems, name="vocals")
+            drums_src: np.ndarray = self._require_stem(stems=stems, name="drums")
+            other_src: np.ndarray = self._require_stem(stems=stems, name="other")
+
+            removed: np.ndarray = self._make_bass_removed(
+                vocals_src=vocals_src,
+                drums_src=drums_src,
+                other_src=other_src,
+            )
+            if "bass_removed" in names:
+                outputs["bass_removed"] = removed
+            if "no_bass" in names:
+                outputs["no_bass"] = removed
+            if "bass_boosted" in names:
+                outputs["bass_boosted"] = self._make_bass_boosted(
+                    bass_removed=removed,
+                    bass_only=bass_src,
+                    gain_db=boosted_volume_db,
+                )
+
+        return {name: outputs[name] for name in names}
+
+    """
+        streaming 분리 : 입력을 겹치는 구간으로 디스크에서 읽음 -> 구간마다 demucs
+        -> 겹친 부분은 crossfade -> 확정된 부분만 출력 wav 뒤에 이어씀
+        메모리는 곡 길이가 아니라 segment 길이에 비례
+    """
+    def _separate_streaming(
+        self,
+        *,
+        model: object,
+        samplerate: int,
+        audio_channels: int,
+        input_path: Path,
+        output_paths: dict[str, Path],
+        needed_stems: list[str],
+        stems_dir: Path | None,
+        boosted_volume_db: float,
+        segment_seconds: float,
+        overlap_seconds: float,
         overwrite: bool,
     ) -> None:
-        if out_path.exists() and overwrite:
-            out_path.unlink()
-        await self._mix_many(
-            input_paths=[vocals_src, drums_src, other_src],
-            output_path=out_path,
+        stem_names: list[str] = list(getattr(model, "sources", []))
+        if not stem_names:
+            raise RuntimeError("Demucs model.sources is empty; cannot map stems.")
+
+        writers: dict[str, sf.SoundFile] = {}
+        try:
+            for name, path in output_paths.items():
+                writers[name] = self._open_pcm24_writer(
+                    path=path,
+                    samplerate=samplerate,
+                    channels=audio_channels,
+                    overwrite=overwrite,
+                )
+            if stems_dir is not None:
+                for name in needed_stems:
+                    writers[f"stem:{name}"] = self._open_pcm24_writer(
+                        path=stems_dir / f"{name}.wav",
+                        samplerate=samplerate,
+                        channels=audio_channels,
+                        overwrite=True,
+                    )
+
+            def emit(chunk: np.ndarray) -> None:
+                if chunk.shape[-1] <= 0:
+                    return
+                stems: dict[str, np.ndarray] = {
+                    name: chunk[i] for i, name in enumerate(stem_names) if name in needed_stems
+                }
+                outputs: dict[str, np.ndarray] = self._build_outputs(
+                    stems=stems,
+                    names=list(output_paths.keys()),
+                    boosted_volume_db=boosted_volume_db,
+                )
+                for name, audio in outputs.items():
+                    self._write_chunk(writer=writers[name], audio=audio)
+                if stems_dir is not None:
+                    for name, audio in stems.items():
+                        self._write_chunk(writer=writers[f"stem:{name}"], audio=audio)
+
+            with sf.SoundFile(str(input_path), mode="r") as src:
+                in_sr: int = int(src.samplerate)
+                total: int = int(src.frames)
+                seg: int = max(1, int(round(segment_seconds * in_sr)))
+                hop: int = max(1, seg - int(round(overlap_seconds * in_sr)))
+                ratio: float = float(samplerate) / float(in_sr)
+
+                pending: np.ndarray | None = None
+                start: int = 0
+                while start < total:
+                    src.seek(start)
+                    frames: np.ndarray = src.read(frames=seg, dtype="float32", always_2d=True)
+                    if frames.shape[0] == 0:
+                        break
+
+                    out: np.ndarray = self._separate_segment(
+                        model=model,
+                        frames=frames,
+                        in_samplerate=in_sr,
+                        samplerate=samplerate,
+                        audio_channels=audio_channels,
+                    )
+
+                    if pending is not None:
+                        out = self._crossfade(prev_tail=pending, cur=out)
+                        pending = None
+
+                    is_last: bool = start + seg >= total
+                    if is_last:
+                        emit(out)
+                        break
+
+                    # 다음 구간 시작점 이후는 다음 구간과 crossfade 하려고 보류
+                    cur_start_out: int = int(round(start * ratio))
+                    next_start_out: int = int(round((start + hop) * ratio))
+                    keep: int = max(0, min(out.shape[-1], next_start_out - cur_start_out))
+                    emit(out[..., :keep])
+                    pending = out[..., keep:].copy()
+                    del out
+
+                    start += hop
+
+                if pending is not None:
+                    emit(pending)
+        finally:
+            for w in writers.values():
+                w.close()
+
+    def _separate_segment(
+        self,
+        *,
+        model: object,
+        frames: np.ndarray,
+        in_samplerate: int,
+        samplerate: int,
+        audio_channels: int,
+    ) -> np.ndarray:
+        wav: torch.Tensor = torch.from_numpy(np.ascontiguousarray(frames.T))
+        wav = convert_audio(wav, int(in_samplerate), int(samplerate), int(audio_channels))
+        sources: torch.Tensor = self._infer_sources(model=model, wav=self._ensure_batched_wav(wav=wav))
+        return sources.detach().cpu().numpy().astype(np.float32, copy=False)
+
+    # 겹친 구간 : 이전 구간 fade-out + 현재 구간 fade-in (선형)
+    def _crossfade(self, *, prev_tail: np.ndarray, cur: np.ndarray) -> np.ndarray:
+        n: int = int(min(prev_tail.shape[-1], cur.shape[-1]))
+        if n <= 0:
+            return cur
+        fade_in: np.ndarray = np.linspace(0.0, 1.0, n, endpoint=False, dtype=np.float32)
+        out: np.ndarray = np.array(cur, copy=True)
+        out[..., :n] = prev_tail[..., :n] * (1.0 - fade_in) + cur[..., :n] * fade_in
+        return out
+
+    def _open_pcm24_writer(
+        self,
+        *,
+        path: Path,
+        samplerate: int,
+        channels: int,
+        overwrite: bool,
+    ) -> sf.SoundFile:
+        if path.exists() and overwrite:
+            path.unlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return sf.SoundFile(
+            str(path),
+            mode="w",
+            samplerate=int(samplerate),
+            channels=int(channels),
+            subtype="PCM_24",
         )
 
-    async def _make_bass_boosted(
+    def _write_chunk(self, *, writer: sf.SoundFile, audio: np.ndarray) -> None:
+        writer.write(to_pcm24(audio=audio).T)
+
+    def _write_output(
         self,
         *,
-        bass_removed_path: Path,
-        bass_only_path: Path,
-        out_path: Path,
-        gain_db: float,
+        path: Path,
+        audio: np.ndarray,
+        samplerate: int,
         overwrite: bool,
     ) -> None:
-        if out_path.exists() and overwrite:
-            out_path.unlink()
-        await self._mix_boost(
-            input_path_first=bass_removed_path,
-            input_path_second=bass_only_path,
-            output_path=out_path,
-            gain_db=float(gain_db),
-        )
+        if path.exists() and overwrite:
+            path.unlink()
+        write_pcm24(path=path, audio=audio, samplerate=int(samplerate))
+
+    # bass_only.wav 가 어떤 dsp 를 거쳤는지 (DerivedAudioAdapter 가 확인)
+    def _write_dsp_meta(self, *, path: Path, dsp_meta: dict[str, object]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(dsp_meta, ensure_ascii=False), encoding="utf-8")
 
     """  
         audlifile -> 2차원
@@ -382,148 +647,3 @@ class DemucsAdapter(DemucsPort):
         if sources.dim() == 3:
             return sources
         raise RuntimeError(f"Unexpected sources shape: {tuple(sources.shape)}")
-
-    # 실제 wav파일로 저장하는 함수
-    def _write_wav(self, *, path: Path, audio: torch.Tensor, samplerate: int) -> None:
-        x: np.ndarray = audio.detach().cpu().numpy().astype(np.float32)
-        if x.ndim != 2:
-            raise ValueError(f"audio must be [channels, time]. got shape={x.shape}")
-        x = np.transpose(x, (1, 0))
-        path.parent.mkdir(parents=True, exist_ok=True)
-        sf.write(str(path), x, int(samplerate), subtype="PCM_24")
-
-    #
-    async def _mix_many(self, *, input_paths: list[Path], output_path: Path) -> None:
-        if len(input_paths) < 2:
-            raise ValueError("input_paths must have at least 2 paths")
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        cmd: list[str] = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
-        for p in input_paths:
-            cmd += ["-i", str(p)]
-
-        cmd += [
-            "-filter_complex",
-            f"amix=inputs={len(input_paths)}:normalize=0[outa]",
-            "-map",
-            "[outa]",
-            "-c:a",
-            "pcm_s24le",
-            str(output_path),
-        ]
-
-        await self._run_ffmpeg(cmd=cmd, err_prefix="ffmpeg mix_many failed")
-
-    async def _mix_boost(
-        self,
-        *,
-        input_path_first: Path,
-        input_path_second: Path,
-        output_path: Path,
-        gain_db: float,
-    ) -> None:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        cmd: list[str] = [
-            "ffmpeg",
-            "-y",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-i",
-            str(input_path_first),
-            "-i",
-            str(input_path_second),
-            "-filter_complex",
-            f"[1:a]volume={gain_db}dB[a1];[0:a][a1]amix=inputs=2:normalize=0[outa]",
-            "-map",
-            "[outa]",
-            "-c:a",
-            "pcm_s24le",
-            str(output_path),
-        ]
-
-        await self._run_ffmpeg(cmd=cmd, err_prefix="ffmpeg mix/boost failed")
-
-    async def _dsp_inplace(
-        self,
-        *,
-        path: Path,
-        dsp_highpass_hz: float,
-        dsp_lowpass_hz: float,
-        dsp_force_mono: bool,
-        dsp_compress: bool,
-    ) -> None:
-        if not path.exists():
-            raise FileNotFoundError(f"dsp target not found: {path}")
-
-        tmp_path: Path = path.with_suffix(".dsp.tmp.wav")
-        if tmp_path.exists():
-            tmp_path.unlink()
-
-        filt: str = self._build_dsp_filter(
-            dsp_highpass_hz=dsp_highpass_hz,
-            dsp_lowpass_hz=dsp_lowpass_hz,
-            dsp_force_mono=dsp_force_mono,
-            dsp_compress=dsp_compress,
-        )
-
-        cmd: list[str] = [
-            "ffmpeg",
-            "-y",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-i",
-            str(path),
-            "-af",
-            filt,
-            "-c:a",
-            "pcm_s24le",
-            str(tmp_path),
-        ]
-
-        await self._run_ffmpeg(cmd=cmd, err_prefix="ffmpeg dsp failed")
-
-        path.unlink()
-        tmp_path.replace(path)
-
-    def _build_dsp_filter(
-        self,
-        *,
-        dsp_highpass_hz: float,
-        dsp_lowpass_hz: float,
-        dsp_force_mono: bool,
-        dsp_compress: bool,
-    ) -> str:
-        filters: list[str] = []
-
-        hp: float = float(dsp_highpass_hz)
-        lp: float = float(dsp_lowpass_hz)
-
-        if hp > 0:
-            filters.append(f"highpass=f={hp:.3f}")
-        if lp > 0:
-            filters.append(f"lowpass=f={lp:.3f}")
-
-        if dsp_compress:
-            filters.append("acompressor=threshold=-18dB:ratio=2:attack=5:release=80")
-
-        filters.append("alimiter=limit=0.97")
-
-        if dsp_force_mono:
-            filters.append("aformat=channel_layouts=mono")
-
-        return ",".join(filters)
-
-    async def _run_ffmpeg(self, *, cmd: list[str], err_prefix: str) -> None:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        _, stderr = await proc.communicate()
-        if proc.returncode != 0:
-            err: str = stderr.decode(errors="ignore")
-            raise RuntimeError(f"{err_prefix}: {err}")
\ No newline at end of file
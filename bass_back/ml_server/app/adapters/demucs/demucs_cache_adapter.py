@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None  # type: ignore[assignment]
+
+from app.adapters.demucs.demucs_fingerprint import audio_fingerprint
+from app.adapters.demucs.demucs_mix import DSP_META_FILENAME, NO_BASS_FILENAME
+from app.application.ports.demucs.demucs_port import (
+    DemucsDspParams,
+    DemucsPort,
+    DemucsSplitSetting,
+)
+
+"""
+    DemucsPort 앞단 stem cache (내용 기준 key)
+
+    key = 오디오 지문 digest + demucs 모델 + 분리 설정 + dsp 설정
+    같은 key entry 만 씀 -> decode 결과가 (볼륨 말고) 같은 파일끼리만 hit
+        재인코딩 / 밀린 음원은 지문이 가까워도 miss (다른 파일에서 분리한 stem 은 이 job 의 original 과 시간이 안 맞음)
+    hit  -> cache 에 있는 wav 를 asset/audio 로 hard link (복사 X) -> demucs 생략
+    miss -> inner.split 실행 -> 결과를 cache 로 hard link (디스크에는 한벌만)
+
+    cache_dir/<key 앞 2글자>/<key>/{bass_only,bass_removed,bass_boosted}.wav + no_bass.flac + bass_only.dsp.json + meta.json
+    meta.json mtime = 마지막 사용 시각 -> max_bytes 넘으면 오래된 것부터 삭제 (LRU)
+
+    cache_dir 는 여러 worker process 가 같이 씀
+        restore / store / eviction 은 cache_dir/.lock 에 flock (process 간) + threading.Lock (process 안)
+        flock 이 없는 환경 (windows) 이나 밖에서 entry 를 지운 경우 -> restore 중 파일이 없으면 miss 로 보고 다시 분리
+"""
+
+BASS_ONLY_OUTPUTS: tuple[str, ...] = ("bass_only.wav", DSP_META_FILENAME)
+META_FILENAME: str = "meta.json"
+LOCK_FILENAME: str = ".lock"
+
+# 결과물 내용에 영향 없는 설정은 key 에서 제외 (어떤 파일을 만들지는 entry 안 파일로 판단)
+_SETTING_KEY_EXCLUDE: tuple[str, ...] = (
+    "overwrite_outputs",
+    "cleanup_stems",
+    "make_bass_removed",
+    "make_bass_boosted",
+)
+
+
+def full_outputs(*, setting: DemucsSplitSetting, dsp: DemucsDspParams) -> tuple[str, ...]:
+    names: list[str] = list(BASS_ONLY_OUTPUTS)
+    if setting.make_bass_removed:
+        names.append("bass_removed.wav")
+    elif not dsp.enable_dsp:
+        names.append(NO_BASS_FILENAME)
+    if setting.make_bass_boosted:
+        names.append("bass_boosted.wav")
+    return tuple(names)
+
+
+@dataclass
+class DemucsCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class CachedDemucsAdapter(DemucsPort):
+    inner: DemucsPort
+    cache_dir: Path
+    max_bytes: int = 20 * 1024 * 1024 * 1024
+    stats: DemucsCacheStats = field(default_factory=DemucsCacheStats)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    async def split(
+        self,
+        *,
+        input_wav_path: Path,
+        output_dir: Path,
+        asset_id: str,
+        setting: DemucsSplitSetting,
+        dsp: DemucsDspParams,
+    ) -> Path:
+        audio_dir: Path = output_dir / "asset" / asset_id / "audio"
+        key: str = await asyncio.to_thread(
+            self.cache_key, input_wav_path=input_wav_path, setting=setting, dsp=dsp
+        )
+
+        names: tuple[str, ...] = full_outputs(setting=setting, dsp=dsp)
+        if await asyncio.to_thread(self._restore, key=key, names=names, audio_dir=audio_dir):
+            # 원본 보관은 inner(full 모드)와 동일하게 (다른 파일시스템이면 복사라서 thread 로)
+            await asyncio.to_thread(self._link_or_copy, src=input_wav_path, dst=audio_dir / "original.wav")
+            self._count_hit(key=key)
+            return audio_dir / "bass_only.wav"
+
+        self._count_miss(key=key)
+        bass_only_path: Path = await self.inner.split(
+            input_wav_path=input_wav_path,
+            output_dir=output_dir,
+            asset_id=asset_id,
+            setting=setting,
+            dsp=dsp,
+        )
+        await asyncio.to_thread(self._store, key=key, names=names, audio_dir=audio_dir)
+        return bass_only_path
+
+    async def split_file(
+        self,
+        *,
+        input_wav_path: Path,
+        output_dir: Path,
+        asset_id: str,
+        setting: DemucsSplitSetting,
+        dsp: DemucsDspParams,
+    ) -> None:
+        audio_dir: Path = output_dir / "asset" / asset_id / "audio"
+        key: str = await asyncio.to_thread(
+            self.cache_key, input_wav_path=input_wav_path, setting=setting, dsp=dsp
+        )
+
+        if await asyncio.to_thread(self._restore, key=key, names=BASS_ONLY_OUTPUTS, audio_dir=audio_dir):
+            self._count_hit(key=key)
+            return
+
+        self._count_miss(key=key)
+        await self.inner.split_file(
+            input_wav_path=input_wav_path,
+            output_dir=output_dir,
+            asset_id=asset_id,
+            setting=setting,
+            dsp=dsp,
+        )
+        await asyncio.to_thread(self._store, key=key, names=BASS_ONLY_OUTPUTS, audio_dir=audio_dir)
+
+    def cache_key(
+        self,
+        *,
+        input_wav_path: Path,
+        setting: DemucsSplitSetting,
+        dsp: DemucsDspParams,
+    ) -> str:
+        if not input_wav_path.exists():
+            raise FileNotFoundError(f"input wav not found: {input_wav_path}")
+
+        setting_part: dict[str, object] = {
+            k: v for k, v in asdict(setting).items() if k not in _SETTING_KEY_EXCLUDE
+        }
+        payload: dict[str, object] = {
+            "fingerprint": audio_fingerprint(path=input_wav_path).digest,
+            "setting": setting_part,
+            "dsp": asdict(dsp),
+        }
+        raw: str = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def entry_dir(self, *, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def total_bytes(self) -> int:
+        return sum(size for _, _, size in self._scan_entries())
+
+    # 같은 key entry 를 audio_dir 로 가져옴 / 없거나 중간에 지워지면 False
+    def _restore(self, *, key: str, names: tuple[str, ...], audio_dir: Path) -> bool:
+        entry: Path = self.entry_dir(key=key)
+        with self._locked():
+            if not all((entry / name).exists() for name in names):
+                return False
+
+            audio_dir.mkdir(parents=True, exist_ok=True)
+            linked: list[Path] = []
+            try:
+                for name in names:
+                    self._link_or_copy(src=entry / name, dst=audio_dir / name)
+                    linked.append(audio_dir / name)
+                self._touch(entry=entry)
+            except OSError as e:
+                # 확인 뒤에 entry 가 지워짐 -> 반쯤 가져온 파일은 치우고 miss
+                for dst in linked:
+                    dst.unlink(missing_ok=True)
+                print(f"[demucs-cache] restore failed key={key}: {e}")
+                return False
+        return True
+
+    def _store(self, *, key: str, names: tuple[str, ...], audio_dir: Path) -> None:
+        entry: Path = self.entry_dir(key=key)
+        with self._locked():
+            entry.mkdir(parents=True, exist_ok=True)
+            for name in names:
+                src: Path = audio_dir / name
+                if not src.exists():
+                    raise FileNotFoundError(f"demucs output missing for cache: {src}")
+                self._link_or_copy(src=src, dst=entry / name)
+
+            files: list[str] = sorted(p.name for p in entry.iterdir() if p.name != META_FILENAME)
+            meta_path: Path = entry / META_FILENAME
+            meta_path.write_text(
+                json.dumps({"key": key, "files": files}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            self._evict_locked(keep=entry)
+
+    # process 안 (threading.Lock) + process 간 (cache_dir/.lock flock)
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with (self.cache_dir / LOCK_FILENAME).open("a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    # 같은 파일시스템이면 hard link, 아니면 복사
+    def _link_or_copy(self, *, src: Path, dst: Path) -> None:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if dst.exists():
+            if dst.samefile(src):
+                return
+            dst.unlink()
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(str(src), str(dst))
+
+    def _touch(self, *, entry: Path) -> None:
+        meta_path: Path = entry / META_FILENAME
+        if meta_path.exists():
+            os.utime(meta_path, None)
+
+    # (entry, 마지막 사용 시각, 크기)
+    def _scan_entries(self) -> list[tuple[Path, float, int]]:
+        if not self.cache_dir.exists():
+            return []
+
+        out: list[tuple[Path, float, int]] = []
+        for meta_path in self.cache_dir.glob(f"*/*/{META_FILENAME}"):
+            entry: Path = meta_path.parent
+            try:
+                size: int = sum(p.stat().st_size for p in entry.iterdir() if p.is_file())
+                last_used: float = meta_path.stat().st_mtime
+            except FileNotFoundError:
+                # lock 없이 도는 total_bytes() 중에 eviction 된 entry
+                continue
+            out.append((entry, last_used, size))
+        return out
+
+    def _evict_locked(self, *, keep: Path) -> None:
+        if self.max_bytes <= 0:
+            return
+
+        entries: list[tuple[Path, float, int]] = sorted(self._scan_entries(), key=lambda e: e[1])
+        total: int = sum(size for _, _, size in entries)
+
+        for entry, _last_used, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            self.stats.evictions += 1
+            self.stats.evicted_bytes += size
+            print(f"[demucs-cache] evict key={entry.name} bytes={size}")
+
+    def _count_hit(self, *, key: str) -> None:
+        with self._lock:
+            self.stats.hits += 1
+        print(f"[demucs-cache] hit key={key} hits={self.stats.hits} misses={self.stats.misses}")
+
+    def _count_miss(self, *, key: str) -> None:
+        with self._lock:
+            self.stats.misses += 1
+        print(f"[demucs-cache] miss key={key} hits={self.stats.hits} misses={self.stats.misses}")
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from scipy.ndimage import minimum_filter1d, uniform_filter1d
+from scipy.signal import lfilter
+
+"""
+    ffmpeg -af 필터 체인을 numpy/scipy로 메모리에서 처리
+
+    highpass -> lowpass -> acompressor -> alimiter -> mono
+    (build_dsp_filter 가 만드는 ffmpeg 체인과 같은 순서 / 같은 기본값)
+
+    입력 -> [channels, time] float32 배열 여러개
+    출력 -> 같은 순서의 배열 리스트 (mono면 [1, time])
+    계산은 출력 하나씩 float64 (동시에 float64 로 올라가는 것은 한 출력분)
+"""
+
+# ffmpeg highpass/lowpass 기본값 (poles=2, width_type=q, width=0.707)
+BIQUAD_Q: float = 0.707
+
+# acompressor=threshold=-18dB:ratio=2:attack=5:release=80 (나머지는 ffmpeg 기본값)
+COMP_THRESHOLD_DB: float = -18.0
+COMP_RATIO: float = 2.0
+COMP_ATTACK_MS: float = 5.0
+COMP_RELEASE_MS: float = 80.0
+COMP_KNEE: float = 2.82843
+
+# alimiter=limit=0.97 (attack=5ms, release=50ms, level=1 기본값)
+LIMIT: float = 0.97
+LIMIT_ATTACK_MS: float = 5.0
+LIMIT_RELEASE_MS: float = 50.0
+
+# compressor envelope 구간 병렬 계산 (_envelope_follow)
+ENVELOPE_CHUNK: int = 16384
+ENVELOPE_LOOP_MAX: int = 4 * ENVELOPE_CHUNK
+ENVELOPE_MAX_PASSES: int = 8
+ENVELOPE_TOL: float = 1e-12
+
+
+def build_dsp_filter(
+    *,
+    dsp_highpass_hz: float,
+    dsp_lowpass_hz: float,
+    dsp_force_mono: bool,
+    dsp_compress: bool,
+) -> str:
+    filters: list[str] = []
+
+    hp: float = float(dsp_highpass_hz)
+    lp: float = float(dsp_lowpass_hz)
+
+    if hp > 0:
+        filters.append(f"highpass=f={hp:.3f}")
+    if lp > 0:
+        filters.append(f"lowpass=f={lp:.3f}")
+
+    if dsp_compress:
+        filters.append(
+            f"acompressor=threshold={COMP_THRESHOLD_DB:g}dB:ratio={COMP_RATIO:g}"
+            f":attack={COMP_ATTACK_MS:g}:release={COMP_RELEASE_MS:g}"
+        )
+
+    filters.append(f"alimiter=limit={LIMIT:g}")
+
+    if dsp_force_mono:
+        filters.append("aformat=channel_layouts=mono")
+
+    return ",".join(filters)
+
+
+def apply_dsp_chain(
+    *,
+    audios: list[np.ndarray],
+    samplerate: int,
+    dsp_highpass_hz: float,
+    dsp_lowpass_hz: float,
+    dsp_force_mono: bool,
+    dsp_compress: bool,
+) -> list[np.ndarray]:
+    if not audios:
+        return []
+
+    for a in audios:
+        if a.ndim != 2:
+            raise ValueError(f"audio must be [channels, time]. got shape={a.shape}")
+
+    sr: int = int(samplerate)
+
+    # 출력 하나씩 float64 로 올려서 처리 -> 끝나면 float32 로 내림 (float64 사본은 한 출력분만)
+    out: list[np.ndarray] = []
+    for a in audios:
+        x: np.ndarray = _biquad_chain(
+            x=np.array(a, dtype=np.float64, copy=True),
+            samplerate=sr,
+            highpass_hz=float(dsp_highpass_hz),
+            lowpass_hz=float(dsp_lowpass_hz),
+        )
+        if dsp_compress:
+            x = _compress(x=x, samplerate=sr)
+        x = _limit(x=x, samplerate=sr)
+        if dsp_force_mono:
+            x = np.mean(x, axis=0, keepdims=True)
+        out.append(x.astype(np.float32))
+        del x
+    return out
+
+
+# ffmpeg은 24bit 입력을 정수 포맷 그대로 biquad 처리 -> 단계마다 full scale 에서 clip
+# x 는 float64 사본 (제자리에서 clip)
+def _biquad_chain(
+    *,
+    x: np.ndarray,
+    samplerate: int,
+    highpass_hz: float,
+    lowpass_hz: float,
+) -> np.ndarray:
+    np.clip(x, -1.0, 1.0, out=x)
+    if highpass_hz > 0:
+        b, a = _biquad_coeffs(kind="highpass", freq=highpass_hz, samplerate=samplerate)
+        x = lfilter(b, a, x, axis=-1)
+        np.clip(x, -1.0, 1.0, out=x)
+    if lowpass_hz > 0:
+        b, a = _biquad_coeffs(kind="lowpass", freq=lowpass_hz, samplerate=samplerate)
+        x = lfilter(b, a, x, axis=-1)
+        np.clip(x, -1.0, 1.0, out=x)
+    return x
+
+
+# RBJ cookbook (ffmpeg af_biquads 와 같은 식)
+def _biquad_coeffs(*, kind: str, freq: float, samplerate: int) -> tuple[np.ndarray, np.ndarray]:
+    w0: float = 2.0 * math.pi * float(freq) / float(samplerate)
+    alpha: float = math.sin(w0) / (2.0 * BIQUAD_Q)
+    cos_w0: float = math.cos(w0)
+
+    if kind == "highpass":
+        b: list[float] = [(1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0]
+    elif kind == "lowpass":
+        b = [(1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0]
+    else:
+        raise ValueError(f"unknown biquad kind: {kind}")
+
+    a: list[float] = [1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha]
+    return np.asarray(b) / a[0], np.asarray(a) / a[0]
+
+
+# ffmpeg acompressor (detection=rms, link=average, mode=downward)
+def _compress(*, x: np.ndarray, samplerate: int) -> np.ndarray:
+    threshold: float = 10.0 ** (COMP_THRESHOLD_DB / 20.0)
+    attack_coeff: float = min(1.0, 1.0 / (COMP_ATTACK_MS * samplerate / 4000.0))
+    release_coeff: float = min(1.0, 1.0 / (COMP_RELEASE_MS * samplerate / 4000.0))
+
+    thres: float = math.log(threshold)
+    lin_knee_start: float = threshold / math.sqrt(COMP_KNEE)
+    lin_knee_stop: float = threshold * math.sqrt(COMP_KNEE)
+    adj_knee_start: float = lin_knee_start * lin_knee_start
+    knee_start: float = math.log(lin_knee_start)
+    knee_stop: float = math.log(lin_knee_stop)
+    compressed_knee_stop: float = (knee_stop - thres) / COMP_RATIO + thres
+
+    detector: np.ndarray = np.mean(np.abs(x), axis=0)
+    detector *= detector
+
+    envelope: np.ndarray = _envelope_follow(
+        x=detector,
+        attack_coeff=attack_coeff,
+        release_coeff=release_coeff,
+    )
+
+    gain: np.ndarray = np.ones_like(envelope)
+    active: np.ndarray = (envelope > 0.0) & (envelope > adj_knee_start)
+    if np.any(active):
+        slope: np.ndarray = 0.5 * np.log(envelope[active])
+        g: np.ndarray = (slope - thres) / COMP_RATIO + thres
+
+        in_knee: np.ndarray = slope < knee_stop
+        if COMP_KNEE > 1.0 and np.any(in_knee):
+            g[in_knee] = _hermite(
+                x=slope[in_knee],
+                x0=knee_start,
+                x1=knee_stop,
+                p0=knee_start,
+                p1=compressed_knee_stop,
+                m0=1.0,
+                m1=1.0 / COMP_RATIO,
+            )
+        gain[active] = np.exp(g - slope)
+
+    return x * gain[np.newaxis, :]
+
+
+# attack/release 계수가 샘플마다 바뀌는 1-pole : y += (v - y) * (v > y ? attack : release)
+# 순차 의존이라 그대로는 샘플마다 python loop -> ENVELOPE_CHUNK 길이 구간들을 나란히 (열 단위 numpy) 계산
+#   구간 시작값은 모르니 처음엔 0, 다음 pass 에서 앞 구간의 마지막 값으로 다시 계산
+#   한 샘플마다 두 시작값의 차이가 최소 (1 - release) 배로 줄어듦 (단조 + 축소 사상)
+#   -> 16384 샘플이면 최소 1.5e-8 배, 보통 2 pass 면 시작값 변화가 ENVELOPE_TOL 아래로 (loop 결과와 ~1e-14 상대오차)
+# 짧은 입력은 그냥 loop 가 빠름
+def _envelope_follow(*, x: np.ndarray, attack_coeff: float, release_coeff: float) -> np.ndarray:
+    n: int = int(x.shape[0])
+    if n < ENVELOPE_LOOP_MAX:
+        return _envelope_follow_loop(x=x, attack_coeff=attack_coeff, release_coeff=release_coeff)
+
+    chunk: int = ENVELOPE_CHUNK
+    n_chunks: int = -(-n // chunk)
+    padded: np.ndarray = np.zeros(n_chunks * chunk, dtype=np.float64)
+    padded[:n] = x
+    # [chunk 안 위치, 구간] -> 한 step 에 모든 구간의 같은 위치를 계산
+    v: np.ndarray = np.ascontiguousarray(padded.reshape(n_chunks, chunk).T)
+    del padded
+
+    out: np.ndarray = np.empty_like(v)
+    start: np.ndarray = np.zeros(n_chunks, dtype=np.float64)
+    delta: np.ndarray = np.empty(n_chunks, dtype=np.float64)
+    rise: np.ndarray = np.empty(n_chunks, dtype=np.float64)
+    fall: np.ndarray = np.empty(n_chunks, dtype=np.float64)
+    tol: float = ENVELOPE_TOL * max(float(np.max(x)), 0.0)
+
+    for _ in range(ENVELOPE_MAX_PASSES):
+        prev: np.ndarray = start
+        for i in range(chunk):
+            # (v - y) * coeff 를 부호별로 나눠 곱함 (한쪽은 0 -> loop 와 같은 값)
+            np.subtract(v[i], prev, out=delta)
+            np.maximum(delta, 0.0, out=rise)
+            np.minimum(delta, 0.0, out=fall)
+            rise *= attack_coeff
+            fall *= release_coeff
+            rise += fall
+            np.add(prev, rise, out=out[i])
+            prev = out[i]
+
+        next_start: np.ndarray = np.zeros(n_chunks, dtype=np.float64)
+        next_start[1:] = out[-1, :-1]
+        converged: bool = float(np.max(np.abs(next_start - start))) <= tol
+        start = next_start
+        if converged:
+            break
+
+    return out.T.reshape(-1)[:n].copy()
+
+
+def _envelope_follow_loop(*, x: np.ndarray, attack_coeff: float, release_coeff: float) -> np.ndarray:
+    values: list[float] = x.tolist()
+    out: list[float] = [0.0] * len(values)
+    y: float = 0.0
+    for i, v in enumerate(values):
+        y += (v - y) * (attack_coeff if v > y else release_coeff)
+        out[i] = y
+    return np.asarray(out, dtype=np.float64)
+
+
+def _hermite(
+    *,
+    x: np.ndarray,
+    x0: float,
+    x1: float,
+    p0: float,
+    p1: float,
+    m0: float,
+    m1: float,
+) -> np.ndarray:
+    width: float = x1 - x0
+    t: np.ndarray = (x - x0) / width
+    m0 *= width
+    m1 *= width
+
+    ct2: float = -3.0 * p0 - 2.0 * m0 + 3.0 * p1 - m1
+    ct3: float = 2.0 * p0 + m0 - 2.0 * p1 + m1
+    return ((ct3 * t + ct2) * t + m0) * t + p0
+
+
+# lookahead peak limiter (alimiter 근사)
+# lookahead 구간 안 최소 gain -> attack 평활 -> 지수 release -> clip -> level(1/limit)
+def _limit(*, x: np.ndarray, samplerate: int) -> np.ndarray:
+    lookahead: int = max(1, int(samplerate * LIMIT_ATTACK_MS / 1000.0))
+    n: int = int(x.shape[1])
+    if n == 0:
+        return x
+
+    peak: np.ndarray = np.max(np.abs(x), axis=0)
+    need: np.ndarray = np.minimum(1.0, LIMIT / np.maximum(peak, 1e-12))
+
+    # 앞으로 lookahead 샘플 안에 올 peak 까지 미리 내려감
+    window: int = 2 * lookahead + 1
+    ahead_min: np.ndarray = minimum_filter1d(need, size=window, mode="nearest")
+    attack_gain: np.ndarray = uniform_filter1d(ahead_min, size=lookahead, mode="nearest")
+
+    # 감쇠량(1-gain)의 지수 감쇠 peak-hold : h[n] = max(d[n], h[n-1] * k)
+    k: float = math.exp(-1.0 / (samplerate * LIMIT_RELEASE_MS / 1000.0))
+    depth: np.ndarray = np.clip(1.0 - attack_gain, 0.0, 1.0)
+    with np.errstate(divide="ignore"):
+        log_depth: np.ndarray = np.log(depth)
+    idx: np.ndarray = np.arange(n, dtype=np.float64)
+    log_k: float = math.log(k)
+    held: np.ndarray = np.exp(np.maximum.accumulate(log_depth - idx * log_k) + idx * log_k)
+    gain: np.ndarray = 1.0 - held
+
+    y: np.ndarray = np.clip(x * gain[np.newaxis, :], -LIMIT, LIMIT) / LIMIT
+
+    # alimiter(latency=0)은 ring buffer 길이-1 샘플 만큼 늦게 출력됨
+    delay: int = min(lookahead - 1, n)
+    if delay <= 0:
+        return y
+    delayed: np.ndarray = np.zeros_like(y)
+    delayed[:, delay:] = y[:, : n - delay]
+    return delayed
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.demucs.demucs_dsp import (
+    _envelope_follow,
+    _envelope_follow_loop,
+    apply_dsp_chain,
+    build_dsp_filter,
+)
+from app.adapters.demucs.demucs_mix import write_pcm24
+
+"""
+    numpy dsp 체인 vs 기존 ffmpeg -af 체인 비교
+
+    limiter 가 안 걸리는 음량 -> 24bit 양자화 오차 수준으로 같아야 함
+    limiter 가 걸리는 음량 -> alimiter 근사라서 약간 다름 (허용 오차 안이면 OK)
+    compressor envelope : 구간 병렬 계산 vs 샘플 loop (ENVELOPE_SECONDS 길이, 상대 오차 + 시간)
+"""
+
+SAMPLERATE: int = 44100
+HIGHPASS_HZ: float = 40.0
+LOWPASS_HZ: float = 5000.0
+
+# (입력 음량, 최대 절대 오차, 상대 rms 오차)
+CASES: list[tuple[float, float, float]] = [
+    (0.2, 1e-5, 1e-5),
+    (0.8, 2e-2, 5e-3),
+    (1.5, 2e-2, 5e-3),
+]
+
+ENVELOPE_SECONDS: float = 240.0
+ENVELOPE_REL_TOL: float = 1e-9
+
+
+def _fake_mix(*, amp: float, seconds: float) -> np.ndarray:
+    rng: np.random.Generator = np.random.default_rng(1)
+    n: int = int(SAMPLERATE * seconds)
+    t: np.ndarray = np.arange(n, dtype=np.float64) / float(SAMPLERATE)
+    left: np.ndarray = amp * np.sin(2.0 * np.pi * 90.0 * t) * (1.0 + 0.5 * np.sin(2.0 * np.pi * 1.3 * t))
+    right: np.ndarray = amp * np.sin(2.0 * np.pi * 300.0 * t)
+    noise: np.ndarray = 0.02 * rng.standard_normal((2, n))
+    return (np.stack([left, right], axis=0) + noise).astype(np.float32)
+
+
+def _read(path: Path) -> np.ndarray:
+    x, _sr = sf.read(str(path), dtype="float64", always_2d=True)
+    return x.T
+
+
+def _ffmpeg_dsp(*, input_path: Path, output_path: Path, filt: str) -> None:
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-i", str(input_path),
+            "-af", filt,
+            "-c:a", "pcm_s24le",
+            str(output_path),
+        ],
+        check=True,
+    )
+
+
+def _check_envelope() -> bool:
+    detector: np.ndarray = np.mean(np.abs(_fake_mix(amp=0.8, seconds=ENVELOPE_SECONDS)), axis=0).astype(np.float64)
+    detector *= detector
+    attack: float = 1.0 / (5.0 * SAMPLERATE / 4000.0)
+    release: float = 1.0 / (80.0 * SAMPLERATE / 4000.0)
+
+    t0: float = time.perf_counter()
+    expected: np.ndarray = _envelope_follow_loop(x=detector, attack_coeff=attack, release_coeff=release)
+    loop_seconds: float = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ours: np.ndarray = _envelope_follow(x=detector, attack_coeff=attack, release_coeff=release)
+    chunk_seconds: float = time.perf_counter() - t0
+
+    rel: float = float(np.max(np.abs(ours - expected)) / max(float(np.max(expected)), 1e-12))
+    ok: bool = rel <= ENVELOPE_REL_TOL
+    print(
+        f"envelope {ENVELOPE_SECONDS:.0f}s: loop={loop_seconds:.2f}s chunked={chunk_seconds:.2f}s "
+        f"max_rel={rel:.3e} -> {'OK' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+def main() -> None:
+    failed: int = 0 if _check_envelope() else 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir: Path = Path(tmp)
+
+        for amp, max_abs_tol, rel_rms_tol in CASES:
+            input_path: Path = tmp_dir / f"in_{amp}.wav"
+            write_pcm24(path=input_path, audio=_fake_mix(amp=amp, seconds=5.0), samplerate=SAMPLERATE)
+            source: np.ndarray = _read(input_path)
+
+            for compress in (False, True):
+                for mono in (False, True):
+                    ff_path: Path = tmp_dir / "ff.wav"
+                    _ffmpeg_dsp(
+                        input_path=input_path,
+                        output_path=ff_path,
+                        filt=build_dsp_filter(
+                            dsp_highpass_hz=HIGHPASS_HZ,
+                            dsp_lowpass_hz=LOWPASS_HZ,
+                            dsp_force_mono=mono,
+                            dsp_compress=compress,
+                        ),
+                    )
+                    expected: np.ndarray = _read(ff_path)
+
+                    ours: np.ndarray = apply_dsp_chain(
+                        audios=[source],
+                        samplerate=SAMPLERATE,
+                        dsp_highpass_hz=HIGHPASS_HZ,
+                        dsp_lowpass_hz=LOWPASS_HZ,
+                        dsp_force_mono=mono,
+                        dsp_compress=compress,
+                    )[0]
+
+                    if expected.shape != ours.shape:
+                        print(f"amp={amp} compress={compress} mono={mono}: shape {expected.shape} != {ours.shape}")
+                        failed += 1
+                        continue
+
+                    diff: np.ndarray = expected - ours
+                    max_abs: float = float(np.max(np.abs(diff)))
+                    rel_rms: float = float(
+                        np.sqrt(np.mean(diff * diff)) / max(np.sqrt(np.mean(expected * expected)), 1e-12)
+                    )
+                    ok: bool = max_abs <= max_abs_tol and rel_rms <= rel_rms_tol
+                    if not ok:
+                        failed += 1
+                    print(
+                        f"amp={amp} compress={compress} mono={mono}: "
+                        f"max_abs={max_abs:.3e} rel_rms={rel_rms:.3e} -> {'OK' if ok else 'MISMATCH'}"
+                    )
+
+    print("dsp 비교 완료" if failed == 0 else f"dsp 비교 실패 {failed}건")
+
+
+if __name__ == "__main__":
+    main()
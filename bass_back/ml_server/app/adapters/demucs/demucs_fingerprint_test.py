@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
+
+from app.adapters.demucs.demucs_fingerprint import MAX_BIT_ERROR, AudioFingerprint, audio_fingerprint
+
+"""
+    stem cache 지문 확인 (합성 음원)
+
+    같은 음원의 변형 (16bit / 볼륨 / mp3 / 48k / 샘플 밀림 / 잡음) -> bit_error <= MAX_BIT_ERROR 이어야 함
+    다른 곡                                                   -> bit_error >  MAX_BIT_ERROR 이어야 함
+    digest 가 같은지도 같이 출력 (볼륨 말고는 보통 다름 -> cache 는 digest 로만 찾으니 이런 변형은 miss)
+"""
+
+SAMPLERATE: int = 44100
+SECONDS: int = 60
+SEED: int = 0
+OTHER_SEEDS: tuple[int, ...] = (1, 2, 3, 4, 5)
+OFFSET_SAMPLES: int = 1105
+NOISE_STD: float = 0.003
+
+
+# 0.25초마다 음 하나 (+ 절반은 타악기 같은 잡음)
+def _fake_song(*, seed: int) -> np.ndarray:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    n: int = SAMPLERATE * SECONDS
+    out: np.ndarray = np.zeros(n, dtype=np.float64)
+    t: np.ndarray = np.arange(SAMPLERATE // 2, dtype=np.float64) / float(SAMPLERATE)
+    hit: np.ndarray = np.exp(-np.arange(2000, dtype=np.float64) / 300.0)
+
+    for start in range(0, n - t.size, SAMPLERATE // 4):
+        freq: float = 110.0 * 2.0 ** (int(rng.integers(0, 36)) / 12.0)
+        env: np.ndarray = np.exp(-t * rng.uniform(2.0, 8.0))
+        out[start : start + t.size] += 0.2 * rng.uniform(0.3, 1.0) * env * np.sin(2.0 * np.pi * freq * t)
+        if rng.random() < 0.5:
+            out[start : start + hit.size] += 0.3 * rng.standard_normal(hit.size) * hit
+    return np.stack([out, 0.9 * out], axis=1)
+
+
+def _variants(*, tmp_dir: Path, song: np.ndarray) -> dict[str, Path]:
+    paths: dict[str, Path] = {}
+
+    def write(name: str, audio: np.ndarray, samplerate: int = SAMPLERATE, subtype: str = "PCM_24") -> None:
+        paths[name] = tmp_dir / f"{name}.wav"
+        sf.write(str(paths[name]), audio, samplerate, subtype=subtype)
+
+    write("pcm16", song, subtype="PCM_16")
+    write("gain -3dB", song * 0.7)
+    if "MP3" in sf.available_formats():
+        mp3_path: Path = tmp_dir / "song.mp3"
+        sf.write(str(mp3_path), song, SAMPLERATE, format="MP3")
+        write("mp3", sf.read(str(mp3_path))[0])
+    write("48k", resample_poly(song, 160, 147, axis=0), samplerate=48000)
+    write(f"offset {OFFSET_SAMPLES}", np.concatenate([np.zeros((OFFSET_SAMPLES, 2)), song], axis=0))
+    write("noise", song + NOISE_STD * np.random.default_rng(SEED + 100).standard_normal(song.shape))
+    return paths
+
+
+def main() -> None:
+    failed: int = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir: Path = Path(tmp)
+        base_path: Path = tmp_dir / "base.wav"
+        song: np.ndarray = _fake_song(seed=SEED)
+        sf.write(str(base_path), song, SAMPLERATE, subtype="PCM_24")
+        base: AudioFingerprint = audio_fingerprint(path=base_path)
+
+        for name, path in _variants(tmp_dir=tmp_dir, song=song).items():
+            fp: AudioFingerprint = audio_fingerprint(path=path)
+            error: float = base.bit_error(fp)
+            ok: bool = error <= MAX_BIT_ERROR
+            failed += 0 if ok else 1
+            print(f"same {name}: bit_error={error:.4f} digest_equal={fp.digest == base.digest} -> {'OK' if ok else 'MISS'}")
+
+        for seed in OTHER_SEEDS:
+            other_path: Path = tmp_dir / f"other_{seed}.wav"
+            sf.write(str(other_path), _fake_song(seed=seed), SAMPLERATE, subtype="PCM_24")
+            error = base.bit_error(audio_fingerprint(path=other_path))
+            ok = error > MAX_BIT_ERROR
+            failed += 0 if ok else 1
+            print(f"other seed={seed}: bit_error={error:.4f} -> {'OK' if ok else 'FALSE MATCH'}")
+
+    print("지문 확인 완료" if failed == 0 else f"지문 확인 실패 {failed}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+"""
+    demucs sources 배열 -> 파생 음원(bass_removed, bass_boosted) 메모리에서 바로 합성
+
+    ffmpeg amix(normalize=0) 와 같은 결과 : 입력을 그대로 더함 (평균 X)
+    volume=XdB 와 같은 결과 : 10 ** (X / 20) 배
+    pcm_s24le 저장 시 ffmpeg처럼 [-1, 1) 범위로 clip
+    24bit 정수 변환은 직접 (libsndfile 의 float 변환은 wav / flac 마다 반올림이 달라 1 LSB 씩 다름)
+
+    bass_removed 를 job 때 안 만들면 같은 값 (vocals + drums + other 합) 을 NO_BASS_FILENAME 으로 저장
+        24bit flac (무손실) -> 읽어서 다시 저장하면 job 때 저장했을 bass_removed.wav 와 sample 단위로 같음
+    bass_only.wav 옆에 그 job 의 dsp 설정을 DSP_META_FILENAME 으로 저장 (dsp 를 거친 bass 로는 파생 음원을 안 만듬)
+"""
+
+PCM24_MAX: float = 1.0 - 1.0 / float(1 << 23)
+NO_BASS_FILENAME: str = "no_bass.flac"
+DSP_META_FILENAME: str = "bass_only.dsp.json"
+
+
+def db_to_gain(*, gain_db: float) -> float:
+    return float(10.0 ** (float(gain_db) / 20.0))
+
+
+# amix normalize=0 : 단순 합
+def mix_sum(*, stems: list[np.ndarray]) -> np.ndarray:
+    if len(stems) < 2:
+        raise ValueError("stems must have at least 2 arrays")
+
+    shape: tuple[int, ...] = stems[0].shape
+    for s in stems[1:]:
+        if s.shape != shape:
+            raise ValueError(f"stem shape mismatch. {shape} != {s.shape}")
+
+    out: np.ndarray = np.array(stems[0], dtype=np.float32, copy=True)
+    for s in stems[1:]:
+        out += s
+    return out
+
+
+# [1:a]volume=XdB[a1];[0:a][a1]amix=inputs=2:normalize=0
+# ffmpeg 은 방금 저장한 (clip 된) bass_removed.wav 를 boost 함 -> base 도 clip 후 더함
+def mix_boost(*, base: np.ndarray, boost: np.ndarray, gain_db: float) -> np.ndarray:
+    if base.shape != boost.shape:
+        raise ValueError(f"shape mismatch. {base.shape} != {boost.shape}")
+
+    out: np.ndarray = np.array(boost, dtype=np.float32, copy=True)
+    out *= np.float32(db_to_gain(gain_db=gain_db))
+    out += np.clip(base, -1.0, PCM24_MAX).astype(np.float32, copy=False)
+    return out
+
+
+def clip_pcm24(*, audio: np.ndarray) -> np.ndarray:
+    return np.clip(audio, -1.0, PCM24_MAX, out=audio)
+
+
+# float -> int32 상위 24bit (soundfile PCM_24 그대로 저장) / 2^23 배는 float32 에서도 오차 없음
+def to_pcm24(*, audio: np.ndarray) -> np.ndarray:
+    x: np.ndarray = np.array(audio, dtype=np.float32, copy=True)
+    clip_pcm24(audio=x)
+    x *= np.float32(1 << 23)
+    np.rint(x, out=x)
+    return x.astype(np.int32) << 8
+
+
+# audio : [channels, time]
+def write_pcm24(*, path: Path, audio: np.ndarray, samplerate: int) -> None:
+    if audio.ndim != 2:
+        raise ValueError(f"audio must be [channels, time]. got shape={audio.shape}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 형식은 확장자로 (.wav / .flac)
+    sf.write(str(path), to_pcm24(audio=audio).T, int(samplerate), subtype="PCM_24")
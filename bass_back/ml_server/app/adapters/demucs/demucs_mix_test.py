@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import subprocess
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.demucs.demucs_mix import mix_boost, mix_sum, write_pcm24
+
+"""
+    numpy 합성 결과 vs 기존 ffmpeg amix(normalize=0) 결과 비교
+    24bit 양자화 오차 수준(1e-5) 안에 들어오면 OK
+
+    CASES
+        normal : 합이 full scale 안
+        loud   : drums+other+vocals 합이 full scale 넘음 (bass_removed clip -> 그걸 boost)
+"""
+
+SAMPLERATE: int = 44100
+TOLERANCE: float = 1e-5
+# case 이름 -> stem 크기 배율
+CASES: dict[str, float] = {"normal": 1.0, "loud": 2.0}
+
+
+def _fake_stem(*, seed: int, seconds: float, scale: float) -> np.ndarray:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    n: int = int(SAMPLERATE * seconds)
+    t: np.ndarray = np.arange(n, dtype=np.float32) / float(SAMPLERATE)
+    freq: float = float(rng.uniform(50.0, 2000.0))
+    tone: np.ndarray = 0.2 * np.sin(2.0 * np.pi * freq * t)
+    noise: np.ndarray = 0.05 * rng.standard_normal(n).astype(np.float32)
+    mono: np.ndarray = (scale * (tone + noise)).astype(np.float32)
+    return np.stack([mono, mono * 0.8], axis=0)
+
+
+def _read(path: Path) -> np.ndarray:
+    x, _sr = sf.read(str(path), dtype="float32", always_2d=True)
+    return x.T
+
+
+def _ffmpeg(cmd: list[str]) -> None:
+    subprocess.run(
+        ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", *cmd],
+        check=True,
+    )
+
+
+def _run_case(*, tmp_dir: Path, case: str, scale: float, gain_db: float) -> None:
+    stem_paths: dict[str, Path] = {}
+    for i, name in enumerate(["vocals", "drums", "other", "bass"]):
+        stem_paths[name] = tmp_dir / f"{case}_{name}.wav"
+        write_pcm24(
+            path=stem_paths[name],
+            audio=_fake_stem(seed=i, seconds=3.0, scale=scale),
+            samplerate=SAMPLERATE,
+        )
+    # ffmpeg 과 같은 입력 (24bit 로 저장된 stem)
+    stems: dict[str, np.ndarray] = {name: _read(path) for name, path in stem_paths.items()}
+
+    # 기존 ffmpeg 경로
+    ff_removed: Path = tmp_dir / f"{case}_ff_bass_removed.wav"
+    ff_boosted: Path = tmp_dir / f"{case}_ff_bass_boosted.wav"
+    _ffmpeg([
+        "-i", str(stem_paths["vocals"]),
+        "-i", str(stem_paths["drums"]),
+        "-i", str(stem_paths["other"]),
+        "-filter_complex", "amix=inputs=3:normalize=0[outa]",
+        "-map", "[outa]", "-c:a", "pcm_s24le", str(ff_removed),
+    ])
+    _ffmpeg([
+        "-i", str(ff_removed),
+        "-i", str(stem_paths["bass"]),
+        "-filter_complex", f"[1:a]volume={gain_db}dB[a1];[0:a][a1]amix=inputs=2:normalize=0[outa]",
+        "-map", "[outa]", "-c:a", "pcm_s24le", str(ff_boosted),
+    ])
+
+    # numpy 경로
+    np_removed_path: Path = tmp_dir / f"{case}_np_bass_removed.wav"
+    np_boosted_path: Path = tmp_dir / f"{case}_np_bass_boosted.wav"
+    removed: np.ndarray = mix_sum(stems=[stems["vocals"], stems["drums"], stems["other"]])
+    boosted: np.ndarray = mix_boost(base=removed, boost=stems["bass"], gain_db=gain_db)
+    write_pcm24(path=np_removed_path, audio=removed, samplerate=SAMPLERATE)
+    write_pcm24(path=np_boosted_path, audio=boosted, samplerate=SAMPLERATE)
+
+    clipped: float = float(np.mean(np.abs(removed) >= 1.0))
+    for label, ff_path, np_path in [
+        ("bass_removed", ff_removed, np_removed_path),
+        ("bass_boosted", ff_boosted, np_boosted_path),
+    ]:
+        a: np.ndarray = _read(ff_path)
+        b: np.ndarray = _read(np_path)
+        n: int = min(a.shape[1], b.shape[1])
+        max_err: float = float(np.max(np.abs(a[:, :n] - b[:, :n])))
+        status: str = "OK" if max_err <= TOLERANCE else "MISMATCH"
+        print(f"[{case}] {label}: removed_clipped={clipped:.2%} max_abs_err={max_err:.3e} -> {status}")
+
+
+def main() -> None:
+    gain_db: float = 10.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir: Path = Path(tmp)
+        for case, scale in CASES.items():
+            _run_case(tmp_dir=tmp_dir, case=case, scale=scale, gain_db=gain_db)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from demucs.pretrained import get_model
+
+"""
+    프로세스 단위 demucs 모델 보관소 (모델 이름 -> 로드된 모델)
+
+    worker 시작 시 preload -> split 마다 get_model() 재호출 없이 꺼내씀
+    max_models / max_bytes 초과 시 가장 오래 안쓴 모델부터 제거 (LRU)
+"""
+
+
+@dataclass(frozen=True)
+class DemucsLoadedModel:
+    name: str
+    model: object
+    samplerate: int
+    audio_channels: int
+    size_bytes: int
+
+
+class DemucsModelRegistry:
+    def __init__(self, *, max_models: int = 2, max_bytes: int = 0) -> None:
+        if max_models <= 0:
+            raise ValueError("max_models must be > 0")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0 (0 = unlimited)")
+
+        self._max_models: int = int(max_models)
+        self._max_bytes: int = int(max_bytes)
+        self._models: OrderedDict[str, DemucsLoadedModel] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def configure(self, *, max_models: int, max_bytes: int = 0) -> None:
+        if max_models <= 0:
+            raise ValueError("max_models must be > 0")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0 (0 = unlimited)")
+
+        with self._lock:
+            self._max_models = int(max_models)
+            self._max_bytes = int(max_bytes)
+            self._evict_locked(keep=None)
+
+    def get(self, *, demucs_model: str) -> DemucsLoadedModel:
+        name: str = str(demucs_model)
+
+        with self._lock:
+            hit: DemucsLoadedModel | None = self._models.get(name)
+            if hit is not None:
+                self._models.move_to_end(name)
+                return hit
+
+            # 로드는 lock 안에서 -> 같은 모델을 동시에 두번 로드하지 않음
+            loaded: DemucsLoadedModel = self._load(name=name)
+            self._models[name] = loaded
+            self._evict_locked(keep=name)
+            return loaded
+
+    def preload(self, *, demucs_models: list[str]) -> list[str]:
+        loaded_names: list[str] = []
+        for name in demucs_models:
+            if not name:
+                continue
+            self.get(demucs_model=name)
+            loaded_names.append(str(name))
+        return loaded_names
+
+    def loaded_names(self) -> list[str]:
+        with self._lock:
+            return list(self._models.keys())
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(m.size_bytes for m in self._models.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    def _load(self, *, name: str) -> DemucsLoadedModel:
+        model: object = get_model(name=name)
+        model.cpu()  # type: ignore[union-attr]
+        model.eval()  # type: ignore[union-attr]
+
+        return DemucsLoadedModel(
+            name=name,
+            model=model,
+            samplerate=int(getattr(model, "samplerate", 44100)),
+            audio_channels=int(getattr(model, "audio_channels", 2)),
+            size_bytes=_model_size_bytes(model=model),
+        )
+
+    # 방금 쓴 모델(keep)은 남기고 오래된 순서로 제거
+    def _evict_locked(self, *, keep: str | None) -> None:
+        while len(self._models) > self._max_models:
+            if not self._pop_oldest_locked(keep=keep):
+                break
+
+        if self._max_bytes <= 0:
+            return
+
+        while sum(m.size_bytes for m in self._models.values()) > self._max_bytes:
+            if not self._pop_oldest_locked(keep=keep):
+                break
+
+    def _pop_oldest_locked(self, *, keep: str | None) -> bool:
+        for name in self._models.keys():
+            if name == keep:
+                continue
+            removed: DemucsLoadedModel = self._models.pop(name)
+            print(f"[demucs-registry] evict model={removed.name} bytes={removed.size_bytes}")
+            return True
+        return False
+
+
+def _model_size_bytes(*, model: object) -> int:
+    parameters = getattr(model, "parameters", None)
+    buffers = getattr(model, "buffers", None)
+
+    total: int = 0
+    if callable(parameters):
+        for p in parameters():
+            total += int(p.numel()) * int(p.element_size())
+    if callable(buffers):
+        for b in buffers():
+            total += int(b.numel()) * int(b.element_size())
+    return total
+
+
+_DEFAULT_REGISTRY: DemucsModelRegistry = DemucsModelRegistry()
+
+
+def get_demucs_model_registry() -> DemucsModelRegistry:
+    return _DEFAULT_REGISTRY
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.demucs.demucs_mix import DSP_META_FILENAME, NO_BASS_FILENAME, mix_boost, write_pcm24
+from app.application.ports.demucs.derived_audio_port import (
+    DEFAULT_BOOSTED_VOLUME_DB,
+    DerivedAudioKind,
+    DerivedAudioPort,
+    DerivedAudioResult,
+    quantize_boosted_volume_db,
+)
+
+"""
+    bass_removed / bass_boosted 를 처음 요청될 때 만드는 adapter
+
+    demucs 는 bass_only + no_bass.flac (vocals + drums + other 합, 24bit 무손실) 을 만들어 둠
+    bass_removed = no_bass                               -> job 때 만들던 bass_removed.wav 와 sample 단위로 같음
+    bass_boosted = bass_removed + bass_only * 10^(dB/20)
+        job 때는 저장 전 (24bit 양자화 전) bass 로 더함 -> 차이는 24bit (배율 + 1) LSB 이하 (10dB 에서 3 LSB)
+    no_bass 가 없는 asset 은 만들지 않음 (original - bass_only 근사로 대신하지 않음)
+    dsp 를 켠 job 은 만들지 않음 (bass_only.dsp.json 으로 확인, 없으면 모르는 것으로 보고 거절)
+        job 때는 섞은 뒤에 dsp (compressor 는 비선형) -> dsp 거친 bass 를 나중에 섞으면 다른 소리
+    확인은 derived_audio_test.py (같은 stem 으로 job 때 결과 vs 이 adapter 결과)
+
+    결과는 bass_only.wav 옆에 저장 -> 다음 요청부터는 파일 그대로 반환
+    boost 는 0.1dB 단위로 맞춘 값으로 만들고 이름도 그 값으로 (3.04 / 3.0 -> 같은 파일)
+    boost 기본값(10dB) -> bass_boosted.wav
+    그 외 boost       -> bass_boosted_<dB>db.wav (예 bass_boosted_3.5db.wav)
+
+    입력 경로는 요청에서 오므로 resolve 후 storage_root 안에 있는 것만 받음 (symlink / .. 로 밖을 못 읽고 / 못 씀)
+        bass_only 는 파일 이름도 bass_only.wav 만 (결과를 그 폴더에 씀)
+"""
+
+BASS_ONLY_FILENAME: str = "bass_only.wav"
+# 출력 경로 hash 로 고르는 고정 lock 개수 (경로마다 lock 을 두면 요청마다 계속 늘어남)
+LOCK_STRIPES: int = 64
+
+
+def derived_filename(*, kind: DerivedAudioKind, boosted_volume_db: float) -> str:
+    if kind == "bass_removed":
+        return "bass_removed.wav"
+    if kind == "bass_boosted":
+        db: float = quantize_boosted_volume_db(boosted_volume_db=boosted_volume_db)
+        if db == DEFAULT_BOOSTED_VOLUME_DB:
+            return "bass_boosted.wav"
+        return f"bass_boosted_{db:.1f}db.wav"
+    raise ValueError(f"unknown derived audio kind: {kind}")
+
+
+@dataclass(frozen=True)
+class DerivedAudioAdapter(DerivedAudioPort):
+    storage_root: Path
+    min_boosted_volume_db: float = -24.0
+    max_boosted_volume_db: float = 24.0
+    # 같은 파일을 동시에 만들지 않도록 (다른 파일이 같은 lock 에 걸리면 기다리기만 함)
+    _locks: tuple[threading.Lock, ...] = field(
+        default_factory=lambda: tuple(threading.Lock() for _ in range(LOCK_STRIPES)),
+        repr=False,
+        compare=False,
+    )
+
+    async def materialize(
+        self,
+        *,
+        bass_only_wav_path: Path,
+        kind: DerivedAudioKind,
+        boosted_volume_db: float = DEFAULT_BOOSTED_VOLUME_DB,
+    ) -> DerivedAudioResult:
+        bass_only_wav_path = self._confine(path=bass_only_wav_path, what="bass_only wav")
+        if bass_only_wav_path.name != BASS_ONLY_FILENAME:
+            raise PermissionError(f"bass_only wav must be named {BASS_ONLY_FILENAME}: {bass_only_wav_path}")
+
+        if not bass_only_wav_path.exists():
+            raise FileNotFoundError(f"bass_only wav not found: {bass_only_wav_path}")
+
+        db: float = quantize_boosted_volume_db(boosted_volume_db=boosted_volume_db)
+        if not (self.min_boosted_volume_db <= db <= self.max_boosted_volume_db):
+            raise ValueError(
+                f"boosted_volume_db must be in [{self.min_boosted_volume_db}, {self.max_boosted_volume_db}]. got {db}"
+            )
+
+        output_path: Path = bass_only_wav_path.parent / derived_filename(kind=kind, boosted_volume_db=db)
+        created: bool = await asyncio.to_thread(
+            self._materialize_sync,
+            bass_only_wav_path=bass_only_wav_path,
+            kind=kind,
+            boosted_volume_db=db,
+            output_path=output_path,
+        )
+        return DerivedAudioResult(
+            kind=kind,
+            path=output_path,
+            boosted_volume_db=db if kind == "bass_boosted" else None,
+            created=created,
+        )
+
+    def _materialize_sync(
+        self,
+        *,
+        bass_only_wav_path: Path,
+        kind: DerivedAudioKind,
+        boosted_volume_db: float,
+        output_path: Path,
+    ) -> bool:
+        with self._lock_for(path=output_path):
+            if output_path.exists():
+                return False
+
+            self._require_no_dsp(bass_only_wav_path=bass_only_wav_path)
+            removed_path: Path = self._bass_removed_source(bass_only_wav_path=bass_only_wav_path)
+            audio, samplerate = self._read_audio(path=removed_path)
+            if kind == "bass_boosted":
+                bass, _sr = self._read_audio(path=bass_only_wav_path)
+                audio = mix_boost(base=audio, boost=bass, gain_db=boosted_volume_db)
+
+            self._write_atomic(path=output_path, audio=audio, samplerate=samplerate)
+            return True
+
+    def _confine(self, *, path: Path, what: str) -> Path:
+        resolved: Path = Path(path).resolve()
+        if not resolved.is_relative_to(Path(self.storage_root).resolve()):
+            raise PermissionError(f"{what} is outside storage root: {resolved}")
+        return resolved
+
+    def _lock_for(self, *, path: Path) -> threading.Lock:
+        return self._locks[hash(str(path.resolve())) % len(self._locks)]
+
+    def _require_no_dsp(self, *, bass_only_wav_path: Path) -> None:
+        meta_path: Path = bass_only_wav_path.parent / DSP_META_FILENAME
+        if not meta_path.exists():
+            raise FileNotFoundError(
+                f"dsp setting of bass_only not found (separate again to make derived audio): {meta_path}"
+            )
+        meta: dict[str, object] = json.loads(meta_path.read_text(encoding="utf-8"))
+        if bool(meta.get("enable_dsp", True)):
+            raise ValueError(f"derived audio is not available for a dsp-processed bass_only: {bass_only_wav_path}")
+
+    # [channels, time]
+    def _read_audio(self, *, path: Path) -> tuple[np.ndarray, int]:
+        x, sr = sf.read(str(path), dtype="float32", always_2d=True)
+        return np.ascontiguousarray(x.T), int(sr)
+
+    # bass_removed.wav (job 때 만든 것) -> no_bass.flac 순서로 / 둘 다 없으면 만들지 않음
+    def _bass_removed_source(self, *, bass_only_wav_path: Path) -> Path:
+        audio_dir: Path = bass_only_wav_path.parent
+        for path in (audio_dir / "bass_removed.wav", audio_dir / NO_BASS_FILENAME):
+            if not path.exists():
+                continue
+            # (sr, channels, frames) 가 bass_only 와 같아야 더할 수 있음
+            expected: tuple[int, int, int] = self._layout(path=bass_only_wav_path)
+            got: tuple[int, int, int] = self._layout(path=path)
+            if got != expected:
+                raise ValueError(f"{path.name} does not match bass_only. (sr, channels, frames)={got} != {expected}")
+            return path
+
+        raise FileNotFoundError(f"{NO_BASS_FILENAME} not found (separate again to make derived audio): {audio_dir}")
+
+    def _layout(self, *, path: Path) -> tuple[int, int, int]:
+        info = sf.info(str(path))
+        return int(info.samplerate), int(info.channels), int(info.frames)
+
+    # 임시 파일에 쓰고 rename (cache 와 hard link 된 파일을 덮어쓰지 않음)
+    def _write_atomic(self, *, path: Path, audio: np.ndarray, samplerate: int) -> None:
+        tmp_path: Path = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp.wav")
+        try:
+            write_pcm24(path=tmp_path, audio=audio, samplerate=samplerate)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
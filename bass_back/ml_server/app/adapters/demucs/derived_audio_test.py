@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from app.adapters.demucs.demucs_adapter import DemucsAdapter
+from app.adapters.demucs.derived_audio_adapter import BASS_ONLY_FILENAME, DerivedAudioAdapter
+from app.adapters.demucs.demucs_mix import DSP_META_FILENAME, NO_BASS_FILENAME
+
+"""
+    지연 생성 bass_removed / bass_boosted 가 job 때 바로 만든 것과 같은지 확인 (모델 없이 합성 stem)
+
+    같은 stem 으로
+        eager : DemucsAdapter 출력 bass_only + bass_removed + bass_boosted  (make_bass_removed=True 와 같음)
+        lazy  : DemucsAdapter 출력 bass_only + no_bass -> DerivedAudioAdapter.materialize
+    bass_removed : sample 단위로 같아야 함
+    bass_boosted : 24bit (boost 배율 + 1) LSB 안 (job 때는 저장 전 bass 로 더함)
+    dsp 를 켠 job (bass_only.dsp.json enable_dsp=true) 은 ValueError 로 거절해야 함
+
+    CASES
+        normal : 합이 full scale 안
+        loud   : vocals+drums+other 합이 full scale 넘음 (clip 된 bass_removed 를 boost)
+"""
+
+SAMPLERATE: int = 44100
+SECONDS: float = 5.0
+BOOSTED_VOLUME_DB: float = 10.0
+# case 이름 -> stem 크기 배율
+CASES: dict[str, float] = {"normal": 1.0, "loud": 2.0}
+LSB: float = 1.0 / float(1 << 23)
+
+
+def _fake_stem(*, seed: int, scale: float) -> np.ndarray:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    n: int = int(SAMPLERATE * SECONDS)
+    t: np.ndarray = np.arange(n, dtype=np.float32) / float(SAMPLERATE)
+    tone: np.ndarray = 0.2 * np.sin(2.0 * np.pi * float(rng.uniform(50.0, 2000.0)) * t)
+    mono: np.ndarray = (scale * (tone + 0.05 * rng.standard_normal(n))).astype(np.float32)
+    return np.stack([mono, mono * 0.8], axis=0)
+
+
+def _read(path: Path) -> np.ndarray:
+    x, _sr = sf.read(str(path), dtype="float32", always_2d=True)
+    return x.T.astype(np.float64)
+
+
+def _write(
+    *,
+    demucs: DemucsAdapter,
+    stems: dict[str, np.ndarray],
+    names: list[str],
+    audio_dir: Path,
+    enable_dsp: bool = False,
+) -> None:
+    outputs: dict[str, np.ndarray] = demucs._build_outputs(
+        stems=stems, names=names, boosted_volume_db=BOOSTED_VOLUME_DB
+    )
+    for name, audio in outputs.items():
+        filename: str = NO_BASS_FILENAME if name == "no_bass" else f"{name}.wav"
+        demucs._write_output(path=audio_dir / filename, audio=audio, samplerate=SAMPLERATE, overwrite=True)
+    demucs._write_dsp_meta(path=audio_dir / DSP_META_FILENAME, dsp_meta={"enable_dsp": enable_dsp})
+
+
+async def _run_case(*, tmp_dir: Path, case: str, scale: float) -> int:
+    demucs: DemucsAdapter = DemucsAdapter()
+    stems: dict[str, np.ndarray] = {
+        name: _fake_stem(seed=i, scale=scale) for i, name in enumerate(["vocals", "drums", "other", "bass"])
+    }
+
+    eager_dir: Path = tmp_dir / case / "eager"
+    lazy_dir: Path = tmp_dir / case / "lazy"
+    _write(demucs=demucs, stems=stems, names=["bass_only", "bass_removed", "bass_boosted"], audio_dir=eager_dir)
+    _write(demucs=demucs, stems=stems, names=["bass_only", "no_bass"], audio_dir=lazy_dir)
+
+    derived: DerivedAudioAdapter = DerivedAudioAdapter(storage_root=tmp_dir)
+    failed: int = 0
+    for kind, tolerance in (("bass_removed", 0.0), ("bass_boosted", LSB * (10.0 ** (BOOSTED_VOLUME_DB / 20.0) + 1.0))):
+        result = await derived.materialize(
+            bass_only_wav_path=lazy_dir / BASS_ONLY_FILENAME,
+            kind=kind,  # type: ignore[arg-type]
+            boosted_volume_db=BOOSTED_VOLUME_DB,
+        )
+        max_abs: float = float(np.max(np.abs(_read(result.path) - _read(eager_dir / f"{kind}.wav"))))
+        ok: bool = max_abs <= tolerance + 1e-12
+        failed += 0 if ok else 1
+        print(f"{case} {kind}: max_abs={max_abs:.3e} ({max_abs / LSB:.1f} LSB) -> {'OK' if ok else 'FAIL'}")
+
+    # dsp 는 실제로 안 돌리고 기록만 (거절만 확인)
+    dsp_dir: Path = tmp_dir / case / "dsp"
+    _write(demucs=demucs, stems=stems, names=["bass_only", "no_bass"], audio_dir=dsp_dir, enable_dsp=True)
+    try:
+        await derived.materialize(bass_only_wav_path=dsp_dir / BASS_ONLY_FILENAME, kind="bass_removed")
+        failed += 1
+        print(f"{case} dsp: materialized -> FAIL")
+    except ValueError:
+        print(f"{case} dsp: rejected -> OK")
+    return failed
+
+
+async def main() -> None:
+    failed: int = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for case, scale in CASES.items():
+            failed += await _run_case(tmp_dir=Path(tmp), case=case, scale=scale)
+
+    print("파생 음원 확인 완료" if failed == 0 else f"파생 음원 확인 실패 {failed}건")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
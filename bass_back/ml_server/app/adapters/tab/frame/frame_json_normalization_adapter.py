@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from app.application.ports.basic_pitch.basic_pitch_port import (
     BasicPitchFramePitchDTO,
-    BasicPitchNoteEventDTO,
+    BasicPitchFrameTrack,
+    NoteTrack,
+    as_frame_track,
 )
 from app.application.ports.tab.frame.frame_note_normalization_port import (
     FramePitchNormalizeParams,
@@ -18,6 +22,12 @@ from app.application.ports.tab.frame.frame_note_normalization_port import (
     input_json -> 이건 옥타브 보정을 먼저 한 원시 json파일
     최종 : sort -> conf_cut -> frames_to_onset -> merge -> 마지막 보정
     최종 : sort -> frames_to_onset -> merge -> 마지막 보정 -> conf_cut 
+
+    단계 사이는 NoteTrack 으로 넘김 (DTO list 는 안만듦)
+        frames_to_onset : np.diff 로 run 경계, reduceat 으로 run 별 confidence
+        merge           : 이웃 note 비교 mask -> 그룹 경계 -> reduceat
+        conf / 길이 컷  : mask
+        close_octave    : 앞 note 의 보정 결과에 의존해서 순차 (note 수 만큼만)
 """
 
 
@@ -28,49 +38,13 @@ class FramePitchNormalizeAdapter(FramePitchNormalizePort):
     def normalize(
         self,
         *,
-        notes: list[BasicPitchFramePitchDTO],
+        notes: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
         params: FramePitchNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not notes:
-            return []
-
-        frames_any: list[dict[str, Any]] = [
-            {
-                "t": float(n.t),
-                "pitch_midi": int(n.pitch_midi),
-                "confidence": None if n.confidence is None else float(n.confidence),
-            }
-            for n in notes
-        ]
-
-        frames_sorted: list[dict[str, Any]] = sorted(frames_any, key=lambda r: float(r["t"]))
-
-        runs: list[BasicPitchNoteEventDTO] = self._frames_to_onset(
-            frames=frames_sorted,
-            params=params,
-        )
-
-        merged: list[BasicPitchNoteEventDTO] = self._merge_gap(
-            notes=sorted(runs, key=lambda n: (float(n.start_time), float(n.end_time))),
-            merge_gap_seconds=float(params.merge_gap_seconds),
-        )
-
-        closed_octave: list[BasicPitchNoteEventDTO] = self._close_octave(
-            notes=merged,
-            params=params,
-        )
-
-        notes_confidence_cutted: list[BasicPitchNoteEventDTO] = self._confidence_cut_notes(
-            notes=closed_octave,
-            params=params,
-        )
-
-        out: list[BasicPitchNoteEventDTO] = self._min_duration_cut(
-            notes=notes_confidence_cutted,
-            params=params,
-        )
-
-        return out
+    ) -> NoteTrack:
+        track: BasicPitchFrameTrack = as_frame_track(notes)
+        if len(track) == 0:
+            return NoteTrack.empty()
+        return self._normalize_track(track=track.sorted_by_time(), params=params)
 
     def normalize_file(
         self,
@@ -90,40 +64,48 @@ class FramePitchNormalizeAdapter(FramePitchNormalizePort):
 
         frames_any: list[dict[str, Any]] = self._load_list_json(path=input_json_path)
 
-        frames_sorted: list[dict[str, Any]] = sorted(frames_any, key=lambda r: float(r["t"]))
-
         # (옵션 A) 프레임 단계에서 confidence cut
-        # frames_sorted = self._confidence_cut_frames(frames=frames_sorted, params=params)
+        # frames_any = self._confidence_cut_frames(frames=frames_any, params=params)
 
-        runs: list[BasicPitchNoteEventDTO] = self._frames_to_onset(
-            frames=frames_sorted,
-            params=params,
+        track: BasicPitchFrameTrack = BasicPitchFrameTrack(
+            t=[r["t"] for r in frames_any],
+            pitch_midi=[r["pitch_midi"] for r in frames_any],
+            confidence=[float("nan") if r["confidence"] is None else r["confidence"] for r in frames_any],
         )
 
-        merged: list[BasicPitchNoteEventDTO] = self._merge_gap(
-            notes=sorted(runs, key=lambda n: (float(n.start_time), float(n.end_time))),
+        out: NoteTrack = NoteTrack.empty()
+        if len(track) > 0:
+            out = self._normalize_track(track=track.sorted_by_time(), params=params)
+
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._save_notes_json(path=out_path, notes=out)
+        return out_path
+
+    # t 정렬된 track -> note 열
+    def _normalize_track(
+        self,
+        *,
+        track: BasicPitchFrameTrack,
+        params: FramePitchNormalizeParams,
+    ) -> NoteTrack:
+        runs: NoteTrack = self._frames_to_onset(track=track, params=params)
+
+        # (start, end) 기준 안정 정렬
+        order: np.ndarray = np.lexsort((runs.end_time, runs.start_time))
+        merged: NoteTrack = self._merge_gap(
+            notes=runs.take(order),
             merge_gap_seconds=float(params.merge_gap_seconds),
         )
 
-        closed_octave: list[BasicPitchNoteEventDTO] = self._close_octave(
-            notes=merged,
-            params=params,
-        )
+        closed_octave: NoteTrack = self._close_octave(notes=merged, params=params)
 
         # (옵션 B) 노트 단계에서 confidence cut
-        notes_confidence_cutted: list[BasicPitchNoteEventDTO] = self._confidence_cut_notes(
+        notes_confidence_cutted: NoteTrack = self._confidence_cut_notes(
             notes=closed_octave,
             params=params,
         )
 
-        out: list[BasicPitchNoteEventDTO] = self._min_duration_cut(
-            notes=notes_confidence_cutted,
-            params=params,
-        )
-
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        self._save_notes_json(path=out_path, notes=out)
-        return out_path
+        return self._min_duration_cut(notes=notes_confidence_cutted, params=params)
 
     # list로 로드
     def _load_list_json(self, *, path: Path) -> list[dict[str, Any]]:
@@ -176,152 +158,126 @@ class FramePitchNormalizeAdapter(FramePitchNormalizePort):
             )
         return out
 
-    # confidence로 컷 (notes 버전)
+    # confidence로 컷 (notes 버전) : conf 없음(NaN) 도 버림
     @staticmethod
     def _confidence_cut_notes(
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         params: FramePitchNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not notes:
-            return []
-
-        conf_threshold: float = float(params.conf_threshold)
-
-        out: list[BasicPitchNoteEventDTO] = []
-        for n in notes:
-            if n.confidence is None:
-                continue
-            conf: float = float(n.confidence)
-            if conf < conf_threshold:
-                continue
-            out.append(n)
-        return out
+    ) -> NoteTrack:
+        conf: np.ndarray = notes.confidence
+        keep: np.ndarray = ~np.isnan(conf) & (conf >= float(params.conf_threshold))
+        return notes.compress(keep)
 
-    # merge
+    # merge : 같은 pitch 이고 앞 note 끝과의 간격이 0 ~ merge_gap 이면 합침 (conf 는 둘중 높은것)
     def _merge_gap(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         merge_gap_seconds: float,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not notes:
-            return []
+    ) -> NoteTrack:
+        n: int = len(notes)
+        if n < 2:
+            return notes
+
+        # 모든 note 가 end >= start 이면 합쳐진 note 의 end 는 항상 마지막 note 의 end
+        # -> 이웃끼리만 비교해도 됨 (아니면 순차 버전)
+        if not bool(np.all(notes.end_time >= notes.start_time)):
+            return self._merge_gap_sequential(notes=notes, merge_gap_seconds=merge_gap_seconds)
+
+        gap: np.ndarray = notes.start_time[1:] - notes.end_time[:-1]
+        link: np.ndarray = (
+            (notes.pitch_midi[1:] == notes.pitch_midi[:-1])
+            & (gap >= 0.0)
+            & (gap <= float(merge_gap_seconds))
+        )
 
-        out: list[BasicPitchNoteEventDTO] = []
-        for n in notes:
-            if not out:
-                out.append(n)
-                continue
+        first: np.ndarray = np.flatnonzero(np.concatenate(([True], ~link)))
+        last: np.ndarray = np.concatenate((first[1:] - 1, [n - 1]))
 
-            prev: BasicPitchNoteEventDTO = out[-1]
-            gap: float = float(n.start_time) - float(prev.end_time)
+        return NoteTrack(
+            start_time=notes.start_time[first],
+            end_time=notes.end_time[last],
+            pitch_midi=notes.pitch_midi[first],
+            confidence=np.fmax.reduceat(notes.confidence, first),
+        )
 
-            if int(n.pitch_midi) == int(prev.pitch_midi) and 0.0 <= gap <= float(merge_gap_seconds):
-                out[-1] = BasicPitchNoteEventDTO(
-                    start_time=float(prev.start_time),
-                    end_time=float(max(float(prev.end_time), float(n.end_time))),
-                    pitch_midi=int(prev.pitch_midi),
-                    confidence=self._merge_conf(prev.confidence, n.confidence),
-                )
+    def _merge_gap_sequential(
+        self,
+        *,
+        notes: NoteTrack,
+        merge_gap_seconds: float,
+    ) -> NoteTrack:
+        starts: list[float] = notes.start_time.tolist()
+        ends: list[float] = notes.end_time.tolist()
+        pitches: list[int] = notes.pitch_midi.tolist()
+        confs: list[float] = notes.confidence.tolist()
+
+        out_start: list[float] = [starts[0]]
+        out_end: list[float] = [ends[0]]
+        out_pitch: list[int] = [pitches[0]]
+        out_conf: list[float] = [confs[0]]
+
+        for i in range(1, len(starts)):
+            gap: float = starts[i] - out_end[-1]
+            if pitches[i] == out_pitch[-1] and 0.0 <= gap <= float(merge_gap_seconds):
+                out_end[-1] = max(out_end[-1], ends[i])
+                out_conf[-1] = float(np.fmax(out_conf[-1], confs[i]))
             else:
-                out.append(n)
-
-        return out
-
-    # 둘중 높은 conf 돌려줌
-    def _merge_conf(self, a: float | None, b: float | None) -> float | None:
-        if a is None and b is None:
-            return None
-        if a is None:
-            return float(b)
-        if b is None:
-            return float(a)
-        return float(max(float(a), float(b)))
+                out_start.append(starts[i])
+                out_end.append(ends[i])
+                out_pitch.append(pitches[i])
+                out_conf.append(confs[i])
+
+        return NoteTrack(
+            start_time=out_start,
+            end_time=out_end,
+            pitch_midi=out_pitch,
+            confidence=out_conf,
+        )
 
-    # frames -> onset
+    # frames -> onset (t 정렬된 track)
     def _frames_to_onset(
         self,
         *,
-        frames: list[dict[str, Any]],
+        track: BasicPitchFrameTrack,
         params: FramePitchNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not frames:
-            return []
-
+    ) -> NoteTrack:
         mt: float = float(params.maximum_divide_time)  # 이보다 크면 run 끊음
         dt: float = float(params.default_plus_time)  # 끝에 조금 더해 흔적만 남김
 
-        out: list[BasicPitchNoteEventDTO] = []
-
-        cur_p: int = int(frames[0]["pitch_midi"])
-        start_t: float = float(frames[0]["t"])
-        last_t: float = float(frames[0]["t"])
-
-        confs: list[float] = []
-        c0: object = frames[0].get("confidence", None)
-        if c0 is not None:
-            try:
-                confs.append(float(c0))
-            except Exception:
-                pass
-
-        for r in frames[1:]:
-            t: float = float(r["t"])
-            p: int = int(r["pitch_midi"])
-            c_obj: object = r.get("confidence", None)
-
-            t_gap: float = t - last_t
-            gap_break: bool = t_gap > mt
-            pitch_break: bool = p != cur_p
-
-            if gap_break or pitch_break:
-                out.append(
-                    BasicPitchNoteEventDTO(
-                        start_time=float(start_t),
-                        end_time=float(last_t) + float(dt),
-                        pitch_midi=int(cur_p),
-                        confidence=max(confs),
-                    )
-                )
-
-                cur_p = p
-                start_t = t
-                last_t = t
-                confs = []
-                if c_obj is not None:
-                    try:
-                        confs.append(float(c_obj))
-                    except Exception:
-                        pass
-                continue
-
-            last_t = t
-            if c_obj is not None:
-                try:
-                    confs.append(float(c_obj))
-                except Exception:
-                    pass
-
-        out.append(
-            BasicPitchNoteEventDTO(
-                start_time=float(start_t),
-                end_time=float(last_t) + float(dt),
-                pitch_midi=int(cur_p),
-                confidence=self._median(confs),
-            )
+        t: np.ndarray = track.t
+        p: np.ndarray = track.pitch_midi.astype(np.int64)
+        c: np.ndarray = track.confidence
+        n: int = int(t.shape[0])
+
+        # 시간 간격이 mt 보다 크거나 pitch 가 바뀌면 새 run
+        brk: np.ndarray = (np.diff(t) > mt) | (np.diff(p) != 0)
+        first: np.ndarray = np.flatnonzero(np.concatenate(([True], brk)))
+        last: np.ndarray = np.concatenate((first[1:] - 1, [n - 1]))
+
+        # run 별 conf : 중간 run 은 최대값, 마지막 run 은 중앙값 (conf 없는 frame 제외)
+        conf: np.ndarray = np.fmax.reduceat(c, first)
+        tail: np.ndarray = c[first[-1] :]
+        tail_median: float | None = self._median(tail[~np.isnan(tail)].tolist())
+        conf[-1] = np.nan if tail_median is None else tail_median
+
+        return NoteTrack(
+            start_time=t[first],
+            end_time=t[last] + dt,
+            pitch_midi=p[first],
+            confidence=conf,
         )
-        return out
 
     # 적어도 하나는 merge 해야 살려주는 옵션
     def _min_duration_cut(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         params: FramePitchNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
+    ) -> NoteTrack:
         min_seconds: float = float(params.min_note_seconds)
-        return [n for n in notes if (float(n.end_time) - float(n.start_time)) >= min_seconds]
+        return notes.compress((notes.end_time - notes.start_time) >= min_seconds)
 
     # 중앙값
     def _median(self, values: list[float]) -> float | None:
@@ -333,7 +289,7 @@ class FramePitchNormalizeAdapter(FramePitchNormalizePort):
             return float(vs[mid])
         return float((vs[mid - 1] + vs[mid]) / 2.0)
 
-    def _save_notes_json(self, *, path: Path, notes: list[BasicPitchNoteEventDTO]) -> None:
+    def _save_notes_json(self, *, path: Path, notes: NoteTrack) -> None:
         payload: list[dict[str, object]] = [
             {
                 "start_time": float(n.start_time),
@@ -351,24 +307,21 @@ class FramePitchNormalizeAdapter(FramePitchNormalizePort):
     def _close_octave(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         params: FramePitchNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
+    ) -> NoteTrack:
         """  
             1. 만약에 너무 짧은 시간안데 너무 큰 이동이있다면 물리적으로 불가능 -> 옥타브 튐
             2. 하지만 0번 프렛은 예외이므로 0번 프렛인 후보들은 제외하고 결정.
         """
 
-        if not notes:
-            return []
+        if len(notes) == 0:
+            return notes
 
         fast_jump_sec: float = float(params.fast_jump_sec) if float(params.fast_jump_sec) > 0.0 else 0.20
         fast_jump_semitones: int = int(params.fast_jump_semitones) if int(params.fast_jump_semitones) > 0 else 10
         snap_only_octave: bool = bool(params.snap_only_octave)
 
-        default_num: int = int(params.default)
-        skip_pitch: set[int] = set(range(default_num, 71, 5))
-
         midi_min_obj: Any = params.midi_min
         midi_max_obj: Any = params.midi_max
         midi_min: int | None = None if midi_min_obj is None else int(midi_min_obj)
@@ -384,53 +337,38 @@ class FramePitchNormalizeAdapter(FramePitchNormalizePort):
                     p -= 12
             return int(p)
 
-        # note와 pitch가 있으면 교체함
-        def _replace_pitch(note: BasicPitchNoteEventDTO, new_pitch: int) -> BasicPitchNoteEventDTO:
-            return replace(note, pitch_midi=int(new_pitch))
-
-        # 현재 pitch를 가까운 후보 pitch로 바꿈
+        # 현재 pitch를 가까운 후보 pitch로 바꿈 (cur + 12k 중 target 에 가장 가까운것)
+        # 거리 6 으로 동점이면 k=0 (그대로) 우선, 아니면 작은 k
         def _closest_octave_pitch(cur: int, target: int) -> int:
-            k0: int = int(round((target - cur) / 12.0))
-            best: int = cur
-            best_d: int = abs(cur - target)
-
-            for k in (k0 - 2, k0 - 1, k0, k0 + 1, k0 + 2):
-                cand: int = cur + 12 * k
-                d: int = abs(cand - target)
-                if d < best_d:
-                    best = cand
-                    best_d = d
-
-            return best
-
-        out: list[BasicPitchNoteEventDTO] = list(notes)
-
-        prev_pitch: int = int(out[0].pitch_midi)
-        prev_end_time: float = float(out[0].end_time)
+            q, r = divmod(target - cur, 12)
+            if r < 6:
+                k: int = q
+            elif r > 6:
+                k = q + 1
+            else:
+                k = 0 if q == -1 else q
+            return cur + 12 * k
 
-        for i in range(1, len(out)):
-            cur_note: BasicPitchNoteEventDTO = out[i]
-            cur_pitch: int = int(cur_note.pitch_midi)
-            cur_start_time: float = float(cur_note.start_time)
+        # 앞 note 와의 간격은 보정과 무관 -> 미리 계산, 후보가 아니면 건너뜀
+        pitches: list[int] = notes.pitch_midi.tolist()
+        gap_ok: list[bool] = (notes.start_time[1:] - notes.end_time[:-1] <= fast_jump_sec).tolist()
 
-            dt: float = cur_start_time - prev_end_time
+        prev_pitch: int = pitches[0]
+        for i in range(1, len(pitches)):
+            cur_pitch: int = pitches[i]
             dp: int = cur_pitch - prev_pitch
 
-            should_consider: bool = (dt <= fast_jump_sec) and (abs(dp) >= fast_jump_semitones)
-
-            if should_consider:
+            if gap_ok[i - 1] and abs(dp) >= fast_jump_semitones:
                 if snap_only_octave and abs(dp) == 12:
                     fixed: int = prev_pitch
                 else:
                     fixed = _closest_octave_pitch(cur=cur_pitch, target=prev_pitch)
 
                 fixed = _clamp_pitch(int(fixed))
-
                 if fixed != cur_pitch:
-                    out[i] = _replace_pitch(cur_note, fixed)
+                    pitches[i] = fixed
                     cur_pitch = fixed
 
             prev_pitch = cur_pitch
-            prev_end_time = float(cur_note.end_time)
 
-        return out
\ No newline at end of file
+        return notes.with_pitch(np.asarray(pitches, dtype=np.int64))
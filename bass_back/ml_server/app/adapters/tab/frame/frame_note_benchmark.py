@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+
+import numpy as np
+
+from app.adapters.tab.frame.frame_json_normalization_adapter import FramePitchNormalizeAdapter
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchFrameTrack, BasicPitchNoteEventDTO
+from app.application.ports.tab.frame.frame_note_normalization_port import FramePitchNormalizeParams
+
+"""
+    frame -> note 정규화 속도 비교 (합성 frame, FRAME_COUNTS 별)
+        reference : 이전 구현 (frame 마다 python loop, 단계마다 DTO list 재생성)
+        columns   : 현재 FramePitchNormalizeAdapter (run-length / mask, NoteTrack 반환)
+    결과 note 가 같은지도 같이 확인
+"""
+
+FRAME_COUNTS: tuple[int, ...] = (10_000, 100_000, 500_000)
+FPS: float = 86.0
+REPEATS: int = 3
+SEED: int = 0
+
+
+def _synthetic_track(*, n: int, rng: np.random.Generator) -> BasicPitchFrameTrack:
+    # 평균 8 frame 짜리 note + 가끔 쉼 / 옥타브 튐 / conf 없음
+    lengths: np.ndarray = rng.integers(1, 16, size=n // 4 + 1)
+    pitch_per_note: np.ndarray = rng.integers(28, 60, size=lengths.shape[0])
+    pitch: np.ndarray = np.repeat(pitch_per_note, lengths)[:n]
+    pitch = np.where(rng.random(n) < 0.03, pitch + 12, pitch)
+
+    step: np.ndarray = np.where(rng.random(n) < 0.02, 0.1, 1.0 / FPS)
+    t: np.ndarray = np.cumsum(step)
+
+    conf: np.ndarray = rng.random(n)
+    # reference 는 conf 가 전부 없는 run 에서 max([]) 에러 -> run 첫 frame 은 항상 conf 있게
+    conf[(rng.random(n) < 0.01) & (np.diff(pitch, prepend=-1) == 0) & (step < 0.05)] = np.nan
+    return BasicPitchFrameTrack(t=t, pitch_midi=pitch, confidence=conf)
+
+
+def _reference_normalize(*, track: BasicPitchFrameTrack, params: FramePitchNormalizeParams) -> list[BasicPitchNoteEventDTO]:
+    adapter: FramePitchNormalizeAdapter = FramePitchNormalizeAdapter()
+    ts: list[float] = track.t.tolist()
+    ps: list[int] = track.pitch_midi.tolist()
+    cs: list[float | None] = track.confidence_list()
+    mt: float = float(params.maximum_divide_time)
+    dt: float = float(params.default_plus_time)
+
+    runs: list[BasicPitchNoteEventDTO] = []
+    cur_p, start_t, last_t = ps[0], ts[0], ts[0]
+    confs: list[float] = [] if cs[0] is None else [cs[0]]
+    for t, p, c in zip(ts[1:], ps[1:], cs[1:]):
+        if t - last_t > mt or p != cur_p:
+            runs.append(BasicPitchNoteEventDTO(start_t, last_t + dt, cur_p, max(confs)))
+            cur_p, start_t, last_t = p, t, t
+            confs = [] if c is None else [c]
+            continue
+        last_t = t
+        if c is not None:
+            confs.append(c)
+    runs.append(BasicPitchNoteEventDTO(start_t, last_t + dt, cur_p, adapter._median(confs)))
+
+    merged: list[BasicPitchNoteEventDTO] = []
+    for n in sorted(runs, key=lambda r: (r.start_time, r.end_time)):
+        if merged:
+            prev: BasicPitchNoteEventDTO = merged[-1]
+            gap: float = n.start_time - prev.end_time
+            if n.pitch_midi == prev.pitch_midi and 0.0 <= gap <= float(params.merge_gap_seconds):
+                confs2: list[float] = [c for c in (prev.confidence, n.confidence) if c is not None]
+                merged[-1] = BasicPitchNoteEventDTO(
+                    prev.start_time,
+                    max(prev.end_time, n.end_time),
+                    prev.pitch_midi,
+                    max(confs2) if confs2 else None,
+                )
+                continue
+        merged.append(n)
+
+    closed: list[BasicPitchNoteEventDTO] = _reference_close_octave(notes=merged, params=params)
+
+    return [
+        n
+        for n in closed
+        if n.confidence is not None
+        and n.confidence >= float(params.conf_threshold)
+        and (n.end_time - n.start_time) >= float(params.min_note_seconds)
+    ]
+
+
+def _reference_close_octave(
+    *,
+    notes: list[BasicPitchNoteEventDTO],
+    params: FramePitchNormalizeParams,
+) -> list[BasicPitchNoteEventDTO]:
+    out: list[BasicPitchNoteEventDTO] = list(notes)
+    prev_pitch: int = out[0].pitch_midi
+    prev_end: float = out[0].end_time
+
+    for i in range(1, len(out)):
+        cur: BasicPitchNoteEventDTO = out[i]
+        p: int = cur.pitch_midi
+        dp: int = p - prev_pitch
+        if cur.start_time - prev_end <= float(params.fast_jump_sec) and abs(dp) >= int(params.fast_jump_semitones):
+            if params.snap_only_octave and abs(dp) == 12:
+                fixed: int = prev_pitch
+            else:
+                k0: int = int(round((prev_pitch - p) / 12.0))
+                fixed = p
+                for k in (k0 - 2, k0 - 1, k0, k0 + 1, k0 + 2):
+                    if abs(p + 12 * k - prev_pitch) < abs(fixed - prev_pitch):
+                        fixed = p + 12 * k
+            while fixed < int(params.midi_min):
+                fixed += 12
+            while fixed > int(params.midi_max):
+                fixed -= 12
+            if fixed != p:
+                out[i] = replace(cur, pitch_midi=fixed)
+                p = fixed
+        prev_pitch = p
+        prev_end = cur.end_time
+    return out
+
+
+def _best_of(fn, repeats: int) -> float:  # type: ignore[no-untyped-def]
+    best: float = float("inf")
+    for _ in range(repeats):
+        t0: float = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    rng: np.random.Generator = np.random.default_rng(SEED)
+    params: FramePitchNormalizeParams = FramePitchNormalizeParams()
+    adapter: FramePitchNormalizeAdapter = FramePitchNormalizeAdapter()
+
+    for n in FRAME_COUNTS:
+        track: BasicPitchFrameTrack = _synthetic_track(n=n, rng=rng)
+
+        ref: list[BasicPitchNoteEventDTO] = _reference_normalize(track=track, params=params)
+        got: list[BasicPitchNoteEventDTO] = adapter.normalize(notes=track, params=params).to_dtos()
+
+        t_ref: float = _best_of(lambda: _reference_normalize(track=track, params=params), REPEATS)
+        t_new: float = _best_of(lambda: adapter.normalize(notes=track, params=params), REPEATS)
+
+        print(
+            f"frames={n} notes={len(got)} reference={t_ref * 1000.0:.1f}ms "
+            f"columns={t_new * 1000.0:.1f}ms speedup={t_ref / max(t_new, 1e-9):.1f}x "
+            f"identical={ref == got}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,115 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from math import inf
 from pathlib import Path
 from typing import Any
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchFramePitchDTO
+import numpy as np
+
+from app.adapters.tab.octave_viterbi_kernel import FixedLagOctaveDecoder, decode_octave_offsets
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchFramePitchDTO,
+    BasicPitchFrameTrack,
+    as_frame_track,
+)
 from app.application.ports.tab.frame.frame_octave_port import (
     FramePitchOctaveNormalizeParams,
     FramePitchOctaveNormalizePort,
+    FramePitchOctaveStreamPort,
 )
 
 
+def _octave_offsets(params: FramePitchOctaveNormalizeParams) -> list[int]:
+    offsets: list[int] = [int(k) for k in params.alias_semitones]
+    if 0 not in offsets:
+        offsets = [0] + offsets
+    return offsets
+
+
+def _apply_offsets(
+    *,
+    track: BasicPitchFrameTrack,
+    offsets: np.ndarray,
+    params: FramePitchOctaveNormalizeParams,
+) -> BasicPitchFrameTrack:
+    st_pitch: np.ndarray = track.pitch_midi.astype(np.int64) + offsets
+    st_pitch = np.minimum(np.maximum(st_pitch, int(params.midi_min)), int(params.midi_max))
+    return track.with_pitch(st_pitch)
+
+
+class FramePitchOctaveStream(FramePitchOctaveStreamPort):
+    """
+    fixed-lag 온라인 옥타브 보정 (basic_pitch window 단위 등으로 chunk push)
+
+    push  : chunk 를 이어서 decode, lag frame 보다 뒤로 밀려난 frame 만 보정해서 반환
+    flush : 남은 frame 전부 확정
+    보관하는 것은 미확정 frame (최대 lag + chunk) 과 그 back-pointer 뿐
+    lag 가 전체 길이 이상이면 normalize_track 과 같은 결과
+    """
+
+    def __init__(self, *, params: FramePitchOctaveNormalizeParams, lag_frames: int) -> None:
+        self._params: FramePitchOctaveNormalizeParams = params
+        self._decoder: FixedLagOctaveDecoder = FixedLagOctaveDecoder(
+            offsets=_octave_offsets(params),
+            lag=int(lag_frames),
+            alias_cost_per_octave=float(params.alias_cost_per_octave),
+            conf_floor=float(params.conf_floor),
+            conf_power=float(params.conf_power),
+            conf_default=float(params.conf_default),
+            conf_cost=float(params.conf_cost),
+            lambda_step=float(params.lambda_step),
+            lambda_oct=float(params.lambda_oct),
+        )
+        self._pending: BasicPitchFrameTrack = BasicPitchFrameTrack.empty()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def push(
+        self,
+        *,
+        frames: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
+    ) -> BasicPitchFrameTrack:
+        chunk: BasicPitchFrameTrack = as_frame_track(frames)
+        if len(chunk) == 0:
+            return BasicPitchFrameTrack.empty()
+
+        settled: np.ndarray = self._decoder.push(pitches=chunk.pitch_midi, confidence=chunk.confidence)
+        self._pending = self._concat(self._pending, chunk)
+        return self._take(offsets=settled)
+
+    def flush(self) -> BasicPitchFrameTrack:
+        return self._take(offsets=self._decoder.flush())
+
+    def _take(self, *, offsets: np.ndarray) -> BasicPitchFrameTrack:
+        n: int = int(offsets.shape[0])
+        if n == 0:
+            return BasicPitchFrameTrack.empty()
+
+        head: BasicPitchFrameTrack = BasicPitchFrameTrack(
+            t=self._pending.t[:n],
+            pitch_midi=self._pending.pitch_midi[:n],
+            confidence=self._pending.confidence[:n],
+        )
+        self._pending = BasicPitchFrameTrack(
+            t=self._pending.t[n:].copy(),
+            pitch_midi=self._pending.pitch_midi[n:].copy(),
+            confidence=self._pending.confidence[n:].copy(),
+        )
+        return _apply_offsets(track=head, offsets=offsets, params=self._params)
+
+    @staticmethod
+    def _concat(a: BasicPitchFrameTrack, b: BasicPitchFrameTrack) -> BasicPitchFrameTrack:
+        if len(a) == 0:
+            return b
+        return BasicPitchFrameTrack(
+            t=np.concatenate([a.t, b.t]),
+            pitch_midi=np.concatenate([a.pitch_midi, b.pitch_midi]),
+            confidence=np.concatenate([a.confidence, b.confidence]),
+        )
+
+
 @dataclass(frozen=True)
 class FramePitchOctaveNormalizeAdapter(FramePitchOctaveNormalizePort):
     output_filename: str = "frame_pitch_octave_normalized.json"
@@ -23,116 +121,58 @@ class FramePitchOctaveNormalizeAdapter(FramePitchOctaveNormalizePort):
     Transition -> 연속성 비용 + 옥타브 점프 추가 비용
 
     총점 = transition(연속성/점프 비용) + emission(관측과의 일치 비용)
+    (비용 행렬 / DP 는 octave_viterbi_kernel 공용)
     """
 
+    # list[DTO] 가 오면 list[DTO], BasicPitchFrameTrack 이 오면 BasicPitchFrameTrack 반환
     def normalize(
         self,
         *,
-        frames: list[BasicPitchFramePitchDTO],
+        frames: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
         params: FramePitchOctaveNormalizeParams,
-    ) -> list[BasicPitchFramePitchDTO]:
-        if not frames:
-            return []
-
-        offsets: list[int] = [int(k) for k in params.alias_semitones]
-        if 0 not in offsets:
-            offsets = [0] + offsets
-
-        S: int = len(offsets)
-        T: int = len(frames)
-
-        prev_idx: list[list[int]] = [[-1] * S for _ in range(T)]
-        prev_cost: list[float] = [inf] * S
-        cur_cost: list[float] = [inf] * S
-
-        conf0: float | None = frames[0].confidence
-        for s in range(S):
-            prev_cost[s] = self._emission_cost_offset(
-                offset=offsets[s],
-                obs_conf=conf0,
-                params=params,
-            )
-            prev_idx[0][s] = -1
-
-        for t in range(1, T):
-            obs_pitch: int = frames[t].pitch_midi
-            obs_conf: float | None = frames[t].confidence
-
-            cur_state_pitches: list[int] = [obs_pitch + k for k in offsets]
-
-            emit_costs: list[float] = [
-                self._emission_cost_offset(
-                    offset=k,
-                    obs_conf=obs_conf,
-                    params=params,
-                )
-                for k in offsets
-            ]
-
-            prev_obs_pitch: int = frames[t - 1].pitch_midi
-
-            for s in range(S):
-                best_cost: float = inf
-                best_pi: int = -1
-
-                cur_pitch: int = cur_state_pitches[s]
-
-                for p in range(S):
-                    prev_pitch: int = prev_obs_pitch + offsets[p]
-
-                    trans: float = self._transition_cost(
-                        prev_pitch=prev_pitch,
-                        cur_pitch=cur_pitch,
-                        params=params,
-                    )
-
-                    c: float = prev_cost[p] + trans
-
-                    if c < best_cost:
-                        best_cost = c
-                        best_pi = p
-
-                cur_cost[s] = best_cost + emit_costs[s]
-                prev_idx[t][s] = best_pi
-
-            prev_cost, cur_cost = cur_cost, [inf] * S
-
-        last_state: int = min(range(S), key=lambda i: prev_cost[i])
-
-        path_state_idx: list[int] = [0] * T
-        path_state_idx[T - 1] = last_state
-
-        for t in range(T - 1, 0, -1):
-            path_state_idx[t - 1] = prev_idx[t][path_state_idx[t]]
-
-        midi_min: int = params.midi_min
-        midi_max: int = params.midi_max
-
-        out: list[BasicPitchFramePitchDTO] = []
-
-        for t in range(T):
-            obs_pitch: int = frames[t].pitch_midi
-            best_offset: int = offsets[path_state_idx[t]]
-
-            st_pitch: int = obs_pitch + best_offset
-
-            if st_pitch < midi_min:
-                st_pitch = midi_min
-
-            if st_pitch > midi_max:
-                st_pitch = midi_max
+    ) -> list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack:
+        out_track: BasicPitchFrameTrack = self.normalize_track(
+            track=as_frame_track(frames),
+            params=params,
+        )
+        if isinstance(frames, BasicPitchFrameTrack):
+            return out_track
+        return out_track.to_dtos()
 
-            f: BasicPitchFramePitchDTO = frames[t]
+    def normalize_track(
+        self,
+        *,
+        track: BasicPitchFrameTrack,
+        params: FramePitchOctaveNormalizeParams,
+    ) -> BasicPitchFrameTrack:
+        if len(track) == 0:
+            return track
+
+        offsets: list[int] = _octave_offsets(params)
+
+        best_offsets: np.ndarray = decode_octave_offsets(
+            pitches=track.pitch_midi,
+            confidence=track.confidence,
+            offsets=offsets,
+            alias_cost_per_octave=float(params.alias_cost_per_octave),
+            conf_floor=float(params.conf_floor),
+            conf_power=float(params.conf_power),
+            conf_default=float(params.conf_default),
+            conf_cost=float(params.conf_cost),
+            lambda_step=float(params.lambda_step),
+            lambda_oct=float(params.lambda_oct),
+        )
 
-            out.append(
-                BasicPitchFramePitchDTO(
-                    t=float(f.t),
-                    pitch_midi=int(st_pitch),
-                    confidence=f.confidence,
-                )
-            )
+        return _apply_offsets(track=track, offsets=best_offsets, params=params)
 
-        return out
+    # lag_frames 256 = 86fps 기준 약 3초
+    def open_stream(
+        self,
+        *,
+        params: FramePitchOctaveNormalizeParams,
+        lag_frames: int = 256,
+    ) -> FramePitchOctaveStream:
+        return FramePitchOctaveStream(params=params, lag_frames=lag_frames)
 
     def normalize_file(
         self,
@@ -207,46 +247,3 @@ class FramePitchOctaveNormalizeAdapter(FramePitchOctaveNormalizePort):
             )
 
         return out
-
-    def _emission_cost_offset(
-        self,
-        *,
-        offset: int,
-        obs_conf: float | None,
-        params: FramePitchOctaveNormalizeParams,
-    ) -> float:
-        conf_floor: float = params.conf_floor
-        conf_power: float = params.conf_power
-        conf_default: float = params.conf_default
-        conf_cost: float = params.conf_cost
-
-        c: float = conf_floor if obs_conf is None else float(obs_conf)
-
-        if c < conf_floor:
-            c = conf_floor
-        if c > 1.0:
-            c = 1.0
-
-        conf_w: float = c ** conf_power
-
-        octs: int = abs(offset) // 12
-        alias_pen: float = octs * params.alias_cost_per_octave
-
-        return alias_pen * (conf_default + conf_cost * conf_w)
-
-    def _transition_cost(
-        self,
-        *,
-        prev_pitch: int,
-        cur_pitch: int,
-        params: FramePitchOctaveNormalizeParams,
-    ) -> float:
-        dp: int = abs(cur_pitch - prev_pitch)
-
-        # 보편적으로 너무 큰 dp를 그대로 벌점주면 과하게 고정될 수 있어서 캡핑
-        step_cost: float = params.lambda_step * min(dp, 12)
-
-        is_oct_like: bool = (dp % 12 == 0)
-        oct_cost: float = params.lambda_oct if is_oct_like else 0.0
-
-        return step_cost + oct_cost
\ No newline at end of file
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from app.adapters.tab.frame.frame_octave_adapter import FramePitchOctaveNormalizeAdapter, FramePitchOctaveStream
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchFrameTrack
+from app.application.ports.tab.frame.frame_octave_port import FramePitchOctaveNormalizeParams
+
+"""
+    fixed-lag 스트리밍 보정 vs 전체 보정 비교
+    frame_pitches.json 을 CHUNK_FRAMES 단위로 push 하면서 lag 별 일치율 / 최대 미확정 frame 수 출력
+"""
+
+CHUNK_FRAMES: int = 2048
+LAGS: tuple[int, ...] = (32, 128, 256, 1024)
+
+
+def main() -> None:
+    input_json_path: Path = Path(r"C:\bass_project\storage\assets\last\frame_pitches.json")
+
+    with input_json_path.open("r", encoding="utf-8") as f:
+        raw_obj: object = json.load(f)
+
+    adapter: FramePitchOctaveNormalizeAdapter = FramePitchOctaveNormalizeAdapter()
+    params: FramePitchOctaveNormalizeParams = FramePitchOctaveNormalizeParams()
+
+    track: BasicPitchFrameTrack = BasicPitchFrameTrack.from_dtos(adapter._parse_frames_json(raw_obj))
+    full: BasicPitchFrameTrack = adapter.normalize_track(track=track, params=params)
+    print(f"frames={len(track)}")
+
+    for lag in LAGS:
+        stream: FramePitchOctaveStream = adapter.open_stream(params=params, lag_frames=lag)
+        out_pitch: list[np.ndarray] = []
+        max_pending: int = 0
+
+        for i in range(0, len(track), CHUNK_FRAMES):
+            chunk: BasicPitchFrameTrack = BasicPitchFrameTrack(
+                t=track.t[i : i + CHUNK_FRAMES],
+                pitch_midi=track.pitch_midi[i : i + CHUNK_FRAMES],
+                confidence=track.confidence[i : i + CHUNK_FRAMES],
+            )
+            out_pitch.append(stream.push(frames=chunk).pitch_midi)
+            max_pending = max(max_pending, stream.pending)
+        out_pitch.append(stream.flush().pitch_midi)
+
+        got: np.ndarray = np.concatenate(out_pitch) if out_pitch else np.zeros((0,), dtype=np.int16)
+        same: float = float(np.mean(got == full.pitch_midi)) if len(full) else 1.0
+        print(f"lag={lag} match={same * 100.0:.2f}% max_pending={max_pending}")
+
+
+if __name__ == "__main__":
+    main()
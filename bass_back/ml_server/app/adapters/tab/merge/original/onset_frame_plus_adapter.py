@@ -5,7 +5,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+import numpy as np
+
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchNoteEventDTO,
+    NoteTrack,
+    as_note_track,
+)
 from app.application.ports.tab.merge.original.onset_frame_plus_port import (
     OnsetFrameFuseParams,
     OnsetFrameFusePort,
@@ -28,97 +34,48 @@ class OnsetFrameFuseAdapter(OnsetFrameFusePort):
         self,
         *,
         bpm: float,
-        onset_notes: list[BasicPitchNoteEventDTO],
-        frame_notes: list[BasicPitchNoteEventDTO],
+        onset_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
+        frame_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetFrameFuseParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        onset_sorted: list[BasicPitchNoteEventDTO] = sorted(
-            onset_notes,
-            key=lambda n: (float(n.start_time), float(n.end_time), int(n.pitch_midi)),
-        )
-        frame_sorted: list[BasicPitchNoteEventDTO] = sorted(
-            frame_notes,
-            key=lambda n: (float(n.start_time), float(n.end_time), int(n.pitch_midi)),
-        )
+    ) -> NoteTrack:
+        onset_sorted: NoteTrack = as_note_track(onset_notes).sorted()
+        frame_sorted: NoteTrack = as_note_track(frame_notes).sorted()
 
-        if not onset_sorted:
+        if len(onset_sorted) == 0:
             # "첫 음은 onset 이후" 정책상 onset이 없으면 결과도 없음
-            return []
+            return NoteTrack.empty()
 
         # first_onset 이전 frame 제거
-        first_onset_start: float = float(onset_sorted[0].start_time)
-        frame_filtered: list[BasicPitchNoteEventDTO] = [
-            f for f in frame_sorted if float(f.start_time) >= first_onset_start
-        ]
+        first_onset_start: float = float(onset_sorted.start_time[0])
+        frame_filtered: NoteTrack = frame_sorted.compress(frame_sorted.start_time >= first_onset_start)
 
         # onset skeleton 만들기 (유효한 노트만)
-        onset_skeleton: list[BasicPitchNoteEventDTO] = [
-            BasicPitchNoteEventDTO(
-                start_time=float(o.start_time),
-                end_time=float(o.end_time),
-                pitch_midi=int(o.pitch_midi),
-                confidence=None if o.confidence is None else float(o.confidence),
-            )
-            for o in onset_sorted
-            if float(o.end_time) > float(o.start_time)
-        ]
-        if not onset_skeleton:
-            return []
+        onset_skeleton: NoteTrack = onset_sorted.compress(onset_sorted.end_time > onset_sorted.start_time)
+        if len(onset_skeleton) == 0:
+            return NoteTrack.empty()
 
         # sustain 확장 안 함
-        skeleton: list[BasicPitchNoteEventDTO] = list(onset_skeleton)
+        skeleton: NoteTrack = onset_skeleton
 
-        if not frame_filtered:
+        if len(frame_filtered) == 0:
             return self._finalize(bpm=bpm, notes=skeleton, params=params)
 
-        inserts: list[BasicPitchNoteEventDTO] = []
         sec_per_step: float = self._sec_per_step(bpm=bpm, params=params)
         min_len: float = float(params.missing_min_steps) * sec_per_step
 
-        for f in frame_filtered:
-            frame_start: float = float(f.start_time)
-            frame_end: float = float(f.end_time)
-            frame_pitch: int = int(f.pitch_midi)
-
-            if frame_end <= frame_start:
-                continue
-
-            # onset과 겹치면 삽입 금지
-            if self._frame_overlaps_any_onset(
-                f0=frame_start,
-                f1=frame_end,
-                onsets=skeleton,
-                params=params,
-            ):
-                continue
-
-            # onset "사이" 구간에만 삽입 허용 (마지막 이후는 기본 불허)
-            if not self._is_frame_between_onsets(
-                f0=frame_start,
-                f1=frame_end,
-                onsets=skeleton,
-                bpm=bpm,
-                params=params,
-            ):
-                continue
-
-            # 최소 길이 조건
-            if (frame_end - frame_start) + 1e-9 < min_len:
-                continue
-
-            inserts.append(
-                BasicPitchNoteEventDTO(
-                    start_time=frame_start,
-                    end_time=frame_end,
-                    pitch_midi=frame_pitch,
-                    confidence=f.confidence,
-                )
-            )
-
-        combined: list[BasicPitchNoteEventDTO] = sorted(
-            skeleton + inserts,
-            key=lambda n: (float(n.start_time), float(n.end_time), int(n.pitch_midi)),
-        )
+        f0: np.ndarray = frame_filtered.start_time
+        f1: np.ndarray = frame_filtered.end_time
+
+        keep: np.ndarray = f1 > f0
+        # onset과 겹치면 삽입 금지
+        keep &= ~self._frames_overlap_onsets(f0=f0, f1=f1, onsets=skeleton, params=params)
+        # onset "사이" 구간에만 삽입 허용 (마지막 이후는 기본 불허)
+        keep &= self._frames_between_onsets(f0=f0, f1=f1, onsets=skeleton, bpm=bpm, params=params)
+        # 최소 길이 조건
+        keep &= ~((f1 - f0) + 1e-9 < min_len)
+
+        inserts: NoteTrack = frame_filtered.compress(keep)
+        combined: NoteTrack = NoteTrack.concat([skeleton, inserts]).sorted()
 
         return self._finalize(bpm=bpm, notes=combined, params=params)
 
@@ -126,13 +83,13 @@ class OnsetFrameFuseAdapter(OnsetFrameFusePort):
         self,
         *,
         bpm: float,
-        onset_notes: list[BasicPitchNoteEventDTO],
-        frame_notes: list[BasicPitchNoteEventDTO],
+        onset_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
+        frame_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         output_dir: str,
         params: OnsetFrameFuseParams,
         overwrite=True
     ) -> None:
-        out: list[BasicPitchNoteEventDTO] = self.normalize(
+        out: NoteTrack = self.normalize(
             bpm=bpm,
             onset_notes=onset_notes,
             frame_notes=frame_notes,
@@ -170,126 +127,118 @@ class OnsetFrameFuseAdapter(OnsetFrameFusePort):
         sec_per_beat: float = 60.0 / bpm_f
         return sec_per_beat / float(steps_per_beat)
 
-    @staticmethod
-    def _overlap_len(*, a0: float, a1: float, b0: float, b1: float) -> float:
-        lo: float = max(float(a0), float(b0))
-        hi: float = min(float(a1), float(b1))
-        return 0.0 if hi <= lo else float(hi - lo)
-
-    def _frame_overlaps_any_onset(
+    def _frames_overlap_onsets(
         self,
         *,
-        f0: float,
-        f1: float,
-        onsets: list[BasicPitchNoteEventDTO],
+        f0: np.ndarray,
+        f1: np.ndarray,
+        onsets: NoteTrack,
         params: OnsetFrameFuseParams,
-    ) -> bool:
+    ) -> np.ndarray:
         """
         frame [f0,f1) 이 onset 구간과 min_overlap_seconds 이상 겹치면 True.
         sustain을 안 쓰므로 pitch 비교 없이 시간 겹침만 본다.
+
+        onset 은 start 순 정렬 (end>start)
+        -> start < f1 인 onset 은 앞쪽 [0, hi) 구간 (searchsorted)
+        -> 그중 end > f0 인게 있으면 겹침 = 앞에서부터 end 누적 최대값 > f0
+        min_overlap_seconds 가 있으면 겹치는 후보 구간 [lo, hi) 만 실제 겹친 길이 확인
         """
         min_ov_sec: float = float(getattr(params, "min_overlap_seconds", 0.0))
         if min_ov_sec < 0.0:
             min_ov_sec = 0.0
 
-        for o in onsets:
-            o0: float = float(o.start_time)
-            o1: float = float(o.end_time)
-            ov: float = self._overlap_len(a0=f0, a1=f1, b0=o0, b1=o1)
-            if ov + 1e-12 >= min_ov_sec and ov > 0.0:
-                return True
-
-        return False
-
-    def _is_frame_between_onsets(
+        o0: np.ndarray = onsets.start_time
+        o1: np.ndarray = onsets.end_time
+        end_prefix_max: np.ndarray = np.maximum.accumulate(o1)
+
+        hi: np.ndarray = np.searchsorted(o0, f1, side="left")
+        overlaps: np.ndarray = (hi > 0) & (end_prefix_max[np.maximum(hi - 1, 0)] > f0)
+        if min_ov_sec <= 0.0:
+            return overlaps
+
+        # end 누적 최대값이 f0 를 처음 넘는 곳부터가 겹칠 수 있는 onset
+        lo: np.ndarray = np.searchsorted(end_prefix_max, f0, side="right")
+        for i in np.flatnonzero(overlaps).tolist():
+            k0: int = int(lo[i])
+            k1: int = int(hi[i])
+            ov: np.ndarray = np.minimum(f1[i], o1[k0:k1]) - np.maximum(f0[i], o0[k0:k1])
+            overlaps[i] = bool(np.any((ov + 1e-12 >= min_ov_sec) & (ov > 0.0)))
+        return overlaps
+
+    def _frames_between_onsets(
         self,
         *,
-        f0: float,
-        f1: float,
-        onsets: list[BasicPitchNoteEventDTO],
+        f0: np.ndarray,
+        f1: np.ndarray,
+        onsets: NoteTrack,
         bpm: float,
         params: OnsetFrameFuseParams,
-    ) -> bool:
+    ) -> np.ndarray:
         """
         frame이 onset 사이의 빈 구간에 '완전히' 들어가면 True.
 
         - 기본: 마지막 onset 이후는 False (끝에 노이즈 붙는 걸 방지)
         - 옵션: params.allow_after_last_onset=True 이면, after_last_tail_steps 이내만 허용
+
+        빈 구간 i = (onset[i-1].end, onset[i].start)
+        -> onset[i].start >= f1 인 i 는 뒤쪽 [j, n) 구간 (searchsorted)
+        -> 그중 onset[i-1].end <= f0 인게 있으면 True = 뒤에서부터 prev_end 누적 최소값 <= f0
         """
-        if not onsets:
-            return False
+        n: int = len(onsets)
+        if n == 0:
+            return np.zeros(f0.shape, dtype=bool)
+
+        o0: np.ndarray = onsets.start_time
+        o1: np.ndarray = onsets.end_time
+
+        between: np.ndarray = np.zeros(f0.shape, dtype=bool)
+        if n >= 2:
+            prev_end_suffix_min: np.ndarray = np.minimum.accumulate(o1[:-1][::-1])[::-1]
+            j: np.ndarray = np.maximum(np.searchsorted(o0, f1, side="left"), 1)
+            valid: np.ndarray = j <= n - 1
+            between[valid] = prev_end_suffix_min[j[valid] - 1] <= f0[valid]
 
         # (옵션) 마지막 onset 이후 허용
         allow_after_last: bool = bool(getattr(params, "allow_after_last_onset", False))
         after_tail_steps: int = int(getattr(params, "after_last_tail_steps", 0))
-        last_end: float = float(onsets[-1].end_time)
-        if f0 >= last_end:
-            if not allow_after_last:
-                return False
-            if after_tail_steps <= 0:
-                return False
-            sec_per_step: float = self._sec_per_step(bpm=bpm, params=params)
-            tail_allow: float = float(after_tail_steps) * sec_per_step
-            return (f0 - last_end) <= tail_allow
-
-        # onset 사이 빈 구간
-        for i in range(1, len(onsets)):
-            prev_end: float = float(onsets[i - 1].end_time)
-            next_start: float = float(onsets[i].start_time)
-            if f0 >= prev_end and f1 <= next_start:
-                return True
-
-        return False
+        last_end: float = float(o1[-1])
+        after_last: np.ndarray = f0 >= last_end
+
+        if not allow_after_last or after_tail_steps <= 0:
+            return between & ~after_last
+
+        sec_per_step: float = self._sec_per_step(bpm=bpm, params=params)
+        tail_allow: float = float(after_tail_steps) * sec_per_step
+        return np.where(after_last, (f0 - last_end) <= tail_allow, between)
 
     def _finalize(
         self,
         *,
         bpm: float,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         params: OnsetFrameFuseParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not notes:
-            return []
+    ) -> NoteTrack:
+        valid: NoteTrack = notes.compress(notes.end_time > notes.start_time)
+        if len(valid) == 0:
+            return NoteTrack.empty()
 
         # quantize 끄면 정렬만
         if not bool(params.quantize):
-            return sorted(
-                [
-                    BasicPitchNoteEventDTO(
-                        start_time=float(n.start_time),
-                        end_time=float(n.end_time),
-                        pitch_midi=int(n.pitch_midi),
-                        confidence=n.confidence,
-                    )
-                    for n in notes
-                    if float(n.end_time) > float(n.start_time)
-                ],
-                key=lambda n: (float(n.start_time), float(n.end_time), int(n.pitch_midi)),
-            )
+            return valid.sorted()
 
         sec_per_step: float = self._sec_per_step(bpm=bpm, params=params)
 
-        out: list[BasicPitchNoteEventDTO] = []
-        for n in notes:
-            st: float = float(n.start_time)
-            et: float = float(n.end_time)
-            if et <= st:
-                continue
-
-            qs: float = round(st / sec_per_step) * sec_per_step
-            qe: float = round(et / sec_per_step) * sec_per_step
-
-            # 최소 1 step 길이 보장
-            if qe <= qs:
-                qe = qs + sec_per_step
-
-            out.append(
-                BasicPitchNoteEventDTO(
-                    start_time=float(qs),
-                    end_time=float(qe),
-                    pitch_midi=int(n.pitch_midi),
-                    confidence=n.confidence,
-                )
-            )
-
-        return sorted(out, key=lambda n: (float(n.start_time), float(n.end_time), int(n.pitch_midi)))
\ No newline at end of file
+        # python round 와 같은 half-to-even
+        qs: np.ndarray = np.round(valid.start_time / sec_per_step) * sec_per_step
+        qe: np.ndarray = np.round(valid.end_time / sec_per_step) * sec_per_step
+
+        # 최소 1 step 길이 보장
+        qe = np.where(qe <= qs, qs + sec_per_step, qe)
+
+        return NoteTrack(
+            start_time=qs,
+            end_time=qe,
+            pitch_midi=valid.pitch_midi,
+            confidence=valid.confidence,
+        ).sorted()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.adapters.tab.merge.original.onset_frame_plus_adapter import OnsetFrameFuseAdapter
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
+from app.application.ports.tab.merge.original.onset_frame_plus_port import OnsetFrameFuseParams
+
+"""
+    OnsetFrameFuseAdapter (searchsorted) vs 이전 구현 (frame 마다 onset 전체 scan) 결과 비교
+    랜덤 onset / frame 으로 TRIALS 회 돌려서 하나라도 다르면 AssertionError
+    마지막에 큰 입력으로 속도 비교
+"""
+
+TRIALS: int = 500
+SEED: int = 0
+BENCH_ONSETS: int = 3000
+BENCH_FRAMES: int = 20000
+
+
+# 옵션 파라미터 (min_overlap_seconds / allow_after_last_onset) 까지 확인용
+@dataclass(frozen=True)
+class _FuseParamsWithOptions(OnsetFrameFuseParams):
+    min_overlap_seconds: float = 0.0
+    allow_after_last_onset: bool = False
+    after_last_tail_steps: int = 0
+
+
+def _reference_fuse(
+    *,
+    bpm: float,
+    onset_notes: list[BasicPitchNoteEventDTO],
+    frame_notes: list[BasicPitchNoteEventDTO],
+    params: OnsetFrameFuseParams,
+) -> list[BasicPitchNoteEventDTO]:
+    def key(n: BasicPitchNoteEventDTO) -> tuple[float, float, int]:
+        return (n.start_time, n.end_time, n.pitch_midi)
+
+    onsets: list[BasicPitchNoteEventDTO] = sorted(onset_notes, key=key)
+    frames: list[BasicPitchNoteEventDTO] = sorted(frame_notes, key=key)
+    if not onsets:
+        return []
+
+    frames = [f for f in frames if f.start_time >= onsets[0].start_time]
+    skeleton: list[BasicPitchNoteEventDTO] = [o for o in onsets if o.end_time > o.start_time]
+    if not skeleton:
+        return []
+
+    sec_per_step: float = 60.0 / float(bpm) / float(params.steps_per_beat)
+    min_len: float = float(params.missing_min_steps) * sec_per_step
+    min_ov: float = max(0.0, float(getattr(params, "min_overlap_seconds", 0.0)))
+    allow_after: bool = bool(getattr(params, "allow_after_last_onset", False))
+    tail_steps: int = int(getattr(params, "after_last_tail_steps", 0))
+
+    inserts: list[BasicPitchNoteEventDTO] = []
+    for f in frames:
+        f0, f1 = f.start_time, f.end_time
+        if f1 <= f0:
+            continue
+
+        overlapped: bool = False
+        for o in skeleton:
+            lo, hi = max(f0, o.start_time), min(f1, o.end_time)
+            ov: float = 0.0 if hi <= lo else hi - lo
+            if ov + 1e-12 >= min_ov and ov > 0.0:
+                overlapped = True
+                break
+        if overlapped:
+            continue
+
+        last_end: float = skeleton[-1].end_time
+        if f0 >= last_end:
+            between: bool = allow_after and tail_steps > 0 and (f0 - last_end) <= tail_steps * sec_per_step
+        else:
+            between = any(
+                f0 >= skeleton[i - 1].end_time and f1 <= skeleton[i].start_time for i in range(1, len(skeleton))
+            )
+        if not between:
+            continue
+
+        if (f1 - f0) + 1e-9 < min_len:
+            continue
+        inserts.append(f)
+
+    combined: list[BasicPitchNoteEventDTO] = sorted(skeleton + inserts, key=key)
+    out: list[BasicPitchNoteEventDTO] = []
+    for n in combined:
+        if not params.quantize:
+            out.append(n)
+            continue
+        qs: float = round(n.start_time / sec_per_step) * sec_per_step
+        qe: float = round(n.end_time / sec_per_step) * sec_per_step
+        if qe <= qs:
+            qe = qs + sec_per_step
+        out.append(BasicPitchNoteEventDTO(qs, qe, n.pitch_midi, n.confidence))
+    return sorted(out, key=key)
+
+
+def _random_notes(*, rng: np.random.Generator, n: int, span: float, grid: float) -> list[BasicPitchNoteEventDTO]:
+    # grid 에 맞춘 시간으로 경계가 딱 맞는 경우(겹침 0, 간격 0)도 자주 나오게
+    starts: np.ndarray = np.round(rng.random(n) * span / grid) * grid
+    lengths: np.ndarray = rng.choice([0.0, grid, 2 * grid, 3 * grid, 5 * grid, -grid], size=n)
+    pitches: np.ndarray = rng.integers(28, 60, size=n)
+    confs: np.ndarray = rng.random(n)
+    return [
+        BasicPitchNoteEventDTO(
+            start_time=float(s),
+            end_time=float(s + d),
+            pitch_midi=int(p),
+            confidence=None if c < 0.1 else float(c),
+        )
+        for s, d, p, c in zip(starts, lengths, pitches, confs)
+    ]
+
+
+def _as_list(notes: NoteTrack | list[BasicPitchNoteEventDTO]) -> list[BasicPitchNoteEventDTO]:
+    return notes.to_dtos() if isinstance(notes, NoteTrack) else list(notes)
+
+
+def main() -> None:
+    rng: np.random.Generator = np.random.default_rng(SEED)
+    adapter: OnsetFrameFuseAdapter = OnsetFrameFuseAdapter()
+
+    for trial in range(TRIALS):
+        bpm: float = float(rng.integers(60, 220))
+        grid: float = float(rng.choice([0.01, 0.05, 60.0 / bpm / 4.0]))
+        span: float = float(rng.integers(1, 40))
+        onset_notes = _random_notes(rng=rng, n=int(rng.integers(0, 60)), span=span, grid=grid)
+        frame_notes = _random_notes(rng=rng, n=int(rng.integers(0, 200)), span=span, grid=grid)
+
+        params: OnsetFrameFuseParams = _FuseParamsWithOptions(
+            quantize=bool(rng.random() < 0.8),
+            missing_min_steps=int(rng.integers(0, 3)),
+            min_overlap_seconds=float(rng.choice([0.0, 0.0, grid, 2.5 * grid])),
+            allow_after_last_onset=bool(rng.random() < 0.3),
+            after_last_tail_steps=int(rng.integers(0, 8)),
+        )
+
+        expected = _reference_fuse(bpm=bpm, onset_notes=onset_notes, frame_notes=frame_notes, params=params)
+        got = _as_list(adapter.normalize(bpm=bpm, onset_notes=onset_notes, frame_notes=frame_notes, params=params))
+        assert got == expected, f"trial={trial} mismatch: expected={len(expected)} got={len(got)}"
+
+    print(f"equivalence ok trials={TRIALS}")
+
+    onset_notes = _random_notes(rng=rng, n=BENCH_ONSETS, span=BENCH_ONSETS * 0.3, grid=0.01)
+    frame_notes = _random_notes(rng=rng, n=BENCH_FRAMES, span=BENCH_ONSETS * 0.3, grid=0.01)
+    params = OnsetFrameFuseParams()
+
+    t0: float = time.perf_counter()
+    expected = _reference_fuse(bpm=120.0, onset_notes=onset_notes, frame_notes=frame_notes, params=params)
+    t1: float = time.perf_counter()
+    got = _as_list(adapter.normalize(bpm=120.0, onset_notes=onset_notes, frame_notes=frame_notes, params=params))
+    t2: float = time.perf_counter()
+
+    print(
+        f"onsets={BENCH_ONSETS} frames={BENCH_FRAMES} reference={t1 - t0:.2f}s "
+        f"searchsorted={t2 - t1:.3f}s identical={got == expected}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,13 @@ from math import floor
 from pathlib import Path
 from typing import Any
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+import numpy as np
+
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchNoteEventDTO,
+    NoteTrack,
+    as_note_track,
+)
 from app.application.ports.tab.merge.original.onset_frame_plus_port import OnsetFrameFuseParams
 from app.application.ports.tab.merge.root.root_note_port import RootTabBuildPort
 
@@ -23,16 +29,13 @@ class RootTabBuildAdapter(RootTabBuildPort):
         self,
         *,
         bpm: float,
-        original_notes: list[BasicPitchNoteEventDTO],
+        original_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetFrameFuseParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        notes: list[BasicPitchNoteEventDTO] = sorted(
-            [n for n in original_notes],
-            key=lambda n: (float(n.start_time), float(n.end_time), int(n.pitch_midi)),
-        )
+    ) -> NoteTrack:
+        notes: NoteTrack = as_note_track(original_notes).sorted()
 
-        if not notes:
-            return []
+        if len(notes) == 0:
+            return NoteTrack.empty()
 
         bpm_f: float = float(bpm)
         if bpm_f <= 0.0:
@@ -47,108 +50,61 @@ class RootTabBuildAdapter(RootTabBuildPort):
         # 1마디 -> 4박
         one_madi_sec: float = one_bak_sec * float(beats_per_bar)
 
-        t_start: float = float(notes[0].start_time)
-        t_end: float = float(notes[-1].end_time)
+        starts: np.ndarray = notes.start_time
+        ends: np.ndarray = notes.end_time
+
+        t_start: float = float(starts[0])
+        t_end: float = float(ends[-1])
 
         # 처음으로 시작해야할 바의 인덱스
         start_madi_idx: int = int(floor(t_start / one_madi_sec))
         # 마지막으로 치면 될 바의 인덱스
         last_madi_idx: int = int(floor((t_end - 1e-9) / one_madi_sec))
 
-        out: list[BasicPitchNoteEventDTO] = []
-
-        i: int = 0
-        note_lengh: int = len(notes)
-
-        #
-        for madi_idx in range(start_madi_idx, last_madi_idx + 1):
-
-            # 마디가 시작되는 시간
-            madi_start: float = float(madi_idx) * one_madi_sec
-            # 마디가 끝나는 시간
-            madi_end: float = madi_start + one_madi_sec
-
-            # madi의 start시간이 notes[i]를 넘겼다면 notes[i]는 이미 넘어갔으니 i를 더해 다음노트의
-            # 루트를 검사한다 그리고 시간이 지날수록 [i]를 더한다
-            # 즉 i -> 이미 검사가 끝나고 건너뛴 위치
-            while i < note_lengh and float(notes[i].end_time) <= madi_start:
-                i += 1
-
-            root_pitch: int | None = None
-            root_conf: float | None = None
-
-            # j에 i를 저장함 그리고 j의 start_time을 가져옴 이게 madi_end보다 크면 사용함
-            # 현재 마디에서 가장 큰 노트를 찾는것임
-            best_j: int | None = None
-            best_diff: float = float("inf")
-
-            j: int = i
-            while j < note_lengh:
-                note: BasicPitchNoteEventDTO = notes[j]
-                ns: float = float(note.start_time)
-                ne: float = float(note.end_time)
-
-                if ns >= madi_end:
-                    break
-
-                is_active_at_bar_start: bool = ns <= madi_start < ne
-                if is_active_at_bar_start:
-                    best_j = j
-                    best_diff = 0.0
-                    break
-
-                diff: float = abs(ns - madi_start)
-
-                if diff < best_diff:
-                    best_diff = diff
-                    best_j = j
-                elif ns > madi_start and diff > best_diff:
-                    break
-
-                j += 1
-
-            if best_j is not None:
-                root_pitch = int(notes[best_j].pitch_midi)
-                root_conf = (
-                    None
-                    if notes[best_j].confidence is None
-                    else float(notes[best_j].confidence)
-                )
-
-            # 마디에 노트가 없으면 스킵
-            if root_pitch is None:
-                continue
-
-            # 마디를 beats_per_bar개의 beat로 채움
-            for b in range(beats_per_bar):
-                beat_start: float = madi_start + float(b) * one_bak_sec
-                beat_end: float = beat_start + one_bak_sec
-
-                # 전체 곡 범위를 넘어가면 중단
-                if beat_start >= t_end:
-                    break
-
-                out.append(
-                    BasicPitchNoteEventDTO(
-                        start_time=float(beat_start),
-                        end_time=float(beat_end),
-                        pitch_midi=int(root_pitch),
-                        confidence=root_conf,
-                    )
-                )
-
-        return out
+        # 마디 index 표 : 마디마다 볼 note 구간 [first, stop)
+        #   first : 앞쪽 note 들의 end 최대값이 마디 시작을 넘는 첫 위치
+        #           (그 전 note 는 전부 마디 시작 전에 끝남 = 마디 시작 시간이 note를 넘기면 건너뛰는 위치)
+        #   stop  : 마디 끝 이후에 시작하는 첫 위치 (마디 안에 시작하는 note 가 없으면 first >= stop)
+        madi_starts: np.ndarray = np.arange(start_madi_idx, last_madi_idx + 1, dtype=np.int64).astype(np.float64) * one_madi_sec
+        madi_ends: np.ndarray = madi_starts + one_madi_sec
+        firsts: np.ndarray = np.searchsorted(np.maximum.accumulate(ends), madi_starts, side="right")
+        stops: np.ndarray = np.searchsorted(starts, madi_ends, side="left")
+
+        # 마디 루트 = notes[first]
+        #   first 가 마디 시작 전에 시작했으면 마디 시작에 울리고 있는 첫 note
+        #   아니면 구간 note 는 전부 마디 시작 뒤 -> start 정렬이라 마디 시작과 가장 가까운 첫 note
+        # 마디에 노트가 없으면 스킵
+        has_root: np.ndarray = firsts < stops
+        root_idx: np.ndarray = firsts[has_root]
+
+        # 마디를 beats_per_bar개의 beat로 채움 [마디, beat]
+        beat_offsets: np.ndarray = np.arange(beats_per_bar, dtype=np.int64).astype(np.float64) * one_bak_sec
+        beat_starts: np.ndarray = madi_starts[has_root][:, np.newaxis] + beat_offsets[np.newaxis, :]
+        beat_ends: np.ndarray = beat_starts + one_bak_sec
+
+        # 전체 곡 범위를 넘어가는 beat 는 버림
+        in_song: np.ndarray = beat_starts < t_end
+        beat_root: np.ndarray = np.broadcast_to(root_idx[:, np.newaxis], beat_starts.shape)[in_song]
+
+        # 마디 / beat 순으로 만들어서 이미 정렬됨
+        return NoteTrack(
+            start_time=beat_starts[in_song],
+            end_time=beat_ends[in_song],
+            pitch_midi=notes.pitch_midi[beat_root],
+            confidence=notes.confidence[beat_root],
+            is_sorted=True,
+        )
 
     def build_file(
         self,
         *,
         bpm: float,
-        original_notes: list[BasicPitchNoteEventDTO],
+        original_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         output_dir: str,
         params: OnsetFrameFuseParams,
         overwrite: bool
     ) -> None:
-        out: list[BasicPitchNoteEventDTO] = self.build(
+        out: NoteTrack = self.build(
             bpm=bpm,
             original_notes=original_notes,
             params=params,
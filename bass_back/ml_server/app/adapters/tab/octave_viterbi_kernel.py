@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import numpy as np
+
+"""
+    옥타브 정규화 HMM 공용 Viterbi (frame / onset octave adapter 가 같이 씀)
+
+    상태 s = alias offset (예: 0, -12, +12)  -> 후보 pitch = 관측 pitch + offsets[s]
+
+    emission[t, s]   = (|offset| // 12) * alias_cost_per_octave * (conf_default + conf_cost * conf_w)
+                       conf_w = clamp(conf, conf_floor, 1) ** conf_power   (conf 없음 = conf_floor)
+    transition[p, s] = lambda_step * min(dp, 12) + (dp % 12 == 0 ? lambda_oct : 0)
+                       dp = |(obs[t] + off[s]) - (obs[t-1] + off[p])|
+
+    transition 은 관측 pitch 차이(obs[t] - obs[t-1])에만 의존
+    -> 나오는 차이값 종류별로 [S, S] 표를 한번만 만들고 t 마다 꺼내씀
+    back-pointer 는 [T, S] int8 (S 가 127 넘으면 int16)
+
+    덧셈 순서 / 동점 처리(앞 index 우선)는 기존 순수 python 구현과 같음 -> 결과 동일
+"""
+
+
+def octave_emission_costs(
+    *,
+    confidence: np.ndarray,
+    offsets: np.ndarray,
+    alias_cost_per_octave: float,
+    conf_floor: float,
+    conf_power: float,
+    conf_default: float,
+    conf_cost: float,
+) -> np.ndarray:
+    conf: np.ndarray = np.asarray(confidence, dtype=np.float64)
+    c: np.ndarray = np.where(np.isnan(conf), float(conf_floor), conf)
+    c = np.where(c < float(conf_floor), float(conf_floor), c)
+    c = np.where(c > 1.0, 1.0, c)
+    conf_w: np.ndarray = np.power(c, float(conf_power))
+
+    octs: np.ndarray = np.abs(np.asarray(offsets, dtype=np.int64)) // 12
+    alias_pen: np.ndarray = octs.astype(np.float64) * float(alias_cost_per_octave)
+
+    weight: np.ndarray = float(conf_default) + float(conf_cost) * conf_w
+    return alias_pen[np.newaxis, :] * weight[:, np.newaxis]
+
+
+# 관측 pitch 차이값 하나에 대한 [prev_state, cur_state] 비용
+def octave_transition_table(
+    *,
+    obs_delta: np.ndarray,
+    offsets: np.ndarray,
+    lambda_step: float,
+    lambda_oct: float,
+) -> np.ndarray:
+    off: np.ndarray = np.asarray(offsets, dtype=np.int64)
+    delta: np.ndarray = np.asarray(obs_delta, dtype=np.int64)
+
+    dp: np.ndarray = np.abs(delta[:, np.newaxis, np.newaxis] + off[np.newaxis, np.newaxis, :] - off[np.newaxis, :, np.newaxis])
+    step_cost: np.ndarray = float(lambda_step) * np.minimum(dp, 12).astype(np.float64)
+    oct_cost: np.ndarray = np.where(dp % 12 == 0, float(lambda_oct), 0.0)
+    return step_cost + oct_cost
+
+
+def back_pointer_dtype(n_states: int) -> type:
+    return np.int8 if n_states <= 127 else np.int16
+
+
+# prev_cost 에서 시작해서 emission 행마다 한 step 씩 진행 (back 에 back-pointer 기록)
+def viterbi_forward(
+    *,
+    prev_cost: np.ndarray,
+    emission: np.ndarray,
+    transition_tables: np.ndarray,
+    transition_index: np.ndarray,
+    back: np.ndarray,
+) -> np.ndarray:
+    """
+    prev_cost         : [S] 직전 step 누적 비용
+    emission          : [n, S]
+    transition_index  : [n] (i 번째 행으로 들어오는 전이에 쓸 표 번호)
+    back              : [n, S] 출력
+    반환              : [S] 마지막 행 누적 비용
+    """
+    S: int = int(emission.shape[1])
+    cols: np.ndarray = np.arange(S)
+    cost: np.ndarray = np.asarray(prev_cost, dtype=np.float64)
+    scores: np.ndarray = np.empty((S, S), dtype=np.float64)
+
+    for i in range(int(emission.shape[0])):
+        np.add(cost[:, np.newaxis], transition_tables[transition_index[i]], out=scores)
+        best_prev: np.ndarray = np.argmin(scores, axis=0)
+        back[i] = best_prev
+        cost = scores[best_prev, cols] + emission[i]
+    return cost
+
+
+# back[i, s] = i 번째 행이 s 일때 i-1 번째 행 상태 (back[0] 은 안씀)
+def viterbi_backtrace(*, back: np.ndarray, last_state: int) -> np.ndarray:
+    n: int = int(back.shape[0])
+    path: np.ndarray = np.empty((n,), dtype=np.int64)
+    if n == 0:
+        return path
+    path[n - 1] = int(last_state)
+    for i in range(n - 1, 0, -1):
+        path[i - 1] = back[i, path[i]]
+    return path
+
+
+def viterbi_decode(
+    *,
+    emission: np.ndarray,
+    transition_tables: np.ndarray,
+    transition_index: np.ndarray,
+) -> np.ndarray:
+    """
+    emission          : [T, S]
+    transition_tables : [U, S(prev), S(cur)]
+    transition_index  : [T-1]  (t -> t+1 전이에 쓸 표 번호)
+    반환              : [T] 최적 상태 index
+    """
+    T: int = int(emission.shape[0])
+    S: int = int(emission.shape[1])
+    if T == 0:
+        return np.zeros((0,), dtype=np.int64)
+
+    back: np.ndarray = np.zeros((T, S), dtype=back_pointer_dtype(S))
+    last_cost: np.ndarray = viterbi_forward(
+        prev_cost=np.array(emission[0], dtype=np.float64, copy=True),
+        emission=emission[1:],
+        transition_tables=transition_tables,
+        transition_index=transition_index,
+        back=back[1:],
+    )
+    return viterbi_backtrace(back=back, last_state=int(np.argmin(last_cost)))
+
+
+def decode_octave_offsets(
+    *,
+    pitches: np.ndarray,
+    confidence: np.ndarray,
+    offsets: list[int],
+    alias_cost_per_octave: float,
+    conf_floor: float,
+    conf_power: float,
+    conf_default: float,
+    conf_cost: float,
+    lambda_step: float,
+    lambda_oct: float,
+) -> np.ndarray:
+    """
+    pitches    : [T] 관측 midi
+    confidence : [T] (없으면 NaN)
+    반환       : [T] 프레임/노트별로 고른 offset (semitone)
+    """
+    obs: np.ndarray = np.asarray(pitches, dtype=np.int64)
+    off: np.ndarray = np.asarray(offsets, dtype=np.int64)
+    if obs.shape[0] == 0:
+        return np.zeros((0,), dtype=np.int64)
+
+    emission: np.ndarray = octave_emission_costs(
+        confidence=confidence,
+        offsets=off,
+        alias_cost_per_octave=alias_cost_per_octave,
+        conf_floor=conf_floor,
+        conf_power=conf_power,
+        conf_default=conf_default,
+        conf_cost=conf_cost,
+    )
+
+    deltas, transition_index = np.unique(np.diff(obs), return_inverse=True)
+    tables: np.ndarray = octave_transition_table(
+        obs_delta=deltas,
+        offsets=off,
+        lambda_step=lambda_step,
+        lambda_oct=lambda_oct,
+    )
+
+    path: np.ndarray = viterbi_decode(
+        emission=emission,
+        transition_tables=tables,
+        transition_index=transition_index.reshape(-1),
+    )
+    return off[path]
+
+
+class FixedLagOctaveDecoder:
+    """
+    fixed-lag 온라인 Viterbi (chunk 단위 push)
+
+    push 할때마다 forward 를 이어서 진행하고
+    현재 최적 상태에서 backtrace 해서 lag 보다 오래된 위치의 offset 을 확정해서 반환
+    -> 보관하는 back-pointer / 미확정 관측은 최대 lag + chunk 길이
+    확정된 위치는 다시 바뀌지 않음 (lag 안에서 경로가 합쳐지면 전체 decode 와 같은 결과)
+    flush 는 남은 위치를 전부 확정 (lag >= 전체 길이면 decode_octave_offsets 와 동일)
+    """
+
+    def __init__(
+        self,
+        *,
+        offsets: list[int],
+        lag: int,
+        alias_cost_per_octave: float,
+        conf_floor: float,
+        conf_power: float,
+        conf_default: float,
+        conf_cost: float,
+        lambda_step: float,
+        lambda_oct: float,
+    ) -> None:
+        if int(lag) < 0:
+            raise ValueError("lag must be >= 0")
+
+        self._offsets: np.ndarray = np.asarray(offsets, dtype=np.int64)
+        self._lag: int = int(lag)
+        self._alias_cost_per_octave: float = float(alias_cost_per_octave)
+        self._conf_floor: float = float(conf_floor)
+        self._conf_power: float = float(conf_power)
+        self._conf_default: float = float(conf_default)
+        self._conf_cost: float = float(conf_cost)
+        self._lambda_step: float = float(lambda_step)
+        self._lambda_oct: float = float(lambda_oct)
+
+        S: int = int(self._offsets.shape[0])
+        self._back_dtype: type = back_pointer_dtype(S)
+        self._cost: np.ndarray | None = None
+        self._last_obs: int = 0
+        # 아직 확정 안된 위치들의 back-pointer [P, S]
+        self._back: np.ndarray = np.zeros((0, S), dtype=self._back_dtype)
+
+    @property
+    def lag(self) -> int:
+        return self._lag
+
+    @property
+    def pending(self) -> int:
+        return int(self._back.shape[0])
+
+    def push(self, *, pitches: np.ndarray, confidence: np.ndarray) -> np.ndarray:
+        """
+        pitches / confidence : 이번 chunk [n] (confidence 없으면 NaN)
+        반환                 : 이번에 확정된 (가장 오래된 것부터) 위치들의 offset
+        """
+        obs: np.ndarray = np.asarray(pitches, dtype=np.int64).reshape(-1)
+        n: int = int(obs.shape[0])
+        if n == 0:
+            return np.zeros((0,), dtype=np.int64)
+
+        emission: np.ndarray = octave_emission_costs(
+            confidence=np.asarray(confidence, dtype=np.float64).reshape(-1),
+            offsets=self._offsets,
+            alias_cost_per_octave=self._alias_cost_per_octave,
+            conf_floor=self._conf_floor,
+            conf_power=self._conf_power,
+            conf_default=self._conf_default,
+            conf_cost=self._conf_cost,
+        )
+
+        back: np.ndarray = np.zeros((n, int(self._offsets.shape[0])), dtype=self._back_dtype)
+        start: int = 0
+        if self._cost is None:
+            self._cost = np.array(emission[0], dtype=np.float64, copy=True)
+            start = 1
+            deltas_raw: np.ndarray = np.diff(obs)
+        else:
+            deltas_raw = np.diff(obs, prepend=self._last_obs)
+
+        if start < n:
+            deltas, transition_index = np.unique(deltas_raw, return_inverse=True)
+            tables: np.ndarray = octave_transition_table(
+                obs_delta=deltas,
+                offsets=self._offsets,
+                lambda_step=self._lambda_step,
+                lambda_oct=self._lambda_oct,
+            )
+            self._cost = viterbi_forward(
+                prev_cost=self._cost,
+                emission=emission[start:],
+                transition_tables=tables,
+                transition_index=transition_index.reshape(-1),
+                back=back[start:],
+            )
+
+        self._last_obs = int(obs[-1])
+        self._back = back if self._back.shape[0] == 0 else np.concatenate([self._back, back], axis=0)
+
+        settled: int = int(self._back.shape[0]) - self._lag
+        if settled <= 0:
+            return np.zeros((0,), dtype=np.int64)
+        return self._settle(count=settled)
+
+    def flush(self) -> np.ndarray:
+        if self._cost is None or self._back.shape[0] == 0:
+            return np.zeros((0,), dtype=np.int64)
+        out: np.ndarray = self._settle(count=int(self._back.shape[0]))
+        self.reset()
+        return out
+
+    def reset(self) -> None:
+        self._cost = None
+        self._last_obs = 0
+        self._back = self._back[:0]
+
+    def _settle(self, *, count: int) -> np.ndarray:
+        assert self._cost is not None
+        path: np.ndarray = viterbi_backtrace(back=self._back, last_state=int(np.argmin(self._cost)))
+        # 남는 부분은 복사해서 앞쪽 버퍼를 놓아줌
+        self._back = self._back[count:].copy()
+        return self._offsets[path[:count]]
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+import numpy as np
+
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchNoteEventDTO,
+    NoteTrack,
+    as_note_track,
+)
 from app.application.ports.tab.onset.onset_json_noramization_port import (
     OnsetNormalizeParams,
     OnsetNormalizePort,
 )
 
 """
-    
+    filter -> sort -> 같은 pitch 이웃 merge -> close_octave
+    단계 사이는 NoteTrack (이미 정렬된 입력이면 다시 정렬 안함)
 """
 
 
@@ -23,28 +30,29 @@ class OnsetNormalizeAdapter(OnsetNormalizePort):
     def normalize(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not notes:
-            return []
+    ) -> NoteTrack:
+        track: NoteTrack = as_note_track(notes)
+        if len(track) == 0:
+            return NoteTrack.empty()
 
         merge_gap_seconds: float = params.merge_gap_seconds
         conf_threshold: float = params.conf_threshold
 
-        filtered: list[BasicPitchNoteEventDTO] = self._filter_events(
-            notes=notes,
+        filtered: NoteTrack = self._filter_events(
+            notes=track,
             conf_threshold=conf_threshold,
         )
 
-        sorted_notes: list[BasicPitchNoteEventDTO] = self._sort_events(notes=filtered)
+        sorted_notes: NoteTrack = filtered.sorted()
 
-        merged: list[BasicPitchNoteEventDTO] = self._merge_adjacent_same_pitch_events(
+        merged: NoteTrack = self._merge_adjacent_same_pitch_events(
             notes=sorted_notes,
             merge_gap_seconds=merge_gap_seconds,
         )
 
-        closed: list[BasicPitchNoteEventDTO] = self._close_octave(
+        closed: NoteTrack = self._close_octave(
             notes=merged,
             params=params,
         )
@@ -72,7 +80,7 @@ class OnsetNormalizeAdapter(OnsetNormalizePort):
         
         notes: list[BasicPitchNoteEventDTO] = self._load_notes_json(path=input_json_path)
 
-        normalized: list[BasicPitchNoteEventDTO] = self.normalize(
+        normalized: NoteTrack = self.normalize(
             notes=notes,
             params=params,
         )
@@ -87,104 +95,80 @@ class OnsetNormalizeAdapter(OnsetNormalizePort):
     def _filter_events(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         conf_threshold: float,
-    ) -> list[BasicPitchNoteEventDTO]:
-        filtered: list[BasicPitchNoteEventDTO] = []
-        for n in notes:
-            start_time: float = float(n.start_time)
-            end_time: float = float(n.end_time)
-            if end_time <= start_time:
-                continue
-
-            conf: float | None = n.confidence
-            if conf is not None and float(conf) <= float(conf_threshold):
-                continue
-
-            filtered.append(
-                BasicPitchNoteEventDTO(
-                    start_time=start_time,
-                    end_time=end_time,
-                    pitch_midi=int(n.pitch_midi),
-                    confidence=None if conf is None else float(conf),
-                )
-            )
-        return filtered
-
-    # 정렬한번 더 함
-    def _sort_events(
-        self,
-        *,
-        notes: list[BasicPitchNoteEventDTO],
-    ) -> list[BasicPitchNoteEventDTO]:
-        return sorted(
-            notes,
-            key=lambda n: (float(n.start_time), float(n.end_time), int(n.pitch_midi)),
-        )
+    ) -> NoteTrack:
+        # conf 없음(NaN) 은 비교가 False -> 남김
+        keep: np.ndarray = (notes.end_time > notes.start_time) & ~(notes.confidence <= float(conf_threshold))
+        return notes.compress(keep)
 
     # merge함 간격 (0.2)
     def _merge_adjacent_same_pitch_events(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         merge_gap_seconds: float,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not notes:
-            return []
-
-        merged: list[BasicPitchNoteEventDTO] = []
-        for n in notes:
-            if not merged:
-                merged.append(n)
-                continue
-
-            prev: BasicPitchNoteEventDTO = merged[-1]
-            gap: float = float(n.start_time) - float(prev.end_time)
-
-            if int(n.pitch_midi) == int(prev.pitch_midi) and gap <= float(merge_gap_seconds):
-                merged[-1] = BasicPitchNoteEventDTO(
-                    start_time=float(prev.start_time),
-                    end_time=float(max(float(prev.end_time), float(n.end_time))),
-                    pitch_midi=int(prev.pitch_midi),
-                    confidence=self._merge_confidence(
-                        prev_conf=prev.confidence,
-                        n_conf=n.confidence,
-                    ),
-                )
+    ) -> NoteTrack:
+        if len(notes) == 0:
+            return notes
+
+        gap_limit: float = float(merge_gap_seconds)
+        starts: list[float] = notes.start_time.tolist()
+        ends: list[float] = notes.end_time.tolist()
+        pitches: list[int] = notes.pitch_midi.tolist()
+        confs: list[float] = notes.confidence.tolist()
+
+        out_start: list[float] = [starts[0]]
+        out_end: list[float] = [ends[0]]
+        out_pitch: list[int] = [pitches[0]]
+        out_conf: list[float] = [confs[0]]
+
+        for i in range(1, len(starts)):
+            gap: float = starts[i] - out_end[-1]
+
+            if pitches[i] == out_pitch[-1] and gap <= gap_limit:
+                out_end[-1] = max(out_end[-1], ends[i])
+                out_conf[-1] = self._merge_confidence(prev_conf=out_conf[-1], n_conf=confs[i])
             else:
-                merged.append(n)
-
-        return merged
+                out_start.append(starts[i])
+                out_end.append(ends[i])
+                out_pitch.append(pitches[i])
+                out_conf.append(confs[i])
+
+        return NoteTrack(
+            start_time=out_start,
+            end_time=out_end,
+            pitch_midi=out_pitch,
+            confidence=out_conf,
+        )
 
-    # confidence 무조건 높은거로 가져감
+    # confidence 무조건 높은거로 가져감 (NaN = 없음)
     def _merge_confidence(
         self,
         *,
-        prev_conf: float | None,
-        n_conf: float | None,
-    ) -> float | None:
-        if prev_conf is None and n_conf is None:
-            return None
-        if prev_conf is None:
-            return float(n_conf) 
-        if n_conf is None:
-            return float(prev_conf)
-        return float(max(float(prev_conf), float(n_conf)))
+        prev_conf: float,
+        n_conf: float,
+    ) -> float:
+        if prev_conf != prev_conf:
+            return n_conf
+        if n_conf != n_conf:
+            return prev_conf
+        return max(prev_conf, n_conf)
 
     # 가까운데 너무 큰 옥타브차이 -> 물리적으로 불가능
     def _close_octave(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         params: OnsetNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
+    ) -> NoteTrack:
         """  
             1. 만약에 너무 짧은 시간안데 너무 큰 이동이있다면 물리적으로 불가능 -> 옥타브 튐
             2. 하지만 0번 프렛은 예외이므로 0번 프렛인 후보들은 제외하고 결정.
         """
 
-        if not notes:
-            return []
+        if len(notes) == 0:
+            return notes
 
         fast_jump_sec = params.fast_jump_sec
         fast_jump_semitones = params.fast_jump_semitones
@@ -206,10 +190,6 @@ class OnsetNormalizeAdapter(OnsetNormalizePort):
                     p -= 12
             return int(p)
 
-        # note와 pitch가 있으면 교체함
-        def _replace_pitch(note: BasicPitchNoteEventDTO, new_pitch: int) -> BasicPitchNoteEventDTO:
-            return replace(note, pitch_midi=int(new_pitch))
-
         # 현재 pitch를 가까운 후보 pitch로 바꿈
         def _closest_octave_pitch(cur: int, target: int) -> int:
             k0: int = int(round((target - cur) / 12.0))
@@ -225,17 +205,17 @@ class OnsetNormalizeAdapter(OnsetNormalizePort):
 
             return best
 
-        out: list[BasicPitchNoteEventDTO] = list(notes)
+        starts: list[float] = notes.start_time.tolist()
+        ends: list[float] = notes.end_time.tolist()
+        pitches: list[int] = notes.pitch_midi.tolist()
 
-        prev_pitch: int = int(out[0].pitch_midi)
-        prev_end_time: float = float(out[0].end_time)
+        prev_pitch: int = pitches[0]
+        prev_end_time: float = ends[0]
 
-        for i in range(1, len(out)):
-            cur_note: BasicPitchNoteEventDTO = out[i]
-            cur_pitch: int = int(cur_note.pitch_midi)
-            cur_start_time: float = float(cur_note.start_time)
+        for i in range(1, len(pitches)):
+            cur_pitch: int = pitches[i]
 
-            dt: float = cur_start_time - prev_end_time
+            dt: float = starts[i] - prev_end_time
             dp: int = cur_pitch - prev_pitch
 
             should_consider: bool = (dt <= fast_jump_sec) and (abs(dp) >= fast_jump_semitones)
@@ -251,13 +231,13 @@ class OnsetNormalizeAdapter(OnsetNormalizePort):
                 fixed = _clamp_pitch(int(fixed))
 
                 if fixed != cur_pitch:
-                    out[i] = _replace_pitch(cur_note, fixed)
+                    pitches[i] = fixed
                     cur_pitch = fixed
 
             prev_pitch = cur_pitch
-            prev_end_time = float(cur_note.end_time)
+            prev_end_time = ends[i]
 
-        return out
+        return notes.with_pitch(np.asarray(pitches, dtype=np.int64))
 
     def _load_notes_json(self, *, path: Path) -> list[BasicPitchNoteEventDTO]:
         raw: Any
@@ -314,7 +294,7 @@ class OnsetNormalizeAdapter(OnsetNormalizePort):
         self,
         *,
         path: Path,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
     ) -> None:
         payload: list[dict[str, object]] = [
             {
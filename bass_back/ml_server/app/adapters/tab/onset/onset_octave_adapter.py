@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from math import inf
 from pathlib import Path
 from typing import Any
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+import numpy as np
+
+from app.adapters.tab.octave_viterbi_kernel import decode_octave_offsets
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchNoteEventDTO,
+    NoteTrack,
+    as_note_track,
+)
 from app.application.ports.tab.onset.onset_json_noramization_port import (
     OnsetNormalizeParams,
     OnsetNormalizePort,
@@ -18,7 +24,7 @@ class OnsetPitchOctaveNormalizeAdapter(OnsetNormalizePort):
     """
     onset_note (note event) 기준 Viterbi 옥타브 정규화.
 
-    - 입력/출력: BasicPitchNoteEventDTO (start_time, end_time, pitch_midi, confidence)
+    - 입력: list[BasicPitchNoteEventDTO] 또는 NoteTrack / 출력: NoteTrack (정렬됨)
     - 전처리: start_time 기준 sort -> pitch_low 미만은 +12 lift
     - Viterbi: alias_semitones 후보 오프셋 중 비용 최소 경로 선택
     - 후처리: pitch_low 미만은 +12 재적용 + midi_min/max clamp
@@ -30,120 +36,40 @@ class OnsetPitchOctaveNormalizeAdapter(OnsetNormalizePort):
     def normalize(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
-        if not notes:
-            return []
-
-        # (0) 전처리: sort -> lift(<pitch_low => +12)
-        notes_sorted: list[BasicPitchNoteEventDTO] = self._sort_notes(notes=notes)
+    ) -> NoteTrack:
+        track: NoteTrack = as_note_track(notes)
+        if len(track) == 0:
+            return NoteTrack.empty()
 
-
-        notes_in: list[BasicPitchNoteEventDTO] = notes_sorted
+        # (0) 전처리: sort
+        notes_in: NoteTrack = self._sort_notes(notes=track)
 
         # alias 후보 offsets
         offsets: list[int] = [int(k) for k in params.alias_semitones]
         if 0 not in offsets:
             offsets = [0] + offsets
 
-        S: int = int(len(offsets))
-        T: int = int(len(notes_in))
-
-        # DP tables
-        prev_idx: list[list[int]] = [[-1] * S for _ in range(T)]
-        prev_cost: list[float] = [inf] * S
-        cur_cost: list[float] = [inf] * S
-
-        # ---- t=0 초기화 ----
-        conf0: float | None = notes_in[0].confidence
-        for s in range(S):
-            prev_cost[s] = float(
-                self._emission_cost_offset(
-                    offset=int(offsets[s]),
-                    obs_conf=conf0,
-                    params=params,
-                )
-            )
-            prev_idx[0][s] = -1
-
-        # ---- DP ----
-        for t in range(1, T):
-            obs_pitch: int = int(notes_in[t].pitch_midi)
-            obs_conf: float | None = notes_in[t].confidence
-
-            emit_costs: list[float] = [
-                float(
-                    self._emission_cost_offset(
-                        offset=int(k),
-                        obs_conf=obs_conf,
-                        params=params,
-                    )
-                )
-                for k in offsets
-            ]
-
-            prev_obs_pitch: int = int(notes_in[t - 1].pitch_midi)
-
-            for s in range(S):
-                best_cost: float = inf
-                best_pi: int = -1
-
-                cur_pitch: int = int(obs_pitch + int(offsets[s]))
-
-                for p in range(S):
-                    prev_pitch: int = int(prev_obs_pitch + int(offsets[p]))
-                    trans: float = float(
-                        self._transition_cost(
-                            prev_pitch=int(prev_pitch),
-                            cur_pitch=int(cur_pitch),
-                            params=params,
-                        )
-                    )
-                    c: float = float(prev_cost[p]) + float(trans)
-                    if c < best_cost:
-                        best_cost = float(c)
-                        best_pi = int(p)
-
-                cur_cost[s] = float(best_cost) + float(emit_costs[s])
-                prev_idx[t][s] = int(best_pi)
-
-            prev_cost, cur_cost = cur_cost, [inf] * S
-
-        # ---- backtrace ----
-        last_state: int = int(min(range(S), key=lambda i: float(prev_cost[i])))
-        path_state_idx: list[int] = [0] * T
-        path_state_idx[T - 1] = int(last_state)
-
-        for t in range(T - 1, 0, -1):
-            path_state_idx[t - 1] = int(prev_idx[t][path_state_idx[t]])
-
-        # ---- 적용 ----
-        midi_min: int = int(params.midi_min)
-        midi_max: int = int(params.midi_max)
-
-        out: list[BasicPitchNoteEventDTO] = []
-        for t in range(T):
-            base_pitch: int = int(notes_in[t].pitch_midi)
-            best_offset: int = int(offsets[path_state_idx[t]])
-            st_pitch: int = int(base_pitch + best_offset)
-
-            if st_pitch < midi_min:
-                st_pitch = int(midi_min)
-            if st_pitch > midi_max:
-                st_pitch = int(midi_max)
+        # ---- Viterbi (공용 kernel) ----
+        best_offsets: np.ndarray = decode_octave_offsets(
+            pitches=notes_in.pitch_midi,
+            confidence=notes_in.confidence,
+            offsets=offsets,
+            alias_cost_per_octave=float(params.alias_cost_per_octave),
+            conf_floor=float(params.conf_floor),
+            conf_power=float(params.conf_power),
+            conf_default=float(params.conf_default),
+            conf_cost=float(params.conf_cost),
+            lambda_step=float(params.lambda_step),
+            lambda_oct=float(params.lambda_oct),
+        )
 
-            n: BasicPitchNoteEventDTO = notes_in[t]
-            out.append(
-                BasicPitchNoteEventDTO(
-                    start_time=float(n.start_time),
-                    end_time=float(n.end_time),
-                    pitch_midi=int(st_pitch),
-                    confidence=None if n.confidence is None else float(n.confidence),
-                )
-            )
+        # ---- 적용 : midi_min / midi_max clamp ----
+        st_pitch: np.ndarray = notes_in.pitch_midi.astype(np.int64) + best_offsets
+        st_pitch = np.minimum(np.maximum(st_pitch, int(params.midi_min)), int(params.midi_max))
 
-        return self._sort_notes(notes=out)
+        return self._sort_notes(notes=notes_in.with_pitch(st_pitch))
 
     def normalize_file(
         self,
@@ -190,17 +116,12 @@ class OnsetPitchOctaveNormalizeAdapter(OnsetNormalizePort):
     # ------------------------
     # helpers: sort / lift
     # ------------------------
+    # (start, end, pitch, conf 높은순) 안정 정렬 (conf 없음은 1.0 취급)
     @staticmethod
-    def _sort_notes(*, notes: list[BasicPitchNoteEventDTO]) -> list[BasicPitchNoteEventDTO]:
-        return sorted(
-            notes,
-            key=lambda n: (
-                float(n.start_time),
-                float(n.end_time),
-                int(n.pitch_midi),
-                -1.0 if n.confidence is None else -float(n.confidence),
-            ),
-        )
+    def _sort_notes(*, notes: NoteTrack) -> NoteTrack:
+        conf_key: np.ndarray = np.where(np.isnan(notes.confidence), -1.0, -notes.confidence)
+        order: np.ndarray = np.lexsort((conf_key, notes.pitch_midi, notes.end_time, notes.start_time))
+        return notes.take(order, is_sorted=True)
 
     @staticmethod
     def _lift_one_pitch_below_midi(*, pitch_midi: int, midi_floor: int) -> int:
@@ -210,55 +131,6 @@ class OnsetPitchOctaveNormalizeAdapter(OnsetNormalizePort):
             p += 12
         return int(p)
 
-    # ------------------------
-    # emission / transition
-    # ------------------------
-    @staticmethod
-    def _clamp_float(*, x: float, lo: float, hi: float) -> float:
-        if x < lo:
-            return float(lo)
-        if x > hi:
-            return float(hi)
-        return float(x)
-
-    def _emission_cost_offset(
-        self,
-        *,
-        offset: int,
-        obs_conf: float | None,
-        params: OnsetNormalizeParams,
-    ) -> float:
-        conf_floor: float = float(params.conf_floor)
-        conf_power: float = float(params.conf_power)
-        conf_default: float = float(params.conf_default)
-        conf_cost: float = float(params.conf_cost)
-
-        c: float = float(conf_floor if obs_conf is None else float(obs_conf))
-        c = float(self._clamp_float(x=float(c), lo=float(conf_floor), hi=1.0))
-        conf_w: float = float(c**conf_power)
-
-        octs: int = abs(int(offset)) // 12
-        alias_pen: float = float(octs) * float(params.alias_cost_per_octave)
-        return float(alias_pen) * (float(conf_default) + float(conf_cost) * float(conf_w))
-
-    @staticmethod
-    def _transition_cost(
-        *,
-        prev_pitch: int,
-        cur_pitch: int,
-        params: OnsetNormalizeParams,
-    ) -> float:
-        dp: int = abs(int(cur_pitch) - int(prev_pitch))
-
-        # ✅ 보편성 관점:
-        # 노트 이벤트는 프레임보다 점프가 자연스러운 경우가 많아서 dp 그대로 벌점주면 과벌점 가능.
-        # 최소한 12로 캡핑하면, "일반적인 진행"을 덜 망가뜨리면서도 급격한 튐은 억제 가능.
-        step_cost: float = float(params.lambda_step) * float(min(dp, 12))
-
-        is_oct_like: bool = (dp % 12 == 0)
-        oct_cost: float = float(params.lambda_oct) if is_oct_like else 0.0
-        return float(step_cost + oct_cost)
-
     # ------------------------
     # json parsing
     # ------------------------
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
 from app.application.ports.tab.tab.original_tab.candidate_port import (
     BassTabCandidateBuildParams,
     BassTabCandidateBuilderPort,
@@ -10,6 +11,17 @@ from app.application.ports.tab.tab.original_tab.candidate_port import (
 )
 
 
+MIDI_PITCH_COUNT: int = 128
+
+
+# pitch 하나의 후보 (fallback 까지 끝낸 결과)
+# resolved_pitch = 후보를 찾은 pitch (원래 pitch 면 fallback X, 끝까지 없으면 None)
+@dataclass(frozen=True)
+class _PitchCandidates:
+    candidates: tuple[BassTabCandidateDTO, ...]
+    resolved_pitch: int | None
+
+
 @dataclass(frozen=True)
 class BassTabCandidateBuilderAdapter(BassTabCandidateBuilderPort):
     """
@@ -20,61 +32,89 @@ class BassTabCandidateBuilderAdapter(BassTabCandidateBuilderPort):
     - 불가능한 후보만 제거한다.
     - 직접 후보가 없으면 -12 octave fallback을 반복 시도한다.
     - 그래도 없으면 빈 후보로 남긴다. (상위 레이어에서 후처리 가능)
+    - 결과는 pitch 에만 의존 -> params 별로 pitch(0~127) 표를 한번 만들고 note 마다 꺼내씀
     """
 
     def build_candidates(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: BassTabCandidateBuildParams,
     ) -> list[list[BassTabCandidateDTO]]:
-        out: list[list[BassTabCandidateDTO]] = []
+        table: tuple[_PitchCandidates, ...] = self._candidate_table(params=params)
 
-        for note_idx, note in enumerate(notes):
-            original_pitch: int = int(note.pitch_midi)
+        pitches: list[int]
+        if isinstance(notes, NoteTrack):
+            pitches = notes.pitch_midi.tolist()
+        else:
+            pitches = [int(note.pitch_midi) for note in notes]
 
-            one_candidates: list[BassTabCandidateDTO] = self._build_one_candidates(
-                note_pitch=original_pitch,
-                params=params,
-            )
-
-            if one_candidates:
-                out.append(one_candidates)
-                continue
+        out: list[list[BassTabCandidateDTO]] = []
 
-            fallback_pitch: int = original_pitch
-            fallback_used: bool = False
+        for note_idx, original_pitch in enumerate(pitches):
+            entry: _PitchCandidates
+            if 0 <= original_pitch < MIDI_PITCH_COUNT:
+                entry = table[original_pitch]
+            else:
+                entry = self._resolve_pitch(note_pitch=original_pitch, params=params)
 
-            while fallback_pitch - 12 >= 0:
-                fallback_pitch -= 12
-                one_candidates = self._build_one_candidates(
-                    note_pitch=fallback_pitch,
-                    params=params,
-                )
-                if one_candidates:
-                    fallback_used = True
-                    print(
-                        f"[OCTAVE FALLBACK] idx={note_idx} "
-                        f"pitch={original_pitch} -> {fallback_pitch} "
-                        f"start={float(note.start_time)} "
-                        f"end={float(note.end_time)}"
-                    )
-                    break
-
-            if not one_candidates:
+            if entry.resolved_pitch is None:
+                note: BasicPitchNoteEventDTO = notes[note_idx]
                 print(
                     f"[NO CANDIDATE] idx={note_idx} "
                     f"pitch={original_pitch} "
                     f"start={float(note.start_time)} "
                     f"end={float(note.end_time)}"
                 )
-            elif fallback_used:
-                one_candidates = self._sort_candidates(candidates=one_candidates)
+            elif entry.resolved_pitch != original_pitch:
+                note = notes[note_idx]
+                print(
+                    f"[OCTAVE FALLBACK] idx={note_idx} "
+                    f"pitch={original_pitch} -> {entry.resolved_pitch} "
+                    f"start={float(note.start_time)} "
+                    f"end={float(note.end_time)}"
+                )
 
-            out.append(one_candidates)
+            out.append(list(entry.candidates))
 
         return out
 
+    # params (tuning / min, max fret) 별로 한번만 만듦 (frozen params -> hash 가능)
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _candidate_table(*, params: BassTabCandidateBuildParams) -> tuple[_PitchCandidates, ...]:
+        builder: BassTabCandidateBuilderAdapter = BassTabCandidateBuilderAdapter()
+        return tuple(
+            builder._resolve_pitch(note_pitch=pitch, params=params)
+            for pitch in range(MIDI_PITCH_COUNT)
+        )
+
+    # 직접 후보 -> 없으면 -12 octave fallback 반복
+    def _resolve_pitch(
+        self,
+        *,
+        note_pitch: int,
+        params: BassTabCandidateBuildParams,
+    ) -> _PitchCandidates:
+        one_candidates: list[BassTabCandidateDTO] = self._build_one_candidates(
+            note_pitch=note_pitch,
+            params=params,
+        )
+        if one_candidates:
+            return _PitchCandidates(candidates=tuple(one_candidates), resolved_pitch=note_pitch)
+
+        fallback_pitch: int = note_pitch
+        while fallback_pitch - 12 >= 0:
+            fallback_pitch -= 12
+            one_candidates = self._build_one_candidates(
+                note_pitch=fallback_pitch,
+                params=params,
+            )
+            if one_candidates:
+                return _PitchCandidates(candidates=tuple(one_candidates), resolved_pitch=fallback_pitch)
+
+        return _PitchCandidates(candidates=(), resolved_pitch=None)
+
     def _build_one_candidates(
         self,
         *,
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-import json
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+import numpy as np
+
+from app.adapters.tab.tab.tab_binary_format import write_tab_binary, write_tab_json_encodings
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchNoteEventDTO,
+    NoteTrack,
+    as_note_track,
+)
 from app.application.ports.tab.tab.original_tab.candidate_port import (
     BassTabCandidateBuildParams,
     BassTabCandidateBuilderPort,
@@ -26,7 +33,10 @@ from app.application.ports.tab.tab.original_tab.viterbi_port import (
 class OriginalTabGenerateAdapter(OriginalTabGeneratePort):
     candidate_builder: BassTabCandidateBuilderPort
     viterbi: BassTabViterbiPort
-    output_filename: str = "original_tab.json"
+    # bar 범위로 읽을 수 있는 binary (JSON 은 tab_binary_format.ensure_tab_json_view 로 필요할때 만듦)
+    output_filename: str = "original_tab.btab"
+    # 같이 써둘 JSON view 압축본 (Content-Encoding 이름)
+    json_encodings: tuple[str, ...] = ("gzip", "br")
 
     beats_per_bar: int = 4
     candidate_params: BassTabCandidateBuildParams = field(
@@ -39,7 +49,7 @@ class OriginalTabGenerateAdapter(OriginalTabGeneratePort):
     def tab_generate(
         self,
         *,
-        original_json: list[BasicPitchNoteEventDTO],
+        original_json: list[BasicPitchNoteEventDTO] | NoteTrack,
         bpm: int,
         output_dir: Path,
         asset_id: str,
@@ -49,35 +59,30 @@ class OriginalTabGenerateAdapter(OriginalTabGeneratePort):
         if self.beats_per_bar <= 0:
             raise ValueError("beats_per_bar must be > 0")
 
-        filtered_notes: list[BasicPitchNoteEventDTO] = self._filter_notes(notes=original_json)
-
-        original_tab_path: Path = self._build_output_path(
-            output_dir=output_dir,
-            asset_id=asset_id,
-        )
-
-        if not filtered_notes:
-            self._write_json(
-                output_path=original_tab_path,
-                bars=[],
+        filtered_notes: NoteTrack = self._filter_notes(notes=as_note_track(original_json))
+        if len(filtered_notes) == 0:
+            return self.tab_generate_from_steps(
+                steps=[],
+                bpm=int(bpm),
+                output_dir=output_dir,
+                asset_id=asset_id,
             )
-            return original_tab_path
 
-        sorted_notes: list[BasicPitchNoteEventDTO] = sorted(
-            filtered_notes,
-            key=lambda x: (float(x.start_time), float(x.end_time), int(x.pitch_midi)),
-        )
+        sorted_notes: NoteTrack = filtered_notes.sorted()
 
+        t0: float = time.perf_counter()
         raw_candidates: list[list[BassTabCandidateDTO]] = self.candidate_builder.build_candidates(
             notes=sorted_notes,
             params=self.candidate_params,
         )
+        candidate_seconds: float = time.perf_counter() - t0
 
-        valid_notes: list[BasicPitchNoteEventDTO] = []
+        has_candidate: list[bool] = []
         valid_candidates: list[list[BassTabCandidateDTO]] = []
         skipped_count: int = 0
 
         for i, one_candidates in enumerate(raw_candidates):
+            has_candidate.append(bool(one_candidates))
             if not one_candidates:
                 note: BasicPitchNoteEventDTO = sorted_notes[i]
                 skipped_count += 1
@@ -89,51 +94,97 @@ class OriginalTabGenerateAdapter(OriginalTabGeneratePort):
                 )
                 continue
 
-            valid_notes.append(sorted_notes[i])
             valid_candidates.append(one_candidates)
 
         if skipped_count > 0:
             print(f"[TAB GENERATE] skipped_no_candidate={skipped_count}")
 
-        if not valid_notes:
-            self._write_json(
-                output_path=original_tab_path,
-                bars=[],
+        valid_notes: NoteTrack = sorted_notes
+        if skipped_count > 0:
+            valid_notes = sorted_notes.compress(np.asarray(has_candidate, dtype=bool))
+
+        steps: list[BassTabViterbiStepDTO] = []
+        t0 = time.perf_counter()
+        if len(valid_notes) > 0:
+            steps = self.viterbi.decode(
+                notes=valid_notes,
+                candidates=valid_candidates,
+                bpm=int(bpm),
+                params=self.viterbi_params,
             )
-            return original_tab_path
+        viterbi_seconds: float = time.perf_counter() - t0
+        print(
+            f"[TAB GENERATE] notes={len(valid_notes)} "
+            f"candidates={candidate_seconds * 1000.0:.1f}ms viterbi={viterbi_seconds * 1000.0:.1f}ms"
+        )
 
-        steps: list[BassTabViterbiStepDTO] = self.viterbi.decode(
-            notes=valid_notes,
-            candidates=valid_candidates,
+        return self.tab_generate_from_steps(
+            steps=steps,
             bpm=int(bpm),
-            params=self.viterbi_params,
+            output_dir=output_dir,
+            asset_id=asset_id,
         )
 
+    def tab_generate_from_steps(
+        self,
+        *,
+        steps: list[BassTabViterbiStepDTO],
+        bpm: int,
+        output_dir: Path,
+        asset_id: str,
+    ) -> Path:
+        if bpm <= 0:
+            raise ValueError("bpm must be > 0")
+        if self.beats_per_bar <= 0:
+            raise ValueError("beats_per_bar must be > 0")
+
+        self._validate_steps(steps=steps)
+
         bars: list[BassTabBarDTO] = self._group_steps_by_bar(
             steps=steps,
             bpm=int(bpm),
             beats_per_bar=int(self.beats_per_bar),
         )
 
-        self._write_json(
+        original_tab_path: Path = self._build_output_path(
+            output_dir=output_dir,
+            asset_id=asset_id,
+        )
+        write_tab_binary(
             output_path=original_tab_path,
             bars=bars,
         )
+        write_tab_json_encodings(
+            binary_path=original_tab_path,
+            bars=bars,
+            encodings=self.json_encodings,
+        )
         return original_tab_path
 
+    # decode 결과는 tab_generate 가 decode 에 넣는 note 열과 같은 조건이어야 함
+    # (note_index 0..n-1 순서, start_time 정렬, end_time > start_time)
+    def _validate_steps(
+        self,
+        *,
+        steps: list[BassTabViterbiStepDTO],
+    ) -> None:
+        prev_start: float = float("-inf")
+        for i, step in enumerate(steps):
+            if int(step.note_index) != i:
+                raise ValueError(f"step note_index must be sequential. index={i} note_index={step.note_index}")
+            start: float = float(step.start_time)
+            if start < prev_start:
+                raise ValueError(f"steps must be sorted by start_time. index={i} start={start} prev={prev_start}")
+            if float(step.end_time) <= start:
+                raise ValueError(f"step end_time must be > start_time. index={i}")
+            prev_start = start
+
     def _filter_notes(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
-    ) -> list[BasicPitchNoteEventDTO]:
-        out: list[BasicPitchNoteEventDTO] = []
-        for note in notes:
-            start_time: float = float(note.start_time)
-            end_time: float = float(note.end_time)
-            if end_time <= start_time:
-                continue
-            out.append(note)
-        return out
+        notes: NoteTrack,
+    ) -> NoteTrack:
+        return notes.compress(notes.end_time > notes.start_time)
 
     def _group_steps_by_bar(
         self,
@@ -201,33 +252,3 @@ class OriginalTabGenerateAdapter(OriginalTabGeneratePort):
         tab_dir: Path = asset_dir / "tab"
         tab_dir.mkdir(parents=True, exist_ok=True)
         return tab_dir / self.output_filename
-
-    def _write_json(
-        self,
-        *,
-        output_path: Path,
-        bars: list[BassTabBarDTO],
-    ) -> None:
-        payload: list[dict[str, object]] = []
-        for bar in bars:
-            payload.append(
-                {
-                    "bar_index": int(bar.bar_index),
-                    "start_time": float(bar.start_time),
-                    "end_time": float(bar.end_time),
-                    "notes": [
-                        {
-                            "time": float(note.time),
-                            "offset": float(note.offset),
-                            "line": int(note.line),
-                            "fret": int(note.fret),
-                        }
-                        for note in bar.notes
-                    ],
-                }
-            )
-
-        output_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
\ No newline at end of file
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from app.adapters.tab.tab.origianal_tab.viterbi_adapter import (
+    BassTabViterbiAdapter,
+    TabCostTables,
+    tab_viterbi_path,
+)
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack, as_note_track
+from app.application.ports.tab.tab.original_tab.candidate_port import BassTabCandidateDTO
+from app.application.ports.tab.tab.original_tab.viterbi_port import (
+    BassTabViterbiParams,
+    BassTabViterbiPort,
+    BassTabViterbiStepDTO,
+)
+
+"""
+    긴 쉼표에서 note 열을 잘라서 구간별로 process pool 에서 Viterbi 를 돌리는 decode
+
+    1) 비용 표 (emission / transition / preferred line) 는 전체 note 로 한번 계산 (BassTabViterbiAdapter 와 같음)
+    2) 앞 note 들이 다 끝난 뒤 split_rest_beats 보다 길게 쉬는 곳에서 자름 (구간은 최소 min_segment_notes 개)
+    3) 구간마다 독립 DP (process pool)
+    4) 경계 fix-up : 경계 양쪽 fixup_notes 개를 바깥 상태를 고정한 채 다시 DP
+       -> 구간 사이 전이 비용이 반영됨
+    5) zigzag smoothing / step 생성은 전체 결과에 한번
+
+    실험용 (TAB_SEGMENT_WORKERS 기본값 0 = 끔)
+        병렬이 되는 것은 3) DP 만, 1) 비용 표 / 4) fix-up / 5) smoothing 은 parent 에서 순서대로
+        17.8k note 곡 (1 cpu) : 비용 표 0.05s / DP 0.12s / smoothing + step 0.09s / 표 pickle 0.003s
+        -> cpu 가 구간 수만큼 남아도 decode 전체는 최대 ~1.8 배, 곡 하나에 0.1초 정도 줄어듬
+        빈 cpu 가 2개 이상이고 구간이 여러개인 긴 곡 (수만 note) 에서만 이득
+        쓸 process 수 = min(max_workers, cpu 수, 구간 수) -> 1 이면 pool 없이 순서대로 (IPC 비용만 늘어서)
+
+    긴 쉼표 뒤에는 speed multiplier = 1 이라 경계 전이 영향이 작음
+    -> 대부분 전체 decode 와 같음
+    다른 곳은 주로 비용이 같은 경로끼리 동점 처리가 갈린 경우
+    (누적 비용 크기가 달라서 반올림이 달라짐) -> compare_with_exact 의 path_cost_gap 으로 확인
+"""
+
+
+@dataclass(frozen=True)
+class SegmentDecodeReport:
+    note_count: int
+    segment_count: int
+    differing_notes: int
+    # segment 경로 비용 - 전체 경로 비용 (smoothing 전, 0 이면 같은 비용의 다른 경로 = 동점 처리 차이)
+    path_cost_gap: float
+    exact_seconds: float
+    segmented_seconds: float
+
+
+# max_workers 별 process pool (worker 프로세스 안에서 계속 재사용)
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK: threading.Lock = threading.Lock()
+
+
+def _get_pool(*, max_workers: int) -> ProcessPoolExecutor:
+    with _POOLS_LOCK:
+        pool: ProcessPoolExecutor | None = _POOLS.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=max_workers)
+            _POOLS[max_workers] = pool
+        return pool
+
+
+def shutdown_segment_pools() -> None:
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _POOLS.clear()
+
+
+def _path_cost(*, path: np.ndarray, tables: TabCostTables) -> float:
+    index: np.ndarray = np.arange(int(path.shape[0]))
+    emission: float = float(tables.emission[index, path].sum())
+    transition: float = float(tables.transition[index[1:], path[:-1], path[1:]].sum())
+    return emission + transition
+
+
+# process pool 에서 도는 구간 하나 (pickle 가능한 module 함수)
+def _decode_segment(emission: np.ndarray, transition: np.ndarray) -> np.ndarray:
+    return tab_viterbi_path(emission=emission, transition=transition)
+
+
+@dataclass(frozen=True)
+class SegmentParallelViterbiAdapter(BassTabViterbiPort):
+    inner: BassTabViterbiAdapter = field(default_factory=BassTabViterbiAdapter)
+
+    # 이 beat 수보다 길게 아무것도 안 울리면 자를 수 있는 곳
+    split_rest_beats: float = 2.0
+    min_segment_notes: int = 256
+    # 경계 양쪽으로 다시 decode 할 note 수
+    fixup_notes: int = 32
+    # 0 이면 os.cpu_count(), 1 이면 pool 없이 순서대로 (cpu 수 / 구간 수보다 크면 그만큼만)
+    max_workers: int = 0
+
+    def decode(
+        self,
+        *,
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
+        candidates: list[list[BassTabCandidateDTO]],
+        bpm: int,
+        params: BassTabViterbiParams,
+    ) -> list[BassTabViterbiStepDTO]:
+        if len(notes) == 0:
+            return []
+
+        track: NoteTrack = as_note_track(notes)
+        tables: TabCostTables = self.inner.build_cost_tables(
+            notes=track,
+            candidates=candidates,
+            bpm=bpm,
+            params=params,
+        )
+        bounds: list[int] = self._segment_bounds(notes=track, bpm=bpm)
+        path: np.ndarray = self._segmented_path(tables=tables, bounds=bounds)
+
+        return self.inner.finish_steps(
+            notes=track,
+            candidates=candidates,
+            tables=tables,
+            chosen_indices=path.tolist(),
+            params=params,
+        )
+
+    # 같은 비용 표로 전체 DP / segment DP 를 둘다 돌려서 비교 (시간은 DP 부분만)
+    def compare_with_exact(
+        self,
+        *,
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
+        candidates: list[list[BassTabCandidateDTO]],
+        bpm: int,
+        params: BassTabViterbiParams,
+    ) -> SegmentDecodeReport:
+        track: NoteTrack = as_note_track(notes)
+        if len(track) == 0:
+            return SegmentDecodeReport(0, 0, 0, 0.0, 0.0, 0.0)
+
+        tables: TabCostTables = self.inner.build_cost_tables(
+            notes=track,
+            candidates=candidates,
+            bpm=bpm,
+            params=params,
+        )
+        bounds: list[int] = self._segment_bounds(notes=track, bpm=bpm)
+
+        t0: float = time.perf_counter()
+        exact_path: np.ndarray = tab_viterbi_path(emission=tables.emission, transition=tables.transition)
+        exact_seconds: float = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        segmented_path: np.ndarray = self._segmented_path(tables=tables, bounds=bounds)
+        segmented_seconds: float = time.perf_counter() - t0
+
+        exact: list[BassTabViterbiStepDTO] = self.inner.finish_steps(
+            notes=track,
+            candidates=candidates,
+            tables=tables,
+            chosen_indices=exact_path.tolist(),
+            params=params,
+        )
+        segmented: list[BassTabViterbiStepDTO] = self.inner.finish_steps(
+            notes=track,
+            candidates=candidates,
+            tables=tables,
+            chosen_indices=segmented_path.tolist(),
+            params=params,
+        )
+
+        return SegmentDecodeReport(
+            note_count=len(track),
+            segment_count=len(bounds) - 1,
+            differing_notes=sum(1 for a, b in zip(exact, segmented) if a != b),
+            path_cost_gap=_path_cost(path=segmented_path, tables=tables) - _path_cost(path=exact_path, tables=tables),
+            exact_seconds=exact_seconds,
+            segmented_seconds=segmented_seconds,
+        )
+
+    # [0, b1, b2, ..., N] 구간 경계
+    def _segment_bounds(self, *, notes: NoteTrack, bpm: int) -> list[int]:
+        n_notes: int = len(notes)
+        if n_notes < 2 * int(self.min_segment_notes):
+            return [0, n_notes]
+
+        seconds_per_beat: float = 60.0 / float(bpm)
+        sounding_until: np.ndarray = np.maximum.accumulate(notes.end_time)
+        rest_beats: np.ndarray = (notes.start_time[1:] - sounding_until[:-1]) / seconds_per_beat
+        cuts: np.ndarray = np.flatnonzero(rest_beats > float(self.split_rest_beats)) + 1
+
+        bounds: list[int] = [0]
+        for cut in cuts.tolist():
+            if cut - bounds[-1] >= int(self.min_segment_notes) and n_notes - cut >= int(self.min_segment_notes):
+                bounds.append(int(cut))
+        bounds.append(n_notes)
+        return bounds
+
+    def _segmented_path(self, *, tables: TabCostTables, bounds: list[int]) -> np.ndarray:
+        emission: np.ndarray = tables.emission
+        transition: np.ndarray = tables.transition
+        if len(bounds) <= 2:
+            return tab_viterbi_path(emission=emission, transition=transition)
+
+        spans: list[tuple[int, int]] = list(zip(bounds[:-1], bounds[1:]))
+        workers: int = self._effective_workers(segment_count=len(spans))
+
+        parts: list[np.ndarray]
+        if workers <= 1:
+            parts = [_decode_segment(emission[a:b], transition[a:b]) for a, b in spans]
+        else:
+            pool: ProcessPoolExecutor = _get_pool(max_workers=workers)
+            parts = list(
+                pool.map(
+                    _decode_segment,
+                    [emission[a:b] for a, b in spans],
+                    [transition[a:b] for a, b in spans],
+                )
+            )
+
+        path: np.ndarray = np.concatenate(parts)
+        for boundary in bounds[1:-1]:
+            self._fix_boundary(path=path, tables=tables, boundary=boundary)
+        return path
+
+    # cpu 보다 많이 띄우거나 구간보다 많이 띄워도 빨라지지 않음
+    def _effective_workers(self, *, segment_count: int) -> int:
+        cpus: int = os.cpu_count() or 1
+        requested: int = int(self.max_workers) if int(self.max_workers) > 0 else cpus
+        return max(1, min(requested, cpus, int(segment_count)))
+
+    # [lo, hi) 를 path[lo-1], path[hi] 를 고정한 채로 다시 decode (path 를 직접 고침)
+    def _fix_boundary(self, *, path: np.ndarray, tables: TabCostTables, boundary: int) -> None:
+        n_notes: int = int(path.shape[0])
+        lo: int = max(0, boundary - int(self.fixup_notes))
+        hi: int = min(n_notes, boundary + int(self.fixup_notes))
+
+        emission: np.ndarray = tables.emission
+        transition: np.ndarray = tables.transition
+
+        start_costs: np.ndarray | None = None
+        if lo > 0:
+            start_costs = emission[lo] + transition[lo, int(path[lo - 1]), :]
+        end_costs: np.ndarray | None = None
+        if hi < n_notes:
+            end_costs = transition[hi, :, int(path[hi])]
+
+        path[lo:hi] = tab_viterbi_path(
+            emission=emission[lo:hi],
+            transition=transition[lo:hi],
+            start_costs=start_costs,
+            end_costs=end_costs,
+        )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import random
+
+from app.adapters.tab.tab.origianal_tab.candidate_adapter import BassTabCandidateBuilderAdapter
+from app.adapters.tab.tab.origianal_tab.segment_viterbi_adapter import (
+    SegmentDecodeReport,
+    SegmentParallelViterbiAdapter,
+    shutdown_segment_pools,
+)
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.tab.tab.original_tab.candidate_port import BassTabCandidateBuildParams, BassTabCandidateDTO
+from app.application.ports.tab.tab.original_tab.viterbi_port import BassTabViterbiParams
+
+"""
+    segment 병렬 decode vs 전체 decode 비교 리포트
+
+    합성 곡 (phrase 사이에 REST_BEATS 범위의 쉼표) SONGS 곡
+        곡별 구간 수, 전체 decode 와 다른 note 수, 경로 비용 차이, DP 시간
+    마지막 줄에 전체 합계 (다른 note 비율 / 다른 곡 수) + cpu 수
+    cpu 1개면 pool 없이 순서대로 -> fix-up 만큼 전체 decode 보다 느린게 정상 (이득은 빈 cpu 가 있을때만)
+"""
+
+SONGS: int = 20
+NOTES_PER_SONG: tuple[int, int] = (4_000, 20_000)
+PHRASE_NOTES: tuple[int, int] = (64, 600)
+REST_BEATS: tuple[float, float] = (1.0, 8.0)
+MAX_WORKERS: int = 0
+SEED: int = 0
+
+
+def _synthetic_song(*, rng: random.Random, bpm: int) -> list[BasicPitchNoteEventDTO]:
+    seconds_per_beat: float = 60.0 / float(bpm)
+    total: int = rng.randint(*NOTES_PER_SONG)
+
+    out: list[BasicPitchNoteEventDTO] = []
+    t: float = 0.0
+    while len(out) < total:
+        phrase: int = min(rng.randint(*PHRASE_NOTES), total - len(out))
+        root: int = rng.randint(28, 45)
+        for _ in range(phrase):
+            step_beats: float = rng.choice([0.25, 0.5, 0.5, 1.0])
+            pitch: int = root + rng.choice([0, 0, 3, 5, 7, 10, 12])
+            length: float = step_beats * seconds_per_beat * 0.9
+            out.append(BasicPitchNoteEventDTO(start_time=t, end_time=t + length, pitch_midi=pitch, confidence=None))
+            t += step_beats * seconds_per_beat
+        t += rng.uniform(*REST_BEATS) * seconds_per_beat
+    return out
+
+
+def main() -> None:
+    rng: random.Random = random.Random(SEED)
+    adapter: SegmentParallelViterbiAdapter = SegmentParallelViterbiAdapter(max_workers=MAX_WORKERS)
+    params: BassTabViterbiParams = BassTabViterbiParams()
+
+    total_notes: int = 0
+    total_diff: int = 0
+    differing_songs: int = 0
+    exact_seconds: float = 0.0
+    segmented_seconds: float = 0.0
+    worst_gap: float = 0.0
+
+    try:
+        for song in range(SONGS):
+            bpm: int = rng.randint(70, 180)
+            notes: list[BasicPitchNoteEventDTO] = _synthetic_song(rng=rng, bpm=bpm)
+            candidates: list[list[BassTabCandidateDTO]] = BassTabCandidateBuilderAdapter().build_candidates(
+                notes=notes,
+                params=BassTabCandidateBuildParams(),
+            )
+
+            report: SegmentDecodeReport = adapter.compare_with_exact(
+                notes=notes,
+                candidates=candidates,
+                bpm=bpm,
+                params=params,
+            )
+            print(
+                f"song={song} notes={report.note_count} segments={report.segment_count} "
+                f"diff={report.differing_notes} cost_gap={report.path_cost_gap:.2e} exact={report.exact_seconds * 1000.0:.0f}ms "
+                f"segmented={report.segmented_seconds * 1000.0:.0f}ms"
+            )
+
+            total_notes += report.note_count
+            total_diff += report.differing_notes
+            differing_songs += 1 if report.differing_notes > 0 else 0
+            exact_seconds += report.exact_seconds
+            segmented_seconds += report.segmented_seconds
+            worst_gap = max(worst_gap, report.path_cost_gap)
+    finally:
+        shutdown_segment_pools()
+
+    print(
+        f"total songs={SONGS} differing_songs={differing_songs} "
+        f"differing_notes={total_diff}/{total_notes} ({total_diff / max(total_notes, 1) * 100.0:.3f}%) "
+        f"worst_cost_gap={worst_gap:.2e} exact={exact_seconds:.2f}s segmented={segmented_seconds:.2f}s "
+        f"cpus={os.cpu_count()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import inf
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+import numpy as np
+
+from app.adapters.tab.octave_viterbi_kernel import back_pointer_dtype, viterbi_backtrace
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack, as_note_track
 from app.application.ports.tab.tab.original_tab.candidate_port import BassTabCandidateDTO
 from app.application.ports.tab.tab.original_tab.viterbi_port import (
     BassTabViterbiParams,
@@ -11,6 +13,65 @@ from app.application.ports.tab.tab.original_tab.viterbi_port import (
     BassTabViterbiStepDTO,
 )
 
+# 평균 pitch 계산에서 빼는 개방현 pitch (E1, A1, D2, G2)
+_OPEN_STRING_PITCHES: tuple[int, ...] = (28, 33, 38, 43)
+
+
+# note별 후보를 [N, K_max] 로 채운 column (K_max = 가장 많은 후보 수)
+# note i 의 후보 k < count[i] 만 유효, 나머지 칸은 line/fret 0 + emission inf
+@dataclass(frozen=True)
+class _CandidateColumns:
+    line: np.ndarray  # int64 [N, K]
+    fret: np.ndarray  # int64 [N, K]
+    is_open: np.ndarray  # bool [N, K]
+    fret_height: np.ndarray  # int64 [N, K]
+    valid: np.ndarray  # bool [N, K]
+
+
+# note 단위 비용 표 (decode / segment 병렬 decode 가 같이 씀)
+@dataclass(frozen=True)
+class TabCostTables:
+    columns: _CandidateColumns
+    dt_beats: np.ndarray  # float64 [N]
+    emission: np.ndarray  # float64 [N, K] (빈 칸 inf)
+    transition: np.ndarray  # float64 [N, K(prev), K(cur)] (i 번째 = note i-1 -> i, 0 번째는 안씀)
+
+
+def tab_viterbi_path(
+    *,
+    emission: np.ndarray,
+    transition: np.ndarray,
+    start_costs: np.ndarray | None = None,
+    end_costs: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    emission    : [n, K]
+    transition  : [n, K, K] (0 번째는 안씀)
+    start_costs : [K] 첫 행 누적 비용 (없으면 emission[0])
+    end_costs   : [K] 마지막 행에 더해서 고름 (구간 오른쪽 상태가 정해져 있을때)
+    반환        : [n] 후보 index
+    """
+    n_notes: int = int(emission.shape[0])
+    k_max: int = int(emission.shape[1])
+    if n_notes == 0:
+        return np.zeros((0,), dtype=np.int64)
+
+    cols: np.ndarray = np.arange(k_max)
+    back_ptr: np.ndarray = np.zeros((n_notes, k_max), dtype=back_pointer_dtype(k_max))
+    scores: np.ndarray = np.empty((k_max, k_max), dtype=np.float64)
+
+    prev_costs: np.ndarray = emission[0] if start_costs is None else start_costs
+    for i in range(1, n_notes):
+        np.add(prev_costs[:, np.newaxis], emission[i][np.newaxis, :], out=scores)
+        scores += transition[i]
+        best_prev: np.ndarray = scores.argmin(axis=0)
+        back_ptr[i] = best_prev
+        prev_costs = scores[best_prev, cols]
+
+    if end_costs is not None:
+        prev_costs = prev_costs + end_costs
+    return viterbi_backtrace(back=back_ptr, last_state=int(np.argmin(prev_costs)))
+
 
 @dataclass(frozen=True)
 class BassTabViterbiAdapter(BassTabViterbiPort):
@@ -22,19 +83,50 @@ class BassTabViterbiAdapter(BassTabViterbiPort):
     - string change, fret move, same-string large jump, fret range,
       time 여유 시 low fret bias를 반영
     - 짧은 ABA zigzag는 후처리 smoothing에서 보정
+
+    계산:
+    - dt / speed multiplier / local preferred line 은 note 단위로 한번만 계산
+    - emission [N, K], transition [N, K(prev), K(cur)] 를 array 로 한번에 만들고
+      DP 는 step 마다 min / argmin, smoothing 도 같은 표를 꺼내씀
+    - 덧셈 순서 / 동점 처리(앞 index 우선)는 기존 scalar 구현과 같음 -> 결과 동일
     """
 
     def decode(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         candidates: list[list[BassTabCandidateDTO]],
         bpm: int,
         params: BassTabViterbiParams,
     ) -> list[BassTabViterbiStepDTO]:
-        n_notes: int = len(notes)
-        if n_notes == 0:
+        if len(notes) == 0:
             return []
+
+        track: NoteTrack = as_note_track(notes)
+        tables: TabCostTables = self.build_cost_tables(
+            notes=track,
+            candidates=candidates,
+            bpm=bpm,
+            params=params,
+        )
+        path: np.ndarray = tab_viterbi_path(emission=tables.emission, transition=tables.transition)
+        return self.finish_steps(
+            notes=track,
+            candidates=candidates,
+            tables=tables,
+            chosen_indices=path.tolist(),
+            params=params,
+        )
+
+    def build_cost_tables(
+        self,
+        *,
+        notes: NoteTrack,
+        candidates: list[list[BassTabCandidateDTO]],
+        bpm: int,
+        params: BassTabViterbiParams,
+    ) -> TabCostTables:
+        n_notes: int = len(notes)
         if bpm <= 0:
             raise ValueError("bpm must be > 0")
         if n_notes != len(candidates):
@@ -44,157 +136,152 @@ class BassTabViterbiAdapter(BassTabViterbiPort):
             if not one_candidates:
                 raise ValueError(f"note index {i} has no candidates")
 
-        prev_costs: list[float] = [inf] * len(candidates[0])
-        back_ptr: list[list[int]] = [
-            [-1 for _ in range(len(candidates[i]))] for i in range(n_notes)
-        ]
+        columns: _CandidateColumns = self._candidate_columns(candidates=candidates)
 
-        first_preferred_line: int | None = self._get_local_preferred_line(
+        dt_beats: np.ndarray = self._dt_beats(notes=notes, bpm=bpm)
+        speed_mult: np.ndarray = self._movement_speed_multiplier(dt_beats=dt_beats, params=params)
+        preferred_lines: np.ndarray = self._local_preferred_lines(
             notes=notes,
-            current_index=0,
             bpm=bpm,
             local_window_bar_count=int(params.local_window_bar_count),
         )
-        for s_idx, cand in enumerate(candidates[0]):
-            prev_costs[s_idx] = self._emission_cost(
-                candidate=cand,
-                preferred_line=first_preferred_line,
-                params=params,
-            )
-
-        for i in range(1, n_notes):
-            cur_candidates: list[BassTabCandidateDTO] = candidates[i]
-            prev_candidates: list[BassTabCandidateDTO] = candidates[i - 1]
-            cur_costs: list[float] = [inf] * len(cur_candidates)
-
-            preferred_line: int | None = self._get_local_preferred_line(
-                notes=notes,
-                current_index=i,
-                bpm=bpm,
-                local_window_bar_count=int(params.local_window_bar_count),
-            )
 
-            for cur_idx, cur_cand in enumerate(cur_candidates):
-                emit_cost: float = self._emission_cost(
-                    candidate=cur_cand,
-                    preferred_line=preferred_line,
-                    params=params,
-                )
-
-                best_cost: float = inf
-                best_prev_idx: int = -1
-
-                for prev_idx, prev_cand in enumerate(prev_candidates):
-                    trans_cost: float = self._transition_cost(
-                        notes=notes,
-                        note_index=i,
-                        prev_candidate=prev_cand,
-                        cur_candidate=cur_cand,
-                        bpm=bpm,
-                        params=params,
-                    )
-                    total_cost: float = prev_costs[prev_idx] + emit_cost + trans_cost
-                    if total_cost < best_cost:
-                        best_cost = total_cost
-                        best_prev_idx = prev_idx
-
-                cur_costs[cur_idx] = best_cost
-                back_ptr[i][cur_idx] = best_prev_idx
-
-            prev_costs = cur_costs
-
-        chosen_indices: list[int] = self._traceback(
-            back_ptr=back_ptr,
-            last_best_idx=self._argmin(values=prev_costs),
+        return TabCostTables(
+            columns=columns,
+            dt_beats=dt_beats,
+            emission=self._emission_costs(
+                columns=columns,
+                preferred_lines=preferred_lines,
+                params=params,
+            ),
+            transition=self._transition_costs(
+                columns=columns,
+                dt_beats=dt_beats,
+                speed_mult=speed_mult,
+                params=params,
+            ),
         )
-        chosen_indices = self._smooth_short_zigzags(
-            notes=notes,
-            candidates=candidates,
+
+    # DP 로 고른 후보 index -> zigzag smoothing -> step DTO
+    def finish_steps(
+        self,
+        *,
+        notes: NoteTrack,
+        candidates: list[list[BassTabCandidateDTO]],
+        tables: TabCostTables,
+        chosen_indices: list[int],
+        params: BassTabViterbiParams,
+    ) -> list[BassTabViterbiStepDTO]:
+        smoothed: list[int] = self._smooth_short_zigzags(
+            columns=tables.columns,
             chosen_indices=chosen_indices,
-            bpm=bpm,
+            emission=tables.emission,
+            transition=tables.transition,
+            dt_beats=tables.dt_beats,
             params=params,
         )
-
         return self._build_steps(
             notes=notes,
             candidates=candidates,
-            chosen_indices=chosen_indices,
+            chosen_indices=smoothed,
         )
 
-    def _emission_cost(
+    def _candidate_columns(
         self,
         *,
-        candidate: BassTabCandidateDTO,
-        preferred_line: int | None,
-        params: BassTabViterbiParams,
-    ) -> float:
-        cost: float = 0.0
-
-        if bool(candidate.is_open):
-            cost += float(params.open_string_cost)
+        candidates: list[list[BassTabCandidateDTO]],
+    ) -> _CandidateColumns:
+        n_notes: int = len(candidates)
+        counts: np.ndarray = np.fromiter((len(c) for c in candidates), dtype=np.int64, count=n_notes)
+        k_max: int = int(counts.max()) if n_notes > 0 else 0
 
-        fret_height: int = int(candidate.fret_height)
-        if fret_height == 2:
-            cost += float(params.fret_height_2_cost)
-        elif fret_height == 3:
-            cost += float(params.fret_height_3_cost)
-        elif fret_height == 4:
-            cost += float(params.fret_height_4_cost)
+        flat: list[BassTabCandidateDTO] = [cand for one in candidates for cand in one]
+        valid: np.ndarray = np.arange(k_max)[np.newaxis, :] < counts[:, np.newaxis]
 
-        if preferred_line is not None and int(candidate.line) == int(preferred_line):
-            cost += float(params.local_string_bonus)
+        def _column(values: list[int], dtype: type) -> np.ndarray:
+            out: np.ndarray = np.zeros((n_notes, k_max), dtype=dtype)
+            out[valid] = np.asarray(values, dtype=dtype)
+            return out
 
-        return cost
+        return _CandidateColumns(
+            line=_column([int(c.line) for c in flat], np.int64),
+            fret=_column([int(c.fret) for c in flat], np.int64),
+            is_open=_column([bool(c.is_open) for c in flat], np.bool_),
+            fret_height=_column([int(c.fret_height) for c in flat], np.int64),
+            valid=valid,
+        )
 
-    def _transition_cost(
+    # [N, K] (빈 칸은 inf)
+    def _emission_costs(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
-        note_index: int,
-        prev_candidate: BassTabCandidateDTO,
-        cur_candidate: BassTabCandidateDTO,
-        bpm: int,
+        columns: _CandidateColumns,
+        preferred_lines: np.ndarray,
         params: BassTabViterbiParams,
-    ) -> float:
-        cost: float = 0.0
-
-        prev_line: int = int(prev_candidate.line)
-        cur_line: int = int(cur_candidate.line)
-        prev_fret: int = int(prev_candidate.fret)
-        cur_fret: int = int(cur_candidate.fret)
-        dfret: int = abs(cur_fret - prev_fret)
-
-        dt_beats: float = self._dt_beats(
-            notes=notes,
-            note_index=note_index,
-            bpm=bpm,
+    ) -> np.ndarray:
+        cost: np.ndarray = np.where(columns.is_open, float(params.open_string_cost), 0.0)
+
+        fret_height: np.ndarray = columns.fret_height
+        cost = cost + np.select(
+            [fret_height == 2, fret_height == 3, fret_height == 4],
+            [float(params.fret_height_2_cost), float(params.fret_height_3_cost), float(params.fret_height_4_cost)],
+            default=0.0,
         )
-        speed_mult: float = self._movement_speed_multiplier(
-            dt_beats=dt_beats,
-            params=params,
-        )
-
-        if prev_line != cur_line:
-            cost += float(params.string_change_cost) * speed_mult
 
-        cost += float(dfret) * float(params.fret_move_cost) * speed_mult
+        preferred: np.ndarray = preferred_lines[:, np.newaxis]
+        cost = cost + np.where(
+            (preferred != 0) & (columns.line == preferred),
+            float(params.local_string_bonus),
+            0.0,
+        )
 
-        if prev_line == cur_line and dfret >= int(params.same_string_far_move_start):
-            extra_jump: int = dfret - int(params.same_string_far_move_start) + 1
-            cost += float(extra_jump) * float(params.same_string_far_move_cost) * speed_mult
+        return np.where(columns.valid, cost, np.inf)
 
-        if dt_beats >= float(params.sufficient_t_beats):
-            cost += float(cur_fret) * float(params.low_fret_bias_cost)
+    # [N, K(prev), K(cur)] : i 번째는 note i-1 -> i 전이 (0 번째는 안씀)
+    def _transition_costs(
+        self,
+        *,
+        columns: _CandidateColumns,
+        dt_beats: np.ndarray,
+        speed_mult: np.ndarray,
+        params: BassTabViterbiParams,
+    ) -> np.ndarray:
+        prev_line: np.ndarray = np.roll(columns.line, 1, axis=0)[:, :, np.newaxis]
+        prev_fret: np.ndarray = np.roll(columns.fret, 1, axis=0)[:, :, np.newaxis]
+        cur_line: np.ndarray = columns.line[:, np.newaxis, :]
+        cur_fret: np.ndarray = columns.fret[:, np.newaxis, :]
+        mult: np.ndarray = speed_mult[:, np.newaxis, np.newaxis]
+
+        dfret: np.ndarray = np.abs(cur_fret - prev_fret)
+        line_change: np.ndarray = prev_line != cur_line
+
+        cost: np.ndarray = np.where(line_change, float(params.string_change_cost) * mult, 0.0)
+        cost = cost + dfret.astype(np.float64) * float(params.fret_move_cost) * mult
+
+        far_start: int = int(params.same_string_far_move_start)
+        extra_jump: np.ndarray = dfret - far_start + 1
+        cost = cost + np.where(
+            ~line_change & (dfret >= far_start),
+            extra_jump.astype(np.float64) * float(params.same_string_far_move_cost) * mult,
+            0.0,
+        )
 
+        sufficient: np.ndarray = (dt_beats >= float(params.sufficient_t_beats))[:, np.newaxis, np.newaxis]
+        cost = cost + np.where(
+            sufficient,
+            cur_fret.astype(np.float64) * float(params.low_fret_bias_cost),
+            0.0,
+        )
         return cost
 
     def _smooth_short_zigzags(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
-        candidates: list[list[BassTabCandidateDTO]],
+        columns: _CandidateColumns,
         chosen_indices: list[int],
-        bpm: int,
+        emission: np.ndarray,
+        transition: np.ndarray,
+        dt_beats: np.ndarray,
         params: BassTabViterbiParams,
     ) -> list[int]:
         """
@@ -204,220 +291,141 @@ class BassTabViterbiAdapter(BassTabViterbiPort):
         if len(out) < 3:
             return out
 
-        for i in range(1, len(out) - 1):
-            left_cand: BassTabCandidateDTO = candidates[i - 1][out[i - 1]]
-            mid_cand: BassTabCandidateDTO = candidates[i][out[i]]
-            right_cand: BassTabCandidateDTO = candidates[i + 1][out[i + 1]]
+        line: np.ndarray = columns.line
+        cut_t: float = float(params.string_cut_t_beats)
+        zigzag_cost: float = float(params.string_zigzag_cost)
 
-            left_line: int = int(left_cand.line)
-            mid_line: int = int(mid_cand.line)
-            right_line: int = int(right_cand.line)
+        for i in range(1, len(out) - 1):
+            left_line: int = int(line[i - 1, out[i - 1]])
+            mid_line: int = int(line[i, out[i]])
+            right_line: int = int(line[i + 1, out[i + 1]])
 
             if left_line != right_line:
                 continue
             if mid_line == left_line:
                 continue
 
-            dt_left: float = self._dt_beats(notes=notes, note_index=i, bpm=bpm)
-            dt_right: float = self._dt_beats(notes=notes, note_index=i + 1, bpm=bpm)
-            if max(dt_left, dt_right) > float(params.string_cut_t_beats):
+            if max(float(dt_beats[i]), float(dt_beats[i + 1])) > cut_t:
                 continue
 
-            best_mid_idx: int = out[i]
-            best_local_cost: float = self._pair_cost(
-                notes=notes,
-                prev_note_index=i - 1,
-                prev_candidate=left_cand,
-                cur_candidate=mid_cand,
-                bpm=bpm,
-                params=params,
-            ) + self._pair_cost(
-                notes=notes,
-                prev_note_index=i,
-                prev_candidate=mid_cand,
-                cur_candidate=right_cand,
-                bpm=bpm,
-                params=params,
-            ) + float(params.string_zigzag_cost)
+            # 왼쪽 확정 후보 -> 가운데 후보들, 가운데 후보들 -> 오른쪽 확정 후보
+            from_left: np.ndarray = transition[i, out[i - 1], :]
+            to_right: np.ndarray = transition[i + 1, :, out[i + 1]]
 
-            preferred_line: int | None = self._get_local_preferred_line(
-                notes=notes,
-                current_index=i,
-                bpm=bpm,
-                local_window_bar_count=int(params.local_window_bar_count),
-            )
-
-            for alt_idx, alt_mid in enumerate(candidates[i]):
-                local_cost: float = self._emission_cost(
-                    candidate=alt_mid,
-                    preferred_line=preferred_line,
-                    params=params,
-                )
-                local_cost += self._pair_cost(
-                    notes=notes,
-                    prev_note_index=i - 1,
-                    prev_candidate=left_cand,
-                    cur_candidate=alt_mid,
-                    bpm=bpm,
-                    params=params,
-                )
-                local_cost += self._pair_cost(
-                    notes=notes,
-                    prev_note_index=i,
-                    prev_candidate=alt_mid,
-                    cur_candidate=right_cand,
-                    bpm=bpm,
-                    params=params,
-                )
-                if local_cost < best_local_cost:
-                    best_local_cost = local_cost
-                    best_mid_idx = alt_idx
+            best_local_cost: float = float(from_left[out[i]] + to_right[out[i]]) + zigzag_cost
+            local_costs: np.ndarray = emission[i] + from_left + to_right
 
-            out[i] = best_mid_idx
+            alt_idx: int = int(np.argmin(local_costs))
+            if float(local_costs[alt_idx]) < best_local_cost:
+                out[i] = alt_idx
 
         return out
 
-    def _pair_cost(
-        self,
-        *,
-        notes: list[BasicPitchNoteEventDTO],
-        prev_note_index: int,
-        prev_candidate: BassTabCandidateDTO,
-        cur_candidate: BassTabCandidateDTO,
-        bpm: int,
-        params: BassTabViterbiParams,
-    ) -> float:
-        return self._transition_cost(
-            notes=notes,
-            note_index=prev_note_index + 1,
-            prev_candidate=prev_candidate,
-            cur_candidate=cur_candidate,
-            bpm=bpm,
-            params=params,
-        )
-
-    def _get_local_preferred_line(
+    def _local_preferred_lines(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
-        current_index: int,
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         bpm: int,
         local_window_bar_count: int,
-    ) -> int | None:
-        if current_index < 0 or bpm <= 0:
-            return None
+    ) -> np.ndarray:
+        """
+        note i 의 preferred line = [i 가 속한 bar - window bar 시작, i) 구간 note 들의
+        평균 pitch (open string pitch 제외) 로 고른 line. 첫 bar 이거나 값이 없으면 0 (없음).
+
+        start_time 이 정렬돼 있으면 구간이 [lo, i) 연속 범위라서
+        searchsorted + prefix sum 으로 전체 note 를 한번에 계산 (O(N log N))
+        정렬 안된 입력만 note 마다 앞쪽을 다시 훑음
+        """
+        track: NoteTrack = as_note_track(notes)
+        n_notes: int = len(track)
+        if n_notes == 0 or bpm <= 0:
+            return np.zeros((n_notes,), dtype=np.int64)
 
         seconds_per_beat: float = 60.0 / float(bpm)
         bar_seconds: float = seconds_per_beat * 4.0
         if bar_seconds <= 0.0:
-            return None
-
-        cur_time: float = float(notes[current_index].start_time)
-        cur_bar_index: int = int(cur_time // bar_seconds)
-        if cur_bar_index == 0:
-            return None
-
-        start_bar_index: int = max(0, cur_bar_index - int(local_window_bar_count))
-        start_time: float = float(start_bar_index) * bar_seconds
-
-        values: list[int] = []
-        for i in range(current_index):
-            note: BasicPitchNoteEventDTO = notes[i]
-            pitch: int = int(note.pitch_midi)
-            if float(note.start_time) < start_time:
-                continue
-            if pitch in (28, 33, 38, 43):
-                continue
-            values.append(pitch)
-
-        if not values:
-            return None
-
-        avg_pitch: float = float(sum(values)) / float(len(values))
-        if avg_pitch < 33.0:
-            return 4
-        if avg_pitch < 38.0:
-            return 3
-        if avg_pitch < 43.0:
-            return 2
-        return 1
+            return np.zeros((n_notes,), dtype=np.int64)
+
+        start: np.ndarray = track.start_time
+        pitch: np.ndarray = track.pitch_midi.astype(np.int64)
+
+        cur_bar: np.ndarray = np.floor_divide(start, bar_seconds).astype(np.int64)
+        start_bar: np.ndarray = np.maximum(cur_bar - int(local_window_bar_count), 0)
+        window_start: np.ndarray = start_bar.astype(np.float64) * bar_seconds
+
+        counted: np.ndarray = ~np.isin(pitch, _OPEN_STRING_PITCHES)
+        index: np.ndarray = np.arange(n_notes)
+
+        if bool(np.all(start[1:] >= start[:-1])):
+            lo: np.ndarray = np.minimum(np.searchsorted(start, window_start, side="left"), index)
+            count_prefix: np.ndarray = np.concatenate([[0], np.cumsum(counted)])
+            sum_prefix: np.ndarray = np.concatenate([[0], np.cumsum(np.where(counted, pitch, 0))])
+            counts: np.ndarray = count_prefix[index] - count_prefix[lo]
+            sums: np.ndarray = sum_prefix[index] - sum_prefix[lo]
+        else:
+            counts = np.zeros((n_notes,), dtype=np.int64)
+            sums = np.zeros((n_notes,), dtype=np.int64)
+            for i in range(n_notes):
+                in_window: np.ndarray = counted[:i] & (start[:i] >= window_start[i])
+                counts[i] = int(np.count_nonzero(in_window))
+                sums[i] = int(pitch[:i][in_window].sum())
+
+        avg_pitch: np.ndarray = sums.astype(np.float64) / np.maximum(counts, 1).astype(np.float64)
+        lines: np.ndarray = np.select(
+            [avg_pitch < 33.0, avg_pitch < 38.0, avg_pitch < 43.0],
+            [4, 3, 2],
+            default=1,
+        )
+        return np.where((cur_bar == 0) | (counts == 0), 0, lines).astype(np.int64)
 
     def _movement_speed_multiplier(
         self,
         *,
-        dt_beats: float,
+        dt_beats: np.ndarray,
         params: BassTabViterbiParams,
-    ) -> float:
+    ) -> np.ndarray:
         cut_t: float = float(params.string_cut_t_beats)
         if cut_t <= 0.0:
-            return 1.0
-        if dt_beats >= cut_t:
-            return 1.0
-        if dt_beats <= 0.0:
-            return 2.0
-        ratio: float = (cut_t - dt_beats) / cut_t
-        return 1.0 + min(1.0, ratio)
+            return np.ones_like(dt_beats)
+        ratio: np.ndarray = (cut_t - dt_beats) / cut_t
+        mult: np.ndarray = 1.0 + np.minimum(1.0, ratio)
+        mult = np.where(dt_beats <= 0.0, 2.0, mult)
+        return np.where(dt_beats >= cut_t, 1.0, mult)
 
+    # [N] note i-1 -> i 간격 (beat), 0 번째 / 간격 <= 0 은 0
     def _dt_beats(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
-        note_index: int,
+        notes: NoteTrack,
         bpm: int,
-    ) -> float:
-        if note_index <= 0:
-            return 0.0
+    ) -> np.ndarray:
+        n_notes: int = len(notes)
         seconds_per_beat: float = 60.0 / float(bpm)
-        if seconds_per_beat <= 0.0:
-            return 0.0
-        dt_seconds: float = (
-            float(notes[note_index].start_time) - float(notes[note_index - 1].start_time)
-        )
-        if dt_seconds <= 0.0:
-            return 0.0
-        return dt_seconds / seconds_per_beat
-
-    def _traceback(
-        self,
-        *,
-        back_ptr: list[list[int]],
-        last_best_idx: int,
-    ) -> list[int]:
-        n_notes: int = len(back_ptr)
-        chosen_indices: list[int] = [0] * n_notes
-        chosen_indices[-1] = last_best_idx
-        for i in range(n_notes - 1, 0, -1):
-            chosen_indices[i - 1] = back_ptr[i][chosen_indices[i]]
-        return chosen_indices
+        if n_notes == 0 or seconds_per_beat <= 0.0:
+            return np.zeros((n_notes,), dtype=np.float64)
+        dt_seconds: np.ndarray = np.diff(notes.start_time, prepend=notes.start_time[0])
+        return np.where(dt_seconds > 0.0, dt_seconds / seconds_per_beat, 0.0)
 
     def _build_steps(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         candidates: list[list[BassTabCandidateDTO]],
         chosen_indices: list[int],
     ) -> list[BassTabViterbiStepDTO]:
         out: list[BassTabViterbiStepDTO] = []
-        for i in range(len(notes)):
+        for i, (pitch, start, end) in enumerate(
+            zip(notes.pitch_midi.tolist(), notes.start_time.tolist(), notes.end_time.tolist())
+        ):
             chosen: BassTabCandidateDTO = candidates[i][chosen_indices[i]]
-            note: BasicPitchNoteEventDTO = notes[i]
             out.append(
                 BassTabViterbiStepDTO(
                     note_index=i,
-                    pitch_midi=int(note.pitch_midi),
-                    start_time=float(note.start_time),
-                    end_time=float(note.end_time),
+                    pitch_midi=int(pitch),
+                    start_time=float(start),
+                    end_time=float(end),
                     line=int(chosen.line),
                     fret=int(chosen.fret),
                 )
             )
         return out
-
-    def _argmin(self, *, values: list[float]) -> int:
-        best_idx: int = 0
-        best_value: float = values[0]
-        for i in range(1, len(values)):
-            if values[i] < best_value:
-                best_value = values[i]
-                best_idx = i
-        return best_idx
\ No newline at end of file
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import random
+import time
+
+import numpy as np
+
+from app.adapters.tab.tab.origianal_tab.candidate_adapter import BassTabCandidateBuilderAdapter
+from app.adapters.tab.tab.origianal_tab.viterbi_adapter import BassTabViterbiAdapter
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
+from app.application.ports.tab.tab.original_tab.candidate_port import BassTabCandidateBuildParams, BassTabCandidateDTO
+from app.application.ports.tab.tab.original_tab.viterbi_port import BassTabViterbiParams
+
+"""
+    BassTabViterbiAdapter 비용 array 확인
+        emission [N, K] / transition [N, K, K] 가 note / 후보 쌍마다 계산한 scalar 식과 비트 단위로 같은지
+        (랜덤 note + 랜덤 params, TRIALS 회)
+    NOTE_COUNTS 별 decode 시간도 출력
+"""
+
+TRIALS: int = 300
+NOTE_COUNTS: tuple[int, ...] = (1_000, 10_000, 50_000)
+SEED: int = 0
+
+
+def _random_notes(*, n: int, rng: random.Random) -> list[BasicPitchNoteEventDTO]:
+    t: float = 0.0
+    out: list[BasicPitchNoteEventDTO] = []
+    for _ in range(n):
+        t += rng.choice([0.0, 0.05, 0.1, 0.25, 0.5, 1.0, rng.random() * 3.0])
+        out.append(BasicPitchNoteEventDTO(start_time=t, end_time=t + 0.2, pitch_midi=rng.randint(28, 67), confidence=None))
+    return out
+
+
+def _random_params(*, rng: random.Random) -> BassTabViterbiParams:
+    def cost() -> float:
+        return rng.choice([0.0, 0.5, 1.0, -1.0, rng.uniform(-3.0, 8.0)])
+
+    return BassTabViterbiParams(
+        string_change_cost=cost(),
+        fret_move_cost=cost(),
+        same_string_far_move_cost=cost(),
+        same_string_far_move_start=rng.randint(0, 10),
+        fret_height_2_cost=cost(),
+        fret_height_3_cost=cost(),
+        fret_height_4_cost=cost(),
+        open_string_cost=cost(),
+        local_string_bonus=cost(),
+        string_cut_t_beats=rng.choice([0.0, 0.5, 1.0]),
+        sufficient_t_beats=rng.choice([0.0, 0.5, 1.5]),
+        low_fret_bias_cost=cost(),
+    )
+
+
+# 기존 scalar 식 (note / 후보 쌍 하나씩)
+def _reference_dt_beats(*, notes: list[BasicPitchNoteEventDTO], i: int, bpm: int) -> float:
+    if i <= 0:
+        return 0.0
+    dt_seconds: float = float(notes[i].start_time) - float(notes[i - 1].start_time)
+    if dt_seconds <= 0.0:
+        return 0.0
+    return dt_seconds / (60.0 / float(bpm))
+
+
+def _reference_speed(*, dt_beats: float, params: BassTabViterbiParams) -> float:
+    cut_t: float = float(params.string_cut_t_beats)
+    if cut_t <= 0.0 or dt_beats >= cut_t:
+        return 1.0
+    if dt_beats <= 0.0:
+        return 2.0
+    return 1.0 + min(1.0, (cut_t - dt_beats) / cut_t)
+
+
+def _reference_emission(*, cand: BassTabCandidateDTO, preferred_line: int, params: BassTabViterbiParams) -> float:
+    cost: float = 0.0
+    if cand.is_open:
+        cost += float(params.open_string_cost)
+    height_cost: dict[int, float] = {
+        2: float(params.fret_height_2_cost),
+        3: float(params.fret_height_3_cost),
+        4: float(params.fret_height_4_cost),
+    }
+    if cand.fret_height in height_cost:
+        cost += height_cost[cand.fret_height]
+    if preferred_line != 0 and cand.line == preferred_line:
+        cost += float(params.local_string_bonus)
+    return cost
+
+
+def _reference_transition(
+    *,
+    prev: BassTabCandidateDTO,
+    cur: BassTabCandidateDTO,
+    dt_beats: float,
+    params: BassTabViterbiParams,
+) -> float:
+    speed: float = _reference_speed(dt_beats=dt_beats, params=params)
+    dfret: int = abs(cur.fret - prev.fret)
+    cost: float = 0.0
+    if prev.line != cur.line:
+        cost += float(params.string_change_cost) * speed
+    cost += float(dfret) * float(params.fret_move_cost) * speed
+    if prev.line == cur.line and dfret >= int(params.same_string_far_move_start):
+        cost += float(dfret - int(params.same_string_far_move_start) + 1) * float(params.same_string_far_move_cost) * speed
+    if dt_beats >= float(params.sufficient_t_beats):
+        cost += float(cur.fret) * float(params.low_fret_bias_cost)
+    return cost
+
+
+def _check_trial(*, adapter: BassTabViterbiAdapter, rng: random.Random) -> bool:
+    notes: list[BasicPitchNoteEventDTO] = _random_notes(n=rng.randint(1, 60), rng=rng)
+    bpm: int = rng.randint(40, 240)
+    params: BassTabViterbiParams = _random_params(rng=rng)
+    candidates: list[list[BassTabCandidateDTO]] = BassTabCandidateBuilderAdapter().build_candidates(
+        notes=notes,
+        params=BassTabCandidateBuildParams(),
+    )
+
+    track: NoteTrack = NoteTrack.from_dtos(notes)
+    columns = adapter._candidate_columns(candidates=candidates)
+    dt_beats: np.ndarray = adapter._dt_beats(notes=track, bpm=bpm)
+    preferred: np.ndarray = adapter._local_preferred_lines(
+        notes=track,
+        bpm=bpm,
+        local_window_bar_count=int(params.local_window_bar_count),
+    )
+    emission: np.ndarray = adapter._emission_costs(columns=columns, preferred_lines=preferred, params=params)
+    transition: np.ndarray = adapter._transition_costs(
+        columns=columns,
+        dt_beats=dt_beats,
+        speed_mult=adapter._movement_speed_multiplier(dt_beats=dt_beats, params=params),
+        params=params,
+    )
+
+    for i, cands in enumerate(candidates):
+        dt: float = _reference_dt_beats(notes=notes, i=i, bpm=bpm)
+        if float(dt_beats[i]) != dt:
+            return False
+        for k, cur in enumerate(cands):
+            if float(emission[i, k]) != _reference_emission(cand=cur, preferred_line=int(preferred[i]), params=params):
+                return False
+            if i == 0:
+                continue
+            for p, prev in enumerate(candidates[i - 1]):
+                if float(transition[i, p, k]) != _reference_transition(prev=prev, cur=cur, dt_beats=dt, params=params):
+                    return False
+    return True
+
+
+def main() -> None:
+    rng: random.Random = random.Random(SEED)
+    adapter: BassTabViterbiAdapter = BassTabViterbiAdapter()
+
+    mismatched: int = sum(0 if _check_trial(adapter=adapter, rng=rng) else 1 for _ in range(TRIALS))
+    print(f"cost arrays vs scalar: trials={TRIALS} mismatched={mismatched}")
+
+    for n in NOTE_COUNTS:
+        notes: list[BasicPitchNoteEventDTO] = _random_notes(n=n, rng=rng)
+        candidates: list[list[BassTabCandidateDTO]] = BassTabCandidateBuilderAdapter().build_candidates(
+            notes=notes,
+            params=BassTabCandidateBuildParams(),
+        )
+        t0: float = time.perf_counter()
+        adapter.decode(notes=notes, candidates=candidates, bpm=120, params=BassTabViterbiParams())
+        print(f"notes={n} decode={(time.perf_counter() - t0) * 1000.0:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+import numpy as np
+
+from app.adapters.tab.tab.tab_binary_format import write_tab_binary, write_tab_json_encodings
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchNoteEventDTO,
+    NoteTrack,
+    as_note_track,
+)
 from app.application.ports.tab.tab.original_tab.candidate_port import (
     BassTabCandidateBuildParams,
     BassTabCandidateBuilderPort,
@@ -18,7 +24,8 @@ from app.application.ports.tab.tab.original_tab.original_tab_port import (
 @dataclass(frozen=True)
 class RootTabGenerateAdapter:
     candidate_builder: BassTabCandidateBuilderPort
-    output_filename: str = "root_tab.json"
+    output_filename: str = "root_tab.btab"
+    json_encodings: tuple[str, ...] = ("gzip", "br")
 
     beats_per_bar: int = 4
     candidate_params: BassTabCandidateBuildParams = field(
@@ -28,7 +35,7 @@ class RootTabGenerateAdapter:
     def tab_generate(
         self,
         *,
-        original_json: list[BasicPitchNoteEventDTO],
+        original_json: list[BasicPitchNoteEventDTO] | NoteTrack,
         bpm: int,
         output_dir: Path,
         asset_id: str,
@@ -38,21 +45,19 @@ class RootTabGenerateAdapter:
         if self.beats_per_bar <= 0:
             raise ValueError("beats_per_bar must be > 0")
 
-        filtered_notes: list[BasicPitchNoteEventDTO] = self._filter_notes(notes=original_json)
+        filtered_notes: NoteTrack = self._filter_notes(notes=as_note_track(original_json))
 
         output_path: Path = self._build_output_path(
             output_dir=output_dir,
             asset_id=asset_id,
         )
 
-        if not filtered_notes:
-            self._write_json(output_path=output_path, bars=[])
+        if len(filtered_notes) == 0:
+            write_tab_binary(output_path=output_path, bars=[])
+            write_tab_json_encodings(binary_path=output_path, bars=[], encodings=self.json_encodings)
             return output_path
 
-        sorted_notes: list[BasicPitchNoteEventDTO] = sorted(
-            filtered_notes,
-            key=lambda x: (float(x.start_time), float(x.end_time), int(x.pitch_midi)),
-        )
+        sorted_notes: NoteTrack = filtered_notes.sorted()
 
         bars: list[BassTabBarDTO] = self._build_root_bars(
             notes=sorted_notes,
@@ -60,53 +65,53 @@ class RootTabGenerateAdapter:
             beats_per_bar=self.beats_per_bar,
         )
 
-        self._write_json(output_path=output_path, bars=bars)
+        write_tab_binary(output_path=output_path, bars=bars)
+        write_tab_json_encodings(binary_path=output_path, bars=bars, encodings=self.json_encodings)
         return output_path
 
     def _filter_notes(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
-    ) -> list[BasicPitchNoteEventDTO]:
-        out: list[BasicPitchNoteEventDTO] = []
-        for note in notes:
-            start_time: float = float(note.start_time)
-            end_time: float = float(note.end_time)
-            if end_time <= start_time:
-                continue
-            out.append(note)
-        return out
+        notes: NoteTrack,
+    ) -> NoteTrack:
+        return notes.compress(notes.end_time > notes.start_time)
 
     def _build_root_bars(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: NoteTrack,
         bpm: int,
         beats_per_bar: int,
     ) -> list[BassTabBarDTO]:
         seconds_per_beat: float = 60.0 / float(bpm)
         bar_seconds: float = seconds_per_beat * float(beats_per_bar)
 
-        if not notes:
+        if len(notes) == 0:
             return []
 
-        first_time: float = float(notes[0].start_time)
-        last_time: float = float(notes[-1].end_time)
+        first_time: float = float(notes.start_time[0])
+        last_time: float = float(notes.end_time[-1])
 
         start_bar_index: int = int(first_time // bar_seconds)
         last_bar_index: int = int((last_time - 1e-9) // bar_seconds)
 
-        out: list[BassTabBarDTO] = []
+        bar_indices: np.ndarray = np.arange(start_bar_index, last_bar_index + 1, dtype=np.int64)
+        bar_starts: np.ndarray = bar_indices.astype(np.float64) * bar_seconds
+        bar_ends: np.ndarray = bar_starts + bar_seconds
+        bar_pitches: list[int | None] = self._pick_bar_root_pitches(
+            notes=notes,
+            bar_starts=bar_starts,
+            bar_ends=bar_ends,
+        )
 
-        for bar_index in range(start_bar_index, last_bar_index + 1):
-            bar_start_time: float = float(bar_index) * bar_seconds
-            bar_end_time: float = bar_start_time + bar_seconds
+        out: list[BassTabBarDTO] = []
 
-            bar_pitch: int | None = self._pick_bar_root_pitch(
-                notes=notes,
-                bar_start_time=bar_start_time,
-                bar_end_time=bar_end_time,
-            )
+        for bar_index, bar_start_time, bar_end_time, bar_pitch in zip(
+            bar_indices.tolist(),
+            bar_starts.tolist(),
+            bar_ends.tolist(),
+            bar_pitches,
+        ):
             if bar_pitch is None:
                 continue
 
@@ -145,52 +150,48 @@ class RootTabGenerateAdapter:
 
         return out
 
-    def _pick_bar_root_pitch(
+    def _pick_bar_root_pitches(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
-        bar_start_time: float,
-        bar_end_time: float,
-    ) -> int | None:
+        notes: NoteTrack,
+        bar_starts: np.ndarray,
+        bar_ends: np.ndarray,
+    ) -> list[int | None]:
         """
-        한 bar 안에서 가장 오래/많이 유지된 pitch를 대표 root로 선택.
+        bar 마다 가장 오래/많이 유지된 pitch를 대표 root로 선택.
         동률이면 더 낮은 pitch 우선.
-        """
-        pitch_scores: dict[int, float] = {}
 
-        for note in notes:
-            note_start: float = float(note.start_time)
-            note_end: float = float(note.end_time)
-
-            overlap: float = self._overlap_len(
-                a0=note_start,
-                a1=note_end,
-                b0=bar_start_time,
-                b1=bar_end_time,
-            )
-            if overlap <= 0.0:
+        note 는 start_time 정렬 -> bar 와 겹칠 수 있는 note 는 [lo, hi) 연속 구간
+            lo : 앞쪽 note 들의 end 최대값이 bar 시작을 넘는 첫 위치 (그 전 note 는 전부 bar 전에 끝남)
+            hi : bar 끝 이후에 시작하는 첫 위치
+        구간 안에서 overlap 을 array 로 계산, pitch 별 합은 note 순서대로 더함 (기존 dict 누적과 같은 값)
+        """
+        start: np.ndarray = notes.start_time
+        end: np.ndarray = notes.end_time
+        pitch: np.ndarray = notes.pitch_midi
+
+        reach: np.ndarray = np.maximum.accumulate(end)
+        lo: np.ndarray = np.searchsorted(reach, bar_starts, side="right")
+        hi: np.ndarray = np.searchsorted(start, bar_ends, side="left")
+
+        out: list[int | None] = []
+        for a, b, bar_start, bar_end in zip(lo.tolist(), hi.tolist(), bar_starts.tolist(), bar_ends.tolist()):
+            if a >= b:
+                out.append(None)
                 continue
 
-            pitch_midi: int = int(note.pitch_midi)
-            pitch_scores[pitch_midi] = pitch_scores.get(pitch_midi, 0.0) + overlap
-
-        if not pitch_scores:
-            return None
-
-        best_pitch: int | None = None
-        best_score: float = -1.0
-
-        for pitch_midi, score in pitch_scores.items():
-            if score > best_score:
-                best_score = score
-                best_pitch = pitch_midi
+            overlap: np.ndarray = np.minimum(end[a:b], bar_end) - np.maximum(start[a:b], bar_start)
+            keep: np.ndarray = overlap > 0.0
+            if not bool(np.any(keep)):
+                out.append(None)
                 continue
 
-            if score == best_score and best_pitch is not None:
-                if int(pitch_midi) < int(best_pitch):
-                    best_pitch = pitch_midi
+            # unique 는 오름차순 -> argmax 의 첫 최대값 = 동률 중 낮은 pitch
+            uniq, inverse = np.unique(pitch[a:b][keep], return_inverse=True)
+            scores: np.ndarray = np.bincount(inverse.reshape(-1), weights=overlap[keep])
+            out.append(int(uniq[int(np.argmax(scores))]))
 
-        return best_pitch
+        return out
 
     def _pick_root_candidate(
         self,
@@ -224,18 +225,6 @@ class RootTabGenerateAdapter:
         )
         return candidates[0]
 
-    def _overlap_len(
-        self,
-        *,
-        a0: float,
-        a1: float,
-        b0: float,
-        b1: float,
-    ) -> float:
-        lo: float = a0 if a0 >= b0 else b0
-        hi: float = a1 if a1 <= b1 else b1
-        return 0.0 if hi <= lo else float(hi - lo)
-
     def _build_output_path(
         self,
         *,
@@ -246,33 +235,3 @@ class RootTabGenerateAdapter:
         tab_dir: Path = asset_dir / "tab"
         tab_dir.mkdir(parents=True, exist_ok=True)
         return tab_dir / self.output_filename
-
-    def _write_json(
-        self,
-        *,
-        output_path: Path,
-        bars: list[BassTabBarDTO],
-    ) -> None:
-        payload: list[dict[str, object]] = []
-        for bar in bars:
-            payload.append(
-                {
-                    "bar_index": int(bar.bar_index),
-                    "start_time": float(bar.start_time),
-                    "end_time": float(bar.end_time),
-                    "notes": [
-                        {
-                            "time": float(note.time),
-                            "offset": float(note.offset),
-                            "line": int(note.line),
-                            "fret": int(note.fret),
-                        }
-                        for note in bar.notes
-                    ],
-                }
-            )
-
-        output_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
\ No newline at end of file
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import gzip
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from app.application.ports.tab.tab.original_tab.original_tab_port import (
+    BassTabBarDTO,
+    BassTabBarNoteDTO,
+)
+
+"""
+    tab binary 포맷 (.btab, little-endian)
+
+    [header 16B] [bar 표 28B * bar_count] [note 기록 18B * note_count]
+
+    header : magic "BTAB" (4s) / version (u16) / header_size (u16) / bar_count (u32) / note_count (u32)
+    bar    : bar_index (i32) / start_time (f64) / end_time (f64) / note_start (u32) / note_count (u32)
+             bar_index 오름차순, note_start = 이 bar 첫 note 의 note 기록 번호
+    note   : time (f64) / offset (f64) / line (u8) / fret (u8)
+             bar 순서 -> bar 안에서는 기존 JSON 의 notes 순서 그대로
+
+    bar 범위 읽기 = bar 표만 읽고 -> 해당 note 기록 구간으로 seek 해서 그 부분만 읽음
+    시간 값은 f64 그대로라 JSON view 는 기존 JSON 과 같은 내용
+    (main_server 의 tab reader 도 같은 포맷을 읽음 -> 바꾸면 둘다 같이 바꿔야함)
+
+    JSON view 압축본 (original_tab.json.gz / .json.br) 은 tab 만들때 같이 씀
+    -> main_server 가 Accept-Encoding 보고 그대로 보냄 (압축 안된 .json 은 필요할때만 만듦)
+    brotli 모듈이 없으면 .br 은 skip
+"""
+
+TAB_BINARY_MAGIC: bytes = b"BTAB"
+TAB_BINARY_VERSION: int = 1
+
+TAB_HEADER: struct.Struct = struct.Struct("<4sHHII")
+TAB_BAR_DTYPE: np.dtype = np.dtype(
+    [
+        ("bar_index", "<i4"),
+        ("start_time", "<f8"),
+        ("end_time", "<f8"),
+        ("note_start", "<u4"),
+        ("note_count", "<u4"),
+    ]
+)
+TAB_NOTE_DTYPE: np.dtype = np.dtype(
+    [
+        ("time", "<f8"),
+        ("offset", "<f8"),
+        ("line", "u1"),
+        ("fret", "u1"),
+    ]
+)
+
+
+# Content-Encoding -> JSON view 뒤에 붙는 확장자
+TAB_JSON_ENCODING_SUFFIXES: dict[str, str] = {"gzip": ".gz", "br": ".br"}
+
+
+def tab_json_view_path(binary_path: Path, encoding: str | None = None) -> Path:
+    json_path: Path = Path(binary_path).with_suffix(".json")
+    if encoding is None:
+        return json_path
+    return json_path.with_name(json_path.name + TAB_JSON_ENCODING_SUFFIXES[encoding])
+
+
+def write_tab_binary(*, output_path: Path, bars: list[BassTabBarDTO]) -> None:
+    ordered: list[BassTabBarDTO] = sorted(bars, key=lambda b: int(b.bar_index))
+    note_total: int = sum(len(bar.notes) for bar in ordered)
+
+    bar_table: np.ndarray = np.zeros((len(ordered),), dtype=TAB_BAR_DTYPE)
+    note_table: np.ndarray = np.zeros((note_total,), dtype=TAB_NOTE_DTYPE)
+
+    k: int = 0
+    for i, bar in enumerate(ordered):
+        bar_table[i] = (int(bar.bar_index), float(bar.start_time), float(bar.end_time), k, len(bar.notes))
+        for note in bar.notes:
+            note_table[k] = (float(note.time), float(note.offset), int(note.line), int(note.fret))
+            k += 1
+
+    header: bytes = TAB_HEADER.pack(
+        TAB_BINARY_MAGIC,
+        TAB_BINARY_VERSION,
+        TAB_HEADER.size,
+        len(ordered),
+        note_total,
+    )
+
+    output_path = Path(output_path)
+    tmp_path: Path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(header)
+        f.write(bar_table.tobytes())
+        f.write(note_table.tobytes())
+    tmp_path.replace(output_path)
+
+
+def read_tab_binary(
+    *,
+    path: Path,
+    bar_from: int | None = None,
+    bar_to: int | None = None,
+) -> list[BassTabBarDTO]:
+    """
+    bar_from <= bar_index < bar_to 인 bar 만 읽음 (None 이면 그쪽 끝까지)
+    """
+    with Path(path).open("rb") as f:
+        magic, version, header_size, bar_count, note_count = TAB_HEADER.unpack(f.read(TAB_HEADER.size))
+        if magic != TAB_BINARY_MAGIC:
+            raise ValueError(f"not a tab binary file: {path}")
+        if int(version) != TAB_BINARY_VERSION:
+            raise ValueError(f"unsupported tab binary version: {version}")
+
+        f.seek(int(header_size))
+        bar_table: np.ndarray = np.frombuffer(f.read(int(bar_count) * TAB_BAR_DTYPE.itemsize), dtype=TAB_BAR_DTYPE)
+
+        lo: int = 0 if bar_from is None else int(np.searchsorted(bar_table["bar_index"], int(bar_from), side="left"))
+        hi: int = int(bar_count) if bar_to is None else int(np.searchsorted(bar_table["bar_index"], int(bar_to), side="left"))
+        if lo >= hi:
+            return []
+
+        picked: np.ndarray = bar_table[lo:hi]
+        first_note: int = int(picked["note_start"][0])
+        last_note: int = int(picked["note_start"][-1]) + int(picked["note_count"][-1])
+
+        f.seek(int(header_size) + int(bar_count) * TAB_BAR_DTYPE.itemsize + first_note * TAB_NOTE_DTYPE.itemsize)
+        note_table: np.ndarray = np.frombuffer(
+            f.read((last_note - first_note) * TAB_NOTE_DTYPE.itemsize),
+            dtype=TAB_NOTE_DTYPE,
+        )
+
+    out: list[BassTabBarDTO] = []
+    for bar in picked.tolist():
+        bar_index, start_time, end_time, note_start, count = bar
+        rows: list[tuple[float, float, int, int]] = note_table[note_start - first_note : note_start - first_note + count].tolist()
+        out.append(
+            BassTabBarDTO(
+                bar_index=int(bar_index),
+                start_time=float(start_time),
+                end_time=float(end_time),
+                notes=[
+                    BassTabBarNoteDTO(time=time, offset=offset, line=int(line), fret=int(fret))
+                    for time, offset, line, fret in rows
+                ],
+            )
+        )
+    return out
+
+
+def tab_json_payload(bars: list[BassTabBarDTO]) -> list[dict[str, object]]:
+    payload: list[dict[str, object]] = []
+    for bar in bars:
+        payload.append(
+            {
+                "bar_index": int(bar.bar_index),
+                "start_time": float(bar.start_time),
+                "end_time": float(bar.end_time),
+                "notes": [
+                    {
+                        "time": float(note.time),
+                        "offset": float(note.offset),
+                        "line": int(note.line),
+                        "fret": int(note.fret),
+                    }
+                    for note in bar.notes
+                ],
+            }
+        )
+    return payload
+
+
+def tab_json_bytes(bars: list[BassTabBarDTO]) -> bytes:
+    return json.dumps(tab_json_payload(bars), ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# 못하면 (brotli 없음) None
+def encode_tab_json(*, data: bytes, encoding: str) -> bytes | None:
+    if encoding == "gzip":
+        # mtime=0 -> 같은 내용이면 같은 bytes (ETag 유지)
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br":
+        try:
+            import brotli  # type: ignore
+        except ImportError:
+            return None
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"unknown tab json encoding: {encoding}")
+
+
+def _write_bytes(*, path: Path, data: bytes) -> None:
+    tmp_path: Path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+# binary 옆에 JSON view 압축본을 씀 (만든 파일 경로 반환)
+def write_tab_json_encodings(
+    *,
+    binary_path: Path,
+    bars: list[BassTabBarDTO],
+    encodings: tuple[str, ...],
+) -> list[Path]:
+    if not encodings:
+        return []
+
+    data: bytes = tab_json_bytes(sorted(bars, key=lambda b: int(b.bar_index)))
+    written: list[Path] = []
+    for encoding in encodings:
+        encoded: bytes | None = encode_tab_json(data=data, encoding=encoding)
+        if encoded is None:
+            continue
+        path: Path = tab_json_view_path(binary_path, encoding)
+        _write_bytes(path=path, data=encoded)
+        written.append(path)
+    return written
+
+
+# JSON view 가 없거나 binary 보다 오래됐으면 binary 에서 다시 만듦
+def ensure_tab_json_view(*, binary_path: Path) -> Path:
+    binary_path = Path(binary_path)
+    json_path: Path = tab_json_view_path(binary_path)
+    if json_path.exists() and json_path.stat().st_mtime_ns >= binary_path.stat().st_mtime_ns:
+        return json_path
+
+    _write_bytes(path=json_path, data=tab_json_bytes(read_tab_binary(path=binary_path)))
+    return json_path
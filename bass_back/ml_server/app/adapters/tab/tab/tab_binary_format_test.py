@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from app.adapters.tab.tab.tab_binary_format import (
+    ensure_tab_json_view,
+    read_tab_binary,
+    tab_json_payload,
+    write_tab_binary,
+    write_tab_json_encodings,
+)
+from app.application.ports.tab.tab.original_tab.original_tab_port import (
+    BassTabBarDTO,
+    BassTabBarNoteDTO,
+)
+
+"""
+    tab binary 포맷 확인
+        write -> read 전체 / bar 범위 읽기가 원래 bar 와 같은지 (랜덤 tab, TRIALS 회)
+        JSON view 가 기존 _write_json 결과 (indent=2) 와 같은 문자열인지
+        gzip 압축본을 풀면 JSON view 와 같은지
+    BAR_COUNTS 별 파일 크기 (binary / json / json.gz / json.br) / 전체 JSON 파싱 vs bar 범위 읽기 시간도 출력
+"""
+
+TRIALS: int = 200
+BAR_COUNTS: tuple[int, ...] = (100, 1_000, 10_000)
+RANGE_BARS: int = 8
+SEED: int = 0
+
+
+def _random_bars(*, n_bars: int, rng: random.Random) -> list[BassTabBarDTO]:
+    bar_seconds: float = 4.0 * 60.0 / float(rng.randint(60, 200))
+    out: list[BassTabBarDTO] = []
+    bar_index: int = rng.randint(0, 3)
+    for _ in range(n_bars):
+        bar_index += rng.choice([1, 1, 1, 2, 5])
+        start: float = float(bar_index) * bar_seconds
+        notes: list[BassTabBarNoteDTO] = []
+        for _ in range(rng.choice([0, 1, 4, 8, rng.randint(1, 16)])):
+            offset: float = rng.random() * 4.0
+            notes.append(BassTabBarNoteDTO(time=start + offset * bar_seconds / 4.0, offset=offset, line=rng.randint(1, 4), fret=rng.randint(0, 20)))
+        out.append(BassTabBarDTO(bar_index=bar_index, start_time=start, end_time=start + bar_seconds, notes=notes))
+    return out
+
+
+def _check_trial(*, tmp_dir: Path, rng: random.Random) -> bool:
+    bars: list[BassTabBarDTO] = _random_bars(n_bars=rng.randint(0, 40), rng=rng)
+    path: Path = tmp_dir / "trial.btab"
+    write_tab_binary(output_path=path, bars=bars)
+
+    if read_tab_binary(path=path) != bars:
+        return False
+
+    for _ in range(5):
+        a: int = rng.randint(-2, 120)
+        b: int = a + rng.randint(0, 30)
+        expected: list[BassTabBarDTO] = [bar for bar in bars if a <= bar.bar_index < b]
+        if read_tab_binary(path=path, bar_from=a, bar_to=b) != expected:
+            return False
+
+    expected_json: str = json.dumps(tab_json_payload(bars), ensure_ascii=False, indent=2)
+    json_path: Path = ensure_tab_json_view(binary_path=path)
+    ok: bool = json_path.read_text(encoding="utf-8") == expected_json
+    json_path.unlink()
+
+    for encoded_path in write_tab_json_encodings(binary_path=path, bars=bars, encodings=("gzip",)):
+        ok = ok and gzip.decompress(encoded_path.read_bytes()).decode("utf-8") == expected_json
+    return ok
+
+
+def main() -> None:
+    rng: random.Random = random.Random(SEED)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir: Path = Path(tmp)
+        mismatched: int = sum(0 if _check_trial(tmp_dir=tmp_dir, rng=rng) else 1 for _ in range(TRIALS))
+        print(f"binary round trip / json view: trials={TRIALS} mismatched={mismatched}")
+
+        for n_bars in BAR_COUNTS:
+            bars: list[BassTabBarDTO] = _random_bars(n_bars=n_bars, rng=rng)
+            path: Path = tmp_dir / f"bars_{n_bars}.btab"
+            write_tab_binary(output_path=path, bars=bars)
+            json_path: Path = ensure_tab_json_view(binary_path=path)
+            encoded: list[Path] = write_tab_json_encodings(binary_path=path, bars=bars, encodings=("gzip", "br"))
+
+            t0: float = time.perf_counter()
+            json.loads(json_path.read_text(encoding="utf-8"))
+            json_seconds: float = time.perf_counter() - t0
+
+            middle: int = bars[len(bars) // 2].bar_index
+            t0 = time.perf_counter()
+            read_tab_binary(path=path, bar_from=middle, bar_to=middle + RANGE_BARS)
+            range_seconds: float = time.perf_counter() - t0
+
+            print(
+                f"bars={n_bars} binary={path.stat().st_size}B json={json_path.stat().st_size}B "
+                + "".join(f"{p.suffix[1:]}={p.stat().st_size}B " for p in encoded)
+                + f"json_parse={json_seconds * 1000.0:.2f}ms range_read({RANGE_BARS} bars)={range_seconds * 1000.0:.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
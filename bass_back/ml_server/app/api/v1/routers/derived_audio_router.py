@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.adapters.demucs.derived_audio_adapter import DerivedAudioAdapter
+from app.application.ports.demucs.derived_audio_port import (
+    DEFAULT_BOOSTED_VOLUME_DB,
+    DerivedAudioPort,
+    DerivedAudioResult,
+)
+from shared.dtos.main_ml_dto import MLDerivedAudioRequestDTO, MLDerivedAudioResponseDTO
+
+router: APIRouter = APIRouter(prefix="/v1", tags=["ml-derived-audio"])
+
+DERIVED_KINDS: tuple[str, ...] = ("bass_removed", "bass_boosted")
+
+
+# 요청 경로는 STORAGE_ROOT (main_server 와 같은 storage) 안의 것만 받음
+@lru_cache
+def get_derived_audio() -> DerivedAudioPort:
+    storage_root: str = os.getenv("STORAGE_ROOT", "")
+    if not storage_root:
+        raise HTTPException(status_code=503, detail="STORAGE_ROOT is not set")
+    return DerivedAudioAdapter(storage_root=Path(storage_root))
+
+
+@router.post("/derived-audio", response_model=MLDerivedAudioResponseDTO)
+async def materialize_derived_audio(
+    request: MLDerivedAudioRequestDTO,
+    derived_audio: DerivedAudioPort = Depends(get_derived_audio),
+) -> MLDerivedAudioResponseDTO:
+    print("[ml-derived-audio] request =", request.model_dump())
+
+    if request.kind not in DERIVED_KINDS:
+        raise HTTPException(status_code=400, detail=f"unknown kind: {request.kind}")
+
+    boosted_volume_db: float = (
+        DEFAULT_BOOSTED_VOLUME_DB if request.boosted_volume_db is None else float(request.boosted_volume_db)
+    )
+
+    # original_wav_path 는 안 씀 (bass_only 옆 stem 합으로 만듬, main_server 요청 형식은 그대로)
+    try:
+        result: DerivedAudioResult = await derived_audio.materialize(
+            bass_only_wav_path=Path(request.bass_only_wav_path),
+            kind=request.kind,  # type: ignore[arg-type]
+            boosted_volume_db=boosted_volume_db,
+        )
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    print("[ml-derived-audio] path =", result.path, "created =", result.created)
+
+    return MLDerivedAudioResponseDTO(
+        asset_id=request.asset_id,
+        kind=result.kind,
+        path=str(result.path),
+        boosted_volume_db=result.boosted_volume_db,
+        created=result.created,
+    )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class AudioBuffer:
+    audio: np.ndarray  # float32 [channels, samples] (읽기 전용)
+    samplerate: int
+
+    @property
+    def channels(self) -> int:
+        return int(self.audio.shape[0])
+
+    @property
+    def mono(self) -> np.ndarray:
+        # channels=1 로 받은 buffer 의 [samples]
+        if self.audio.shape[0] != 1:
+            raise ValueError(f"buffer is not mono: channels={self.audio.shape[0]}")
+        return self.audio[0]
+
+
+class AudioBufferPort(ABC):
+    # 파일은 job 안에서 한번만 decode, (path, sr, channels) 변형은 decode 결과에서 만들어 보관
+    # sr / channels = None 이면 파일 그대로
+    # offset / duration 을 주면 그 구간만 (librosa.load 와 같은 방식으로 자름, 보관 X)
+    @abstractmethod
+    def get(
+        self,
+        *,
+        path: Path,
+        sr: int | None = None,
+        channels: int | None = None,
+        offset_seconds: float = 0.0,
+        duration_seconds: float | None = None,
+    ) -> AudioBuffer:
+        raise NotImplementedError
+
+    # job 끝날때 호출 -> 보관한 buffer 전부 버림
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
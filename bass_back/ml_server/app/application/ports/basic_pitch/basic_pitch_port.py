@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Iterator, Sequence, overload
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -20,6 +24,259 @@ class BasicPitchFramePitchDTO:
     confidence: float | None = None
 
 
+# frame pitch 열(column) 단위 보관 : frame 마다 DTO 객체를 만들지 않음
+# confidence 가 없는 frame 은 NaN
+@dataclass(frozen=True)
+class BasicPitchFrameTrack:
+    t: np.ndarray  # float64 [N]
+    pitch_midi: np.ndarray  # int16 [N]
+    confidence: np.ndarray  # float64 [N]
+
+    def __post_init__(self) -> None:
+        t: np.ndarray = np.asarray(self.t, dtype=np.float64)
+        pitch_midi: np.ndarray = np.asarray(self.pitch_midi, dtype=np.int16)
+        confidence: np.ndarray = np.asarray(self.confidence, dtype=np.float64)
+
+        if not (t.ndim == pitch_midi.ndim == confidence.ndim == 1):
+            raise ValueError("frame track columns must be 1-D")
+        if not (t.shape == pitch_midi.shape == confidence.shape):
+            raise ValueError(
+                f"frame track column length mismatch. t={t.shape} pitch={pitch_midi.shape} conf={confidence.shape}"
+            )
+
+        object.__setattr__(self, "t", t)
+        object.__setattr__(self, "pitch_midi", pitch_midi)
+        object.__setattr__(self, "confidence", confidence)
+
+    def __len__(self) -> int:
+        return int(self.t.shape[0])
+
+    @classmethod
+    def empty(cls) -> BasicPitchFrameTrack:
+        return cls(
+            t=np.zeros((0,), dtype=np.float64),
+            pitch_midi=np.zeros((0,), dtype=np.int16),
+            confidence=np.zeros((0,), dtype=np.float64),
+        )
+
+    @classmethod
+    def from_dtos(cls, frames: Sequence[BasicPitchFramePitchDTO]) -> BasicPitchFrameTrack:
+        n: int = len(frames)
+        return cls(
+            t=np.fromiter((float(f.t) for f in frames), dtype=np.float64, count=n),
+            pitch_midi=np.fromiter((int(f.pitch_midi) for f in frames), dtype=np.int16, count=n),
+            confidence=np.fromiter(
+                (np.nan if f.confidence is None else float(f.confidence) for f in frames),
+                dtype=np.float64,
+                count=n,
+            ),
+        )
+
+    # 기존 list[DTO] 를 받는 코드용
+    def to_dtos(self) -> list[BasicPitchFramePitchDTO]:
+        return [
+            BasicPitchFramePitchDTO(t=t, pitch_midi=p, confidence=c)
+            for t, p, c in zip(self.t.tolist(), self.pitch_midi.tolist(), self.confidence_list())
+        ]
+
+    # NaN -> None
+    def confidence_list(self) -> list[float | None]:
+        return [None if c != c else c for c in self.confidence.tolist()]
+
+    def with_pitch(self, pitch_midi: np.ndarray) -> BasicPitchFrameTrack:
+        return BasicPitchFrameTrack(t=self.t, pitch_midi=pitch_midi, confidence=self.confidence)
+
+    # t 기준 안정 정렬 (같은 t 는 원래 순서 유지)
+    def sorted_by_time(self) -> BasicPitchFrameTrack:
+        if len(self) < 2 or bool(np.all(self.t[1:] >= self.t[:-1])):
+            return self
+        order: np.ndarray = np.argsort(self.t, kind="stable")
+        return BasicPitchFrameTrack(
+            t=self.t[order],
+            pitch_midi=self.pitch_midi[order],
+            confidence=self.confidence[order],
+        )
+
+
+def as_frame_track(
+    frames: BasicPitchFrameTrack | Sequence[BasicPitchFramePitchDTO],
+) -> BasicPitchFrameTrack:
+    if isinstance(frames, BasicPitchFrameTrack):
+        return frames
+    return BasicPitchFrameTrack.from_dtos(frames)
+
+
+# note event 열(column) 단위 보관 : 단계 사이에서 DTO list 를 새로 만들거나 다시 정렬하지 않음
+# confidence 가 없는 note 는 NaN
+# is_sorted = (start_time, end_time, pitch_midi) 순 정렬 보장 여부
+#   -> True 면 sorted() 가 그대로 반환, False 면 한번 확인 후 필요할때만 정렬
+# 기존 list[DTO] 코드용 : len / for / notes[i] 는 DTO 로 동작 (DTO 는 처음 필요할때 한번만 만듦)
+@dataclass(frozen=True)
+class NoteTrack:
+    start_time: np.ndarray  # float64 [N]
+    end_time: np.ndarray  # float64 [N]
+    pitch_midi: np.ndarray  # int16 [N]
+    confidence: np.ndarray  # float64 [N]
+    is_sorted: bool = False
+
+    def __post_init__(self) -> None:
+        start_time: np.ndarray = np.asarray(self.start_time, dtype=np.float64)
+        end_time: np.ndarray = np.asarray(self.end_time, dtype=np.float64)
+        pitch_midi: np.ndarray = np.asarray(self.pitch_midi, dtype=np.int16)
+        confidence: np.ndarray = np.asarray(self.confidence, dtype=np.float64)
+
+        if not (start_time.ndim == end_time.ndim == pitch_midi.ndim == confidence.ndim == 1):
+            raise ValueError("note track columns must be 1-D")
+        if not (start_time.shape == end_time.shape == pitch_midi.shape == confidence.shape):
+            raise ValueError(
+                "note track column length mismatch. "
+                f"start={start_time.shape} end={end_time.shape} pitch={pitch_midi.shape} conf={confidence.shape}"
+            )
+
+        object.__setattr__(self, "start_time", start_time)
+        object.__setattr__(self, "end_time", end_time)
+        object.__setattr__(self, "pitch_midi", pitch_midi)
+        object.__setattr__(self, "confidence", confidence)
+        object.__setattr__(self, "is_sorted", bool(self.is_sorted) or start_time.shape[0] < 2)
+
+    def __len__(self) -> int:
+        return int(self.start_time.shape[0])
+
+    def __iter__(self) -> Iterator[BasicPitchNoteEventDTO]:
+        return iter(self.dtos)
+
+    @overload
+    def __getitem__(self, index: int) -> BasicPitchNoteEventDTO: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> NoteTrack: ...
+
+    # 정수 -> DTO, slice -> 복사 없는 view (정렬 상태 유지)
+    def __getitem__(self, index: int | slice) -> BasicPitchNoteEventDTO | NoteTrack:
+        if isinstance(index, slice):
+            return NoteTrack(
+                start_time=self.start_time[index],
+                end_time=self.end_time[index],
+                pitch_midi=self.pitch_midi[index],
+                confidence=self.confidence[index],
+                is_sorted=self.is_sorted and index.step in (None, 1),
+            )
+        return self.dtos[index]
+
+    @classmethod
+    def empty(cls) -> NoteTrack:
+        return cls(
+            start_time=np.zeros((0,), dtype=np.float64),
+            end_time=np.zeros((0,), dtype=np.float64),
+            pitch_midi=np.zeros((0,), dtype=np.int16),
+            confidence=np.zeros((0,), dtype=np.float64),
+            is_sorted=True,
+        )
+
+    @classmethod
+    def from_dtos(cls, notes: Sequence[BasicPitchNoteEventDTO]) -> NoteTrack:
+        n: int = len(notes)
+        return cls(
+            start_time=np.fromiter((float(x.start_time) for x in notes), dtype=np.float64, count=n),
+            end_time=np.fromiter((float(x.end_time) for x in notes), dtype=np.float64, count=n),
+            pitch_midi=np.fromiter((int(x.pitch_midi) for x in notes), dtype=np.int16, count=n),
+            confidence=np.fromiter(
+                (np.nan if x.confidence is None else float(x.confidence) for x in notes),
+                dtype=np.float64,
+                count=n,
+            ),
+        )
+
+    # 기존 list[DTO] 를 받는 코드용 (처음 접근할때 한번만 만듦)
+    @cached_property
+    def dtos(self) -> list[BasicPitchNoteEventDTO]:
+        return [
+            BasicPitchNoteEventDTO(start_time=s, end_time=e, pitch_midi=p, confidence=c)
+            for s, e, p, c in zip(
+                self.start_time.tolist(),
+                self.end_time.tolist(),
+                self.pitch_midi.tolist(),
+                self.confidence_list(),
+            )
+        ]
+
+    def to_dtos(self) -> list[BasicPitchNoteEventDTO]:
+        return list(self.dtos)
+
+    # NaN -> None
+    def confidence_list(self) -> list[float | None]:
+        return [None if c != c else c for c in self.confidence.tolist()]
+
+    # bool mask 로 고름 (순서 유지 -> 정렬 상태 유지)
+    def compress(self, mask: np.ndarray) -> NoteTrack:
+        return NoteTrack(
+            start_time=self.start_time[mask],
+            end_time=self.end_time[mask],
+            pitch_midi=self.pitch_midi[mask],
+            confidence=self.confidence[mask],
+            is_sorted=self.is_sorted,
+        )
+
+    # index 순서대로 고름
+    def take(self, index: np.ndarray, *, is_sorted: bool = False) -> NoteTrack:
+        return NoteTrack(
+            start_time=self.start_time[index],
+            end_time=self.end_time[index],
+            pitch_midi=self.pitch_midi[index],
+            confidence=self.confidence[index],
+            is_sorted=is_sorted,
+        )
+
+    def with_pitch(self, pitch_midi: np.ndarray) -> NoteTrack:
+        return NoteTrack(
+            start_time=self.start_time,
+            end_time=self.end_time,
+            pitch_midi=pitch_midi,
+            confidence=self.confidence,
+        )
+
+    # (start_time, end_time, pitch_midi) 안정 정렬
+    def sorted(self) -> NoteTrack:
+        if self.is_sorted:
+            return self
+        if self._check_sorted():
+            return NoteTrack(
+                start_time=self.start_time,
+                end_time=self.end_time,
+                pitch_midi=self.pitch_midi,
+                confidence=self.confidence,
+                is_sorted=True,
+            )
+        order: np.ndarray = np.lexsort((self.pitch_midi, self.end_time, self.start_time))
+        return self.take(order, is_sorted=True)
+
+    def _check_sorted(self) -> bool:
+        s0, s1 = self.start_time[:-1], self.start_time[1:]
+        e0, e1 = self.end_time[:-1], self.end_time[1:]
+        p0, p1 = self.pitch_midi[:-1], self.pitch_midi[1:]
+        ok: np.ndarray = (s0 < s1) | ((s0 == s1) & ((e0 < e1) | ((e0 == e1) & (p0 <= p1))))
+        return bool(np.all(ok))
+
+    @staticmethod
+    def concat(tracks: Sequence[NoteTrack]) -> NoteTrack:
+        if not tracks:
+            return NoteTrack.empty()
+        return NoteTrack(
+            start_time=np.concatenate([t.start_time for t in tracks]),
+            end_time=np.concatenate([t.end_time for t in tracks]),
+            pitch_midi=np.concatenate([t.pitch_midi for t in tracks]),
+            confidence=np.concatenate([t.confidence for t in tracks]),
+        )
+
+
+def as_note_track(
+    notes: NoteTrack | Sequence[BasicPitchNoteEventDTO],
+) -> NoteTrack:
+    if isinstance(notes, NoteTrack):
+        return notes
+    return NoteTrack.from_dtos(notes)
+
+
 @dataclass(frozen=True)
 class BasicPitchParams:
     input_wav_path: Path
@@ -38,6 +295,21 @@ class BasicPitchResult:
     frame_pitches_json_path: Path
 
 
+# 한번의 추론에서 나온 onset(note event) + frame 결과
+@dataclass(frozen=True)
+class BasicPitchOnsetFrameResult:
+    note_events: list[BasicPitchNoteEventDTO]
+    frame_track: BasicPitchFrameTrack
+
+    @property
+    def note_track(self) -> NoteTrack:
+        return NoteTrack.from_dtos(self.note_events)
+
+    @property
+    def frame_pitches(self) -> list[BasicPitchFramePitchDTO]:
+        return self.frame_track.to_dtos()
+
+
 class BasicPitchPort(ABC):
     @abstractmethod
     async def export_onset(
@@ -55,6 +327,14 @@ class BasicPitchPort(ABC):
     ) -> list[BasicPitchFramePitchDTO]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def export_onset_and_frame(
+        self,
+        *,
+        params: BasicPitchParams,
+    ) -> BasicPitchOnsetFrameResult:
+        raise NotImplementedError
+
     @abstractmethod
     async def export_file(
         self,
@@ -20,6 +20,12 @@ class DemucsSplitSetting:
     demucs_model: str = "htdemucs_ft"
     overwrite_outputs: bool = True
     cleanup_stems: bool = True
+    # full 모드에서 파생 음원을 만들지 여부 (bass_only 는 항상 생성)
+    make_bass_removed: bool = True
+    make_bass_boosted: bool = True
+    # 0 이면 곡 전체를 한번에 분리, > 0 이면 구간 단위 streaming 분리
+    stream_segment_seconds: float = 0.0
+    stream_overlap_seconds: float = 2.0
 
 
 class DemucsPort(ABC):
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+DerivedAudioKind = Literal["bass_removed", "bass_boosted"]
+
+DEFAULT_BOOSTED_VOLUME_DB: float = 10.0
+
+
+# boost 는 0.1dB 단위로 (가까운 값끼리 같은 파일 / 파일 이름이 값마다 하나) / -0.0 -> 0.0
+def quantize_boosted_volume_db(*, boosted_volume_db: float) -> float:
+    return round(float(boosted_volume_db), 1) + 0.0
+
+
+@dataclass(frozen=True)
+class DerivedAudioResult:
+    kind: DerivedAudioKind
+    path: Path
+    boosted_volume_db: float | None
+    # 이번 요청에서 새로 만들었는지 (False 면 디스크에 있던 것 재사용)
+    created: bool
+
+
+class DerivedAudioPort(ABC):
+    # bass_only.wav 와 그 옆에 demucs 가 남긴 stem 합으로 파생 음원을 필요할 때 만듬 (이미 있으면 그대로 반환)
+    # boosted_volume_db 는 quantize_boosted_volume_db 값으로 만들고 결과에도 그 값
+    @abstractmethod
+    async def materialize(
+        self,
+        *,
+        bass_only_wav_path: Path,
+        kind: DerivedAudioKind,
+        boosted_volume_db: float = DEFAULT_BOOSTED_VOLUME_DB,
+    ) -> DerivedAudioResult:
+        raise NotImplementedError
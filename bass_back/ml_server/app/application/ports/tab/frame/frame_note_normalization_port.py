@@ -6,7 +6,8 @@ from pathlib import Path
 
 from app.application.ports.basic_pitch.basic_pitch_port import (
     BasicPitchFramePitchDTO,
-    BasicPitchNoteEventDTO,
+    BasicPitchFrameTrack,
+    NoteTrack,
 )
 
 
@@ -36,9 +37,9 @@ class FramePitchNormalizePort(ABC):
     def normalize(
         self,
         *,
-        frames: list[BasicPitchFramePitchDTO],
+        notes: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
         params: FramePitchNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
+    ) -> NoteTrack:
         raise NotImplementedError
 
     @abstractmethod
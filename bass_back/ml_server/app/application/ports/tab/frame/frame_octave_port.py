@@ -4,7 +4,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchFramePitchDTO
+from app.application.ports.basic_pitch.basic_pitch_port import (
+    BasicPitchFramePitchDTO,
+    BasicPitchFrameTrack,
+)
 
 
 @dataclass(frozen=True)
@@ -35,14 +38,38 @@ class FramePitchOctaveNormalizeParams:
             raise ValueError("alias_semitones must not be empty")
 
 
+# fixed-lag 온라인 보정 : chunk 를 넣을때마다 lag 뒤로 밀려난 frame 만 확정해서 반환
+class FramePitchOctaveStreamPort(ABC):
+    @abstractmethod
+    def push(
+        self,
+        *,
+        frames: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
+    ) -> BasicPitchFrameTrack:
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self) -> BasicPitchFrameTrack:
+        raise NotImplementedError
+
+
 class FramePitchOctaveNormalizePort(ABC):
     @abstractmethod
     def normalize(
         self,
         *,
-        frames: list[BasicPitchFramePitchDTO],
+        frames: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
+        params: FramePitchOctaveNormalizeParams,
+    ) -> list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack:
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_stream(
+        self,
+        *,
         params: FramePitchOctaveNormalizeParams,
-    ) -> list[BasicPitchFramePitchDTO]:
+        lag_frames: int = 256,
+    ) -> FramePitchOctaveStreamPort:
         raise NotImplementedError
 
     @abstractmethod
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Protocol
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
 
 
 @dataclass(frozen=True)
@@ -27,18 +27,18 @@ class OnsetFrameFusePort(Protocol):
         self,
         *,
         bpm: float,
-        onset_notes: list[BasicPitchNoteEventDTO],
-        frame_notes: list[BasicPitchNoteEventDTO],
+        onset_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
+        frame_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetFrameFuseParams,
-    ) -> list[BasicPitchNoteEventDTO]:
+    ) -> NoteTrack:
         ...
 
     def normalize_file(
         self,
         *,
         bpm: float,
-        onset_notes: list[BasicPitchNoteEventDTO],
-        frame_notes: list[BasicPitchNoteEventDTO],
+        onset_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
+        frame_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         output_dir: str,
         params: OnsetFrameFuseParams,
     ) -> None:
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Protocol
 from pathlib import Path
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
 from app.application.ports.tab.merge.original.onset_frame_plus_port import OnsetFrameFuseParams
 
 class RootTabBuildPort(Protocol):
@@ -13,18 +13,16 @@ class RootTabBuildPort(Protocol):
         self,
         *,
         bpm: float,
-        original_notes: list[BasicPitchNoteEventDTO],
-        output_dir : Path,
-        asset_id : str,
+        original_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetFrameFuseParams,
-    ) -> None:
+    ) -> NoteTrack:
         raise NotImplementedError
 
     def build_file(
         self,
         *,
         bpm: float,
-        original_notes: list[BasicPitchNoteEventDTO],
+        original_notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         output_dir: str,
         params: OnsetFrameFuseParams,
     ) -> None:
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
 
 
 @dataclass(frozen=True)
@@ -47,9 +47,9 @@ class OnsetNormalizePort(ABC):
     def normalize(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
+    ) -> NoteTrack:
         raise NotImplementedError
 
     @abstractmethod
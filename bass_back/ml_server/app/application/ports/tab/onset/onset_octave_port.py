@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
 
 
 @dataclass(frozen=True)
@@ -31,9 +31,9 @@ class OnsetPitchOctaveNormalizePort(ABC):
     def normalize(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: OnsetPitchOctaveNormalizeParams,
-    ) -> list[BasicPitchNoteEventDTO]:
+    ) -> NoteTrack:
         raise NotImplementedError
 
     @abstractmethod
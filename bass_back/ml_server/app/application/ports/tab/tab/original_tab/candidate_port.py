@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
 
 
 
@@ -49,7 +49,7 @@ class BassTabCandidateBuilderPort(ABC):
     def build_candidates(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         params: BassTabCandidateBuildParams,
     ) -> list[list[BassTabCandidateDTO]]:
         raise NotImplementedError
\ No newline at end of file
@@ -4,7 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
+from app.application.ports.tab.tab.original_tab.viterbi_port import BassTabViterbiStepDTO
 
 
 @dataclass(frozen=True)
@@ -28,9 +29,27 @@ class OriginalTabGeneratePort(ABC):
     def tab_generate(
         self,
         *,
-        original_json: list[BasicPitchNoteEventDTO],
+        original_json: list[BasicPitchNoteEventDTO] | NoteTrack,
         bpm: int,
         output_dir: Path,
         asset_id: str,
     ) -> Path:
-        raise NotImplementedError
\ No newline at end of file
+        """
+        note 열을 받아서 candidate build + viterbi decode 를 직접 한번 하고 tab 을 만든다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def tab_generate_from_steps(
+        self,
+        *,
+        steps: list[BassTabViterbiStepDTO],
+        bpm: int,
+        output_dir: Path,
+        asset_id: str,
+    ) -> Path:
+        """
+        이미 decode 된 결과로 tab 만 만든다. (candidate build / decode 다시 안함)
+        steps 는 note_index 0..n-1 순서, start_time 정렬, end_time > start_time 이어야 함 (아니면 ValueError)
+        """
+        raise NotImplementedError
@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO
+from app.application.ports.basic_pitch.basic_pitch_port import BasicPitchNoteEventDTO, NoteTrack
 from app.application.ports.tab.tab.original_tab.candidate_port import (
     BassTabCandidateDTO,
 )
@@ -48,7 +48,7 @@ class BassTabViterbiPort(ABC):
     def decode(
         self,
         *,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
         candidates: list[list[BassTabCandidateDTO]],
         bpm: int,
         params: BassTabViterbiParams,
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import json
+import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
 from shared.dtos.main_ml_dto import (
     MLProcessRequestDTO,
     MLProcessResponseDTO,
 )
 
+from app.application.ports.audio.audio_buffer_port import AudioBufferPort
 from app.application.ports.jobs.job_store_port import JobStore
 from app.application.ports.bpm.bpm_port import BpmEstimatePort
 from app.application.ports.demucs.demucs_port import (
@@ -18,10 +22,12 @@ from app.application.ports.demucs.demucs_port import (
     DemucsSplitSetting,
 )
 from app.application.ports.basic_pitch.basic_pitch_port import (
-    BasicPitchFramePitchDTO,
+    BasicPitchFrameTrack,
     BasicPitchNoteEventDTO,
+    BasicPitchOnsetFrameResult,
     BasicPitchParams,
     BasicPitchPort,
+    NoteTrack,
 )
 from app.application.ports.tab.frame.frame_octave_port import (
     FramePitchOctaveNormalizeParams,
@@ -80,6 +86,8 @@ class RunMLProcessUseCase:
     bass_tab_viterbi_port: BassTabViterbiPort
     original_tab_generate_port: OriginalTabGeneratePort
     root_tab_generate_adapter: RootTabGenerateAdapter
+    # demucs / basic_pitch / bpm 이 같이 쓰는 decode 보관소 -> job 끝나면 비움
+    audio_buffer_port: AudioBufferPort | None = None
 
     async def execute(
         self,
@@ -87,6 +95,8 @@ class RunMLProcessUseCase:
         request: MLProcessRequestDTO,
     ) -> MLProcessResponseDTO:
         stage: str = "init"
+        stage_started: float = time.perf_counter()
+        stage_seconds: dict[str, float] = {}
 
         print("[USECASE] 시작")
 
@@ -110,17 +120,22 @@ class RunMLProcessUseCase:
 
         try:
             stage = "prepare_dirs"
+            stage_started = time.perf_counter()
             print("[USECASE] prepare_dirs 시작")
             self._prepare_dirs(asset_root_path)
             print("[USECASE] prepare_dirs 끝")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "mark_running"
+            stage_started = time.perf_counter()
             print("[USECASE] job mark_running 시작")
             job.mark_running()
             await self.job_store.save(job)
             print("[USECASE] job mark_running 끝")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "demucs"
+            stage_started = time.perf_counter()
             print("[USECASE] demucs 시작")
             bass_only_wav_path: Path = await self.demucs_port.split(
                 input_wav_path=input_wav_path,
@@ -131,6 +146,9 @@ class RunMLProcessUseCase:
                     demucs_model="htdemucs",
                     overwrite_outputs=True,
                     cleanup_stems=True,
+                    # bass_removed / bass_boosted 는 main server 가 요청할 때 만듬 (/v1/derived-audio)
+                    make_bass_removed=False,
+                    make_bass_boosted=False,
                 ),
                 dsp=DemucsDspParams(
                     enable_dsp=False,
@@ -142,46 +160,46 @@ class RunMLProcessUseCase:
             )
             print("[USECASE] demucs 끝")
             print(f"[USECASE] bass_only_wav_path={bass_only_wav_path}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "save_progress_15"
+            stage_started = time.perf_counter()
             job.set_progress(progress=15)
             await self.job_store.save(job)
             print("[USECASE] progress 15 저장 끝")
 
             original_wav_path: Path = input_wav_path
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
-            stage = "basic_pitch_onset"
-            print("[USECASE] basic_pitch onset 시작")
-            basic_pitch_onset_result: list[BasicPitchNoteEventDTO] = await self.basic_pitch_port.export_onset(
+            stage = "basic_pitch"
+            stage_started = time.perf_counter()
+            print("[USECASE] basic_pitch onset + frame 시작")
+            basic_pitch_result: BasicPitchOnsetFrameResult = await self.basic_pitch_port.export_onset_and_frame(
                 params=BasicPitchParams(
                     input_wav_path=bass_only_wav_path,
                     output_dir=asset_root_path,
                     asset_id=job.asset_id,
                 )
             )
-            print("[USECASE] basic_pitch onset 끝")
+            # onset / frame 모두 DTO list 대신 column 배열 (NoteTrack / BasicPitchFrameTrack) 로 다음 단계로
+            basic_pitch_onset_result: NoteTrack = basic_pitch_result.note_track
+            basic_pitch_frame_result: BasicPitchFrameTrack = basic_pitch_result.frame_track
+            print("[USECASE] basic_pitch onset + frame 끝")
             print(f"[USECASE] onset count={len(basic_pitch_onset_result)}")
-
-            stage = "basic_pitch_frame"
-            print("[USECASE] basic_pitch frame 시작")
-            basic_pitch_frame_result: list[BasicPitchFramePitchDTO] = await self.basic_pitch_port.export_frame(
-                params=BasicPitchParams(
-                    input_wav_path=bass_only_wav_path,
-                    output_dir=asset_root_path,
-                    asset_id=job.asset_id,
-                )
-            )
-            print("[USECASE] basic_pitch frame 끝")
             print(f"[USECASE] frame count={len(basic_pitch_frame_result)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "save_progress_40"
+            stage_started = time.perf_counter()
             job.set_progress(progress=40)
             await self.job_store.save(job)
             print("[USECASE] progress 40 저장 끝")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "onset_octave"
+            stage_started = time.perf_counter()
             print("[USECASE] onset octave 시작")
-            onset_octave_notes: list[BasicPitchNoteEventDTO] = self.onset_octave_port.normalize(
+            onset_octave_notes: NoteTrack = self.onset_octave_port.normalize(
                 notes=basic_pitch_onset_result,
                 params=OnsetPitchOctaveNormalizeParams(
                     alias_semitones=[-24, -12, 0, 12, 24],
@@ -189,35 +207,43 @@ class RunMLProcessUseCase:
             )
             print("[USECASE] onset octave 끝")
             print(f"[USECASE] onset_octave count={len(onset_octave_notes)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "frame_octave"
+            stage_started = time.perf_counter()
             print("[USECASE] frame octave 시작")
-            frame_octave_notes: list[BasicPitchFramePitchDTO] = self.frame_octave_port.normalize(
+            frame_octave_notes: BasicPitchFrameTrack = self.frame_octave_port.normalize(
                 frames=basic_pitch_frame_result,
                 params=FramePitchOctaveNormalizeParams(),
             )
             print("[USECASE] frame octave 끝")
             print(f"[USECASE] frame_octave count={len(frame_octave_notes)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "onset_normalize"
+            stage_started = time.perf_counter()
             print("[USECASE] onset normalize 시작")
-            onset_normalized_notes: list[BasicPitchNoteEventDTO] = self.onset_normalize_port.normalize(
+            onset_normalized_notes: NoteTrack = self.onset_normalize_port.normalize(
                 notes=onset_octave_notes,
                 params=OnsetNormalizeParams(),
             )
             print("[USECASE] onset normalize 끝")
             print(f"[USECASE] onset_normalized count={len(onset_normalized_notes)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "frame_normalize"
+            stage_started = time.perf_counter()
             print("[USECASE] frame normalize 시작")
-            frame_normalized_notes: list[BasicPitchNoteEventDTO] = self.frame_note_normalize_port.normalize(
+            frame_normalized_notes: NoteTrack = self.frame_note_normalize_port.normalize(
                 notes=frame_octave_notes,
                 params=FramePitchNormalizeParams(),
             )
             print("[USECASE] frame normalize 끝")
             print(f"[USECASE] frame_normalized count={len(frame_normalized_notes)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "bpm"
+            stage_started = time.perf_counter()
             print("[USECASE] bpm 시작")
             bpm: int = await self.bpm_port.estimate_bpm(
                 input_wav_path=original_wav_path,
@@ -228,10 +254,12 @@ class RunMLProcessUseCase:
             )
             print("[USECASE] bpm 끝")
             print(f"[USECASE] bpm={bpm}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "fuse_original_notes"
+            stage_started = time.perf_counter()
             print("[USECASE] onset_frame fuse 시작")
-            original_notes: list[BasicPitchNoteEventDTO] = self.onset_frame_fuse_port.normalize(
+            original_notes: NoteTrack = self.onset_frame_fuse_port.normalize(
                 bpm=float(bpm),
                 onset_notes=onset_normalized_notes,
                 frame_notes=frame_normalized_notes,
@@ -239,54 +267,76 @@ class RunMLProcessUseCase:
             )
             print("[USECASE] onset_frame fuse 끝")
             print(f"[USECASE] original_notes count={len(original_notes)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "save_progress_65"
+            stage_started = time.perf_counter()
             job.set_progress(progress=65)
             await self.job_store.save(job)
             print("[USECASE] progress 65 저장 끝")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "build_root_notes"
+            stage_started = time.perf_counter()
             print("[USECASE] root build 시작")
-            root_notes: list[BasicPitchNoteEventDTO] = self.root_tab_build_port.build(
+            root_notes: NoteTrack = self.root_tab_build_port.build(
                 bpm=float(bpm),
                 original_notes=original_notes,
                 params=OnsetFrameFuseParams(),
             )
             print("[USECASE] root build 끝")
             print(f"[USECASE] root_notes count={len(root_notes)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "build_candidates"
+            stage_started = time.perf_counter()
             print("[USECASE] candidate build 시작")
+            # tab 에 쓸 note 는 한번만 정리 (길이 0 제거 + 정렬), candidate 없는 note 는 decode 전에 제외
+            tab_notes: NoteTrack = original_notes.compress(original_notes.end_time > original_notes.start_time).sorted()
             candidates: list[list[BassTabCandidateDTO]] = self.bass_tab_candidate_builder_port.build_candidates(
-                notes=original_notes,
+                notes=tab_notes,
                 params=BassTabCandidateBuildParams(),
             )
+            has_candidate: np.ndarray = np.fromiter((bool(c) for c in candidates), dtype=bool, count=len(candidates))
+            if not bool(np.all(has_candidate)):
+                print(f"[USECASE] skipped_no_candidate={int(np.count_nonzero(~has_candidate))}")
+                tab_notes = tab_notes.compress(has_candidate)
+                candidates = [c for c in candidates if c]
             print("[USECASE] candidate build 끝")
             print(f"[USECASE] candidate note count={len(candidates)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "viterbi"
+            stage_started = time.perf_counter()
             print("[USECASE] viterbi 시작")
-            viterbi_steps: list[BassTabViterbiStepDTO] = self.bass_tab_viterbi_port.decode(
-                notes=original_notes,
-                candidates=candidates,
-                bpm=int(bpm),
-                params=BassTabViterbiParams(),
-            )
+            viterbi_steps: list[BassTabViterbiStepDTO] = []
+            if len(tab_notes) > 0:
+                viterbi_steps = self.bass_tab_viterbi_port.decode(
+                    notes=tab_notes,
+                    candidates=candidates,
+                    bpm=int(bpm),
+                    params=BassTabViterbiParams(),
+                )
             print("[USECASE] viterbi 끝")
             print(f"[USECASE] viterbi_steps count={len(viterbi_steps)}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "generate_original_tab"
+            stage_started = time.perf_counter()
             print("[USECASE] original tab 생성 시작")
-            original_tab_path: Path = self.original_tab_generate_port.tab_generate(
-                original_json=viterbi_steps,
+            # 위에서 decode 한 결과를 그대로 씀 (candidate build / viterbi 는 job 당 한번)
+            original_tab_path: Path = self.original_tab_generate_port.tab_generate_from_steps(
+                steps=viterbi_steps,
                 bpm=int(bpm),
                 output_dir=asset_root_path,
                 asset_id=job.asset_id,
             )
             print("[USECASE] original tab 생성 끝")
             print(f"[USECASE] original_tab_path={original_tab_path}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "generate_root_tab"
+            stage_started = time.perf_counter()
             print("[USECASE] root tab 생성 시작")
             root_tab_path: Path = self.root_tab_generate_adapter.tab_generate(
                 original_json=root_notes,
@@ -296,13 +346,17 @@ class RunMLProcessUseCase:
             )
             print("[USECASE] root tab 생성 끝")
             print(f"[USECASE] root_tab_path={root_tab_path}")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
             stage = "mark_done"
+            stage_started = time.perf_counter()
             print("[USECASE] job mark_done 시작")
             job.mark_done()
             await self.job_store.save(job)
             print("[USECASE] job mark_done 끝")
+            self._record_stage(timings=stage_seconds, stage=stage, started=stage_started)
 
+            print("[USECASE] stage timings " + " ".join(f"{k}={v * 1000.0:.0f}ms" for k, v in stage_seconds.items()))
             print("[USECASE] 전체 완료")
             return MLProcessResponseDTO(
                 job_id=job.job_id,
@@ -340,12 +394,21 @@ class RunMLProcessUseCase:
                 norm_artist=request.norm_artist,
             )
 
+        finally:
+            if self.audio_buffer_port is not None:
+                self.audio_buffer_port.clear()
+
     async def _get_job(self, job_id: str) -> MLJob:
         job: MLJob | None = await self.job_store.get(job_id)
         if job is None:
             raise ValueError(f"job not found: {job_id}")
         return job
 
+    def _record_stage(self, *, timings: dict[str, float], stage: str, started: float) -> None:
+        seconds: float = time.perf_counter() - started
+        timings[stage] = seconds
+        print(f"[USECASE] {stage} {seconds * 1000.0:.1f}ms")
+
     def _generate_asset_id(self) -> str:
         return f"asset_{uuid.uuid4().hex}"
 
@@ -360,7 +423,7 @@ class RunMLProcessUseCase:
         self,
         *,
         output_path: Path,
-        notes: list[BasicPitchNoteEventDTO],
+        notes: list[BasicPitchNoteEventDTO] | NoteTrack,
     ) -> None:
         payload: list[dict[str, float | int | None]] = [
             {
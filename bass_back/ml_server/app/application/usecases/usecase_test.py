@@ -11,7 +11,10 @@ from shared.dtos.main_ml_dto import MLProcessRequestDTO
 from app.application.usecases.final_usecase import RunMLProcessUseCase
 from app.application.ports.basic_pitch.basic_pitch_port import (
     BasicPitchFramePitchDTO,
+    BasicPitchFrameTrack,
     BasicPitchNoteEventDTO,
+    BasicPitchOnsetFrameResult,
+    as_frame_track,
 )
 from app.application.ports.tab.tab.original_tab.candidate_port import (
     BassTabCandidateDTO,
@@ -103,15 +106,25 @@ class FakeBasicPitchPort:
             BasicPitchFramePitchDTO(t=1.0, pitch_midi=45, confidence=0.78),
         ]
 
+    async def export_onset_and_frame(
+        self,
+        *,
+        params: Any,
+    ) -> BasicPitchOnsetFrameResult:
+        return BasicPitchOnsetFrameResult(
+            note_events=await self.export_onset(params=params),
+            frame_track=BasicPitchFrameTrack.from_dtos(await self.export_frame(params=params)),
+        )
+
 
 @dataclass
 class FakeFrameOctavePort:
     def normalize(
         self,
         *,
-        frames: list[BasicPitchFramePitchDTO],
+        frames: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
         params: Any,
-    ) -> list[BasicPitchFramePitchDTO]:
+    ) -> list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack:
         return frames
 
 
@@ -120,12 +133,12 @@ class FakeFrameNoteNormalizePort:
     def normalize(
         self,
         *,
-        frames: list[BasicPitchFramePitchDTO],
+        notes: list[BasicPitchFramePitchDTO] | BasicPitchFrameTrack,
         params: Any,
     ) -> list[BasicPitchNoteEventDTO]:
         out: list[BasicPitchNoteEventDTO] = []
 
-        for frame in frames:
+        for frame in as_frame_track(notes).to_dtos():
             out.append(
                 BasicPitchNoteEventDTO(
                     start_time=float(frame.t),
@@ -255,10 +268,10 @@ class FakeBassTabViterbiPort:
 
 @dataclass
 class FakeOriginalTabGeneratePort:
-    def tab_generate(
+    def tab_generate_from_steps(
         self,
         *,
-        original_json: list[BassTabViterbiStepDTO],
+        steps: list[BassTabViterbiStepDTO],
         bpm: int,
         output_dir: Path,
         asset_id: str,
@@ -267,7 +280,7 @@ class FakeOriginalTabGeneratePort:
         tab_dir.mkdir(parents=True, exist_ok=True)
 
         payload: list[dict[str, object]] = []
-        for step in original_json:
+        for step in steps:
             payload.append(
                 {
                     "note_index": int(step.note_index),
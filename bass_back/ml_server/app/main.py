@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 
+from app.api.v1.routers.derived_audio_router import router as derived_audio_router
 from app.api.v1.routers.process_router import router as process_router
 from app.api.v1.routers.status import router as status_router
 
@@ -13,6 +14,9 @@ app.include_router(process_router)
 # ML status API
 app.include_router(status_router)
 
+# 파생 음원 지연 생성 API
+app.include_router(derived_audio_router)
+
 
 @app.get("/")
 async def root() -> dict[str, str]:
@@ -4,6 +4,7 @@ import asyncio
 import os
 import signal
 from dataclasses import dataclass
+from pathlib import Path
 
 import redis.asyncio as redis
 
@@ -22,6 +23,19 @@ class MLWorkerConfig:
     key_prefix: str = "bass:ml:"
     queue_name: str = QUEUE_NAME
     job_ttl_seconds: int = 60 * 60
+    demucs_preload_models: tuple[str, ...] = ("htdemucs",)
+    demucs_max_models: int = 2
+    demucs_max_bytes: int = 0
+    demucs_cache_dir: str = ""
+    demucs_cache_max_bytes: int = 20 * 1024 * 1024 * 1024
+    basic_pitch_backend: str = "auto"
+    # 0 이면 끔 (전체 한번에 decode), 1 이상이면 긴 쉼표에서 잘라서 process pool 로 tab decode
+    # 실험용 : 빈 cpu 가 2개 이상 + 수만 note 곡에서만 이득 (segment_viterbi_adapter 참고)
+    tab_segment_workers: int = 0
+    tab_segment_rest_beats: float = 2.0
+    # decode 결과 (AudioBufferRegistry) 는 이 process 안에서만 공유
+    #   demucs / basic_pitch / bpm 이 모두 이 worker process 안에서 돌아서 raw PCM sidecar / shared memory 를
+    #   올려도 attach 할 process 가 없음 -> 올리지 않음 (raw_pcm_format 은 stage 를 다른 process 로 나눌 때용)
 
 
 class GracefulShutdown:
@@ -41,10 +55,12 @@ class GracefulShutdown:
         return self._stop
 
 
-def build_usecase(*, store: RedisJobStore) -> RunMLProcessUseCase:
+def build_usecase(*, store: RedisJobStore, cfg: MLWorkerConfig | None = None) -> RunMLProcessUseCase:
+    from app.adapters.audio.audio_buffer_registry import AudioBufferRegistry
     from app.adapters.basic_pitch.basic_pitch_adapter import BasicPitchAdapter
     from app.adapters.bpm.bpm_estimate_adapter import LibrosaBpmEstimator
     from app.adapters.demucs.demucs_adapter import DemucsAdapter
+    from app.adapters.demucs.demucs_cache_adapter import CachedDemucsAdapter
     from app.adapters.tab.frame.frame_json_normalization_adapter import FramePitchNormalizeAdapter
     from app.adapters.tab.frame.frame_octave_adapter import FramePitchOctaveNormalizeAdapter
     from app.adapters.tab.merge.original.onset_frame_plus_adapter import OnsetFrameFuseAdapter
@@ -53,11 +69,17 @@ def build_usecase(*, store: RedisJobStore) -> RunMLProcessUseCase:
     from app.adapters.tab.onset.onset_octave_adapter import OnsetPitchOctaveNormalizeAdapter
     from app.adapters.tab.tab.origianal_tab.candidate_adapter import BassTabCandidateBuilderAdapter
     from app.adapters.tab.tab.origianal_tab.original_tab_adapter import OriginalTabGenerateAdapter
+    from app.adapters.tab.tab.origianal_tab.segment_viterbi_adapter import SegmentParallelViterbiAdapter
     from app.adapters.tab.tab.origianal_tab.viterbi_adapter import BassTabViterbiAdapter
     from app.adapters.tab.tab.root_tab.root_tab_adapter import RootTabGenerateAdapter
 
     candidate_builder: BassTabCandidateBuilderAdapter = BassTabCandidateBuilderAdapter()
-    viterbi: BassTabViterbiAdapter = BassTabViterbiAdapter()
+    viterbi: BassTabViterbiAdapter | SegmentParallelViterbiAdapter = BassTabViterbiAdapter()
+    if cfg is not None and cfg.tab_segment_workers > 0:
+        viterbi = SegmentParallelViterbiAdapter(
+            split_rest_beats=cfg.tab_segment_rest_beats,
+            max_workers=cfg.tab_segment_workers,
+        )
 
     original_tab_generator: OriginalTabGenerateAdapter = OriginalTabGenerateAdapter(
         candidate_builder=candidate_builder,
@@ -68,11 +90,26 @@ def build_usecase(*, store: RedisJobStore) -> RunMLProcessUseCase:
         candidate_builder=candidate_builder,
     )
 
+    # original / bass_only 는 job 당 한번만 decode (demucs / basic_pitch / bpm 공유, job 끝나면 비움)
+    audio_buffers: AudioBufferRegistry = AudioBufferRegistry()
+
+    # DEMUCS_CACHE_DIR 가 있으면 같은 음원은 demucs 생략
+    demucs_port: DemucsAdapter | CachedDemucsAdapter = DemucsAdapter(audio_buffers=audio_buffers)
+    if cfg is not None and cfg.demucs_cache_dir:
+        demucs_port = CachedDemucsAdapter(
+            inner=demucs_port,
+            cache_dir=Path(cfg.demucs_cache_dir),
+            max_bytes=cfg.demucs_cache_max_bytes,
+        )
+
     return RunMLProcessUseCase(
         job_store=store,
-        bpm_port=LibrosaBpmEstimator(),
-        demucs_port=DemucsAdapter(),
-        basic_pitch_port=BasicPitchAdapter(),
+        bpm_port=LibrosaBpmEstimator(audio_buffers=audio_buffers),
+        demucs_port=demucs_port,
+        basic_pitch_port=BasicPitchAdapter(
+            backend="auto" if cfg is None else cfg.basic_pitch_backend,
+            audio_buffers=audio_buffers,
+        ),
         frame_octave_port=FramePitchOctaveNormalizeAdapter(),
         frame_note_normalize_port=FramePitchNormalizeAdapter(),
         onset_octave_port=OnsetPitchOctaveNormalizeAdapter(),
@@ -83,7 +120,38 @@ def build_usecase(*, store: RedisJobStore) -> RunMLProcessUseCase:
         bass_tab_viterbi_port=viterbi,
         original_tab_generate_port=original_tab_generator,
         root_tab_generate_adapter=root_tab_generator,
+        audio_buffer_port=audio_buffers,
+    )
+
+
+async def preload_demucs_models(cfg: MLWorkerConfig) -> None:
+    from app.adapters.demucs.demucs_model_registry import (
+        DemucsModelRegistry,
+        get_demucs_model_registry,
+    )
+
+    registry: DemucsModelRegistry = get_demucs_model_registry()
+    registry.configure(max_models=cfg.demucs_max_models, max_bytes=cfg.demucs_max_bytes)
+
+    loaded: list[str] = await asyncio.to_thread(
+        registry.preload,
+        demucs_models=list(cfg.demucs_preload_models),
     )
+    print(f"[ml-worker] demucs preload models={loaded} bytes={registry.total_bytes()}")
+
+
+async def preload_basic_pitch_model(cfg: MLWorkerConfig) -> None:
+    from app.adapters.basic_pitch.basic_pitch_model_registry import (
+        BasicPitchModelRegistry,
+        get_basic_pitch_model_registry,
+    )
+
+    registry: BasicPitchModelRegistry = get_basic_pitch_model_registry()
+    loaded: list[str] = await asyncio.to_thread(
+        registry.preload,
+        backends=[cfg.basic_pitch_backend],
+    )
+    print(f"[ml-worker] basic_pitch preload backends={loaded}")
 
 
 def build_request_from_job(job: MLJob) -> MLProcessRequestDTO:
@@ -154,7 +222,10 @@ async def worker_loop(cfg: MLWorkerConfig) -> None:
     await r.ping()
 
     store: RedisJobStore = RedisJobStore(r, key_prefix=cfg.key_prefix)
-    usecase: RunMLProcessUseCase = build_usecase(store=store)
+    usecase: RunMLProcessUseCase = build_usecase(store=store, cfg=cfg)
+
+    await preload_demucs_models(cfg)
+    await preload_basic_pitch_model(cfg)
 
     shutdown: GracefulShutdown = GracefulShutdown()
     shutdown.install()
@@ -173,6 +244,10 @@ async def worker_loop(cfg: MLWorkerConfig) -> None:
             )
     finally:
         await r.aclose()
+        if cfg.tab_segment_workers > 0:
+            from app.adapters.tab.tab.origianal_tab.segment_viterbi_adapter import shutdown_segment_pools
+
+            shutdown_segment_pools()
 
 
 def main() -> None:
@@ -181,11 +256,23 @@ def main() -> None:
         key_prefix=os.getenv("ML_JOB_KEY_PREFIX", "bass:ml:"),
         queue_name=os.getenv("ML_QUEUE_NAME", QUEUE_NAME),
         job_ttl_seconds=int(os.getenv("JOB_TTL_SECONDS", "3600")),
+        demucs_preload_models=tuple(
+            m.strip() for m in os.getenv("DEMUCS_PRELOAD_MODELS", "htdemucs").split(",") if m.strip()
+        ),
+        demucs_max_models=int(os.getenv("DEMUCS_MAX_MODELS", "2")),
+        demucs_max_bytes=int(os.getenv("DEMUCS_MAX_BYTES", "0")),
+        demucs_cache_dir=os.getenv("DEMUCS_CACHE_DIR", ""),
+        demucs_cache_max_bytes=int(os.getenv("DEMUCS_CACHE_MAX_BYTES", str(20 * 1024 * 1024 * 1024))),
+        basic_pitch_backend=os.getenv("BASIC_PITCH_BACKEND", "auto"),
+        tab_segment_workers=int(os.getenv("TAB_SEGMENT_WORKERS", "0")),
+        tab_segment_rest_beats=float(os.getenv("TAB_SEGMENT_REST_BEATS", "2.0")),
     )
 
     print("[ml-worker] redis_url:", cfg.redis_url)
     print("[ml-worker] key_prefix:", cfg.key_prefix)
     print("[ml-worker] queue_name:", cfg.queue_name)
+    print("[ml-worker] demucs_preload_models:", cfg.demucs_preload_models)
+    print("[ml-worker] basic_pitch_backend:", cfg.basic_pitch_backend)
 
     asyncio.run(worker_loop(cfg))
 